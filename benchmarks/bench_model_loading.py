@@ -0,0 +1,49 @@
+#!/usr/bin/env python3
+"""
+Benchmark loading a stored ScrapingResult under each validation mode.
+
+"legacy" is the original reload path: ``ScrapingResult(**json.load(f))``.
+
+Usage:
+    python benchmarks/bench_model_loading.py [--projects 100000]
+"""
+import argparse
+import json
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from models.hackathon import ScrapingResult  # noqa: E402
+from models.validation import ValidationMode, parse_scraping_result  # noqa: E402
+from synthetic import make_result_json  # noqa: E402
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--projects", type=int, default=100_000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    raw = make_result_json(args.projects)
+    print(f"{args.projects} projects, {len(raw) / 1e6:.1f} MB of JSON")
+
+    loaders = {"legacy": lambda: ScrapingResult(**json.loads(raw))}
+    for mode in ValidationMode:
+        loaders[mode.value] = lambda mode=mode: parse_scraping_result(raw, mode)
+
+    timings = {}
+    for name, loader in loaders.items():
+        best = float("inf")
+        for _ in range(args.repeat):
+            start = time.perf_counter()
+            result = loader()
+            best = min(best, time.perf_counter() - start)
+            del result
+        timings[name] = best
+        print(f"{name:>8}: {best:7.3f}s  ({timings['legacy'] / best:.1f}x vs legacy)")
+
+
+if __name__ == "__main__":
+    main()
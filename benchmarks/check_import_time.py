@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+"""
+Check the import cost of the CLI entry points against a time budget.
+
+Each entry point is run in a fresh interpreter with ``-X importtime``. The
+check fails if the imports take longer than the budget, or if a heavy module
+that the code path does not need (Playwright, the Gemini SDK, jinja2,
+pandas, ...) was loaded.
+
+Usage:
+    python benchmarks/check_import_time.py [--budget-scale 1.5] [--repeat 3]
+"""
+import argparse
+import re
+import subprocess
+import sys
+from pathlib import Path
+
+SRC_DIR = Path(__file__).resolve().parent.parent / "src"
+
+HEAVY_MODULES = ["playwright", "google.generativeai", "jinja2", "pandas", "pyarrow"]
+
+# name -> (python arguments, import budget in ms, modules that must not be loaded)
+CHECKS = {
+    "main.py --help": (
+        ["main.py", "--help"], 150,
+        HEAVY_MODULES + ["rich", "pydantic"]
+    ),
+    "main.py search": (
+        ["-c", "import main\ntry:\n    main.search_command(['rag', '--store', '/nonexistent/store.db'])\nexcept SystemExit:\n    pass"],
+        200,
+        HEAVY_MODULES + ["pydantic"]
+    ),
+    "main.py report": (
+        ["-c", "import main\ntry:\n    main.report_command(['--from-store', 'x', '--store', '/nonexistent/store.db'])\nexcept SystemExit:\n    pass"],
+        800,
+        ["playwright", "google.generativeai", "scraper", "pandas", "pyarrow"]
+    ),
+    "report rendering": (
+        ["-c", "import report.markdown_generator"], 600,
+        ["playwright", "google.generativeai", "pandas", "pyarrow"]
+    ),
+    "report aggregates": (
+        ["-c", "import report.aggregates"], 400,
+        ["playwright", "google.generativeai", "jinja2", "pandas", "pyarrow"]
+    ),
+    "scraper": (
+        ["-c", "import scraper.devpost_scraper"], 600,
+        ["playwright", "google.generativeai", "jinja2", "pandas", "pyarrow"]
+    ),
+}
+
+_IMPORTTIME_LINE = re.compile(r"^import time:\s+(\d+) \|\s+(\d+) \|( *)(\S+)$")
+
+
+def measure(args):
+    """
+    Run Python with ``-X importtime`` and parse its report.
+
+    Returns:
+        (total import time in ms, set of imported module names)
+    """
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", *args],
+        cwd=SRC_DIR, capture_output=True, text=True
+    )
+    if proc.returncode != 0:
+        raise RuntimeError(f"{' '.join(args)} failed:\n{proc.stderr[-2000:]}")
+
+    total_us = 0
+    modules = set()
+    for line in proc.stderr.splitlines():
+        match = _IMPORTTIME_LINE.match(line)
+        if not match:
+            continue
+        self_us, cumulative_us, indent, name = match.groups()
+        modules.add(name)
+        # Top-level imports (one space of indentation) include their children
+        if len(indent) == 1:
+            total_us += int(cumulative_us)
+    return total_us / 1000, modules
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--budget-scale", type=float, default=1.0, help="Multiply every budget (slow machines)")
+    parser.add_argument("--repeat", type=int, default=3, help="Runs per entry point; the fastest counts")
+    args = parser.parse_args()
+
+    failures = 0
+    for name, (command, budget_ms, forbidden) in CHECKS.items():
+        budget_ms *= args.budget_scale
+        runs = [measure(command) for _ in range(args.repeat)]
+        best_ms = min(total for total, _ in runs)
+        modules = runs[0][1]
+        loaded = sorted(
+            module for module in forbidden
+            if any(imported == module or imported.startswith(module + ".") for imported in modules)
+        )
+
+        ok = best_ms <= budget_ms and not loaded
+        failures += not ok
+        status = "ok  " if ok else "FAIL"
+        print(f"{status} {name:<20} {best_ms:7.1f} ms (budget {budget_ms:.0f} ms)")
+        if loaded:
+            print(f"     unexpected imports: {', '.join(loaded)}")
+
+    sys.exit(1 if failures else 0)
+
+
+if __name__ == "__main__":
+    main()
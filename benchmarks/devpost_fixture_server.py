@@ -0,0 +1,436 @@
+#!/usr/bin/env python3
+"""
+Local stand-in for Devpost, for offline end-to-end scraper runs and load tests.
+
+Serves a hackathon listing, hackathon landing pages, paginated project
+galleries and ``/software/`` project pages. The pages are built from the
+stored raw results (the latest usable file of each hackathon) or from
+synthetic corpora. Their markup uses the selectors DevpostScraper and
+HackathonSearcher look for.
+
+Faults are injected per request:
+    --latency / --jitter    delay before the response starts (ms)
+    --rate-limit-rate       fraction of requests answered 429 (with Retry-After)
+    --error-rate            fraction of requests answered 500/502/503
+    --slow-body-rate        fraction of responses streamed in chunks with --chunk-delay between them
+
+URL layout (relative to the printed base URL):
+    /hackathons                         listing of every hackathon
+    /h/<key>/                           hackathon landing page
+    /h/<key>/project-gallery?page=N     gallery, --page-size projects per page
+    /software/<slug>                    project page
+    /health                             always 200, never faulted
+
+Usage:
+    python benchmarks/devpost_fixture_server.py --data-dir src/data/raw --port 8800 --latency 200 --jitter 100
+    python benchmarks/devpost_fixture_server.py --synthetic 5000 --error-rate 0.05 --rate-limit-rate 0.05
+
+    # In another shell
+    python src/main.py http://127.0.0.1:8800/h/synthetic-0/project-gallery --base-url http://127.0.0.1:8800 --headless
+"""
+import argparse
+import html
+import random
+import re
+import sys
+import threading
+import time
+from dataclasses import dataclass
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+from urllib.parse import parse_qs, urlparse
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from synthetic import SECTION_HEADINGS, make_result_dict  # noqa: E402
+
+DEFAULT_PAGE_SIZE = 24
+SERVER_ERROR_CODES = (500, 502, 503)
+
+
+@dataclass
+class FaultConfig:
+    """Fault injection settings applied to every request except /health."""
+    latency_ms: float = 0.0
+    jitter_ms: float = 0.0
+    rate_limit_rate: float = 0.0
+    retry_after_s: int = 1
+    error_rate: float = 0.0
+    slow_body_rate: float = 0.0
+    chunk_size: int = 4096
+    chunk_delay_ms: float = 50.0
+
+
+def _slug(url: str) -> str:
+    """Last path segment of a URL."""
+    return urlparse(url).path.rstrip("/").rsplit("/", 1)[-1]
+
+
+def _key(hackathon: Dict[str, Any], index: int) -> str:
+    """URL-safe key of a hackathon (its Devpost subdomain when there is one)."""
+    host = urlparse(hackathon.get("devpost_url") or "").netloc.split(".")[0]
+    key = re.sub(r"[^a-z0-9-]+", "-", host.lower()).strip("-")
+    return key if key and key not in ("devpost", "www") else f"hackathon-{index}"
+
+
+class FixtureSite:
+    """Hackathon and project records, rendered as Devpost-like HTML pages."""
+
+    def __init__(self, hackathons: List[Dict[str, Any]], page_size: int = DEFAULT_PAGE_SIZE):
+        """
+        Args:
+            hackathons: Hackathon dicts as stored in raw result files
+            page_size: Projects per gallery page
+        """
+        self.page_size = page_size
+        self.hackathons: Dict[str, Dict[str, Any]] = {}
+        self.projects: Dict[str, Dict[str, Any]] = {}
+        for index, hackathon in enumerate(hackathons):
+            key = _key(hackathon, index)
+            while key in self.hackathons:
+                key = f"{key}-{index}"
+            self.hackathons[key] = hackathon
+            for project in hackathon.get("projects") or []:
+                self.projects.setdefault(_slug(project["devpost_url"]), project)
+
+    @classmethod
+    def from_data_dir(cls, data_dir: Path, page_size: int = DEFAULT_PAGE_SIZE) -> "FixtureSite":
+        """Build the site from the current raw results of a data directory."""
+        from storage.corpus import Corpus
+
+        return cls([data["hackathon"] for data in Corpus(data_dir).iter_data()], page_size)
+
+    @classmethod
+    def synthetic(cls, num_projects: int, num_hackathons: int = 1, page_size: int = DEFAULT_PAGE_SIZE) -> "FixtureSite":
+        """Build the site from synthetic hackathons with ``num_projects`` projects in total."""
+        hackathons = []
+        per_hackathon = max(1, num_projects // num_hackathons)
+        for index in range(num_hackathons):
+            hackathon = make_result_dict(per_hackathon, seed=index)["hackathon"]
+            hackathon["name"] = f"Synthetic Hackathon {index}"
+            hackathon["devpost_url"] = f"https://synthetic-{index}.devpost.com/project-gallery"
+            for project in hackathon["projects"]:
+                project["devpost_url"] = project["devpost_url"].replace("/project-", f"/h{index}-project-")
+                # Give the pages story sections for the LLM analyzer's section extraction
+                project["analysis"] = {"sections": {name: project["description"] for _, name in SECTION_HEADINGS}}
+            hackathons.append(hackathon)
+        return cls(hackathons, page_size)
+
+    def _layout(self, title: str, body: str) -> str:
+        return (
+            f"<!DOCTYPE html>\n<html><head><meta charset=\"utf-8\"><title>{html.escape(title)} | Devpost</title></head>\n"
+            f"<body>\n<nav class=\"site-nav\"><a href=\"/hackathons\">Hackathons</a></nav>\n{body}\n</body></html>"
+        )
+
+    def listing_page(self) -> str:
+        """The hackathon search results page."""
+        items = []
+        for key, hackathon in self.hackathons.items():
+            projects = hackathon.get("projects") or []
+            items.append(
+                f'<div class="challenge-listing"><a href="/h/{key}/">'
+                f'<h3>{html.escape(hackathon.get("name") or key)}</h3></a>'
+                f'<p class="challenge-description">{html.escape(hackathon.get("description") or "")}</p>'
+                f'<span class="submissions">{len(projects)} participants</span>'
+                f'<span class="prizes">${1000 * (1 + len(hackathon.get("prizes") or []))} in prizes</span></div>'
+            )
+        return self._layout("Hackathons", f'<div class="challenge-results">{"".join(items)}</div>')
+
+    def landing_page(self, key: str) -> Optional[str]:
+        """A hackathon's landing page, linking to its gallery."""
+        hackathon = self.hackathons.get(key)
+        if hackathon is None:
+            return None
+        return self._layout(hackathon.get("name") or key, (
+            f'<header class="challenge-header"><h1>{html.escape(hackathon.get("name") or key)}</h1></header>'
+            f'<div class="challenge-description">{html.escape(hackathon.get("description") or "")}</div>'
+            f'<a href="/h/{key}/project-gallery">Project Gallery</a>'
+        ))
+
+    def gallery_page(self, key: str, page: int) -> Optional[str]:
+        """One page of a hackathon's project gallery, with pagination links."""
+        hackathon = self.hackathons.get(key)
+        if hackathon is None:
+            return None
+        projects = hackathon.get("projects") or []
+        pages = max(1, -(-len(projects) // self.page_size))
+        page = min(max(page, 1), pages)
+        cards = []
+        for project in projects[(page - 1) * self.page_size:page * self.page_size]:
+            badge = '<aside class="entry-badge"><img class="winner label" alt="Winner"></aside>' if project.get("awards") else ""
+            image = html.escape(project.get("image_url") or f"/static/{_slug(project['devpost_url'])}.png")
+            cards.append(
+                f'<div class="gallery-item">'
+                f'<a class="block-wrapper-link fade link-to-software" href="/software/{_slug(project["devpost_url"])}">'
+                f'<div class="software-entry-name entry-body"><h5>{html.escape(project["name"])}</h5>'
+                f'<p class="small tagline">{html.escape((project.get("description") or "")[:140])}</p></div>'
+                f'<img class="software_thumbnail_image" src="{image}" alt="">'
+                f'{badge}'
+                f'<div class="entry-footer"><span class="count like-count">{project.get("vote_count") or 0}</span>'
+                f'<span class="count comment-count">{project.get("comment_count") or 0}</span></div>'
+                f'</a></div>'
+            )
+        pagination = []
+        if page > 1:
+            pagination.append(f'<a rel="prev" href="/h/{key}/project-gallery?page={page - 1}">Previous</a>')
+        if page < pages:
+            pagination.append(f'<a rel="next" class="next_page" href="/h/{key}/project-gallery?page={page + 1}">Next</a>')
+        return self._layout(f"{hackathon.get('name') or key} - Project Gallery", (
+            f'<header class="challenge-header"><h1>{html.escape(hackathon.get("name") or key)}</h1></header>'
+            f'<div class="challenge-description">{html.escape(hackathon.get("description") or "")}</div>'
+            f'<div id="submission-gallery">{"".join(cards)}</div>'
+            f'<div class="pagination">{"".join(pagination)}</div>'
+        ))
+
+    def project_page(self, slug: str) -> Optional[str]:
+        """A ``/software/`` project page."""
+        project = self.projects.get(slug)
+        if project is None:
+            return None
+        # Stored descriptions may carry an appended LLM summary; serve the scraped part
+        description = (project.get("description") or "").split("\n\n---\n\n", 1)[0]
+        paragraphs = "".join(f"<p>{html.escape(text)}</p>" for text in description.split("\n") if text.strip())
+        # Story sections (what LLMAnalyzer.extract_project_sections reads) come from a stored analysis
+        sections = (project.get("analysis") or {}).get("sections") or {}
+        paragraphs += "".join(
+            f"<h2>{html.escape(heading, quote=False)}</h2>\n<p>{html.escape(sections[name])}</p>"
+            for heading, name in SECTION_HEADINGS if sections.get(name)
+        )
+        tags = "".join(f'<li><a class="cp-tag" href="/software/built-with/{html.escape(tag)}">{html.escape(tag)}</a></li>' for tag in project.get("tags") or [])
+        members = "".join(
+            f'<li class="user-profile"><a href="{html.escape(member.get("profile_url") or "#")}">'
+            f'<h4>{html.escape(member["name"])}</h4></a></li>'
+            for member in project.get("members") or []
+        )
+        awards = "".join(
+            f'<div class="software-winner">{html.escape(award["name"])}</div>'
+            for award in project.get("awards") or []
+        )
+        link = project.get("project_url")
+        links = f'<div id="app-links"><a href="{html.escape(link)}">{html.escape(link)}</a></div>' if link else ""
+        return self._layout(project["name"], (
+            f'<div class="software-header"><h1 id="app-title">{html.escape(project["name"])}</h1></div>'
+            f'<div id="app-details-left"><div class="app-details-left">{paragraphs}</div>'
+            f'<div id="built-with"><ul>{tags}</ul></div>{links}</div>'
+            f'{awards}'
+            f'<section id="app-team"><ul>{members}</ul></section>'
+        ))
+
+    def render(self, path: str, query: Dict[str, List[str]]) -> Tuple[int, str]:
+        """Route a request path to a page."""
+        parts = [part for part in path.split("/") if part]
+        body = None
+        if parts == ["hackathons"]:
+            body = self.listing_page()
+        elif len(parts) == 2 and parts[0] == "h":
+            body = self.landing_page(parts[1])
+        elif len(parts) == 3 and parts[0] == "h" and parts[2] == "project-gallery":
+            try:
+                page = int(query.get("page", ["1"])[0])
+            except ValueError:
+                page = 1
+            body = self.gallery_page(parts[1], page)
+        elif len(parts) == 2 and parts[0] == "software":
+            body = self.project_page(parts[1])
+        if body is None:
+            return 404, self._layout("Not Found", "<h1>Not Found</h1>")
+        return 200, body
+
+
+class FixtureRequestHandler(BaseHTTPRequestHandler):
+    """Serves FixtureSite pages with the server's fault injection."""
+
+    server: "FixtureHTTPServer"
+
+    def log_message(self, format: str, *args: Any) -> None:
+        if self.server.verbose:
+            super().log_message(format, *args)
+
+    def do_GET(self) -> None:
+        parsed = urlparse(self.path)
+        if parsed.path == "/health":
+            self._send(200, "ok", "text/plain")
+            return
+
+        faults = self.server.faults
+        delay_ms, fault, slow = self.server.roll()
+        if delay_ms > 0:
+            time.sleep(delay_ms / 1000)
+
+        if fault == 429:
+            self.server.count("rate_limited")
+            self._send(429, "Too Many Requests", "text/plain", {"Retry-After": str(faults.retry_after_s)})
+            return
+        if fault:
+            self.server.count("server_errors")
+            self._send(fault, "Server Error", "text/plain")
+            return
+
+        status, body = self.server.site.render(parsed.path, parse_qs(parsed.query))
+        self.server.count("ok" if status == 200 else "not_found")
+        self._send(status, body, "text/html; charset=utf-8", slow=slow)
+
+    def _send(
+        self,
+        status: int,
+        body: str,
+        content_type: str,
+        headers: Optional[Dict[str, str]] = None,
+        slow: bool = False
+    ) -> None:
+        data = body.encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(data)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        try:
+            if not slow:
+                self.wfile.write(data)
+                return
+            faults = self.server.faults
+            for start in range(0, len(data), faults.chunk_size):
+                self.wfile.write(data[start:start + faults.chunk_size])
+                self.wfile.flush()
+                time.sleep(faults.chunk_delay_ms / 1000)
+        except (BrokenPipeError, ConnectionResetError):
+            pass
+
+
+class FixtureHTTPServer(ThreadingHTTPServer):
+    """Threaded HTTP server holding the site, fault settings and request counters."""
+
+    daemon_threads = True
+
+    def __init__(self, address: Tuple[str, int], site: FixtureSite, faults: FaultConfig, seed: Optional[int] = None, verbose: bool = False):
+        super().__init__(address, FixtureRequestHandler)
+        self.site = site
+        self.faults = faults
+        self.verbose = verbose
+        self.counts: Dict[str, int] = {}
+        self._rng = random.Random(seed)
+        self._lock = threading.Lock()
+
+    @property
+    def base_url(self) -> str:
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def roll(self) -> Tuple[float, Optional[int], bool]:
+        """Draw the delay (ms), fault status (None for none) and slow-body flag of a request."""
+        faults = self.faults
+        with self._lock:
+            delay = faults.latency_ms + self._rng.uniform(-faults.jitter_ms, faults.jitter_ms)
+            roll = self._rng.random()
+            fault = None
+            if roll < faults.rate_limit_rate:
+                fault = 429
+            elif roll < faults.rate_limit_rate + faults.error_rate:
+                fault = self._rng.choice(SERVER_ERROR_CODES)
+            slow = self._rng.random() < faults.slow_body_rate
+        return max(0.0, delay), fault, slow
+
+    def count(self, outcome: str) -> None:
+        with self._lock:
+            self.counts[outcome] = self.counts.get(outcome, 0) + 1
+
+
+class DevpostFixtureServer:
+    """
+    Run the fixture server on a background thread::
+
+        with DevpostFixtureServer(FixtureSite.synthetic(1000), FaultConfig(latency_ms=100)) as server:
+            scraper = DevpostScraper(base_url=server.base_url)
+    """
+
+    def __init__(
+        self,
+        site: FixtureSite,
+        faults: Optional[FaultConfig] = None,
+        host: str = "127.0.0.1",
+        port: int = 0,
+        seed: Optional[int] = None,
+        verbose: bool = False
+    ):
+        self.httpd = FixtureHTTPServer((host, port), site, faults or FaultConfig(), seed=seed, verbose=verbose)
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def base_url(self) -> str:
+        return self.httpd.base_url
+
+    @property
+    def counts(self) -> Dict[str, int]:
+        return dict(self.httpd.counts)
+
+    def start(self) -> "DevpostFixtureServer":
+        self._thread = threading.Thread(target=self.httpd.serve_forever, name="devpost-fixture", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self.httpd.shutdown()
+        self.httpd.server_close()
+        if self._thread is not None:
+            self._thread.join()
+
+    def __enter__(self) -> "DevpostFixtureServer":
+        return self.start()
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.stop()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    source = parser.add_mutually_exclusive_group()
+    source.add_argument("--data-dir", type=Path, default=Path("src/data/raw"), help="Raw results to serve (default: src/data/raw)")
+    source.add_argument("--synthetic", type=int, default=None, metavar="PROJECTS", help="Serve synthetic hackathons with this many projects")
+    parser.add_argument("--hackathons", type=int, default=1, help="Number of synthetic hackathons")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8800)
+    parser.add_argument("--page-size", type=int, default=DEFAULT_PAGE_SIZE, help="Projects per gallery page")
+    parser.add_argument("--latency", type=float, default=0.0, help="Base response delay in ms")
+    parser.add_argument("--jitter", type=float, default=0.0, help="Uniform +/- jitter on the delay in ms")
+    parser.add_argument("--rate-limit-rate", type=float, default=0.0, help="Fraction of requests answered 429")
+    parser.add_argument("--retry-after", type=int, default=1, help="Retry-After seconds sent with 429")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="Fraction of requests answered 500/502/503")
+    parser.add_argument("--slow-body-rate", type=float, default=0.0, help="Fraction of responses streamed slowly")
+    parser.add_argument("--chunk-size", type=int, default=4096, help="Slow body chunk size in bytes")
+    parser.add_argument("--chunk-delay", type=float, default=50.0, help="Delay between slow body chunks in ms")
+    parser.add_argument("--seed", type=int, default=None, help="Seed for reproducible faults")
+    parser.add_argument("--verbose", action="store_true", help="Log every request")
+    args = parser.parse_args()
+
+    if args.synthetic is not None:
+        site = FixtureSite.synthetic(args.synthetic, args.hackathons, args.page_size)
+    else:
+        site = FixtureSite.from_data_dir(args.data_dir, args.page_size)
+
+    faults = FaultConfig(
+        latency_ms=args.latency,
+        jitter_ms=args.jitter,
+        rate_limit_rate=args.rate_limit_rate,
+        retry_after_s=args.retry_after,
+        error_rate=args.error_rate,
+        slow_body_rate=args.slow_body_rate,
+        chunk_size=args.chunk_size,
+        chunk_delay_ms=args.chunk_delay,
+    )
+    httpd = FixtureHTTPServer((args.host, args.port), site, faults, seed=args.seed, verbose=args.verbose)
+    print(f"Serving {len(site.hackathons)} hackathons / {len(site.projects)} projects at {httpd.base_url}")
+    for key in site.hackathons:
+        print(f"  {httpd.base_url}/h/{key}/project-gallery")
+    try:
+        httpd.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        httpd.server_close()
+        print(f"Requests: {httpd.counts}")
+
+
+if __name__ == "__main__":
+    main()
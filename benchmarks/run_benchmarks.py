@@ -0,0 +1,202 @@
+#!/usr/bin/env python3
+"""
+Benchmark extraction, analytics, rendering and serialization on synthetic corpora.
+
+Each case runs on synthetic hackathons of every requested size (10 to 100k
+projects by default) and reports the best and mean of several runs. The
+results, together with the git commit, are written to a JSON file, and
+--compare checks them against an earlier results file.
+
+Cases:
+    extract_sections   LLMAnalyzer.extract_project_sections on project pages
+                       (at most --max-pages pages per size)
+    analyze_trends     IdeaGenerator.analyze_trends
+    analyze_hackathon  MarkdownReportGenerator._analyze_hackathon_data
+    render_report      MarkdownReportGenerator.generate_report (full render + write)
+    validate_strict    parse_scraping_result, strict mode
+    validate_trusted   parse_scraping_result, trusted mode
+    save_result        storage.serialization.save_result (compact JSON)
+
+Usage:
+    python benchmarks/run_benchmarks.py [--sizes 10,1000,100000] [--cases render_report,save_result]
+    python benchmarks/run_benchmarks.py --compare benchmarks/results/<earlier>.json
+"""
+import argparse
+import json
+import logging
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT / "src"))
+
+# Keep the analyzers offline: an empty key disables Gemini (load_dotenv does not override it)
+os.environ["GOOGLE_API_KEY"] = ""
+
+from analyzer.idea_generator import IdeaGenerator  # noqa: E402
+from analyzer.llm_analyzer import LLMAnalyzer  # noqa: E402
+from models.validation import ValidationMode, parse_scraping_result  # noqa: E402
+from report.markdown_generator import MarkdownReportGenerator  # noqa: E402
+from storage.serialization import save_result  # noqa: E402
+from synthetic import make_project_pages, make_result_json  # noqa: E402
+
+DEFAULT_SIZES = [10, 100, 1_000, 10_000, 100_000]
+RESULTS_DIR = ROOT / "benchmarks" / "results"
+RESULTS_VERSION = 1
+
+
+def git_commit() -> Optional[str]:
+    """Return the current commit (with a -dirty suffix for local changes), or None outside git."""
+    try:
+        commit = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], cwd=ROOT, capture_output=True, text=True, check=True
+        ).stdout.strip()
+        dirty = subprocess.run(
+            ["git", "status", "--porcelain", "--untracked-files=no"], cwd=ROOT, capture_output=True, text=True
+        ).stdout.strip()
+        return f"{commit}-dirty" if dirty else commit
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def measure(func: Callable[[], Any], repeat: int) -> Dict[str, float]:
+    """Run ``func`` ``repeat`` times and return the best and mean wall time."""
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - start)
+    return {'best_s': min(timings), 'mean_s': statistics.fmean(timings)}
+
+
+def build_cases(size: int, workdir: Path, max_pages: int) -> Dict[str, Tuple[int, Callable[[], Any]]]:
+    """
+    Prepare the inputs of every case for one corpus size.
+
+    Returns:
+        Mapping of case name to (number of items processed, callable)
+    """
+    raw = make_result_json(size)
+    result = parse_scraping_result(raw, ValidationMode.TRUSTED)
+    hackathon = result.hackathon
+    pages = make_project_pages(min(size, max_pages))
+
+    analyzer = LLMAnalyzer()
+    ideas = IdeaGenerator()
+    generator = MarkdownReportGenerator(fragment_cache_dir=workdir / "fragments")
+
+    def extract_sections():
+        for page in pages:
+            analyzer.extract_project_sections(page)
+
+    return {
+        'extract_sections': (len(pages), extract_sections),
+        'analyze_trends': (size, lambda: ideas.analyze_trends(hackathon)),
+        'analyze_hackathon': (size, lambda: generator._analyze_hackathon_data(hackathon)),
+        'render_report': (size, lambda: generator.generate_report(hackathon, workdir / "report.md")),
+        'validate_strict': (size, lambda: parse_scraping_result(raw, ValidationMode.STRICT)),
+        'validate_trusted': (size, lambda: parse_scraping_result(raw, ValidationMode.TRUSTED)),
+        'save_result': (size, lambda: save_result(result, workdir / "result.json")),
+    }
+
+
+def run(sizes: List[int], cases: Optional[List[str]], repeat: int, max_pages: int) -> List[Dict[str, Any]]:
+    """Run the selected cases for every size and print one line per measurement."""
+    records = []
+    with tempfile.TemporaryDirectory() as tmp:
+        workdir = Path(tmp)
+        for size in sizes:
+            for name, (items, func) in build_cases(size, workdir, max_pages).items():
+                if cases and name not in cases:
+                    continue
+                timing = measure(func, repeat)
+                record = {
+                    'case': name,
+                    'size': size,
+                    'items': items,
+                    **timing,
+                    'per_item_us': timing['best_s'] / items * 1e6 if items else None,
+                }
+                records.append(record)
+                print(
+                    f"{name:<18} {size:>7} {record['best_s']:>9.4f}s best {record['mean_s']:>9.4f}s mean "
+                    f"{record['per_item_us'] or 0:>9.1f} us/item"
+                )
+    return records
+
+
+def compare(records: List[Dict[str, Any]], baseline_path: Path, threshold: float) -> int:
+    """
+    Print the speed ratio of each measurement against a baseline results file.
+
+    Returns:
+        Number of regressions (slower than the baseline by more than ``threshold``)
+    """
+    baseline = json.loads(baseline_path.read_text(encoding="utf-8"))
+    previous = {(record['case'], record['size']): record for record in baseline['results']}
+    print(f"\nCompared with {baseline_path} ({baseline.get('commit')})")
+
+    regressions = 0
+    for record in records:
+        old = previous.get((record['case'], record['size']))
+        if not old:
+            continue
+        ratio = record['best_s'] / old['best_s'] if old['best_s'] else float('inf')
+        regressed = ratio > threshold
+        regressions += regressed
+        status = "SLOWER" if regressed else "ok    "
+        print(f"{status} {record['case']:<18} {record['size']:>7} {old['best_s']:>9.4f}s -> {record['best_s']:>9.4f}s ({ratio:.2f}x)")
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument(
+        "--sizes",
+        default=",".join(str(size) for size in DEFAULT_SIZES),
+        help="Comma-separated corpus sizes in projects"
+    )
+    parser.add_argument("--cases", default=None, help="Comma-separated case names (default: all)")
+    parser.add_argument("--repeat", type=int, default=3, help="Runs per measurement")
+    parser.add_argument("--max-pages", type=int, default=2_000, help="Project pages per size for extract_sections")
+    parser.add_argument("--output", type=Path, default=None, help="Results file (default: benchmarks/results/<time>_<commit>.json)")
+    parser.add_argument("--compare", type=Path, default=None, help="Earlier results file to compare against")
+    parser.add_argument("--threshold", type=float, default=1.25, help="Slowdown ratio counted as a regression")
+    args = parser.parse_args()
+
+    # Per-call log lines ("Generated report", "No Google API key") would dominate the output
+    logging.basicConfig(level=logging.ERROR)
+
+    sizes = [int(size) for size in args.sizes.split(",") if size]
+    cases = args.cases.split(",") if args.cases else None
+    commit = git_commit()
+
+    records = run(sizes, cases, args.repeat, args.max_pages)
+
+    output = args.output or RESULTS_DIR / f"{datetime.now().strftime('%Y%m%d_%H%M%S')}_{commit or 'nogit'}.json"
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text(json.dumps({
+        'version': RESULTS_VERSION,
+        'commit': commit,
+        'created_at': datetime.now().isoformat(),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'repeat': args.repeat,
+        'results': records,
+    }, indent=2), encoding="utf-8")
+    print(f"\nResults written to {output}")
+
+    if args.compare:
+        sys.exit(1 if compare(records, args.compare, args.threshold) else 0)
+
+
+if __name__ == "__main__":
+    main()
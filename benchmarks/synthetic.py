@@ -0,0 +1,130 @@
+"""
+Synthetic Devpost data for benchmarks.
+
+Everything is generated from a seeded RNG, so a given size always produces
+the same data and timings are comparable between commits.
+"""
+import json
+import random
+from typing import Any, Dict, List
+
+TAGS = [
+    "python", "javascript", "typescript", "react", "next.js", "node.js", "flask", "fastapi",
+    "gemini", "openai", "langchain", "llama", "pytorch", "tensorflow", "firebase", "supabase",
+    "postgresql", "mongodb", "aws", "gcp", "docker", "tailwind", "swift", "kotlin",
+]
+AWARDS = ["Best AI Hack", "Best Use of Gemini", "1st Place", "2nd Place", "Best Design", "Sponsor Prize"]
+WORDS = (
+    "we built an assistant that helps students doctors and developers use retrieval augmented "
+    "generation voice agents computer vision and realtime collaboration to solve everyday problems"
+).split()
+
+SECTION_HEADINGS = [
+    ("Inspiration", "inspiration"),
+    ("What it does", "what_it_does"),
+    ("How we built it", "how_built"),
+    ("Challenges we ran into", "challenges"),
+    ("Accomplishments that we're proud of", "accomplishments"),
+    ("What we learned", "learned"),
+]
+
+SCRAPED_AT = "2025-06-23 23:16:23.123456"
+
+
+def _sentence(rng: random.Random, words: int) -> str:
+    return " ".join(rng.choice(WORDS) for _ in range(words)).capitalize() + "."
+
+
+def make_project_dict(i: int, rng: random.Random) -> Dict[str, Any]:
+    """Build one project dict shaped like save_result output."""
+    won = rng.random() < 0.05
+    return {
+        "name": f"Project {i}",
+        "description": " ".join(_sentence(rng, 12) for _ in range(4)),
+        "devpost_url": f"https://devpost.com/software/project-{i}",
+        "project_url": f"https://github.com/example/project-{i}",
+        "tags": rng.sample(TAGS, rng.randint(2, 6)),
+        "awards": [
+            {"name": rng.choice(AWARDS), "category": None, "sponsor": None, "prize_value": None}
+        ] if won else [],
+        "members": [
+            {"name": f"Member {i}-{j}", "profile_url": f"https://devpost.com/member-{i}-{j}", "role": None}
+            for j in range(rng.randint(1, 4))
+        ],
+        "submission_date": None,
+        "image_url": None,
+        "vote_count": rng.randint(0, 200),
+        "comment_count": rng.randint(0, 20),
+        "analysis": None,
+    }
+
+
+def make_result_dict(num_projects: int, seed: int = 0) -> Dict[str, Any]:
+    """Build a synthetic successful ScrapingResult dict with ``num_projects`` projects."""
+    rng = random.Random(seed)
+    url = "https://example.devpost.com/project-gallery"
+    return {
+        "success": True,
+        "url": url,
+        "hackathon": {
+            "name": "Synthetic Hackathon",
+            "description": None,
+            "devpost_url": url,
+            "start_date": None,
+            "end_date": None,
+            "theme": None,
+            "prizes": [],
+            "sponsors": [],
+            "participant_count": None,
+            "submission_count": None,
+            "projects": [make_project_dict(i, rng) for i in range(num_projects)],
+            "scraped_at": SCRAPED_AT,
+        },
+        "error_message": None,
+        "scraped_at": SCRAPED_AT,
+    }
+
+
+def make_result_json(num_projects: int, seed: int = 0) -> bytes:
+    """Build a synthetic ScrapingResult as JSON bytes."""
+    return json.dumps(make_result_dict(num_projects, seed)).encode("utf-8")
+
+
+def make_project_html(i: int, rng: random.Random) -> str:
+    """
+    Build a Devpost project page: header, navigation, the story sections
+    that LLMAnalyzer.extract_project_sections looks for, tags and team.
+    """
+    sections = "\n".join(
+        f'<h2>{heading}</h2>\n<p>{" ".join(_sentence(rng, 15) for _ in range(rng.randint(2, 6)))}</p>'
+        for heading, _ in SECTION_HEADINGS
+    )
+    tags = "".join(f'<li><a class="cp-tag" href="/software/built-with/{tag}">{tag}</a></li>' for tag in rng.sample(TAGS, 4))
+    team = "".join(
+        f'<li class="software-team-member"><a class="user-profile-link" href="/member-{i}-{j}">Member {j}</a></li>'
+        for j in range(3)
+    )
+    nav = "".join(f'<li><a href="/nav/{n}">Link {n}</a></li>' for n in range(40))
+    return f"""<!DOCTYPE html>
+<html><head><title>Project {i} | Devpost</title>
+<script>window.__data = {{"id": {i}, "flags": [1, 2, 3]}};</script></head>
+<body>
+<nav><ul>{nav}</ul></nav>
+<header class="software-header"><h1 id="app-title">Project {i}</h1></header>
+<div id="app-details-left">
+<div class="app-details-left">
+{sections}
+<h2>What's next for Project {i}</h2>
+<p>{_sentence(rng, 20)}</p>
+</div>
+<div id="built-with"><ul>{tags}</ul></div>
+</div>
+<section id="app-team"><ul>{team}</ul></section>
+<footer>{_sentence(rng, 30)}</footer>
+</body></html>"""
+
+
+def make_project_pages(count: int, seed: int = 0) -> List[str]:
+    """Build ``count`` synthetic project pages."""
+    rng = random.Random(seed)
+    return [make_project_html(i, rng) for i in range(count)]
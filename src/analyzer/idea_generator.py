@@ -7,10 +7,11 @@ import json
 from typing import List, Dict, Any, Optional
 from collections import Counter
 
-import google.generativeai as genai
 from dotenv import load_dotenv
 
 from models.hackathon import Hackathon, Project
+from utils import lazy, metrics
+from utils.profiling import profiled, span
 
 # Load environment variables
 load_dotenv()
@@ -36,6 +37,7 @@ class IdeaGenerator:
             return
             
         try:
+            genai = lazy.gemini()
             genai.configure(api_key=self.api_key)
             self.model = genai.GenerativeModel('gemini-2.5-flash')
             self.enabled = True
@@ -44,6 +46,7 @@ class IdeaGenerator:
             logger.error(f"Failed to initialize idea generator: {e}")
             self.enabled = False
     
+    @profiled("ideas.analyze_trends")
     def analyze_trends(self, hackathon: Hackathon) -> Dict[str, Any]:
         """
         Analyze trends from hackathon projects.
@@ -110,6 +113,7 @@ class IdeaGenerator:
             'unique_technologies': len(tech_counter)
         }
     
+    @profiled("ideas.generate")
     def generate_ideas(self, hackathon: Hackathon, num_ideas: int = 5) -> List[Dict[str, Any]]:
         """
         Generate MVP ideas based on hackathon trends.
@@ -186,7 +190,8 @@ Only return valid JSON, no additional text.
 """
             
             # Generate ideas
-            response = self.model.generate_content(prompt)
+            with span("ideas.llm_generate"), metrics.llm_call("ideas") as call:
+                response = call.response = self.model.generate_content(prompt)
             
             if response and response.text:
                 # Parse response
@@ -208,6 +213,7 @@ Only return valid JSON, no additional text.
             
         except Exception as e:
             logger.error(f"Error generating ideas: {e}")
+            metrics.inc("failures_total", stage="idea_generation")
             return []
     
     def format_ideas_markdown(self, ideas: List[Dict[str, Any]]) -> str:
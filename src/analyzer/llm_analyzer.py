@@ -6,9 +6,11 @@ import os
 import re
 from typing import Optional, Dict, Any
 
-import google.generativeai as genai
 from dotenv import load_dotenv
 
+from utils import lazy, metrics
+from utils.profiling import profiled, span
+
 # from models.hackathon import Project  # Currently unused
 
 # Load environment variables
@@ -35,6 +37,7 @@ class LLMAnalyzer:
             return
             
         try:
+            genai = lazy.gemini()
             genai.configure(api_key=self.api_key)
             # Use the correct model name for Gemini
             self.model = genai.GenerativeModel('gemini-2.5-flash')
@@ -44,6 +47,7 @@ class LLMAnalyzer:
             logger.error(f"Failed to initialize LLM analyzer: {e}")
             self.enabled = False
     
+    @profiled("llm.extract_sections")
     def extract_project_sections(self, html_content: str) -> Dict[str, str]:
         """
         Extract project sections from HTML content.
@@ -77,6 +81,7 @@ class LLMAnalyzer:
         
         return sections
     
+    @profiled("llm.analyze_project")
     async def analyze_project_content(self, html_content: str, project_name: str) -> Dict[str, Any]:
         """
         Analyze project content using LLM.
@@ -171,7 +176,8 @@ Provide a thorough, insightful analysis. Only return valid JSON, no additional t
 """
             
             # Generate analysis
-            response = self.model.generate_content(prompt)
+            with span("llm.generate"), metrics.llm_call("analyzer") as call:
+                response = call.response = self.model.generate_content(prompt)
             
             if response and response.text:
                 # Clean up response text
@@ -228,6 +234,7 @@ Provide a thorough, insightful analysis. Only return valid JSON, no additional t
                 
         except Exception as e:
             logger.error(f"Error analyzing project {project_name}: {e}")
+            metrics.inc("failures_total", stage="llm_analysis")
             return {}
     
     def create_enhanced_description(self, analysis: Dict[str, Any]) -> str:
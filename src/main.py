@@ -4,45 +4,73 @@ Hackathon Insight Automator - Main CLI interface.
 
 Usage:
     python src/main.py <devpost_url> [options]
+    python src/main.py report <result files or dirs> [options]
+    python src/main.py search <query> [options]
+
+Heavy dependencies (Playwright, the Gemini SDK, jinja2 and most of rich)
+are imported inside the code paths that use them, so ``--help``, argument
+errors and searches start quickly. benchmarks/check_import_time.py keeps
+this in check.
 """
 import argparse
-import asyncio
 import logging
 import os
+import sqlite3
 import sys
+import time
+from contextlib import contextmanager
 from datetime import datetime
 from pathlib import Path
-from typing import Optional
+from typing import TYPE_CHECKING, List, Optional
 
-from rich.console import Console
-from rich.logging import RichHandler
-from rich.progress import Progress, SpinnerColumn, TextColumn
-from rich.table import Table
 from dotenv import load_dotenv
 
-from scraper.devpost_scraper import DevpostScraper
-from scraper.hackathon_search import HackathonSearcher, LLMHackathonSelector
-from report.markdown_generator import MarkdownReportGenerator
-from models.hackathon import ScrapingResult
+from storage.compression import COMPRESSION_SUFFIXES, with_compression_suffix
+
+if TYPE_CHECKING:
+    from rich.console import Console
+    from models.hackathon import ScrapingResult
+    from scraper.devpost_scraper import DevpostScraper
 
 # Load environment variables
 load_dotenv()
 
-console = Console()
+_console: Optional["Console"] = None
+
+
+def get_console() -> "Console":
+    """Return the shared rich console, creating it on first use."""
+    global _console
+    if _console is None:
+        from rich.console import Console
+        _console = Console()
+    return _console
+
+
+class _LazyConsole:
+    """Stand-in for the shared console that only imports rich when used."""
+    
+    def __getattr__(self, name: str):
+        return getattr(get_console(), name)
+
+
+console = _LazyConsole()
 
 
 def setup_logging(level: str = "INFO") -> None:
     """Setup logging configuration."""
+    from rich.logging import RichHandler
+    
     logging.basicConfig(
         level=getattr(logging, level.upper()),
         format="%(message)s",
         datefmt="[%X]",
-        handlers=[RichHandler(console=console, rich_tracebacks=True)]
+        handlers=[RichHandler(console=get_console(), rich_tracebacks=True)]
     )
 
 
-def create_output_filename(url: str, base_dir: Path) -> Path:
-    """Create output filename based on URL and timestamp."""
+def create_output_filename(url: str, base_dir: Path, compression: Optional[str] = None) -> Path:
+    """Create output filename based on URL, timestamp and compression."""
     timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
     
     # Extract domain and path for filename
@@ -51,7 +79,7 @@ def create_output_filename(url: str, base_dir: Path) -> Path:
     else:
         filename = f"hackathon_{timestamp}"
     
-    return base_dir / f"{filename}.json"
+    return with_compression_suffix(base_dir / f"{filename}.json", compression)
 
 
 def create_report_filename(hackathon_name: str, reports_dir: Path) -> Path:
@@ -62,7 +90,132 @@ def create_report_filename(hackathon_name: str, reports_dir: Path) -> Path:
     return reports_dir / f"{safe_name}_{timestamp}.md"
 
 
-async def search_and_select_hackathon(scraper: DevpostScraper, auto_select: bool = False) -> Optional[str]:
+def add_profile_arguments(parser: argparse.ArgumentParser) -> None:
+    """Add the --profile options shared by the scrape and report commands."""
+    parser.add_argument(
+        "--profile",
+        action="store_true",
+        help="Print a per-stage timing breakdown and write a Chrome trace (open in chrome://tracing or Perfetto)"
+    )
+    parser.add_argument(
+        "--profile-dir",
+        type=Path,
+        default=Path("profiles"),
+        help="Directory for profiling output (default: profiles)"
+    )
+    parser.add_argument(
+        "--cprofile",
+        action="store_true",
+        help="With --profile, also write a cProfile dump (inspect with pstats or snakeviz)"
+    )
+
+
+@contextmanager
+def profile_session(args: argparse.Namespace, name: str):
+    """
+    Record spans (and optionally cProfile) for the enclosed run when --profile is set.
+    
+    On exit, prints the stage breakdown and writes ``trace_<timestamp>.json``
+    (plus ``<name>_<timestamp>.prof`` with --cprofile) to the profile directory.
+    
+    Args:
+        args: Parsed arguments with the options of add_profile_arguments
+        name: Name of the top-level span and the cProfile dump
+    """
+    if not args.profile:
+        yield
+        return
+    
+    from utils import profiling
+    
+    profiler = profiling.enable()
+    cprofiler = None
+    if args.cprofile:
+        import cProfile
+        cprofiler = cProfile.Profile()
+        cprofiler.enable()
+    
+    try:
+        with profiling.span(f"cli.{name}"):
+            yield
+    finally:
+        if cprofiler is not None:
+            cprofiler.disable()
+        profiling.disable()
+        
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        console.print("\n[bold]Stage timings[/bold]")
+        console.print(profiler.format_stage_stats(), markup=False, highlight=False)
+        try:
+            trace_path = profiler.write_chrome_trace(args.profile_dir / f"trace_{name}_{timestamp}.json")
+            console.print(f"Chrome trace: {trace_path}")
+            if cprofiler is not None:
+                prof_path = args.profile_dir / f"{name}_{timestamp}.prof"
+                cprofiler.dump_stats(str(prof_path))
+                console.print(f"cProfile dump: {prof_path}")
+        except OSError as e:
+            console.print(f"[red]Failed to write profiling output:[/red] {e}")
+
+
+def add_metrics_arguments(parser: argparse.ArgumentParser) -> None:
+    """Add the --metrics options shared by the scrape and report commands."""
+    parser.add_argument(
+        "--metrics",
+        action="store_true",
+        help="Write a JSON run summary and a Prometheus textfile with throughput, latency and failure metrics"
+    )
+    parser.add_argument(
+        "--metrics-textfile",
+        type=Path,
+        default=Path(os.environ["METRICS_TEXTFILE"]) if os.getenv("METRICS_TEXTFILE") else None,
+        help="Prometheus textfile-collector output (default: METRICS_TEXTFILE or <data dir>/metrics/<command>.prom)"
+    )
+
+
+@contextmanager
+def metrics_session(args: argparse.Namespace, job: str, data_dir: Path):
+    """
+    Collect metrics for the enclosed run when --metrics is set.
+    
+    The run counts as successful unless it raises or exits with a non-zero
+    status. On exit, ``<data_dir>/metrics/<job>_<timestamp>.json`` and the
+    Prometheus textfile are written.
+    
+    Args:
+        args: Parsed arguments with the options of add_metrics_arguments
+        job: Command name, used as the ``job`` label and in file names
+        data_dir: Directory the run writes its data to
+    """
+    if not args.metrics:
+        yield
+        return
+    
+    from utils import metrics
+    
+    registry = metrics.enable()
+    success = False
+    try:
+        yield
+        success = True
+    except SystemExit as e:
+        success = not e.code
+        raise
+    finally:
+        metrics.disable()
+        registry.finish(success)
+        
+        metrics_dir = data_dir / "metrics"
+        textfile = args.metrics_textfile or metrics_dir / f"{job}.prom"
+        summary_file = metrics_dir / f"{job}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
+        try:
+            registry.write_prometheus(textfile, job)
+            registry.write_summary(summary_file)
+            console.print(f"Metrics: {summary_file}, {textfile}")
+        except OSError as e:
+            console.print(f"[red]Failed to write metrics:[/red] {e}")
+
+
+async def search_and_select_hackathon(scraper: "DevpostScraper", auto_select: bool = False) -> Optional[str]:
     """
     Search for recent AI hackathons and let user select one.
     
@@ -79,7 +232,10 @@ async def search_and_select_hackathon(scraper: DevpostScraper, auto_select: bool
         if not scraper.browser:
             logger.error("Browser not available for hackathon search")
             return None
-        searcher = HackathonSearcher(scraper.browser)
+        from rich.table import Table
+        from scraper.hackathon_search import HackathonSearcher, LLMHackathonSelector
+        
+        searcher = HackathonSearcher(scraper.browser, base_url=scraper.base_url)
         
         console.print("[blue]Searching for recent AI hackathons...[/blue]")
         hackathons = await searcher.find_recent_ai_hackathons(limit=10)
@@ -194,7 +350,29 @@ async def scrape_and_analyze(
     search_mode: bool = False,
     enable_llm: bool = True,
     auto_select: bool = False,
-    generate_ideas: bool = False
+    generate_ideas: bool = False,
+    incremental: bool = False,
+    parquet_dir: Optional[Path] = None,
+    pretty_json: bool = False,
+    compression: Optional[str] = None,
+    store_path: Optional[Path] = None,
+    raw_json: bool = True,
+    base_url: Optional[str] = None,
+    capture_path: Optional[Path] = None,
+    replay_path: Optional[Path] = None,
+    browser_service: bool = False,
+    recycle_after: Optional[int] = None,
+    max_attempts: int = 3,
+    max_projects: Optional[int] = 5,
+    shards: int = 1,
+    rate_limit: Optional[float] = None,
+    work_queue_path: Optional[Path] = None,
+    queue_run: Optional[str] = None,
+    delta: bool = False,
+    gallery_only: bool = False,
+    max_pages: Optional[int] = None,
+    max_llm_calls: Optional[int] = None,
+    time_budget: Optional[float] = None
 ) -> bool:
     """
     Main function to scrape and analyze hackathon data.
@@ -209,18 +387,66 @@ async def scrape_and_analyze(
         enable_llm: Whether to enable LLM analysis for enhanced descriptions
         auto_select: Whether to use LLM to automatically select hackathon
         generate_ideas: Whether to generate AI ideas from the analysis
+        incremental: Whether to reuse unchanged report sections and AI ideas
+        parquet_dir: Root of the Parquet dataset to append this run to (optional)
+        pretty_json: Whether to indent the saved raw JSON
+        compression: Compression of the saved raw JSON ("gzip", "zstd" or None)
+        store_path: SQLite store to upsert the scraped data into (None disables it)
+        raw_json: Whether to also write the timestamped raw JSON file
+        base_url: Devpost base URL (defaults to DEVPOST_BASE_URL, then devpost.com)
+        capture_path: Capture archive to record every rendered page into (optional)
+        replay_path: Capture archive to replay pages from instead of a browser (optional)
+        browser_service: Whether to connect to the running browser service instead of launching a browser
+        recycle_after: Relaunch the browser after this many pages (None or 0 never recycles)
+        max_attempts: Attempts per project page when the browser crashes while loading it
+        max_projects: Projects to scrape per hackathon (None or 0 for all on the page)
+        shards: Worker processes the project pages of a hackathon are split across
+        rate_limit: Page loads per second across all shards (default: one per delay per shard)
+        work_queue_path: Shared work queue that project pages are scraped through (optional)
+        queue_run: Id of an interrupted work queue crawl run to resume (default: a new run)
+        delta: Whether to only fetch projects that are new or changed since the store last saw them
+        gallery_only: Whether to build project summaries from the gallery cards without loading project pages
+        max_pages: Project page loads before the crawl stops (None for no limit)
+        max_llm_calls: LLM project analyses before analysis stops (None for no limit)
+        time_budget: Minutes before the crawl stops loading project pages (None for no limit)
         
     Returns:
         True if successful, False otherwise
     """
     logger = logging.getLogger(__name__)
+    store = None
+    capture = None
+    replay = None
+    work_queue = None
     
     try:
         # Create output directories
         output_dir.mkdir(parents=True, exist_ok=True)
         reports_dir.mkdir(parents=True, exist_ok=True)
         
-        async with DevpostScraper(headless=headless, delay=delay, enable_llm=enable_llm) as scraper:
+        from rich.progress import Progress, SpinnerColumn, TextColumn
+        from scraper.devpost_scraper import DevpostScraper
+        from scraper.frontier import CrawlBudget
+        from report.markdown_generator import MarkdownReportGenerator
+        from storage.sqlite_store import ProjectStore
+        
+        if store_path:
+            store = ProjectStore(store_path)
+        if capture_path or replay_path:
+            from scraper.capture import CaptureArchive
+            capture = CaptureArchive(capture_path) if capture_path else None
+            replay = CaptureArchive(replay_path) if replay_path else None
+        if work_queue_path:
+            from storage.work_queue import WorkQueue
+            work_queue = WorkQueue(work_queue_path)
+        
+        async with DevpostScraper(
+            headless=headless, delay=delay, enable_llm=enable_llm, store=store, base_url=base_url,
+            capture=capture, replay=replay, browser_service=browser_service,
+            recycle_after=recycle_after, max_attempts=max_attempts, max_projects=max_projects,
+            work_queue=work_queue, queue_run=queue_run, delta=delta,
+            budget=CrawlBudget.create(max_pages, max_llm_calls, time_budget * 60 if time_budget else None)
+        ) as scraper:
             
             # Search mode: let user select a hackathon
             if search_mode:
@@ -237,7 +463,7 @@ async def scrape_and_analyze(
             with Progress(
                 SpinnerColumn(),
                 TextColumn("[progress.description]{task.description}"),
-                console=console
+                console=get_console()
             ) as progress:
                 
                 # Scraping phase
@@ -248,11 +474,17 @@ async def scrape_and_analyze(
                     result = await scraper.scrape_project(url)
                 else:
                     console.print(f"[blue]Scraping hackathon:[/blue] {url}")
-                    result = await scraper.scrape_hackathon(url)
+                    if gallery_only:
+                        result = await scraper.scrape_gallery_summaries(url)
+                    elif shards > 1:
+                        from scraper.sharded import scrape_hackathon_sharded
+                        result = await scrape_hackathon_sharded(scraper, url, shards, rate=rate_limit)
+                    else:
+                        result = await scraper.scrape_hackathon(url)
                 
-                # Save raw data
-                output_file = create_output_filename(url, output_dir)
-                scraper.save_result(result, output_file)
+                # Save raw data (JSON file and/or SQLite store)
+                output_file = create_output_filename(url, output_dir, compression) if raw_json else None
+                scraper.save_result(result, output_file, pretty=pretty_json)
                 
                 progress.update(scrape_task, completed=True)
             
@@ -264,13 +496,22 @@ async def scrape_and_analyze(
                 console.print("[red]No hackathon data found[/red]")
                 return False
             
+            # Columnar export phase
+            if parquet_dir:
+                from storage.columnar import export_parquet
+                written = export_parquet([result], parquet_dir)
+                console.print(f"[green]Exported {len(written)} Parquet tables to:[/green] {parquet_dir}")
+            
             # Report generation phase
             report_task = progress.add_task("Generating report...", total=None)
             
             generator = MarkdownReportGenerator()
             report_file = create_report_filename(result.hackathon.name, reports_dir)
             
-            if generator.generate_report(result.hackathon, report_file, generate_ideas=generate_ideas):
+            if generator.generate_report(
+                result.hackathon, report_file,
+                generate_ideas=generate_ideas, incremental=incremental
+            ):
                 progress.update(report_task, completed=True)
                 console.print(f"[green]Report generated:[/green] {report_file}")
                 
@@ -288,10 +529,17 @@ async def scrape_and_analyze(
     except Exception as e:
         logger.error(f"Error during scraping and analysis: {e}")
         return False
+    
+    finally:
+        for resource in (store, capture, replay, work_queue):
+            if resource is not None:
+                resource.close()
 
 
-def display_summary(result: ScrapingResult) -> None:
+def display_summary(result: "ScrapingResult") -> None:
     """Display a summary of the scraping results."""
+    from rich.table import Table
+    
     if not result.hackathon:
         return
     
@@ -330,8 +578,271 @@ def display_summary(result: ScrapingResult) -> None:
             console.print(f"{i}. {tag}: {count} project(s)")
 
 
+# Control characters marking matched words in snippets (replaced by rich markup)
+SEARCH_HIGHLIGHT = ("\x02", "\x03")
+
+
+def search_command(argv: List[str]) -> None:
+    """Full-text search over the projects in the SQLite store."""
+    parser = argparse.ArgumentParser(
+        prog="main.py search",
+        description="Search stored projects by name, description, tags, awards and LLM analysis",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+    # Winning projects mentioning both RAG and voice
+    python src/main.py search "rag voice" --winners
+
+    # FTS5 query syntax (OR, NEAR, prefix*)
+    python src/main.py search "gemini OR openai" --raw
+        """
+    )
+    parser.add_argument("query", help="Words that must all appear in a project")
+    parser.add_argument("--winners", action="store_true", help="Only show projects that won an award")
+    parser.add_argument("--limit", type=int, default=20, help="Maximum number of results (default: 20)")
+    parser.add_argument("--raw", action="store_true", help="Treat the query as an FTS5 expression")
+    parser.add_argument(
+        "--store",
+        type=Path,
+        default=None,
+        help="SQLite store to search (default: STORE_PATH or data/hackathons.db)"
+    )
+    parser.add_argument(
+        "--reindex",
+        action="store_true",
+        help="Rebuild the search index from the stored projects first"
+    )
+    args = parser.parse_args(argv)
+    
+    from rich.markup import escape
+    from storage.sqlite_store import ProjectStore, get_store_path
+    
+    args.store = get_store_path(args.store)
+    if not args.store.exists():
+        console.print(f"[red]Error:[/red] Store not found: {args.store}")
+        sys.exit(1)
+    
+    with ProjectStore(args.store) as store:
+        if args.reindex:
+            console.print(f"Indexed {store.rebuild_search_index()} projects")
+        
+        start = time.perf_counter()
+        try:
+            hits = store.search(
+                args.query, limit=args.limit, winners_only=args.winners,
+                raw_query=args.raw, highlight=SEARCH_HIGHLIGHT
+            )
+        except sqlite3.OperationalError as e:
+            console.print(f"[red]Invalid search query:[/red] {e}")
+            sys.exit(1)
+        elapsed_ms = (time.perf_counter() - start) * 1000
+    
+    if not hits:
+        console.print(f"No projects match [bold]{escape(args.query)}[/bold] ({elapsed_ms:.1f} ms)")
+        return
+    
+    from rich.table import Table
+    
+    table = Table(title=f"Search: {escape(args.query)}", show_lines=True)
+    table.add_column("#", justify="right")
+    table.add_column("Project", style="cyan")
+    table.add_column("Hackathon")
+    table.add_column("Awards", style="green")
+    table.add_column("Match")
+    
+    for rank, hit in enumerate(hits, 1):
+        table.add_row(
+            str(rank),
+            f"{escape(hit.name)}\n[dim]{escape(hit.devpost_url)}[/dim]",
+            escape(hit.event_name or ""),
+            escape(hit.awards or ""),
+            escape(hit.snippet)
+            .replace(SEARCH_HIGHLIGHT[0], "[bold yellow]")
+            .replace(SEARCH_HIGHLIGHT[1], "[/bold yellow]")
+        )
+    
+    console.print(table)
+    console.print(f"{len(hits)} result(s) in {elapsed_ms:.1f} ms")
+
+
+def _stored_hackathons(
+    inputs: List[Path],
+    store_path: Optional[Path],
+    event_urls: List[str],
+    all_events: bool
+):
+    """
+    Yield (hackathon, raw result file or None) pairs for report-only mode.
+    
+    Directories yield only the current result of each hackathon (see Corpus.current_entries).
+    """
+    logger = logging.getLogger(__name__)
+    
+    from storage.corpus import Corpus
+    from storage.serialization import load_result
+    from utils.profiling import span
+    
+    for path in inputs:
+        paths = Corpus(path).current_paths() if path.is_dir() else [path]
+        for data_file in paths:
+            try:
+                with span("report.load", file=data_file.name):
+                    result = load_result(data_file)
+            except (OSError, ValueError) as e:
+                logger.warning(f"Skipping unreadable result file {data_file}: {e}")
+                continue
+            if not result.success or not result.hackathon:
+                logger.warning(f"Skipping unsuccessful result: {data_file}")
+                continue
+            yield result.hackathon, data_file
+    
+    if event_urls or all_events:
+        from storage.sqlite_store import ProjectStore, get_store_path
+        
+        store_path = get_store_path(store_path)
+        if not store_path.exists():
+            console.print(f"[red]Error:[/red] Store not found: {store_path}")
+            sys.exit(1)
+        with ProjectStore(store_path) as store:
+            urls = event_urls or [event['devpost_url'] for event in store.list_events() if event['project_count']]
+            for url in urls:
+                hackathon = store.load_hackathon(url)
+                if hackathon is None:
+                    logger.warning(f"Hackathon not found in {store.path}: {url}")
+                    continue
+                yield hackathon, None
+
+
+def report_command(argv: List[str]) -> None:
+    """Render reports from stored results without launching a browser."""
+    parser = argparse.ArgumentParser(
+        prog="main.py report",
+        description="Re-render reports from raw result files or the SQLite store (no scraping)",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+    # One report per file (a directory uses the latest result of each hackathon)
+    python src/main.py report data/raw/hackathon_20250623_231623.json --generate-ideas
+    python src/main.py report data/raw --incremental
+
+    # One combined summary report
+    python src/main.py report data/raw --summary
+
+    # From the SQLite store
+    python src/main.py report --from-store https://example.devpost.com/project-gallery
+    python src/main.py report --all-stored --summary
+        """
+    )
+    parser.add_argument("inputs", nargs="*", type=Path, help="Raw result files or directories")
+    parser.add_argument(
+        "--from-store",
+        action="append",
+        default=[],
+        metavar="HACKATHON_URL",
+        help="Render a hackathon from the SQLite store (repeatable)"
+    )
+    parser.add_argument("--all-stored", action="store_true", help="Render every hackathon in the SQLite store")
+    parser.add_argument(
+        "--store",
+        type=Path,
+        default=None,
+        help="SQLite store to read (default: STORE_PATH or data/hackathons.db)"
+    )
+    parser.add_argument(
+        "--reports-dir",
+        type=Path,
+        default=Path("reports"),
+        help="Directory to save reports (default: reports)"
+    )
+    parser.add_argument("--summary", action="store_true", help="Write one combined summary report instead")
+    parser.add_argument("--generate-ideas", action="store_true", help="Generate AI ideas based on hackathon trends")
+    parser.add_argument(
+        "--incremental",
+        action="store_true",
+        help="Re-render only report sections (and AI ideas) whose inputs changed since the last run"
+    )
+    parser.add_argument(
+        "--log-level",
+        choices=["DEBUG", "INFO", "WARNING", "ERROR"],
+        default=os.getenv("LOG_LEVEL", "INFO"),
+        help="Logging level (default: INFO)"
+    )
+    add_profile_arguments(parser)
+    add_metrics_arguments(parser)
+    args = parser.parse_args(argv)
+    
+    if not (args.inputs or args.from_store or args.all_stored):
+        parser.error("give result files/directories, --from-store or --all-stored")
+    if args.summary and args.incremental:
+        parser.error("--incremental only applies to per-hackathon reports, not --summary")
+    
+    setup_logging(args.log_level)
+    
+    from report.markdown_generator import MarkdownReportGenerator
+    from report.batch import report_filename
+    from models.hackathon import ScrapingResult
+    
+    start = time.perf_counter()
+    args.reports_dir.mkdir(parents=True, exist_ok=True)
+    generator = MarkdownReportGenerator()
+    hackathons = _stored_hackathons(args.inputs, args.store, args.from_store, args.all_stored)
+    
+    with metrics_session(args, "report", args.reports_dir), profile_session(args, "report"):
+        if args.summary:
+            loaded = 0
+            
+            def results():
+                # Hackathons are loaded and folded into the summary one at a time
+                nonlocal loaded
+                for hackathon, _ in hackathons:
+                    loaded += 1
+                    yield ScrapingResult(success=True, url=hackathon.devpost_url, hackathon=hackathon)
+            
+            output_path = args.reports_dir / f"summary_{datetime.now().strftime('%Y%m%d_%H%M%S')}.md"
+            ok = generator.generate_summary_report(results(), output_path, generate_ideas=args.generate_ideas)
+            if ok:
+                console.print(f"[green]Summary report generated:[/green] {output_path} ({loaded} hackathons)")
+            else:
+                console.print("[red]Failed to generate summary report[/red]")
+                sys.exit(1)
+        else:
+            count = failed = 0
+            for hackathon, data_file in hackathons:
+                if data_file is not None:
+                    # Reuse the raw file's timestamp so re-rendering overwrites the same report
+                    report_file = report_filename(hackathon.name, data_file, args.reports_dir)
+                else:
+                    # Name it after the stored scrape time, like a raw file of that scrape
+                    stored_file = Path(f"hackathon_{hackathon.scraped_at.strftime('%Y%m%d_%H%M%S')}.json")
+                    report_file = report_filename(hackathon.name, stored_file, args.reports_dir)
+                if generator.generate_report(
+                    hackathon, report_file,
+                    generate_ideas=args.generate_ideas, incremental=args.incremental
+                ):
+                    count += 1
+                    console.print(f"[green]Report generated:[/green] {report_file}")
+                else:
+                    failed += 1
+                    console.print(f"[red]Failed to generate report for:[/red] {hackathon.name}")
+            if not count:
+                console.print("[red]No reports generated[/red]")
+                sys.exit(1)
+            if failed:
+                sys.exit(1)
+    
+    console.print(f"Done in {time.perf_counter() - start:.2f}s")
+
+
 def main():
     """Main CLI function."""
+    if len(sys.argv) > 1 and sys.argv[1] == "search":
+        search_command(sys.argv[2:])
+        return
+    
+    if len(sys.argv) > 1 and sys.argv[1] == "report":
+        report_command(sys.argv[2:])
+        return
+    
     parser = argparse.ArgumentParser(
         description="Hackathon Insight Automator - Scrape and analyze hackathon data",
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -345,6 +856,16 @@ Examples:
 
     # Run with custom settings
     python src/main.py https://devpost.com/software/example --no-headless --delay 3
+
+    # Re-render reports from stored data without scraping (see: python src/main.py report --help)
+    python src/main.py report data/raw --generate-ideas
+
+    # Record rendered pages, then re-run extraction over them without a browser
+    python src/main.py https://example-hackathon.devpost.com --capture data/captures.db
+    python src/main.py https://example-hackathon.devpost.com --replay data/captures.db --no-llm
+
+    # Search stored projects (see: python src/main.py search --help)
+    python src/main.py search "rag voice" --winners
         """
     )
     
@@ -412,30 +933,246 @@ Examples:
         help="Generate AI ideas based on hackathon trends"
     )
     
+    parser.add_argument(
+        "--incremental",
+        action="store_true",
+        help="Re-render only report sections (and AI ideas) whose inputs changed since the last run"
+    )
+    
+    parser.add_argument(
+        "--parquet-dir",
+        type=Path,
+        default=None,
+        help="Also append the scraped data to a Parquet dataset in this directory"
+    )
+    
+    parser.add_argument(
+        "--pretty-json",
+        action="store_true",
+        help="Indent the saved raw JSON (default: compact)"
+    )
+    
+    parser.add_argument(
+        "--compress",
+        choices=sorted(COMPRESSION_SUFFIXES),
+        default=None,
+        help="Compress the saved raw JSON (zstd requires the zstandard package)"
+    )
+    
+    parser.add_argument(
+        "--store",
+        type=Path,
+        default=None,
+        help="SQLite store the scraped data is upserted into (default: STORE_PATH or data/hackathons.db)"
+    )
+    
+    parser.add_argument(
+        "--no-store",
+        action="store_true",
+        help="Do not write to the SQLite store"
+    )
+    
+    parser.add_argument(
+        "--no-raw-json",
+        action="store_true",
+        help="Do not write the timestamped raw JSON file (store only)"
+    )
+    
+    parser.add_argument(
+        "--base-url",
+        default=None,
+        help="Devpost base URL, e.g. a local fixture server (default: DEVPOST_BASE_URL or https://devpost.com)"
+    )
+    
+    parser.add_argument(
+        "--capture",
+        type=Path,
+        default=None,
+        help="Record the rendered HTML of every visited page into this capture archive"
+    )
+    
+    parser.add_argument(
+        "--replay",
+        type=Path,
+        default=None,
+        help="Serve pages from this capture archive instead of launching a browser"
+    )
+    
+    parser.add_argument(
+        "--browser-service",
+        action="store_true",
+        help="Connect to the browser started by 'python -m scraper.browser_service start' (launches one if it is not running)"
+    )
+    
+    parser.add_argument(
+        "--recycle-after",
+        type=int,
+        default=int(os.getenv("BROWSER_RECYCLE_PAGES", "100")),
+        help="Relaunch the browser after this many pages to cap its memory, 0 to never recycle (default: 100)"
+    )
+    
+    parser.add_argument(
+        "--max-attempts",
+        type=int,
+        default=3,
+        help="Attempts per project page when the browser crashes while loading it (default: 3)"
+    )
+    
+    parser.add_argument(
+        "--max-projects",
+        type=int,
+        default=None,
+        help="Projects to scrape per hackathon, winners and most-liked first; 0 for every project on the page (default: 5; every gallery card with --gallery-only)"
+    )
+    
+    parser.add_argument(
+        "--max-pages",
+        type=int,
+        default=None,
+        help="Stop after loading this many project pages (default: no limit)"
+    )
+    
+    parser.add_argument(
+        "--max-llm-calls",
+        type=int,
+        default=None,
+        help="Analyze at most this many projects with the LLM; later projects are scraped without analysis (default: no limit)"
+    )
+    
+    parser.add_argument(
+        "--time-budget",
+        type=float,
+        default=float(os.environ["CRAWL_TIME_BUDGET"]) if os.getenv("CRAWL_TIME_BUDGET") else None,
+        help="Minutes after which no more project pages are loaded; the result covers the projects done by then (env: CRAWL_TIME_BUDGET)"
+    )
+    
+    parser.add_argument(
+        "--shards",
+        type=int,
+        default=int(os.getenv("CRAWL_SHARDS", "1")),
+        help="Worker processes (each with its own browser) to split a hackathon's project pages across (default: 1)"
+    )
+    
+    parser.add_argument(
+        "--rate-limit",
+        type=float,
+        default=None,
+        help="Page loads per second across all shards, 0 for unlimited (default: one per --delay per shard)"
+    )
+    
+    parser.add_argument(
+        "--work-queue",
+        type=Path,
+        default=None,
+        help="Scrape project pages through this shared SQLite work queue, together with 'python -m scraper.queue_worker' workers"
+    )
+    
+    parser.add_argument(
+        "--resume-run",
+        default=None,
+        metavar="RUN",
+        help="Resume an interrupted --work-queue crawl run by the id it logged (default: start a new run)"
+    )
+    
+    parser.add_argument(
+        "--delta",
+        action="store_true",
+        help="Only fetch projects that are new or changed since the last run; reuse the rest from the store"
+    )
+    
+    parser.add_argument(
+        "--gallery-only",
+        action="store_true",
+        help="Build project summaries (name, tagline, thumbnail, winner badge, like/comment counts) from every gallery page without loading project pages"
+    )
+    
+    add_profile_arguments(parser)
+    add_metrics_arguments(parser)
+    
     args = parser.parse_args()
     
     # Setup logging
     setup_logging(args.log_level)
     
+    from scraper.urls import get_base_url, is_devpost_url
+    
     # Validate URL (only if not in search mode)
     if not args.search:
         if not args.url:
             console.print("[red]Error:[/red] URL is required when not using --search mode")
             sys.exit(1)
-        if "devpost.com" not in args.url:
-            console.print("[red]Error:[/red] URL must be from devpost.com")
+        if not is_devpost_url(args.url, args.base_url):
+            console.print(f"[red]Error:[/red] URL must be from devpost.com or {get_base_url(args.base_url)}")
+            sys.exit(1)
+    
+    if args.replay:
+        if not args.replay.exists():
+            console.print(f"[red]Error:[/red] Capture archive {args.replay} does not exist")
+            sys.exit(1)
+        if args.search:
+            console.print("[red]Error:[/red] --search needs a browser and cannot be combined with --replay")
+            sys.exit(1)
+        if args.capture:
+            console.print("[red]Error:[/red] --capture and --replay cannot be combined")
             sys.exit(1)
     
+    if args.work_queue and args.shards > 1:
+        console.print("[red]Error:[/red] --work-queue and --shards cannot be combined (start more queue workers instead)")
+        sys.exit(1)
+    
+    if args.resume_run and not args.work_queue:
+        console.print("[red]Error:[/red] --resume-run resumes a --work-queue crawl and needs --work-queue")
+        sys.exit(1)
+    
+    if args.gallery_only and (args.shards > 1 or args.work_queue or args.delta):
+        console.print("[red]Error:[/red] --gallery-only loads no project pages and cannot be combined with --shards, --work-queue or --delta")
+        sys.exit(1)
+    
+    if args.delta and args.no_store:
+        console.print("[red]Error:[/red] --delta compares against the store and cannot be combined with --no-store")
+        sys.exit(1)
+    
+    if args.no_store and args.no_raw_json:
+        console.print("[red]Error:[/red] --no-store and --no-raw-json together would discard the scraped data")
+        sys.exit(1)
+    
+    if not args.no_store:
+        from storage.sqlite_store import get_store_path
+        args.store = get_store_path(args.store)
+    
     # Display startup info
     console.print("[bold green]Hackathon Insight Automator[/bold green]")
     if args.search:
         console.print("Mode: Search for recent AI hackathons")
     else:
         console.print(f"Target URL: {args.url}")
+    if args.base_url or os.getenv("DEVPOST_BASE_URL"):
+        console.print(f"Devpost base URL: {get_base_url(args.base_url)}")
     console.print(f"Output directory: {args.output_dir}")
     console.print(f"Reports directory: {args.reports_dir}")
-    console.print(f"Headless mode: {args.headless}")
+    console.print(f"Store: {'Disabled' if args.no_store else args.store}")
+    if args.replay:
+        console.print(f"Replaying captures from: {args.replay}")
+    else:
+        console.print(f"Headless mode: {args.headless}")
+        if args.browser_service:
+            console.print("Browser: connect to browser service")
+    if args.capture:
+        console.print(f"Capturing pages to: {args.capture}")
     console.print(f"Request delay: {args.delay}s")
+    if args.shards > 1:
+        console.print(f"Shards: {args.shards} worker processes")
+    if args.delta:
+        console.print("Delta crawl: only new or changed projects are fetched")
+    if args.gallery_only:
+        console.print("Gallery-only mode: project summaries from gallery cards")
+    budgets = [
+        f"{args.max_pages} pages" if args.max_pages is not None else "",
+        f"{args.max_llm_calls} LLM calls" if args.max_llm_calls is not None else "",
+        f"{args.time_budget:g} min" if args.time_budget else "",
+    ]
+    if any(budgets):
+        console.print(f"Crawl budget: {', '.join(budget for budget in budgets if budget)}")
     console.print(f"LLM analysis: {'Disabled' if args.no_llm else 'Enabled'}")
     if args.auto_select:
         console.print("Auto-select mode: AI will select hackathon")
@@ -444,32 +1181,58 @@ Examples:
     console.print()
     
     # Run the scraper
-    try:
-        success = asyncio.run(scrape_and_analyze(
-            args.url,
-            args.output_dir,
-            args.reports_dir,
-            headless=args.headless,
-            delay=args.delay,
-            search_mode=args.search,
-            enable_llm=not args.no_llm,
-            auto_select=args.auto_select,
-            generate_ideas=args.generate_ideas
-        ))
+    import asyncio
+    
+    with metrics_session(args, "scrape", args.output_dir):
+        try:
+            with profile_session(args, "scrape"):
+                success = asyncio.run(scrape_and_analyze(
+                    args.url,
+                    args.output_dir,
+                    args.reports_dir,
+                    headless=args.headless,
+                    delay=args.delay,
+                    search_mode=args.search,
+                    enable_llm=not args.no_llm,
+                    auto_select=args.auto_select,
+                    generate_ideas=args.generate_ideas,
+                    incremental=args.incremental,
+                    parquet_dir=args.parquet_dir,
+                    pretty_json=args.pretty_json,
+                    compression=args.compress,
+                    store_path=None if args.no_store else args.store,
+                    raw_json=not args.no_raw_json,
+                    base_url=args.base_url,
+                    capture_path=args.capture,
+                    replay_path=args.replay,
+                    browser_service=args.browser_service,
+                    recycle_after=args.recycle_after,
+                    max_attempts=args.max_attempts,
+                    max_projects=args.max_projects if args.max_projects is not None else (0 if args.gallery_only else 5),
+                    shards=max(1, args.shards),
+                    rate_limit=args.rate_limit,
+                    work_queue_path=args.work_queue,
+                    queue_run=args.resume_run,
+                    delta=args.delta,
+                    gallery_only=args.gallery_only,
+                    max_pages=args.max_pages,
+                    max_llm_calls=args.max_llm_calls,
+                    time_budget=args.time_budget
+                ))
         
-        if success:
-            console.print("[bold green]✓ Analysis completed successfully![/bold green]")
-            sys.exit(0)
-        else:
-            console.print("[bold red]✗ Analysis failed[/bold red]")
-            sys.exit(1)
+            if success:
+                console.print("[bold green]✓ Analysis completed successfully![/bold green]")
+                sys.exit(0)
+            else:
+                console.print("[bold red]✗ Analysis failed[/bold red]")
+                sys.exit(1)
             
-    except KeyboardInterrupt:
-        console.print("\n[yellow]Analysis cancelled by user[/yellow]")
-        sys.exit(1)
-    except Exception as e:
-        console.print(f"[red]Unexpected error:[/red] {e}")
-        sys.exit(1)
+        except KeyboardInterrupt:
+            console.print("\n[yellow]Analysis cancelled by user[/yellow]")
+            sys.exit(1)
+        except Exception as e:
+            console.print(f"[red]Unexpected error:[/red] {e}")
+            sys.exit(1)
 
 
 if __name__ == "__main__":
@@ -3,17 +3,32 @@ Data models for hackathon data.
 """
 
 from .hackathon import (
+    CrawlCoverage,
     Hackathon,
     Project,
     ProjectMember,
     Award,
     ScrapingResult
 )
+from .validation import (
+    ValidationMode,
+    get_validation_mode,
+    parse_scraping_result,
+    validate_projects
+)
+from .table import ProjectTable, ProjectView
 
 __all__ = [
+    "CrawlCoverage",
     "Hackathon",
     "Project", 
     "ProjectMember",
     "Award",
-    "ScrapingResult"
+    "ScrapingResult",
+    "ValidationMode",
+    "get_validation_mode",
+    "parse_scraping_result",
+    "validate_projects",
+    "ProjectTable",
+    "ProjectView"
 ]
\ No newline at end of file
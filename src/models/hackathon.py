@@ -2,7 +2,7 @@
 Data models for hackathon data.
 """
 from datetime import datetime
-from typing import List, Optional
+from typing import Any, Dict, List, Optional
 from pydantic import BaseModel, Field, HttpUrl
 
 
@@ -34,6 +34,7 @@ class Project(BaseModel):
     image_url: Optional[HttpUrl] = None
     vote_count: Optional[int] = None
     comment_count: Optional[int] = None
+    analysis: Optional[Dict[str, Any]] = None
     
     class Config:
         """Pydantic configuration."""
@@ -42,6 +43,21 @@ class Project(BaseModel):
         }
 
 
+class CrawlCoverage(BaseModel):
+    """How much of a hackathon's gallery a (possibly budgeted) crawl covered."""
+    projects_listed: int = 0
+    projects_selected: int = 0
+    projects_reused: int = 0
+    projects_scraped: int = 0
+    projects_analyzed: int = 0
+    pages_loaded: int = 0
+    llm_calls: int = 0
+    max_pages: Optional[int] = None
+    max_llm_calls: Optional[int] = None
+    time_budget_seconds: Optional[float] = None
+    stopped_by: Optional[str] = None
+
+
 class Hackathon(BaseModel):
     """Represents a hackathon event."""
     name: str
@@ -55,6 +71,7 @@ class Hackathon(BaseModel):
     participant_count: Optional[int] = None
     submission_count: Optional[int] = None
     projects: List[Project] = Field(default_factory=list)
+    coverage: Optional[CrawlCoverage] = None
     scraped_at: datetime = Field(default_factory=datetime.now)
     
     class Config:
@@ -0,0 +1,456 @@
+"""
+Compact, array-backed storage for large numbers of projects.
+
+A ``Project`` model costs several kilobytes once its members, awards, tags
+and URLs are counted. ``ProjectTable`` stores the same data column-wise:
+
+- repeated short strings (tags, award names, sponsors, roles) are interned
+  once in a ``StringPool`` and referenced by integer id
+- mostly-unique text (names, descriptions, URLs) is packed into a single
+  UTF-8 buffer per column
+- tags, awards and members are flat arrays sliced by per-project offsets
+
+Rows are read through ``ProjectView`` objects, which expose the same
+attributes as ``Project`` and only decode the fields that are accessed.
+"""
+from array import array
+from collections import Counter
+from datetime import datetime
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple, Union
+
+from utils import fastjson
+
+from .hackathon import Award, Hackathon, Project, ProjectMember, ScrapingResult
+from .validation import construct_hackathon, construct_project
+
+# Id of a missing (None) string
+NULL_ID = -1
+
+# Stored in integer columns for missing (None) values
+_MISSING_INT = -(2 ** 63)
+
+ProjectLike = Union[Project, Dict[str, Any]]
+
+
+def _get(obj: Any, name: str, default: Any = None) -> Any:
+    """Read a field from either a pydantic model or a raw JSON dict."""
+    if isinstance(obj, dict):
+        return obj.get(name, default)
+    return getattr(obj, name, default)
+
+
+def _str(value: Any) -> Optional[str]:
+    """Convert URLs and datetimes to the strings they are stored as."""
+    if value is None or isinstance(value, str):
+        return value
+    if isinstance(value, datetime):
+        return value.isoformat()
+    return str(value)
+
+
+class StringPool:
+    """Interned strings addressed by integer id."""
+
+    __slots__ = ('_strings', '_ids')
+
+    def __init__(self):
+        self._strings: List[str] = []
+        self._ids: Dict[str, int] = {}
+
+    def intern(self, value: Optional[str]) -> int:
+        """Return the id of a string, adding it to the pool if needed."""
+        if value is None:
+            return NULL_ID
+        string_id = self._ids.get(value)
+        if string_id is None:
+            string_id = len(self._strings)
+            self._strings.append(value)
+            self._ids[value] = string_id
+        return string_id
+
+    def get(self, string_id: int) -> Optional[str]:
+        """Return the string with the given id (None for NULL_ID)."""
+        return None if string_id < 0 else self._strings[string_id]
+
+    def __len__(self) -> int:
+        return len(self._strings)
+
+
+class TextColumn:
+    """Optional strings packed into one UTF-8 buffer."""
+
+    __slots__ = ('_data', '_ends')
+
+    def __init__(self):
+        self._data = bytearray()
+        # End offset of each value; missing values store the bitwise
+        # complement of the current end
+        self._ends = array('q')
+
+    def append(self, value: Optional[str]) -> None:
+        """Append a value (None is stored as missing)."""
+        if value is None:
+            self._ends.append(~len(self._data))
+        else:
+            self._data += value.encode('utf-8')
+            self._ends.append(len(self._data))
+
+    def _end(self, index: int) -> int:
+        end = self._ends[index]
+        return ~end if end < 0 else end
+
+    def __getitem__(self, index: int) -> Optional[str]:
+        end = self._ends[index]
+        if end < 0:
+            return None
+        start = self._end(index - 1) if index else 0
+        return self._data[start:end].decode('utf-8')
+
+    def __len__(self) -> int:
+        return len(self._ends)
+
+    @property
+    def nbytes(self) -> int:
+        """Approximate memory held by the column."""
+        return len(self._data) + self._ends.itemsize * len(self._ends)
+
+
+class ProjectView:
+    """Read-only, Project-like view of one row of a ProjectTable."""
+
+    __slots__ = ('_table', '_row')
+
+    def __init__(self, table: "ProjectTable", row: int):
+        self._table = table
+        self._row = row
+
+    @property
+    def name(self) -> str:
+        return self._table._names[self._row]
+
+    @property
+    def description(self) -> str:
+        return self._table._descriptions[self._row]
+
+    @property
+    def devpost_url(self) -> str:
+        return self._table._devpost_urls[self._row]
+
+    @property
+    def project_url(self) -> Optional[str]:
+        return self._table._project_urls[self._row]
+
+    @property
+    def image_url(self) -> Optional[str]:
+        return self._table._image_urls[self._row]
+
+    @property
+    def submission_date(self) -> Optional[datetime]:
+        value = self._table._submission_dates[self._row]
+        return datetime.fromisoformat(value) if value is not None else None
+
+    @property
+    def vote_count(self) -> Optional[int]:
+        value = self._table._vote_counts[self._row]
+        return None if value == _MISSING_INT else value
+
+    @property
+    def comment_count(self) -> Optional[int]:
+        value = self._table._comment_counts[self._row]
+        return None if value == _MISSING_INT else value
+
+    @property
+    def tags(self) -> List[str]:
+        table = self._table
+        start, end = table._tag_offsets[self._row], table._tag_offsets[self._row + 1]
+        return [table.strings.get(tag_id) for tag_id in table._tag_ids[start:end]]
+
+    @property
+    def awards(self) -> List[Award]:
+        table = self._table
+        get = table.strings.get
+        return [
+            Award.model_construct(
+                name=get(table._award_names[i]),
+                category=get(table._award_categories[i]),
+                sponsor=get(table._award_sponsors[i]),
+                prize_value=get(table._award_prizes[i])
+            )
+            for i in range(table._award_offsets[self._row], table._award_offsets[self._row + 1])
+        ]
+
+    @property
+    def members(self) -> List[ProjectMember]:
+        table = self._table
+        return [
+            ProjectMember.model_construct(
+                name=table._member_names[i],
+                profile_url=table._member_profile_urls[i],
+                role=table.strings.get(table._member_roles[i])
+            )
+            for i in range(table._member_offsets[self._row], table._member_offsets[self._row + 1])
+        ]
+
+    @property
+    def analysis(self) -> Optional[Dict[str, Any]]:
+        value = self._table._analyses[self._row]
+        return fastjson.loads(value) if value is not None else None
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Return the row as a raw project dict (as stored by save_result)."""
+        table = self._table
+        get = table.strings.get
+        return {
+            'name': self.name,
+            'description': self.description,
+            'devpost_url': self.devpost_url,
+            'project_url': self.project_url,
+            'tags': self.tags,
+            'awards': [
+                {
+                    'name': get(table._award_names[i]),
+                    'category': get(table._award_categories[i]),
+                    'sponsor': get(table._award_sponsors[i]),
+                    'prize_value': get(table._award_prizes[i]),
+                }
+                for i in range(table._award_offsets[self._row], table._award_offsets[self._row + 1])
+            ],
+            'members': [
+                {
+                    'name': table._member_names[i],
+                    'profile_url': table._member_profile_urls[i],
+                    'role': get(table._member_roles[i]),
+                }
+                for i in range(table._member_offsets[self._row], table._member_offsets[self._row + 1])
+            ],
+            'submission_date': table._submission_dates[self._row],
+            'image_url': self.image_url,
+            'vote_count': self.vote_count,
+            'comment_count': self.comment_count,
+            'analysis': self.analysis,
+        }
+
+    def to_project(self) -> Project:
+        """Materialize the row as a Project model (without re-validation)."""
+        return construct_project(self.to_dict())
+
+    def model_dump(self, **kwargs: Any) -> Dict[str, Any]:
+        """Dump the row exactly like ``Project.model_dump`` (of a trusted-loaded project)."""
+        kwargs.setdefault('warnings', False)
+        return self.to_project().model_dump(**kwargs)
+
+    def __repr__(self) -> str:
+        return f"ProjectView(row={self._row}, name={self.name!r})"
+
+
+class ProjectTable:
+    """Column-oriented store of projects from one or more hackathons."""
+
+    def __init__(self):
+        """Create an empty table."""
+        self.strings = StringPool()
+        # Hackathon metadata (without projects) and the rows of each hackathon
+        self.hackathons: List[Hackathon] = []
+        self._hackathon_rows: List[Tuple[int, int]] = []
+
+        self._names = TextColumn()
+        self._descriptions = TextColumn()
+        self._devpost_urls = TextColumn()
+        self._project_urls = TextColumn()
+        self._image_urls = TextColumn()
+        self._submission_dates = TextColumn()
+        self._analyses = TextColumn()
+        self._vote_counts = array('q')
+        self._comment_counts = array('q')
+
+        self._tag_offsets = array('q', [0])
+        self._tag_ids = array('l')
+
+        self._award_offsets = array('q', [0])
+        self._award_names = array('l')
+        self._award_categories = array('l')
+        self._award_sponsors = array('l')
+        self._award_prizes = array('l')
+
+        self._member_offsets = array('q', [0])
+        self._member_names = TextColumn()
+        self._member_profile_urls = TextColumn()
+        self._member_roles = array('l')
+
+    @classmethod
+    def from_results(cls, results: Iterable[Union[ScrapingResult, Dict[str, Any]]]) -> "ProjectTable":
+        """
+        Build a table from scraping results.
+
+        Args:
+            results: ScrapingResult models or raw result dicts; unsuccessful
+                results are skipped
+
+        Returns:
+            Populated table
+        """
+        table = cls()
+        for result in results:
+            table.add_result(result)
+        return table
+
+    def add_result(self, result: Union[ScrapingResult, Dict[str, Any]]) -> bool:
+        """
+        Append the projects of a scraping result.
+
+        Args:
+            result: ScrapingResult model or raw result dict
+
+        Returns:
+            True if the result held a hackathon, False otherwise
+        """
+        hackathon = _get(result, 'hackathon')
+        if not _get(result, 'success') or not hackathon:
+            return False
+        self.add_hackathon(hackathon)
+        return True
+
+    def add_hackathon(self, hackathon: Union[Hackathon, Dict[str, Any]]) -> int:
+        """
+        Append a hackathon and all of its projects.
+
+        Args:
+            hackathon: Hackathon model or raw hackathon dict
+
+        Returns:
+            Index of the hackathon in ``hackathons``
+        """
+        if isinstance(hackathon, dict):
+            metadata = construct_hackathon({**hackathon, 'projects': []})
+        else:
+            metadata = hackathon.model_copy(update={'projects': []})
+
+        start = len(self)
+        for project in _get(hackathon, 'projects') or []:
+            self.add_project(project)
+
+        self.hackathons.append(metadata)
+        self._hackathon_rows.append((start, len(self)))
+        return len(self.hackathons) - 1
+
+    def add_project(self, project: ProjectLike) -> int:
+        """
+        Append a single project.
+
+        Args:
+            project: Project model or raw project dict
+
+        Returns:
+            Row index of the project
+        """
+        intern = self.strings.intern
+
+        self._names.append(_get(project, 'name'))
+        self._descriptions.append(_get(project, 'description'))
+        self._devpost_urls.append(_str(_get(project, 'devpost_url')))
+        self._project_urls.append(_str(_get(project, 'project_url')))
+        self._image_urls.append(_str(_get(project, 'image_url')))
+        self._submission_dates.append(_str(_get(project, 'submission_date')))
+
+        analysis = _get(project, 'analysis')
+        self._analyses.append(fastjson.dumps(analysis).decode('utf-8') if analysis is not None else None)
+
+        vote_count = _get(project, 'vote_count')
+        comment_count = _get(project, 'comment_count')
+        self._vote_counts.append(_MISSING_INT if vote_count is None else vote_count)
+        self._comment_counts.append(_MISSING_INT if comment_count is None else comment_count)
+
+        self._tag_ids.extend(intern(tag) for tag in _get(project, 'tags') or [])
+        self._tag_offsets.append(len(self._tag_ids))
+
+        for award in _get(project, 'awards') or []:
+            self._award_names.append(intern(_get(award, 'name')))
+            self._award_categories.append(intern(_get(award, 'category')))
+            self._award_sponsors.append(intern(_get(award, 'sponsor')))
+            self._award_prizes.append(intern(_get(award, 'prize_value')))
+        self._award_offsets.append(len(self._award_names))
+
+        for member in _get(project, 'members') or []:
+            self._member_names.append(_get(member, 'name'))
+            self._member_profile_urls.append(_str(_get(member, 'profile_url')))
+            self._member_roles.append(intern(_get(member, 'role')))
+        self._member_offsets.append(len(self._member_names))
+
+        return len(self) - 1
+
+    def __len__(self) -> int:
+        return len(self._vote_counts)
+
+    def __getitem__(self, row: int) -> ProjectView:
+        if row < 0:
+            row += len(self)
+        if not 0 <= row < len(self):
+            raise IndexError("project row out of range")
+        return ProjectView(self, row)
+
+    def __iter__(self) -> Iterator[ProjectView]:
+        for row in range(len(self)):
+            yield ProjectView(self, row)
+
+    @property
+    def total_awards(self) -> int:
+        """Number of awards across all projects."""
+        return len(self._award_names)
+
+    @property
+    def total_members(self) -> int:
+        """Number of team members across all projects."""
+        return len(self._member_names)
+
+    def tag_counts(self) -> Counter:
+        """Count how many projects use each tag."""
+        get = self.strings.get
+        return Counter({get(tag_id): count for tag_id, count in Counter(self._tag_ids).items()})
+
+    def award_counts(self) -> Counter:
+        """Count how often each award name was given."""
+        get = self.strings.get
+        return Counter({get(name_id): count for name_id, count in Counter(self._award_names).items()})
+
+    def award_count(self, row: int) -> int:
+        """Number of awards won by the project in a row."""
+        return self._award_offsets[row + 1] - self._award_offsets[row]
+
+    def vote_count(self, row: int) -> Optional[int]:
+        """Vote count of the project in a row."""
+        value = self._vote_counts[row]
+        return None if value == _MISSING_INT else value
+
+    def hackathon_projects(self, index: int) -> List[ProjectView]:
+        """Return views of the projects of one hackathon."""
+        start, end = self._hackathon_rows[index]
+        return [ProjectView(self, row) for row in range(start, end)]
+
+    def hackathon(self, index: int) -> Hackathon:
+        """
+        Return a hackathon whose projects are views into this table.
+
+        The result can be passed to ``MarkdownReportGenerator.generate_report``.
+
+        Args:
+            index: Index of the hackathon in ``hackathons``
+
+        Returns:
+            Hackathon model backed by this table
+        """
+        return self.hackathons[index].model_copy(update={'projects': self.hackathon_projects(index)})
+
+    @property
+    def nbytes(self) -> int:
+        """Approximate memory held by the columns (excluding the string pool)."""
+        columns = [
+            self._names, self._descriptions, self._devpost_urls, self._project_urls,
+            self._image_urls, self._submission_dates, self._analyses,
+            self._member_names, self._member_profile_urls,
+        ]
+        arrays = [
+            self._vote_counts, self._comment_counts, self._tag_offsets, self._tag_ids,
+            self._award_offsets, self._award_names, self._award_categories,
+            self._award_sponsors, self._award_prizes, self._member_offsets, self._member_roles,
+        ]
+        return sum(column.nbytes for column in columns) + sum(a.itemsize * len(a) for a in arrays)
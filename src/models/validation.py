@@ -0,0 +1,205 @@
+"""
+Validation strategies for loading hackathon data.
+
+Data scraped from the web is always fully validated when the models are
+created. Data we serialized ourselves can be loaded faster:
+
+- ``strict``: validate every model one by one (the original behaviour)
+- ``batch``: validate the project list in a single TypeAdapter call
+- ``trusted``: build the models with ``model_construct`` and no
+  validation: datetimes are parsed, URLs stay the strings they were stored
+  as. Also loads archived records that no longer pass today's validators
+
+All modes pause the garbage collector while decoding and building models,
+which is where most of the load time of large results went. ``batch`` is
+the default; the VALIDATION_MODE environment variable selects another
+mode. ``trusted`` is the fastest (see benchmarks/bench_model_loading.py)
+but is only used by default for data this package wrote itself, such as
+the SQLite store and work queue results. Models loaded trusted hold plain
+URL strings, so dump them with ``warnings=False``.
+"""
+import gc
+import os
+from contextlib import contextmanager
+from datetime import datetime
+from enum import Enum
+from typing import Any, Dict, Iterator, List, Optional, Type, TypeVar, Union
+
+from pydantic import BaseModel, TypeAdapter
+
+from utils import fastjson
+
+from .hackathon import Award, CrawlCoverage, Hackathon, Project, ProjectMember, ScrapingResult
+
+RawData = Union[bytes, str, Dict[str, Any]]
+ModelT = TypeVar("ModelT", bound=BaseModel)
+
+
+class ValidationMode(str, Enum):
+    """How strictly stored data is validated on load."""
+    STRICT = "strict"
+    BATCH = "batch"
+    TRUSTED = "trusted"
+
+
+_PROJECT_LIST_ADAPTER = TypeAdapter(List[Project])
+
+
+def get_validation_mode(mode: Optional[Union[str, ValidationMode]] = None) -> ValidationMode:
+    """
+    Resolve a validation mode, falling back to VALIDATION_MODE (default: batch).
+
+    Args:
+        mode: Explicit mode (optional)
+
+    Returns:
+        Resolved validation mode
+    """
+    if mode is None:
+        mode = os.getenv("VALIDATION_MODE", ValidationMode.BATCH.value)
+    return ValidationMode(mode)
+
+
+@contextmanager
+def gc_paused() -> Iterator[None]:
+    """
+    Pause the cyclic garbage collector while building many objects.
+
+    Loading creates hundreds of thousands of small objects, none of which
+    are garbage, so collection passes during the load are pure overhead.
+    """
+    was_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        yield
+    finally:
+        if was_enabled:
+            gc.enable()
+
+
+def _construct(cls: Type[ModelT], fields: Dict[str, Any]) -> ModelT:
+    """
+    Create a model instance from already-correct field values.
+    
+    Missing fields get their defaults and unknown keys are dropped.
+    """
+    return cls.model_construct(_fields_set=fields.keys() & cls.model_fields.keys(), **fields)
+
+
+def _parse_datetime(value: Any) -> Optional[datetime]:
+    """Parse a stored datetime (ISO format or ``str(datetime)``)."""
+    if value is None or isinstance(value, datetime):
+        return value
+    return datetime.fromisoformat(value)
+
+
+def construct_project(data: Dict[str, Any]) -> Project:
+    """
+    Build a Project from trusted data without validation.
+
+    Args:
+        data: Project dict as written by the scraper
+
+    Returns:
+        Project model
+    """
+    fields = dict(data)
+    fields['submission_date'] = _parse_datetime(data.get('submission_date'))
+    fields['awards'] = [_construct(Award, dict(award)) for award in data.get('awards') or []]
+    fields['members'] = [_construct(ProjectMember, dict(member)) for member in data.get('members') or []]
+    return _construct(Project, fields)
+
+
+def construct_hackathon(data: Dict[str, Any]) -> Hackathon:
+    """
+    Build a Hackathon (and its projects) from trusted data without validation.
+
+    Args:
+        data: Hackathon dict as written by the scraper
+
+    Returns:
+        Hackathon model
+    """
+    fields = dict(data)
+    fields['projects'] = [construct_project(project) for project in data.get('projects') or []]
+    if data.get('coverage'):
+        fields['coverage'] = _construct(CrawlCoverage, dict(data['coverage']))
+    for key in ('start_date', 'end_date', 'scraped_at'):
+        if key in data:
+            fields[key] = _parse_datetime(data[key])
+    return _construct(Hackathon, fields)
+
+
+def construct_scraping_result(data: Dict[str, Any]) -> ScrapingResult:
+    """
+    Build a ScrapingResult from trusted data without validation.
+
+    Args:
+        data: Result dict as written by save_result
+
+    Returns:
+        ScrapingResult model
+    """
+    fields = dict(data)
+    if data.get('hackathon') is not None:
+        fields['hackathon'] = construct_hackathon(data['hackathon'])
+    if 'scraped_at' in data:
+        fields['scraped_at'] = _parse_datetime(data['scraped_at'])
+    return _construct(ScrapingResult, fields)
+
+
+def validate_projects(
+    items: Union[bytes, str, List[Dict[str, Any]]],
+    mode: Optional[Union[str, ValidationMode]] = None
+) -> List[Project]:
+    """
+    Load a list of projects with the given validation mode.
+
+    Args:
+        items: JSON array (bytes/str) or list of project dicts
+        mode: Validation mode (defaults to VALIDATION_MODE)
+
+    Returns:
+        List of Project models
+    """
+    mode = get_validation_mode(mode)
+    with gc_paused():
+        if isinstance(items, (bytes, str)):
+            items = fastjson.loads(items)
+        if mode == ValidationMode.TRUSTED:
+            return [construct_project(item) for item in items]
+        if mode == ValidationMode.BATCH:
+            return _PROJECT_LIST_ADAPTER.validate_python(items)
+        return [Project(**item) for item in items]
+
+
+def parse_scraping_result(
+    data: RawData,
+    mode: Optional[Union[str, ValidationMode]] = None
+) -> ScrapingResult:
+    """
+    Load a stored ScrapingResult with the given validation mode.
+
+    Args:
+        data: JSON document (bytes/str) or already decoded dict
+        mode: Validation mode (defaults to VALIDATION_MODE)
+
+    Returns:
+        ScrapingResult model
+    """
+    mode = get_validation_mode(mode)
+    with gc_paused():
+        if isinstance(data, (bytes, str)):
+            data = fastjson.loads(data)
+        if mode == ValidationMode.TRUSTED:
+            return construct_scraping_result(data)
+
+        hackathon_data = data.get('hackathon')
+        if mode == ValidationMode.STRICT or not hackathon_data:
+            return ScrapingResult(**data)
+
+        # Validate the envelope on its own and the projects as one list
+        projects = validate_projects(hackathon_data.get('projects') or [], mode)
+        result = ScrapingResult(**{**data, 'hackathon': {**hackathon_data, 'projects': []}})
+        result.hackathon.projects = projects
+        return result
@@ -2,6 +2,13 @@
 Report generation modules for hackathon analysis.
 """
 
-from .markdown_generator import MarkdownReportGenerator
+__all__ = ["MarkdownReportGenerator"]
 
-__all__ = ["MarkdownReportGenerator"]
\ No newline at end of file
+
+def __getattr__(name):
+    # Loaded on first use so that importing report.aggregates or
+    # report.fragment_cache does not pull in jinja2
+    if name == "MarkdownReportGenerator":
+        from .markdown_generator import MarkdownReportGenerator
+        return MarkdownReportGenerator
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
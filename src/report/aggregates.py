@@ -0,0 +1,156 @@
+"""
+Running aggregates for report statistics.
+
+Projects are folded into counters one at a time, so statistics for many
+hackathons can be computed without holding (or re-validating) every project.
+"""
+import heapq
+import itertools
+import logging
+from collections import Counter
+from pathlib import Path
+from typing import Any, Dict, List, Tuple, Union
+
+from models.hackathon import Hackathon, Project
+from models.table import ProjectTable, ProjectView
+from storage.serialization import read_result_data
+
+logger = logging.getLogger(__name__)
+
+# Number of projects kept for the "Projects" section of summary reports
+DEFAULT_SAMPLE_SIZE = 20
+
+ProjectLike = Union[Project, ProjectView, Dict[str, Any]]
+
+
+def _field(obj: Any, name: str, default: Any = None) -> Any:
+    """Read a field from either a pydantic model or a raw JSON dict."""
+    if isinstance(obj, dict):
+        return obj.get(name, default)
+    return getattr(obj, name, default)
+
+
+class ReportAggregates:
+    """Accumulates tag, award and team statistics across projects."""
+
+    def __init__(self, sample_size: int = 0):
+        """
+        Initialize empty aggregates.
+
+        Args:
+            sample_size: Number of top projects to keep as a sample (0 disables sampling)
+        """
+        self.sample_size = sample_size
+        self.tag_counter: Counter = Counter()
+        self.award_counter: Counter = Counter()
+        self.total_projects = 0
+        self.total_awards = 0
+        self.total_members = 0
+        self.hackathon_count = 0
+        self._sample: List[Tuple[Tuple[int, int, int], ProjectLike]] = []
+        self._sequence = itertools.count()
+
+    def add_project(self, project: ProjectLike) -> None:
+        """
+        Fold a single project into the aggregates.
+
+        Args:
+            project: Project model or raw project dict
+        """
+        tags = _field(project, 'tags') or []
+        awards = _field(project, 'awards') or []
+        members = _field(project, 'members') or []
+
+        self.total_projects += 1
+        self.tag_counter.update(tags)
+        for award in awards:
+            self.award_counter[_field(award, 'name')] += 1
+        self.total_awards += len(awards)
+        self.total_members += len(members)
+
+        if self.sample_size > 0:
+            # Rank winners first, then by votes; earlier projects win ties
+            rank = (len(awards), _field(project, 'vote_count') or 0, -next(self._sequence))
+            if len(self._sample) < self.sample_size:
+                heapq.heappush(self._sample, (rank, project))
+            elif rank > self._sample[0][0]:
+                heapq.heapreplace(self._sample, (rank, project))
+
+    def add_hackathon(self, hackathon: Union[Hackathon, Dict[str, Any]]) -> None:
+        """
+        Fold every project of a hackathon into the aggregates.
+
+        Args:
+            hackathon: Hackathon model or raw hackathon dict
+        """
+        self.hackathon_count += 1
+        for project in _field(hackathon, 'projects') or []:
+            self.add_project(project)
+
+    def add_table(self, table: ProjectTable) -> None:
+        """
+        Fold every project of a ProjectTable into the aggregates.
+
+        Counts are taken straight from the table's columns; only sampled
+        projects are wrapped in views.
+
+        Args:
+            table: Table of projects from one or more hackathons
+        """
+        self.hackathon_count += len(table.hackathons)
+        self.total_projects += len(table)
+        self.tag_counter.update(table.tag_counts())
+        self.award_counter.update(table.award_counts())
+        self.total_awards += table.total_awards
+        self.total_members += table.total_members
+
+        if self.sample_size > 0:
+            for row in range(len(table)):
+                rank = (table.award_count(row), table.vote_count(row) or 0, -next(self._sequence))
+                if len(self._sample) < self.sample_size:
+                    heapq.heappush(self._sample, (rank, table[row]))
+                elif rank > self._sample[0][0]:
+                    heapq.heapreplace(self._sample, (rank, table[row]))
+
+    def add_result_file(self, path: Path) -> bool:
+        """
+        Fold a stored scraping result file into the aggregates.
+
+        The file is read as plain JSON and never validated into models.
+
+        Args:
+            path: Path to a raw scraping result file (optionally compressed)
+
+        Returns:
+            True if the file held a successful result, False otherwise
+        """
+        data = read_result_data(path)
+
+        if not data.get('success') or not data.get('hackathon'):
+            logger.info(f"Skipping unsuccessful result: {path}")
+            return False
+
+        self.add_hackathon(data['hackathon'])
+        return True
+
+    def sample_projects(self) -> List[ProjectLike]:
+        """Return the sampled projects, highest ranked first."""
+        return [project for _, project in sorted(self._sample, key=lambda item: item[0], reverse=True)]
+
+    def analysis(self) -> Dict[str, Any]:
+        """
+        Build the analysis dictionary used by the report templates.
+
+        Returns:
+            Dictionary containing analysis results
+        """
+        avg_team_size = self.total_members / self.total_projects if self.total_projects else 0
+
+        return {
+            'top_tags': self.tag_counter.most_common(10),
+            'award_distribution': self.award_counter.most_common(10),
+            'avg_team_size': round(avg_team_size, 1),
+            'total_projects': self.total_projects,
+            'total_awards': self.total_awards,
+            'unique_technologies': len(self.tag_counter)
+        }
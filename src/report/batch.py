@@ -0,0 +1,183 @@
+"""
+Batch report generation across many stored scraping results.
+
+Rendering is fanned out over a process pool. The report generator (and its
+compiled template) is built once in the parent process and inherited by the
+workers through fork, so no worker recompiles the template.
+
+Usage (from src/):
+    python -m report.batch ../data/raw/*.json [--reports-dir ../reports] [--workers N]
+"""
+import argparse
+import logging
+import multiprocessing
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import dataclass
+from pathlib import Path
+from typing import List, Optional
+
+from storage.serialization import load_result
+from report.markdown_generator import MarkdownReportGenerator
+
+logger = logging.getLogger(__name__)
+
+# Generator shared with forked workers; built by _prepare_generator()
+_generator: Optional[MarkdownReportGenerator] = None
+
+
+@dataclass
+class BatchReportResult:
+    """Outcome of rendering one stored result file."""
+    data_file: Path
+    report_file: Optional[Path] = None
+    seconds: float = 0.0
+    error: Optional[str] = None
+
+
+def _prepare_generator() -> MarkdownReportGenerator:
+    """Create the shared generator and compile its default template."""
+    global _generator
+    if _generator is None:
+        _generator = MarkdownReportGenerator()
+        _generator._create_default_template()
+    return _generator
+
+
+def report_filename(hackathon_name: str, data_file: Path, reports_dir: Path) -> Path:
+    """
+    Create a report filename for a stored result file.
+
+    The timestamp of the raw file (``hackathon_YYYYMMDD_HHMMSS.json[.gz|.zst]``) is
+    reused, so re-rendering the same file overwrites the same report.
+
+    Args:
+        hackathon_name: Name of the hackathon
+        data_file: Raw result file the report is rendered from
+        reports_dir: Directory to save reports
+
+    Returns:
+        Path of the report file
+    """
+    safe_name = "".join(c for c in hackathon_name if c.isalnum() or c in (' ', '-', '_')).rstrip()
+    safe_name = safe_name.replace(' ', '_')
+    stem = data_file.name.split('.', 1)[0]
+    suffix = stem.split('_', 1)[1] if '_' in stem else stem
+    return reports_dir / f"{safe_name}_{suffix}.md"
+
+
+def _render_one(data_file: Path, reports_dir: Path, incremental: bool = False) -> BatchReportResult:
+    """Render a single stored result file (runs in a worker process)."""
+    start = time.perf_counter()
+    result = BatchReportResult(data_file=data_file)
+
+    try:
+        scraping_result = load_result(data_file)
+
+        if not scraping_result.success or not scraping_result.hackathon:
+            result.error = "No valid hackathon data found"
+        else:
+            hackathon = scraping_result.hackathon
+            report_file = report_filename(hackathon.name, data_file, reports_dir)
+            if _prepare_generator().generate_report(hackathon, report_file, incremental=incremental):
+                result.report_file = report_file
+            else:
+                result.error = "Failed to generate report"
+    except Exception as e:
+        result.error = str(e)
+
+    result.seconds = time.perf_counter() - start
+    return result
+
+
+def render_batch(
+    data_files: List[Path],
+    reports_dir: Path,
+    workers: Optional[int] = None,
+    incremental: bool = False
+) -> List[BatchReportResult]:
+    """
+    Render reports for many stored result files in parallel.
+
+    Args:
+        data_files: Raw result JSON files to render
+        reports_dir: Directory to save reports
+        workers: Number of worker processes (defaults to the CPU count)
+        incremental: Whether to reuse unchanged report sections
+
+    Returns:
+        One result per input file, in input order
+    """
+    _prepare_generator()
+    reports_dir.mkdir(parents=True, exist_ok=True)
+    workers = workers or os.cpu_count() or 1
+
+    if workers == 1 or len(data_files) <= 1:
+        return [_render_one(data_file, reports_dir, incremental) for data_file in data_files]
+
+    # Fork shares the already compiled template with every worker
+    if "fork" in multiprocessing.get_all_start_methods():
+        context = multiprocessing.get_context("fork")
+    else:
+        context = multiprocessing.get_context()
+
+    results: List[Optional[BatchReportResult]] = [None] * len(data_files)
+    with ProcessPoolExecutor(max_workers=min(workers, len(data_files)), mp_context=context) as executor:
+        futures = {
+            executor.submit(_render_one, data_file, reports_dir, incremental): i
+            for i, data_file in enumerate(data_files)
+        }
+        for future in as_completed(futures):
+            results[futures[future]] = future.result()
+
+    return results
+
+
+def main():
+    """Batch report command."""
+    parser = argparse.ArgumentParser(description="Render reports for many stored scraping results")
+    parser.add_argument("data_files", nargs="+", type=Path, help="Raw result JSON files")
+    parser.add_argument(
+        "--reports-dir",
+        type=Path,
+        default=Path(os.getenv("REPORTS_DIR", "reports")),
+        help="Directory to save reports (default: reports)"
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=None,
+        help="Number of worker processes (default: CPU count)"
+    )
+    parser.add_argument(
+        "--incremental",
+        action="store_true",
+        help="Re-render only report sections whose inputs changed"
+    )
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.WARNING)
+
+    start = time.perf_counter()
+    results = render_batch(
+        args.data_files, args.reports_dir,
+        workers=args.workers, incremental=args.incremental
+    )
+    elapsed = time.perf_counter() - start
+
+    failures = 0
+    for result in results:
+        if result.error:
+            failures += 1
+            print(f"{result.seconds:8.3f}s  FAILED  {result.data_file}: {result.error}")
+        else:
+            print(f"{result.seconds:8.3f}s  OK      {result.data_file} -> {result.report_file}")
+
+    print(f"Rendered {len(results) - failures}/{len(results)} reports in {elapsed:.3f}s")
+    sys.exit(1 if failures else 0)
+
+
+if __name__ == "__main__":
+    main()
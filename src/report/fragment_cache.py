@@ -0,0 +1,100 @@
+"""
+On-disk cache of rendered report fragments for incremental regeneration.
+
+Each fragment is stored together with a hash of the inputs it was rendered
+from. A fragment is reused only when the hash of the current inputs matches.
+"""
+import hashlib
+import json
+import logging
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+from utils import metrics
+from utils.fileio import atomic_write
+
+logger = logging.getLogger(__name__)
+
+CACHE_VERSION = 1
+
+
+def hash_inputs(*values: Any) -> str:
+    """
+    Hash arbitrary JSON-like inputs into a stable hex digest.
+
+    Args:
+        values: Values the fragment depends on
+
+    Returns:
+        SHA-256 hex digest of the canonical JSON encoding
+    """
+    payload = json.dumps(values, sort_keys=True, ensure_ascii=False, default=str)
+    return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+
+class FragmentCache:
+    """Fragments of one report, keyed by section name."""
+
+    def __init__(self, path: Path):
+        """
+        Load the cache file if it exists.
+
+        Args:
+            path: JSON file holding the cached fragments
+        """
+        self.path = path
+        self.hits = 0
+        self.misses = 0
+        self._entries: Dict[str, Dict[str, str]] = {}
+        self._used: Dict[str, Dict[str, str]] = {}
+
+        if path.exists():
+            try:
+                with open(path, 'r', encoding='utf-8') as f:
+                    data = json.load(f)
+                if data.get('version') == CACHE_VERSION:
+                    self._entries = data.get('entries', {})
+            except (OSError, ValueError) as e:
+                logger.warning(f"Ignoring unreadable fragment cache {path}: {e}")
+
+    def get(self, key: str, input_hash: str) -> Optional[str]:
+        """
+        Look up a fragment rendered from the given inputs.
+
+        Args:
+            key: Section key
+            input_hash: Hash of the section's current inputs
+
+        Returns:
+            Cached fragment, or None if it is missing or stale
+        """
+        entry = self._entries.get(key)
+        if entry and entry.get('hash') == input_hash:
+            self.hits += 1
+            metrics.inc("cache_requests_total", cache="report_fragments", result="hit")
+            self._used[key] = entry
+            return entry['fragment']
+        self.misses += 1
+        metrics.inc("cache_requests_total", cache="report_fragments", result="miss")
+        return None
+
+    def put(self, key: str, input_hash: str, fragment: str) -> None:
+        """
+        Store a freshly rendered fragment.
+
+        Args:
+            key: Section key
+            input_hash: Hash of the inputs the fragment was rendered from
+            fragment: Rendered text
+        """
+        entry = {'hash': input_hash, 'fragment': fragment}
+        self._entries[key] = entry
+        self._used[key] = entry
+
+    def save(self) -> None:
+        """Write back the fragments used by this render, dropping stale ones."""
+        try:
+            with atomic_write(self.path) as f:
+                json.dump({'version': CACHE_VERSION, 'entries': self._used}, f, ensure_ascii=False)
+        except OSError as e:
+            logger.warning(f"Failed to save fragment cache {self.path}: {e}")
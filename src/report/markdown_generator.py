@@ -1,52 +1,71 @@
 """
 Markdown report generator for hackathon analysis.
 """
+import hashlib
 import logging
+import os
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Any, Optional
+from typing import Dict, Iterable, List, Any, Optional
 
-from jinja2 import Environment, FileSystemLoader, Template
-from collections import Counter
+from jinja2 import (
+    ChoiceLoader, DictLoader, Environment, FileSystemBytecodeCache,
+    FileSystemLoader, Template, TemplateNotFound
+)
 
 from models.hackathon import Hackathon, Project, ScrapingResult
-from analyzer.idea_generator import IdeaGenerator
+from models.table import ProjectTable, ProjectView
+from storage.corpus import Corpus
+from storage.serialization import load_result
+from report.aggregates import DEFAULT_SAMPLE_SIZE, ReportAggregates
+from report.fragment_cache import FragmentCache, hash_inputs
+from utils import metrics
+from utils.fileio import atomic_write
+from utils.profiling import profiled, span
 
 logger = logging.getLogger(__name__)
 
+DEFAULT_TEMPLATE_NAME = "default_report.md.j2"
 
-class MarkdownReportGenerator:
-    """Generates Markdown reports from hackathon data."""
-    
-    def __init__(self, template_dir: Optional[Path] = None):
-        """
-        Initialize the report generator.
-        
-        Args:
-            template_dir: Directory containing Jinja2 templates
-        """
-        if template_dir and template_dir.exists():
-            self.env = Environment(loader=FileSystemLoader(template_dir))
-        else:
-            # Use string templates if no template directory is provided
-            self.env = Environment(loader=None)
-        
-    def _create_default_template(self) -> Template:
-        """Create a default template for hackathon reports."""
-        template_str = """# {{ hackathon.name }} - Analysis Report
+# Number of template output chunks buffered before each write when streaming
+STREAM_BUFFER_SIZE = 64
+
+# The default report is assembled from section templates so that the
+# incremental renderer can cache and re-render each section on its own.
+# Every section after the header starts with its own leading blank line.
+SECTION_TEMPLATES = {
+    "header": """# {{ hackathon.name }} - Analysis Report
 
 Generated on: {{ generation_date }}
+""",
+    "overview": """
 
 ## Overview
 - **Event**: {{ hackathon.name }}
 - **URL**: {{ hackathon.devpost_url }}
-- **Total Projects**: {{ hackathon.projects|length }}
+- **Total Projects**: {{ total_projects }}
 - **Analysis Date**: {{ hackathon.scraped_at.strftime('%Y-%m-%d %H:%M:%S') if hackathon.scraped_at else 'N/A' }}
 {%- if hackathon.description %}
 
 ### Description
 {{ hackathon.description }}
 {%- endif %}
+{%- if hackathon.coverage %}
+
+### Crawl Coverage
+- **Projects Covered**: {{ hackathon.projects|length }} of {{ hackathon.coverage.projects_selected }} selected ({{ hackathon.coverage.projects_listed }} listed in the gallery)
+- **Scraped This Run**: {{ hackathon.coverage.projects_scraped }}{% if hackathon.coverage.projects_reused %} (+{{ hackathon.coverage.projects_reused }} unchanged, reused){% endif %}
+- **LLM Analyses**: {{ hackathon.coverage.projects_analyzed }} projects ({{ hackathon.coverage.llm_calls }} calls this run{% if hackathon.coverage.max_llm_calls is not none %}, budget {{ hackathon.coverage.max_llm_calls }}{% endif %})
+- **Pages Loaded**: {{ hackathon.coverage.pages_loaded }}{% if hackathon.coverage.max_pages is not none %} (budget {{ hackathon.coverage.max_pages }}){% endif %}
+{%- if hackathon.coverage.time_budget_seconds %}
+- **Time Budget**: {{ (hackathon.coverage.time_budget_seconds / 60)|round(1) }} min
+{%- endif %}
+{%- if hackathon.coverage.stopped_by %}
+- **Stopped By**: {{ hackathon.coverage.stopped_by }} budget (highest-priority projects first: winners, then most liked)
+{%- endif %}
+{%- endif %}
+""",
+    "statistics": """
 
 ## Project Statistics
 
@@ -61,9 +80,16 @@ Generated on: {{ generation_date }}
 - **{{ award }}**: {{ count }} project(s)
 {%- endfor %}
 {%- endif %}
+""",
+    "projects_header": """
 
 ## Projects
-{%- for project in hackathon.projects %}
+{%- if sampled_projects %}
+
+*Showing the top {{ hackathon.projects|length }} of {{ total_projects }} projects.*
+{%- endif %}
+""",
+    "project": """
 
 ### {{ project.name }}
 {%- if project.description %}
@@ -88,15 +114,12 @@ Generated on: {{ generation_date }}
 {%- if project.project_url %}
 **External URL**: {{ project.project_url }}
 {%- endif %}
-{%- if not loop.last %}
-
----
-{%- endif %}
-{%- endfor %}
+""",
+    "summary": """
 
 ## Analysis Summary
 
-This report analyzed {{ hackathon.projects|length }} projects from {{ hackathon.name }}.
+This report analyzed {{ total_projects }} projects from {{ hackathon.name }}.
 {%- if top_tags %}
 
 The most popular technologies were:
@@ -108,19 +131,114 @@ The most popular technologies were:
 ## Methodology
 
 This report was generated by scraping data from Devpost using automated tools. The analysis includes project descriptions, technologies used, team information, and awards received.
+""",
+    "ideas": """
 {%- if include_ideas and ai_ideas %}
 
 ---
 
 {{ ai_ideas }}
 {%- endif %}
+""",
+    "footer": """
 
 ---
 
 *Report generated by Hackathon Insight Automator on {{ generation_date }}*
-"""
-        return self.env.from_string(template_str)
+""",
+}
+
+# Text placed between consecutive project sections
+PROJECT_SEPARATOR = "\n\n---"
+
+
+def section_template_name(section: str) -> str:
+    """Return the loader name of a default report section template."""
+    return f"sections/{section}.md.j2"
+
+
+DEFAULT_TEMPLATE = (
+    '{% include "' + section_template_name("header") + '" %}'
+    '{% include "' + section_template_name("overview") + '" %}'
+    '{% include "' + section_template_name("statistics") + '" %}'
+    '{% include "' + section_template_name("projects_header") + '" %}'
+    '{% for project in hackathon.projects %}'
+    '{% include "' + section_template_name("project") + '" %}'
+    '{% if not loop.last %}' + PROJECT_SEPARATOR + '{% endif %}'
+    '{% endfor %}'
+    '{% include "' + section_template_name("summary") + '" %}'
+    '{% include "' + section_template_name("ideas") + '" %}'
+    '{% include "' + section_template_name("footer") + '" %}'
+)
+
+
+class MarkdownReportGenerator:
+    """Generates Markdown reports from hackathon data."""
+    
+    def __init__(
+        self,
+        template_dir: Optional[Path] = None,
+        cache_dir: Optional[Path] = None,
+        fragment_cache_dir: Optional[Path] = None
+    ):
+        """
+        Initialize the report generator.
+        
+        Args:
+            template_dir: Directory containing Jinja2 templates
+            cache_dir: Directory for the on-disk compiled template cache
+                (defaults to the TEMPLATE_CACHE_DIR environment variable)
+            fragment_cache_dir: Directory for cached report sections used by
+                incremental rendering (defaults to REPORT_FRAGMENT_CACHE_DIR)
+        """
+        # The default template is served through a loader so that it goes
+        # through the environment's template cache like any file template.
+        templates = {DEFAULT_TEMPLATE_NAME: DEFAULT_TEMPLATE}
+        for section, source in SECTION_TEMPLATES.items():
+            templates[section_template_name(section)] = source
+        loaders = [DictLoader(templates)]
+        if template_dir and template_dir.exists():
+            loaders.insert(0, FileSystemLoader(template_dir))
+        
+        if cache_dir is None and os.getenv("TEMPLATE_CACHE_DIR"):
+            cache_dir = Path(os.environ["TEMPLATE_CACHE_DIR"])
+        
+        bytecode_cache = None
+        if cache_dir:
+            cache_dir.mkdir(parents=True, exist_ok=True)
+            bytecode_cache = FileSystemBytecodeCache(str(cache_dir))
+        
+        self.env = Environment(loader=ChoiceLoader(loaders), bytecode_cache=bytecode_cache)
+        self._template_cache: Dict[str, Template] = {}
+        self.fragment_cache_dir = fragment_cache_dir or Path(
+            os.getenv("REPORT_FRAGMENT_CACHE_DIR", ".cache/report_fragments")
+        )
     
+    def _get_template(self, template_name: str) -> Template:
+        """
+        Get a compiled template, compiling it only on first use.
+        
+        Args:
+            template_name: Name of the template to load
+            
+        Returns:
+            Compiled template (the default template if the name is unknown)
+        """
+        template = self._template_cache.get(template_name)
+        if template is None:
+            try:
+                template = self.env.get_template(template_name)
+            except TemplateNotFound:
+                logger.warning(f"Template {template_name} not found, using default")
+                template = self._get_template(DEFAULT_TEMPLATE_NAME)
+            self._template_cache[template_name] = template
+        return template
+    
+    def _create_default_template(self) -> Template:
+        """Get the (cached) default template for hackathon reports."""
+        return self._get_template(DEFAULT_TEMPLATE_NAME)
+    
+    @profiled("report.analyze")
     def _analyze_hackathon_data(self, hackathon: Hackathon) -> Dict[str, Any]:
         """
         Analyze hackathon data to extract insights.
@@ -131,47 +249,18 @@ This report was generated by scraping data from Devpost using automated tools. T
         Returns:
             Dictionary containing analysis results
         """
-        projects = hackathon.projects
-        
-        # Count technologies/tags
-        all_tags = []
-        for project in projects:
-            all_tags.extend(project.tags)
-        
-        tag_counter = Counter(all_tags)
-        top_tags = tag_counter.most_common(10)
-        
-        # Count awards
-        all_awards = []
-        for project in projects:
-            for award in project.awards:
-                all_awards.append(award.name)
-        
-        award_counter = Counter(all_awards)
-        award_distribution = award_counter.most_common(10)
-        
-        # Team size analysis
-        team_sizes = []
-        for project in projects:
-            team_sizes.append(len(project.members))
-        
-        avg_team_size = sum(team_sizes) / len(team_sizes) if team_sizes else 0
-        
-        return {
-            'top_tags': top_tags,
-            'award_distribution': award_distribution,
-            'avg_team_size': round(avg_team_size, 1),
-            'total_projects': len(projects),
-            'total_awards': len(all_awards),
-            'unique_technologies': len(tag_counter)
-        }
+        aggregates = ReportAggregates()
+        aggregates.add_hackathon(hackathon)
+        return aggregates.analysis()
     
+    @profiled("report.generate")
     def generate_report(
         self, 
         hackathon: Hackathon, 
         output_path: Path,
         template_name: Optional[str] = None,
-        generate_ideas: bool = False
+        generate_ideas: bool = False,
+        incremental: bool = False
     ) -> bool:
         """
         Generate a Markdown report for a hackathon.
@@ -181,20 +270,23 @@ This report was generated by scraping data from Devpost using automated tools. T
             output_path: Path to save the report
             template_name: Name of template file to use (optional)
             generate_ideas: Whether to generate AI ideas
+            incremental: Whether to reuse cached sections (and AI ideas) whose
+                inputs have not changed since the last report for this hackathon
             
         Returns:
             True if report was generated successfully, False otherwise
         """
         try:
             # Get template
-            if template_name:
-                try:
-                    template = self.env.get_template(template_name)
-                except:
-                    logger.warning(f"Template {template_name} not found, using default")
-                    template = self._create_default_template()
-            else:
-                template = self._create_default_template()
+            template_name = template_name or DEFAULT_TEMPLATE_NAME
+            template = self._get_template(template_name)
+            
+            fragment_cache = None
+            if incremental:
+                if template_name == DEFAULT_TEMPLATE_NAME:
+                    fragment_cache = self._get_fragment_cache(hackathon)
+                else:
+                    logger.warning(f"Incremental rendering is only supported for the default template, rendering {template_name} in full")
             
             # Analyze data
             analysis = self._analyze_hackathon_data(hackathon)
@@ -202,25 +294,7 @@ This report was generated by scraping data from Devpost using automated tools. T
             # Generate AI ideas if requested
             ideas_markdown = ""
             if generate_ideas:
-                try:
-                    logger.info("Generating AI ideas...")
-                    idea_generator = IdeaGenerator()
-                    
-                    if not idea_generator.enabled:
-                        ideas_markdown = "## 🚀 AI-Generated MVP Ideas\n\n⚠️ AI idea generation is disabled. Please ensure your Google API key is set in the environment variables."
-                    else:
-                        # Call synchronous function directly
-                        ideas = idea_generator.generate_ideas(hackathon, num_ideas=5)
-                        
-                        if ideas:
-                            ideas_markdown = idea_generator.format_ideas_markdown(ideas)
-                            logger.info(f"Generated {len(ideas)} AI ideas")
-                        else:
-                            logger.warning("No AI ideas generated")
-                            ideas_markdown = "## 🚀 AI-Generated MVP Ideas\n\n⚠️ Unable to generate ideas. This may be due to:\n- Insufficient project data\n- API rate limits\n- Network connectivity issues\n\nPlease try again later."
-                except Exception as e:
-                    logger.error(f"Error generating AI ideas: {e}", exc_info=True)
-                    ideas_markdown = f"## 🚀 AI-Generated MVP Ideas\n\n⚠️ Error generating ideas: {str(e)}\n\nPlease check:\n- Google API key is correctly set\n- Network connectivity\n- API quota limits"
+                ideas_markdown = self._generate_ideas_markdown(hackathon, fragment_cache)
             
             # Prepare template context
             context = {
@@ -231,74 +305,376 @@ This report was generated by scraping data from Devpost using automated tools. T
                 **analysis
             }
             
-            # Generate report
-            report_content = template.render(**context)
-            
-            # Save report
-            output_path.parent.mkdir(parents=True, exist_ok=True)
-            with open(output_path, 'w', encoding='utf-8') as f:
-                f.write(report_content)
+            with metrics.timed("report_render_seconds", kind="hackathon"):
+                if fragment_cache is not None:
+                    self._write_incremental_report(context, fragment_cache, output_path)
+                    fragment_cache.save()
+                    logger.info(f"Reused {fragment_cache.hits} cached report sections, rendered {fragment_cache.misses}")
+                else:
+                    self._write_report(template, context, output_path)
             
             logger.info(f"Generated report: {output_path}")
+            metrics.inc("reports_total", kind="hackathon")
             return True
             
         except Exception as e:
             logger.error(f"Failed to generate report: {e}")
+            metrics.inc("failures_total", stage="report")
             return False
     
+    @profiled("report.ideas")
+    def _generate_ideas_markdown(self, hackathon: Hackathon, fragment_cache: Optional[FragmentCache] = None) -> str:
+        """
+        Generate the AI ideas section, reusing cached ideas when possible.
+        
+        Args:
+            hackathon: Hackathon data to generate ideas for
+            fragment_cache: Fragment cache of an incremental render (optional)
+            
+        Returns:
+            Markdown for the ideas section
+        """
+        ideas_hash = None
+        if fragment_cache is not None:
+            # Ideas depend only on the project data fed into the prompt
+            ideas_hash = hash_inputs(
+                hackathon.name,
+                [(project.name, project.tags, project.description) for project in hackathon.projects]
+            )
+            cached_ideas = fragment_cache.get("ideas_markdown", ideas_hash)
+            if cached_ideas is not None:
+                logger.info("Reusing cached AI ideas (project data unchanged)")
+                return cached_ideas
+        
+        try:
+            # Imported here so plain report rendering never loads the LLM stack
+            from analyzer.idea_generator import IdeaGenerator
+            
+            logger.info("Generating AI ideas...")
+            idea_generator = IdeaGenerator()
+            
+            if not idea_generator.enabled:
+                return "## 🚀 AI-Generated MVP Ideas\n\n⚠️ AI idea generation is disabled. Please ensure your Google API key is set in the environment variables."
+            
+            # Call synchronous function directly
+            ideas = idea_generator.generate_ideas(hackathon, num_ideas=5)
+            
+            if ideas:
+                ideas_markdown = idea_generator.format_ideas_markdown(ideas)
+                logger.info(f"Generated {len(ideas)} AI ideas")
+                if fragment_cache is not None:
+                    fragment_cache.put("ideas_markdown", ideas_hash, ideas_markdown)
+                return ideas_markdown
+            
+            logger.warning("No AI ideas generated")
+            return "## 🚀 AI-Generated MVP Ideas\n\n⚠️ Unable to generate ideas. This may be due to:\n- Insufficient project data\n- API rate limits\n- Network connectivity issues\n\nPlease try again later."
+        except Exception as e:
+            logger.error(f"Error generating AI ideas: {e}", exc_info=True)
+            return f"## 🚀 AI-Generated MVP Ideas\n\n⚠️ Error generating ideas: {str(e)}\n\nPlease check:\n- Google API key is correctly set\n- Network connectivity\n- API quota limits"
+    
+    def _get_fragment_cache(self, hackathon: Hackathon) -> FragmentCache:
+        """Open the fragment cache of a hackathon, keyed by its Devpost URL."""
+        key = hashlib.sha1(str(hackathon.devpost_url).encode('utf-8')).hexdigest()
+        return FragmentCache(self.fragment_cache_dir / f"{key}.json")
+    
+    def _render_section(
+        self,
+        section: str,
+        context: Dict[str, Any],
+        fragment_cache: FragmentCache,
+        cache_key: Optional[str] = None,
+        inputs: Any = None
+    ) -> str:
+        """
+        Render one section of the default template, or reuse its cached fragment.
+        
+        Args:
+            section: Section template name (see SECTION_TEMPLATES)
+            context: Template context
+            fragment_cache: Fragment cache of this report
+            cache_key: Cache key (defaults to the section name)
+            inputs: Values the section depends on (None disables caching)
+            
+        Returns:
+            Rendered section text
+        """
+        template = self._get_template(section_template_name(section))
+        if inputs is None:
+            with span("report.render_section", section=section):
+                return template.render(**context)
+        
+        input_hash = hash_inputs(SECTION_TEMPLATES[section], inputs)
+        cache_key = cache_key or section
+        fragment = fragment_cache.get(cache_key, input_hash)
+        if fragment is None:
+            with span("report.render_section", section=section):
+                fragment = template.render(**context)
+            fragment_cache.put(cache_key, input_hash, fragment)
+        return fragment
+    
+    @profiled("report.write_incremental")
+    def _write_incremental_report(
+        self,
+        context: Dict[str, Any],
+        fragment_cache: FragmentCache,
+        output_path: Path
+    ) -> None:
+        """
+        Write the default report section by section, re-rendering only dirty sections.
+        
+        The result is identical to rendering DEFAULT_TEMPLATE in one pass.
+        
+        Args:
+            context: Template context
+            fragment_cache: Fragment cache of this report
+            output_path: Path to save the report
+        """
+        hackathon = context['hackathon']
+        coverage = getattr(hackathon, 'coverage', None)
+        
+        with atomic_write(output_path) as f:
+            # Header and footer only carry the generation date
+            f.write(self._render_section("header", context, fragment_cache))
+            f.write(self._render_section("overview", context, fragment_cache, inputs=[
+                hackathon.name,
+                str(hackathon.devpost_url),
+                context['total_projects'],
+                hackathon.scraped_at,
+                hackathon.description,
+                coverage.model_dump() if coverage is not None else None,
+                len(hackathon.projects)
+            ]))
+            f.write(self._render_section("statistics", context, fragment_cache, inputs=[
+                context['top_tags'],
+                context['award_distribution']
+            ]))
+            f.write(self._render_section("projects_header", context, fragment_cache, inputs=[
+                context.get('sampled_projects'),
+                len(hackathon.projects),
+                context['total_projects']
+            ]))
+            
+            for i, project in enumerate(hackathon.projects):
+                if i:
+                    f.write(PROJECT_SEPARATOR)
+                project_data = project.model_dump(mode='json', warnings=False) if isinstance(project, (Project, ProjectView)) else project
+                project_hash = hash_inputs(project_data)
+                f.write(self._render_section(
+                    "project",
+                    {**context, 'project': project},
+                    fragment_cache,
+                    cache_key=f"project:{project_hash}",
+                    inputs=project_hash
+                ))
+            
+            f.write(self._render_section("summary", context, fragment_cache, inputs=[
+                context['total_projects'],
+                hackathon.name,
+                context['top_tags'][:3]
+            ]))
+            f.write(self._render_section("ideas", context, fragment_cache, inputs=[
+                context['include_ideas'],
+                context['ai_ideas']
+            ]))
+            f.write(self._render_section("footer", context, fragment_cache))
+    
+    @profiled("report.write")
+    def _write_report(self, template: Template, context: Dict[str, Any], output_path: Path) -> None:
+        """
+        Render a template straight to disk.
+        
+        The output is streamed in buffered chunks instead of building the
+        whole document in memory first, and only replaces an existing report
+        once it has been written completely.
+        
+        Args:
+            template: Compiled report template
+            context: Template context
+            output_path: Path to save the report
+        """
+        stream = template.stream(**context)
+        stream.enable_buffering(STREAM_BUFFER_SIZE)
+        with atomic_write(output_path) as f:
+            stream.dump(f)
+    
+    @profiled("report.write_summary")
+    def _write_summary_report(
+        self,
+        aggregates: ReportAggregates,
+        output_path: Path,
+        generate_ideas: bool = False
+    ) -> bool:
+        """
+        Render a combined report from running aggregates.
+        
+        Args:
+            aggregates: Aggregates folded from one or more hackathons
+            output_path: Path to save the summary report
+            generate_ideas: Whether to generate AI ideas from the sampled projects
+            
+        Returns:
+            True if report was generated successfully, False otherwise
+        """
+        if not aggregates.hackathon_count:
+            logger.error("No successful scraping results to generate summary")
+            return False
+        
+        sample = aggregates.sample_projects()
+        # The sample was already validated (or is trusted raw data), so the
+        # combined hackathon is constructed without re-validating it
+        combined_hackathon = Hackathon.model_construct(
+            name=f"Combined Analysis ({aggregates.hackathon_count} events)",
+            devpost_url="https://devpost.com",
+            projects=sample
+        )
+        
+        context = {
+            'hackathon': combined_hackathon,
+            'generation_date': datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
+            'ai_ideas': self._generate_ideas_markdown(combined_hackathon) if generate_ideas else "",
+            'include_ideas': generate_ideas,
+            'sampled_projects': len(sample) < aggregates.total_projects,
+            **aggregates.analysis()
+        }
+        
+        with metrics.timed("report_render_seconds", kind="summary"):
+            self._write_report(self._create_default_template(), context, output_path)
+        
+        logger.info(f"Generated summary report: {output_path}")
+        metrics.inc("reports_total", kind="summary")
+        return True
+    
+    @profiled("report.summary")
     def generate_summary_report(
         self, 
-        results: List[ScrapingResult], 
-        output_path: Path
+        results: Iterable[ScrapingResult], 
+        output_path: Path,
+        sample_size: int = DEFAULT_SAMPLE_SIZE,
+        generate_ideas: bool = False
     ) -> bool:
         """
         Generate a summary report from multiple scraping results.
         
+        Results are folded into running aggregates as they are iterated, so
+        a generator keeps only one result (and the sampled projects) in memory.
+        
         Args:
-            results: List of scraping results
+            results: Scraping results (any iterable)
             output_path: Path to save the summary report
+            sample_size: Number of top projects listed in the report
+            generate_ideas: Whether to generate AI ideas from the listed projects
             
         Returns:
             True if report was generated successfully, False otherwise
         """
         try:
-            successful_results = [r for r in results if r.success and r.hackathon]
+            aggregates = ReportAggregates(sample_size=sample_size)
+            for result in results:
+                if result.success and result.hackathon:
+                    aggregates.add_hackathon(result.hackathon)
             
-            if not successful_results:
-                logger.error("No successful scraping results to generate summary")
-                return False
+            return self._write_summary_report(aggregates, output_path, generate_ideas=generate_ideas)
             
-            # Combine all projects
-            all_projects = []
-            hackathon_names = []
+        except Exception as e:
+            logger.error(f"Failed to generate summary report: {e}")
+            metrics.inc("failures_total", stage="summary_report")
+            return False
+    
+    @profiled("report.table_summary")
+    def generate_table_report(
+        self,
+        table: ProjectTable,
+        output_path: Path,
+        sample_size: int = DEFAULT_SAMPLE_SIZE
+    ) -> bool:
+        """
+        Generate a summary report from a ProjectTable.
+        
+        Statistics are computed from the table's columns and only the
+        sampled projects are materialized for rendering.
+        
+        Args:
+            table: Projects of one or more hackathons
+            output_path: Path to save the summary report
+            sample_size: Number of top projects listed in the report
             
-            for result in successful_results:
-                hackathon = result.hackathon
-                all_projects.extend(hackathon.projects)
-                hackathon_names.append(hackathon.name)
+        Returns:
+            True if report was generated successfully, False otherwise
+        """
+        try:
+            aggregates = ReportAggregates(sample_size=sample_size)
+            aggregates.add_table(table)
             
-            # Create combined hackathon for analysis
-            combined_hackathon = Hackathon(
-                name=f"Combined Analysis ({len(hackathon_names)} events)",
-                devpost_url="https://devpost.com",
-                projects=all_projects
-            )
+            return self._write_summary_report(aggregates, output_path)
             
-            # Generate report
-            return self.generate_report(combined_hackathon, output_path)
+        except Exception as e:
+            logger.error(f"Failed to generate summary report: {e}")
+            metrics.inc("failures_total", stage="summary_report")
+            return False
+    
+    @profiled("report.streaming_summary")
+    def generate_streaming_summary_report(
+        self,
+        result_files: Iterable[Path],
+        output_path: Path,
+        sample_size: int = DEFAULT_SAMPLE_SIZE,
+        generate_ideas: bool = False
+    ) -> bool:
+        """
+        Generate a summary report from stored raw result files.
+        
+        Files are read one at a time and folded into running aggregates, so
+        memory use does not grow with the number of hackathons.
+        
+        Args:
+            result_files: Paths to raw scraping result JSON files
+            output_path: Path to save the summary report
+            sample_size: Number of top projects listed in the report
+            generate_ideas: Whether to generate AI ideas from the listed projects
+            
+        Returns:
+            True if report was generated successfully, False otherwise
+        """
+        try:
+            aggregates = ReportAggregates(sample_size=sample_size)
+            for result_file in result_files:
+                try:
+                    aggregates.add_result_file(result_file)
+                except (OSError, ValueError) as e:
+                    logger.warning(f"Skipping unreadable result file {result_file}: {e}")
+            
+            return self._write_summary_report(aggregates, output_path, generate_ideas=generate_ideas)
             
         except Exception as e:
             logger.error(f"Failed to generate summary report: {e}")
+            metrics.inc("failures_total", stage="summary_report")
             return False
 
 
 def main():
     """Main function for testing the report generator."""
-    import json
     import sys
     
     if len(sys.argv) < 2:
-        print("Usage: python markdown_generator.py <json_data_file>")
+        print("Usage: python markdown_generator.py <json_data_file> [<json_data_file> ...] | <raw_data_dir>")
+        return
+    
+    if len(sys.argv) > 2 or Path(sys.argv[1]).is_dir():
+        # Several files or a raw data directory: stream them into one
+        # combined summary report
+        logging.basicConfig(level=logging.INFO)
+        generator = MarkdownReportGenerator()
+        output_path = Path("reports") / f"summary_{datetime.now().strftime('%Y%m%d_%H%M%S')}.md"
+        if len(sys.argv) == 2:
+            # Only the current result of each hackathon
+            data_files = iter(Corpus(Path(sys.argv[1])).current_paths())
+        else:
+            data_files = (Path(arg) for arg in sys.argv[1:])
+        
+        if generator.generate_streaming_summary_report(data_files, output_path):
+            print(f"Summary report generated: {output_path}")
+        else:
+            print("Failed to generate summary report")
         return
     
     data_file = Path(sys.argv[1])
@@ -311,12 +687,8 @@ def main():
     logging.basicConfig(level=logging.INFO)
     
     try:
-        # Load data
-        with open(data_file, 'r', encoding='utf-8') as f:
-            data = json.load(f)
-        
-        # Create ScrapingResult from JSON
-        result = ScrapingResult(**data)
+        # Load data (validated according to VALIDATION_MODE)
+        result = load_result(data_file)
         
         if not result.success or not result.hackathon:
             print("No valid hackathon data found")
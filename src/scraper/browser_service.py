@@ -0,0 +1,478 @@
+"""
+Browser engine selection and a long-lived local browser service.
+
+Launching a browser costs seconds per run, and much more when Chromium
+fails and the Firefox/WebKit fallback chain has to time out first. Two
+things avoid that:
+
+- EngineCache records, per host and Playwright version, which engine last
+  launched successfully, so launch_browser() tries it first and engines
+  known to fail last.
+- BrowserService keeps one browser running between CLI invocations. The
+  scraper connects to it (``main.py --browser-service``) instead of
+  launching its own. Chromium is exposed over CDP, so the browser itself
+  stays warm; for Firefox and WebKit the service runs ``playwright
+  run-server`` and each connection gets a browser from that warm driver.
+  The service health-checks its endpoint and restarts the browser when it
+  dies.
+
+The engine cache and service state live in BROWSER_STATE_DIR (default: .cache).
+
+Usage (from src/):
+    python -m scraper.browser_service start [--port 9222] [--engine chromium] [--no-headless]
+    python -m scraper.browser_service status
+    python -m scraper.browser_service stop
+"""
+import argparse
+import asyncio
+import json
+import logging
+import os
+import platform
+import signal
+import socket
+import subprocess
+import sys
+import time
+import urllib.request
+from dataclasses import asdict, dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Sequence, Tuple
+
+from utils.fileio import atomic_write
+
+if TYPE_CHECKING:
+    from playwright.async_api import Browser, Playwright
+
+logger = logging.getLogger(__name__)
+
+ENGINES = ("chromium", "firefox", "webkit")
+DEFAULT_PORT = 9222
+LAUNCH_TIMEOUT_MS = 60000
+CONNECT_TIMEOUT_MS = 10000
+ENGINE_CACHE_FILE = "browser_engine.json"
+SERVICE_STATE_FILE = "browser_service.json"
+
+# More conservative options for headless Chromium
+HEADLESS_CHROMIUM_ARGS = [
+    '--no-sandbox',
+    '--disable-setuid-sandbox',
+    '--disable-dev-shm-usage',
+    '--disable-accelerated-2d-canvas',
+    '--no-first-run',
+    '--no-zygote',
+    '--single-process',
+    '--disable-gpu'
+]
+
+
+def get_state_dir(state_dir: Optional[Path] = None) -> Path:
+    """Resolve the directory of the engine cache and service state (BROWSER_STATE_DIR, default .cache)."""
+    if state_dir is not None:
+        return state_dir
+    return Path(os.getenv("BROWSER_STATE_DIR", ".cache"))
+
+
+def _playwright_version() -> str:
+    try:
+        from importlib.metadata import version
+        return version("playwright")
+    except Exception:
+        return "unknown"
+
+
+def launch_options(engine: str, headless: bool, extra_args: Sequence[str] = ()) -> Dict[str, Any]:
+    """Keyword arguments for ``playwright.<engine>.launch``."""
+    options: Dict[str, Any] = {'headless': headless, 'timeout': LAUNCH_TIMEOUT_MS}
+    args = list(HEADLESS_CHROMIUM_ARGS) if engine == "chromium" and headless else []
+    args.extend(extra_args)
+    if args:
+        options['args'] = args
+    return options
+
+
+class EngineCache:
+    """Which browser engine works on this host, keyed by host and Playwright version."""
+
+    def __init__(self, state_dir: Optional[Path] = None):
+        self.path = get_state_dir(state_dir) / ENGINE_CACHE_FILE
+        self.key = f"{platform.node()}|{platform.system()}-{platform.machine()}|playwright-{_playwright_version()}"
+
+    def _load_all(self) -> Dict[str, Any]:
+        try:
+            return json.loads(self.path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return {}
+
+    def load(self) -> Dict[str, Any]:
+        """The record of this host: ``{"engine": ..., "verified_at": ..., "failed": {engine: error}}``."""
+        return self._load_all().get(self.key, {})
+
+    def _update(self, record: Dict[str, Any]) -> None:
+        records = self._load_all()
+        records[self.key] = record
+        try:
+            with atomic_write(self.path) as f:
+                json.dump(records, f, indent=2)
+        except OSError as e:
+            logger.warning(f"Failed to write browser engine cache {self.path}: {e}")
+
+    def preferred_order(self) -> List[str]:
+        """Engines to try: the last working one, then untried ones, then ones that failed."""
+        record = self.load()
+        working = record.get("engine")
+        failed = record.get("failed", {})
+        order = [working] if working in ENGINES else []
+        order += [engine for engine in ENGINES if engine not in order and engine not in failed]
+        order += [engine for engine in ENGINES if engine not in order]
+        return order
+
+    def record_success(self, engine: str) -> None:
+        record = self.load()
+        record["engine"] = engine
+        record["verified_at"] = datetime.now().isoformat()
+        record.get("failed", {}).pop(engine, None)
+        self._update(record)
+
+    def record_failure(self, engine: str, error: Exception) -> None:
+        record = self.load()
+        record.setdefault("failed", {})[engine] = str(error).splitlines()[0][:300] if str(error) else type(error).__name__
+        if record.get("engine") == engine:
+            del record["engine"]
+        self._update(record)
+
+
+async def launch_browser(
+    playwright: "Playwright",
+    headless: bool,
+    cache: Optional[EngineCache] = None,
+    engines: Optional[Sequence[str]] = None,
+    extra_args: Sequence[str] = ()
+) -> Tuple["Browser", str]:
+    """
+    Launch the first engine that works, starting with the one cached for this host.
+
+    Args:
+        playwright: Started Playwright instance
+        headless: Whether to run the browser headless
+        cache: Engine cache (defaults to the one in BROWSER_STATE_DIR)
+        engines: Engines to try instead of the cached order
+        extra_args: Extra command-line arguments for Chromium
+
+    Returns:
+        (browser, engine name)
+
+    Raises:
+        Exception: The last launch error if no engine could be launched
+    """
+    cache = cache or EngineCache()
+    last_error: Optional[Exception] = None
+    for engine in engines or cache.preferred_order():
+        try:
+            browser = await getattr(playwright, engine).launch(
+                **launch_options(engine, headless, extra_args if engine == "chromium" else ())
+            )
+        except Exception as e:
+            logger.warning(f"Failed to launch {engine}: {e}")
+            cache.record_failure(engine, e)
+            last_error = e
+            continue
+        if engine != cache.load().get("engine"):
+            cache.record_success(engine)
+        return browser, engine
+    raise last_error or RuntimeError("No browser engine to launch")
+
+
+@dataclass
+class ServiceState:
+    """Endpoint of a running BrowserService, shared with clients through the state file."""
+    pid: int
+    engine: str
+    mode: str  # "cdp" (Chromium, warm browser), "ws" (playwright run-server) or "starting"
+    endpoint: str
+    port: int
+    headless: bool
+    started_at: str
+    restarts: int = 0
+
+    def save(self, state_dir: Optional[Path] = None) -> None:
+        with atomic_write(get_state_dir(state_dir) / SERVICE_STATE_FILE) as f:
+            json.dump(asdict(self), f, indent=2)
+
+    @classmethod
+    def load(cls, state_dir: Optional[Path] = None) -> Optional["ServiceState"]:
+        try:
+            data = json.loads((get_state_dir(state_dir) / SERVICE_STATE_FILE).read_text(encoding="utf-8"))
+            return cls(**data)
+        except (OSError, ValueError, TypeError):
+            return None
+
+    @staticmethod
+    def remove(state_dir: Optional[Path] = None) -> None:
+        try:
+            (get_state_dir(state_dir) / SERVICE_STATE_FILE).unlink()
+        except FileNotFoundError:
+            pass
+
+
+def _pid_alive(pid: int) -> bool:
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
+
+
+def endpoint_healthy(state: ServiceState, timeout: float = 1.0) -> bool:
+    """Whether the service endpoint answers: CDP's /json/version, or a TCP connect for run-server."""
+    try:
+        if state.mode == "cdp":
+            with urllib.request.urlopen(f"{state.endpoint}/json/version", timeout=timeout) as response:
+                return response.status == 200
+        with socket.create_connection(("127.0.0.1", state.port), timeout=timeout):
+            return True
+    except OSError:
+        return False
+
+
+def running_service(state_dir: Optional[Path] = None) -> Optional[ServiceState]:
+    """State of the running service, or None if none is running and healthy."""
+    state = ServiceState.load(state_dir)
+    if state is None or state.mode == "starting" or not _pid_alive(state.pid) or not endpoint_healthy(state):
+        return None
+    return state
+
+
+async def connect_to_service(
+    playwright: "Playwright",
+    headless: bool = True,
+    state_dir: Optional[Path] = None
+) -> Optional["Browser"]:
+    """
+    Connect to the running browser service.
+
+    Args:
+        playwright: Started Playwright instance
+        headless: Headless setting for browsers launched by a run-server service
+        state_dir: Directory of the service state file
+
+    Returns:
+        Connected browser, or None if no healthy service is running
+    """
+    state = await asyncio.to_thread(running_service, state_dir)
+    if state is None:
+        return None
+    try:
+        if state.mode == "cdp":
+            browser = await playwright.chromium.connect_over_cdp(state.endpoint, timeout=CONNECT_TIMEOUT_MS)
+        else:
+            browser = await getattr(playwright, state.engine).connect(
+                state.endpoint,
+                timeout=CONNECT_TIMEOUT_MS,
+                headers={"x-playwright-launch-options": json.dumps(launch_options(state.engine, headless))}
+            )
+    except Exception as e:
+        logger.warning(f"Failed to connect to browser service at {state.endpoint}: {e}")
+        return None
+    logger.info(f"Connected to browser service ({state.engine}) at {state.endpoint}")
+    return browser
+
+
+class BrowserService:
+    """Keeps a browser running and reachable, restarting it when health checks fail."""
+
+    def __init__(
+        self,
+        port: int = DEFAULT_PORT,
+        headless: bool = True,
+        engine: Optional[str] = None,
+        state_dir: Optional[Path] = None,
+        health_interval: float = 5.0
+    ):
+        """
+        Args:
+            port: Local port of the CDP or run-server endpoint
+            headless: Whether to run the browser headless
+            engine: Engine to serve (defaults to the first working one)
+            state_dir: Directory of the engine cache and state file
+            health_interval: Seconds between health checks
+        """
+        self.port = port
+        self.headless = headless
+        self.engine = engine
+        self.state_dir = get_state_dir(state_dir)
+        self.health_interval = health_interval
+        self.cache = EngineCache(self.state_dir)
+        self.state: Optional[ServiceState] = None
+        self.restarts = 0
+        self._playwright: Optional["Playwright"] = None
+        self._browser: Optional["Browser"] = None
+        self._server: Optional[subprocess.Popen] = None
+        self._stopping = asyncio.Event()
+
+    async def _start(self) -> None:
+        engines = [self.engine] if self.engine else self.cache.preferred_order()
+        if engines[0] == "chromium":
+            try:
+                self._browser, engine = await launch_browser(
+                    self._playwright, self.headless, self.cache, engines=["chromium"],
+                    extra_args=[f"--remote-debugging-port={self.port}", "--remote-debugging-address=127.0.0.1"]
+                )
+                mode, endpoint = "cdp", f"http://127.0.0.1:{self.port}"
+            except Exception:
+                if self.engine:
+                    raise
+                engines = [e for e in engines if e != "chromium"]
+        if self._browser is None:
+            # No CDP outside Chromium: verify the engine launches, then serve it through run-server
+            probe, engine = await launch_browser(self._playwright, self.headless, self.cache, engines=engines)
+            await probe.close()
+            self._server = subprocess.Popen(
+                [sys.executable, "-m", "playwright", "run-server", "--port", str(self.port), "--host", "127.0.0.1"],
+                stdout=subprocess.DEVNULL
+            )
+            mode, endpoint = "ws", f"ws://127.0.0.1:{self.port}/"
+
+        self.state = ServiceState(
+            pid=os.getpid(), engine=engine, mode=mode, endpoint=endpoint, port=self.port,
+            headless=self.headless, started_at=datetime.now().isoformat(), restarts=self.restarts
+        )
+        for _ in range(50):
+            if await asyncio.to_thread(endpoint_healthy, self.state):
+                break
+            await asyncio.sleep(0.2)
+        else:
+            raise RuntimeError(f"Browser service endpoint {endpoint} did not come up")
+        self.state.save(self.state_dir)
+        logger.info(f"Browser service ready: {engine} at {endpoint}")
+
+    def _save_starting(self) -> None:
+        """Record the pid before any endpoint is up, so stop and status can find the service."""
+        ServiceState(
+            pid=os.getpid(), engine=self.engine or "", mode="starting", endpoint="", port=self.port,
+            headless=self.headless, started_at=datetime.now().isoformat(), restarts=self.restarts
+        ).save(self.state_dir)
+
+    async def _stop_current(self) -> None:
+        if self._browser is not None:
+            try:
+                await self._browser.close()
+            except Exception as e:
+                logger.warning(f"Error closing browser: {e}")
+            self._browser = None
+        if self._server is not None:
+            self._server.terminate()
+            try:
+                self._server.wait(timeout=10)
+            except subprocess.TimeoutExpired:
+                self._server.kill()
+            self._server = None
+
+    async def _healthy(self) -> bool:
+        if self.state is None:
+            return False
+        if self._browser is not None and not self._browser.is_connected():
+            return False
+        if self._server is not None and self._server.poll() is not None:
+            return False
+        return await asyncio.to_thread(endpoint_healthy, self.state)
+
+    def stop(self) -> None:
+        """Ask run() to shut down."""
+        self._stopping.set()
+
+    async def run(self) -> None:
+        """Serve until stopped (SIGTERM/SIGINT or stop()), restarting the browser when it fails."""
+        from playwright.async_api import async_playwright
+
+        loop = asyncio.get_running_loop()
+        for sig in (signal.SIGTERM, signal.SIGINT):
+            loop.add_signal_handler(sig, self.stop)
+
+        failures = 0
+        async with async_playwright() as playwright:
+            self._playwright = playwright
+            try:
+                while not self._stopping.is_set():
+                    if not await self._healthy():
+                        if self.state is not None:
+                            self.restarts += 1
+                            logger.warning(f"Browser service unhealthy; restarting (restart {self.restarts})")
+                        await self._stop_current()
+                        self._save_starting()
+                        try:
+                            await self._start()
+                            failures = 0
+                        except Exception as e:
+                            failures += 1
+                            self.state = None
+                            logger.error(f"Failed to start browser service: {e}")
+                    # Back off while starts keep failing
+                    wait = min(self.health_interval * 2 ** failures, 60.0)
+                    try:
+                        await asyncio.wait_for(self._stopping.wait(), wait)
+                    except asyncio.TimeoutError:
+                        pass
+            finally:
+                await self._stop_current()
+                ServiceState.remove(self.state_dir)
+                logger.info("Browser service stopped")
+
+
+def stop_service(state_dir: Optional[Path] = None, timeout: float = 15.0) -> bool:
+    """Send SIGTERM to the running service and wait for it to exit. Returns False if none was running."""
+    state = ServiceState.load(state_dir)
+    if state is None or not _pid_alive(state.pid):
+        ServiceState.remove(state_dir)
+        return False
+    os.kill(state.pid, signal.SIGTERM)
+    deadline = time.monotonic() + timeout
+    while _pid_alive(state.pid) and time.monotonic() < deadline:
+        time.sleep(0.2)
+    return True
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Long-lived local browser for the scraper")
+    parser.add_argument("command", choices=["start", "status", "stop"])
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT, help=f"Endpoint port (default: {DEFAULT_PORT})")
+    parser.add_argument("--engine", choices=ENGINES, default=None, help="Engine to serve (default: first that works)")
+    parser.add_argument("--no-headless", action="store_true", help="Show the browser window")
+    parser.add_argument("--health-interval", type=float, default=5.0, help="Seconds between health checks")
+    parser.add_argument("--state-dir", type=Path, default=None, help="Engine cache and state directory (default: BROWSER_STATE_DIR or .cache)")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(message)s")
+
+    if args.command == "status":
+        state = ServiceState.load(args.state_dir)
+        cached = EngineCache(args.state_dir).load()
+        print(f"Cached engine: {cached.get('engine', '-')} (failed: {', '.join(cached.get('failed', {})) or '-'})")
+        if state is None:
+            print("Browser service: not running")
+            raise SystemExit(1)
+        if state.mode == "starting" and _pid_alive(state.pid):
+            print(f"Browser service: starting (pid {state.pid}, {state.restarts} restarts)")
+            raise SystemExit(1)
+        healthy = _pid_alive(state.pid) and endpoint_healthy(state)
+        print(f"Browser service: {'healthy' if healthy else 'UNHEALTHY'} pid {state.pid}, {state.engine} "
+              f"at {state.endpoint}, started {state.started_at}, {state.restarts} restarts")
+        raise SystemExit(0 if healthy else 1)
+
+    if args.command == "stop":
+        print("Browser service stopped" if stop_service(args.state_dir) else "Browser service was not running")
+        return
+
+    if running_service(args.state_dir):
+        parser.error("a browser service is already running (see: status)")
+    asyncio.run(BrowserService(
+        port=args.port, headless=not args.no_headless, engine=args.engine,
+        state_dir=args.state_dir, health_interval=args.health_interval
+    ).run())
+
+
+if __name__ == "__main__":
+    main()
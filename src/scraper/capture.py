@@ -0,0 +1,325 @@
+"""
+Record and replay rendered Devpost pages.
+
+With ``capture`` set, DevpostScraper stores the rendered HTML of every page
+it visits (after the dynamic-content wait) in a CaptureArchive, a single
+SQLite file of compressed snapshots keyed by the requested URL. With
+``replay`` set, it serves pages from the archive through ReplayPage instead
+of launching a browser, so selector and extraction changes can be re-run
+over the same pages in seconds, offline and deterministically.
+
+ReplayPage implements the subset of Playwright's Page API the scraper uses;
+selectors are evaluated by scraper.dom. Pages replay as captured, so
+anything the scraper does not read from the HTML (scrolling, clicks) is not
+reproduced.
+
+Usage (from src/):
+    python -m scraper.capture ../data/captures.db            # list snapshots
+    python -m scraper.capture ../data/captures.db --extract  # re-extract every capture
+"""
+import argparse
+import asyncio
+import logging
+import sqlite3
+import time
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Optional
+from urllib.parse import urldefrag
+
+from scraper.dom import Element, parse_html
+from storage.compression import compress, decompress, zstandard
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CAPTURE_COMPRESSION = "zstd" if zstandard is not None else "gzip"
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS snapshots (
+    url TEXT PRIMARY KEY,
+    final_url TEXT NOT NULL,
+    title TEXT,
+    kind TEXT,
+    captured_at TEXT NOT NULL,
+    size INTEGER NOT NULL,
+    compression TEXT,
+    html BLOB NOT NULL
+);
+"""
+
+_UPSERT_SNAPSHOT = """
+INSERT INTO snapshots (url, final_url, title, kind, captured_at, size, compression, html)
+VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+ON CONFLICT(url) DO UPDATE SET
+    final_url = excluded.final_url,
+    title = excluded.title,
+    kind = excluded.kind,
+    captured_at = excluded.captured_at,
+    size = excluded.size,
+    compression = excluded.compression,
+    html = excluded.html
+"""
+
+
+class MissingSnapshotError(LookupError):
+    """A replayed page was never captured."""
+
+
+@dataclass
+class Snapshot:
+    """One captured page."""
+    url: str
+    final_url: str
+    title: Optional[str]
+    kind: Optional[str]
+    captured_at: str
+    size: int
+    html: str = ""
+
+
+def _key(url: str) -> str:
+    """Archive key of a URL (fragments never reach the server)."""
+    return urldefrag(url)[0]
+
+
+class CaptureArchive:
+    """SQLite file of compressed page snapshots keyed by URL."""
+
+    def __init__(self, path: Path, compression: Optional[str] = DEFAULT_CAPTURE_COMPRESSION):
+        """
+        Open (and if needed create) an archive.
+
+        Args:
+            path: Archive file
+            compression: Compression of newly stored snapshots ("gzip", "zstd" or None)
+        """
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.compression = compression
+        self.conn = sqlite3.connect(str(self.path))
+        self.conn.row_factory = sqlite3.Row
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.executescript(SCHEMA)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def __len__(self) -> int:
+        return self.conn.execute("SELECT COUNT(*) FROM snapshots").fetchone()[0]
+
+    def __contains__(self, url: str) -> bool:
+        return self.conn.execute("SELECT 1 FROM snapshots WHERE url = ?", (_key(url),)).fetchone() is not None
+
+    def close(self) -> None:
+        """Close the database connection."""
+        self.conn.close()
+
+    def save(
+        self,
+        url: str,
+        html: str,
+        final_url: Optional[str] = None,
+        title: Optional[str] = None,
+        kind: Optional[str] = None
+    ) -> None:
+        """
+        Store (or replace) the snapshot of a page.
+
+        Args:
+            url: URL the page was requested with
+            html: Rendered HTML (``page.content()``)
+            final_url: URL after redirects (defaults to ``url``)
+            title: Document title
+            kind: Page kind, e.g. "gallery" or "project"
+        """
+        data = html.encode("utf-8")
+        with self.conn:
+            self.conn.execute(_UPSERT_SNAPSHOT, (
+                _key(url), final_url or url, title, kind, datetime.now().isoformat(),
+                len(data), self.compression, compress(data, self.compression)
+            ))
+
+    def get(self, url: str) -> Optional[Snapshot]:
+        """Load the snapshot of a URL, or None if it was never captured."""
+        row = self.conn.execute("SELECT * FROM snapshots WHERE url = ?", (_key(url),)).fetchone()
+        if row is None:
+            return None
+        return Snapshot(
+            url=row["url"],
+            final_url=row["final_url"],
+            title=row["title"],
+            kind=row["kind"],
+            captured_at=row["captured_at"],
+            size=row["size"],
+            html=decompress(row["html"], row["compression"]).decode("utf-8"),
+        )
+
+    def list_snapshots(self, kind: Optional[str] = None) -> List[Snapshot]:
+        """Snapshot metadata (without HTML) in capture order, optionally of one kind."""
+        query = "SELECT url, final_url, title, kind, captured_at, size FROM snapshots"
+        params: tuple = ()
+        if kind is not None:
+            query += " WHERE kind = ?"
+            params = (kind,)
+        rows = self.conn.execute(query + " ORDER BY captured_at, url", params).fetchall()
+        return [Snapshot(**dict(row)) for row in rows]
+
+
+class ReplayElement:
+    """Element handle over a parsed snapshot (Playwright ElementHandle subset)."""
+
+    def __init__(self, element: Element):
+        self._element = element
+
+    async def text_content(self) -> str:
+        return self._element.text_content()
+
+    async def get_attribute(self, name: str) -> Optional[str]:
+        return self._element.attrs.get(name)
+
+    async def query_selector(self, selector: str) -> Optional["ReplayElement"]:
+        element = self._element.query_selector(selector)
+        return ReplayElement(element) if element is not None else None
+
+    async def query_selector_all(self, selector: str) -> List["ReplayElement"]:
+        return [ReplayElement(element) for element in self._element.query_selector_all(selector)]
+
+
+class ReplayPage:
+    """Page served from a CaptureArchive (Playwright Page subset)."""
+
+    def __init__(self, archive: CaptureArchive):
+        self.archive = archive
+        self._snapshot: Optional[Snapshot] = None
+        self._document: Optional[Element] = None
+        self._headers: Dict[str, str] = {}
+
+    @property
+    def url(self) -> str:
+        return self._snapshot.final_url if self._snapshot else "about:blank"
+
+    def _require_document(self) -> Element:
+        if self._document is None:
+            raise RuntimeError("No page loaded; call goto() first")
+        return self._document
+
+    async def set_extra_http_headers(self, headers: Dict[str, str]) -> None:
+        self._headers.update(headers)
+
+    async def goto(self, url: str, **kwargs) -> None:
+        """
+        Load the snapshot of a URL.
+
+        Raises:
+            MissingSnapshotError: If the URL is not in the archive
+        """
+        snapshot = self.archive.get(url)
+        if snapshot is None:
+            raise MissingSnapshotError(f"No capture of {url} in {self.archive.path}")
+        self._snapshot = snapshot
+        self._document = parse_html(snapshot.html)
+
+    async def wait_for_timeout(self, timeout: float) -> None:
+        """Captured pages are already rendered, so there is nothing to wait for."""
+
+    async def content(self) -> str:
+        self._require_document()
+        return self._snapshot.html
+
+    async def title(self) -> str:
+        if self._snapshot and self._snapshot.title is not None:
+            return self._snapshot.title
+        title = self._require_document().query_selector("title")
+        return title.text_content().strip() if title else ""
+
+    async def query_selector(self, selector: str) -> Optional[ReplayElement]:
+        element = self._require_document().query_selector(selector)
+        return ReplayElement(element) if element is not None else None
+
+    async def query_selector_all(self, selector: str) -> List[ReplayElement]:
+        return [ReplayElement(element) for element in self._require_document().query_selector_all(selector)]
+
+    async def close(self) -> None:
+        self._snapshot = None
+        self._document = None
+
+
+async def replay_archive(archive: CaptureArchive, urls: List[str], output_dir: Optional[Path] = None) -> int:
+    """
+    Re-run extraction over captured pages without a browser or LLM calls.
+
+    Args:
+        archive: Archive to replay
+        urls: Captured gallery or project URLs to extract
+        output_dir: Directory to save the replayed results to (optional)
+
+    Returns:
+        Number of failed extractions
+    """
+    from scraper.devpost_scraper import DevpostScraper
+
+    failures = 0
+    async with DevpostScraper(delay=0, enable_llm=False, replay=archive) as scraper:
+        for index, url in enumerate(urls):
+            start = time.perf_counter()
+            snapshot = archive.get(url)
+            if snapshot is not None and snapshot.kind == "project":
+                result = await scraper.scrape_project(url)
+            else:
+                result = await scraper.scrape_hackathon(url)
+            elapsed = time.perf_counter() - start
+
+            if not result.success or not result.hackathon:
+                failures += 1
+                print(f"FAILED {url}: {result.error_message}")
+                continue
+            projects = result.hackathon.projects
+            print(
+                f"{elapsed * 1000:8.1f} ms  {len(projects):>4} projects  "
+                f"{sum(len(p.tags) for p in projects):>5} tags  {url}"
+            )
+            if output_dir is not None:
+                scraper.save_result(result, output_dir / f"replay_{index:04d}.json")
+    return failures
+
+
+def main():
+    parser = argparse.ArgumentParser(description="List or re-extract captured Devpost pages")
+    parser.add_argument("archive", type=Path, help="Capture archive (written by main.py --capture)")
+    parser.add_argument(
+        "--extract",
+        action="store_true",
+        help="Re-extract every captured gallery (or, if there are none, every project) without a browser"
+    )
+    parser.add_argument("--url", action="append", default=[], help="Re-extract only this captured URL (repeatable)")
+    parser.add_argument("--output-dir", type=Path, default=None, help="Save the replayed results here")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.WARNING)
+
+    if not args.archive.exists():
+        parser.error(f"{args.archive} does not exist")
+
+    with CaptureArchive(args.archive) as archive:
+        if not (args.extract or args.url):
+            for snapshot in archive.list_snapshots():
+                print(f"{snapshot.captured_at}  {snapshot.kind or '-':<8} {snapshot.size:>9,} B  {snapshot.url}")
+            print(f"{len(archive)} snapshots")
+            return
+
+        urls = args.url or [snapshot.url for snapshot in archive.list_snapshots("gallery")] or [
+            snapshot.url for snapshot in archive.list_snapshots("project")
+        ]
+        start = time.perf_counter()
+        failures = asyncio.run(replay_archive(archive, urls, args.output_dir))
+        print(f"Replayed {len(urls)} pages in {time.perf_counter() - start:.2f}s ({failures} failed)")
+        raise SystemExit(1 if failures else 0)
+
+
+if __name__ == "__main__":
+    main()
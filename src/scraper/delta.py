@@ -0,0 +1,154 @@
+"""
+Delta crawling: only fetch project pages that are new or changed since the last run.
+
+With ``delta`` set and a ProjectStore, DevpostScraper fingerprints every
+project card on the gallery page (link, name, tagline, thumbnail and winner
+badge; not the like/comment counts, which change all the time) and compares
+the fingerprints with the ones the store recorded on the previous run. The
+fingerprints are taken from the card summaries scraper.gallery parses out
+of the page HTML, so delta and gallery-only mode read cards the same way:
+
+- new: never listed before, so the page is fetched
+- changed: the card differs, so the page is fetched
+- unchanged: the stored project is reused without loading the page
+
+Unchanged cards whose project is missing from the store (the earlier fetch
+failed) are fetched again. A card fingerprint is only recorded once its
+project is in hand, so a failed page is retried on the next run.
+
+Fetched pages get a second check: the extracted fields are hashed, and when
+the hash matches the stored one the stored LLM analysis is reused instead of
+calling the LLM again. This covers cards that changed cosmetically (e.g. a
+new thumbnail) while the write-up stayed the same.
+"""
+import hashlib
+import json
+import logging
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any, Dict, List, Optional
+
+from scraper.urls import url_key
+from utils import metrics
+
+if TYPE_CHECKING:
+    from models.hackathon import Award, Project, ProjectMember
+    from storage.sqlite_store import ProjectStore
+
+logger = logging.getLogger(__name__)
+
+def _digest(parts: Any) -> str:
+    return hashlib.sha256(json.dumps(parts, ensure_ascii=False).encode('utf-8')).hexdigest()[:32]
+
+
+def listing_hashes(project_urls: List[str], cards: Dict[str, "Project"]) -> Dict[str, str]:
+    """
+    Fingerprint the project cards of a gallery page.
+
+    Like and comment counts are left out on purpose.
+
+    Args:
+        project_urls: Project URLs of the gallery page
+        cards: Card summaries from scraper.frontier.card_index()
+
+    Returns:
+        Card fingerprints keyed by project URL (projects without a
+        recognizable card are missing and are always fetched)
+    """
+    hashes: Dict[str, str] = {}
+    for url in project_urls:
+        card = cards.get(url_key(url))
+        if card is not None:
+            hashes[url] = _digest([
+                url, card.name, card.description, str(card.image_url) if card.image_url else None,
+                [award.name for award in card.awards],
+            ])
+    return hashes
+
+
+def content_hash(
+    name: str,
+    description: str,
+    tags: List[str],
+    members: List["ProjectMember"],
+    awards: List["Award"],
+    project_link: Optional[str]
+) -> str:
+    """Hash the fields extracted from a project page (before LLM enhancement)."""
+    return _digest([
+        name, description, tags,
+        [[member.name, str(member.profile_url or "")] for member in members],
+        [award.name for award in awards],
+        project_link or None,
+    ])
+
+
+@dataclass
+class DeltaPlan:
+    """Which project pages of a gallery to fetch and which stored projects to reuse."""
+    fetch: List[str] = field(default_factory=list)
+    reuse: Dict[str, "Project"] = field(default_factory=dict)
+    new: int = 0
+    changed: int = 0
+    unchanged: int = 0
+
+
+def plan_delta(store: "ProjectStore", project_urls: List[str], hashes: Dict[str, str]) -> DeltaPlan:
+    """
+    Split a gallery's project URLs into pages to fetch and stored projects to reuse.
+
+    Args:
+        store: Store holding the previous runs' projects and crawl state
+        project_urls: Project URLs in gallery order
+        hashes: Card fingerprints from listing_hashes()
+
+    Returns:
+        DeltaPlan (``fetch`` keeps gallery order)
+    """
+    states = store.crawl_states(project_urls)
+    plan = DeltaPlan()
+    unchanged = [
+        url for url in project_urls
+        if url in states and hashes.get(url) is not None and states[url].listing_hash == hashes[url]
+    ]
+    stored = store.get_projects(unchanged)
+    for url in project_urls:
+        if url in stored:
+            plan.reuse[url] = stored[url]
+            plan.unchanged += 1
+            continue
+        plan.fetch.append(url)
+        if url in states and url not in unchanged:
+            plan.changed += 1
+        else:
+            # Never listed, or listed but its page never made it into the store
+            plan.new += 1
+
+    for status in ("new", "changed", "unchanged"):
+        metrics.inc("delta_projects_total", getattr(plan, status), status=status)
+    logger.info(
+        f"Delta crawl: {plan.new} new, {plan.changed} changed, {plan.unchanged} unchanged "
+        f"({len(plan.fetch)} of {len(project_urls)} pages to fetch)"
+    )
+    return plan
+
+
+def reusable_project(store: "ProjectStore", project_url: str, page_hash: str, need_analysis: bool) -> Optional["Project"]:
+    """
+    The stored project if its page content is unchanged since it was stored.
+
+    Args:
+        store: Store holding the previous runs' projects and crawl state
+        project_url: Project page URL
+        page_hash: content_hash() of the page just loaded
+        need_analysis: Only reuse a stored project that has an LLM analysis
+
+    Returns:
+        Stored project, or None if the page must be processed again
+    """
+    state = store.crawl_states([project_url]).get(project_url)
+    if state is None or state.content_hash != page_hash:
+        return None
+    project = store.get_project(project_url)
+    if project is None or (need_analysis and project.analysis is None):
+        return None
+    return project
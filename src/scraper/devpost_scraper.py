@@ -2,27 +2,80 @@
 Devpost scraper implementation using Playwright.
 """
 import asyncio
-import json
 import logging
+from collections import deque
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import List, Optional
+from typing import TYPE_CHECKING, Dict, List, Optional, Tuple
 from urllib.parse import urljoin, urlparse
 
-from playwright.async_api import async_playwright, Page, Browser
 from pydantic import ValidationError
 
 from models.hackathon import (
     Hackathon, Project, ProjectMember, Award, ScrapingResult
 )
 from analyzer.llm_analyzer import LLMAnalyzer
+from storage.serialization import save_result
+from scraper.frontier import CrawlBudget, build_coverage, card_index, gallery_order, prioritize
+from scraper.urls import get_base_url, url_key
+from storage.sqlite_store import LLM_DESCRIPTION_SEPARATOR, ProjectStore
+from utils import metrics
+from utils.profiling import profiled, span
+
+if TYPE_CHECKING:
+    from playwright.async_api import Browser, Page
+    from scraper.capture import CaptureArchive
+    from scraper.delta import DeltaPlan
+    from scraper.sharded import RateLimiter
+    from storage.work_queue import WorkQueue
 
 logger = logging.getLogger(__name__)
 
+DEFAULT_RECYCLE_AFTER = 100
+DEFAULT_MAX_ATTEMPTS = 3
+DEFAULT_MAX_PROJECTS = 5
+
+
+@dataclass
+class GalleryPage:
+    """What scrape_gallery found on a hackathon page."""
+    name: str
+    description: str
+    project_urls: List[str]
+    listing_hashes: Dict[str, str] = field(default_factory=dict)
+    cards: Dict[str, Project] = field(default_factory=dict)
+    listed: int = 0
+
+
+@dataclass
+class ProjectPages:
+    """What scrape_project_pages got out of a list of project pages."""
+    scraped: Dict[int, List[Project]] = field(default_factory=dict)
+    failed: List[str] = field(default_factory=list)
+
 
 class DevpostScraper:
     """Scraper for Devpost hackathon and project data."""
     
-    def __init__(self, headless: bool = True, delay: float = 2.0, enable_llm: bool = True):
+    def __init__(
+        self,
+        headless: bool = True,
+        delay: float = 2.0,
+        enable_llm: bool = True,
+        store: Optional[ProjectStore] = None,
+        base_url: Optional[str] = None,
+        capture: Optional["CaptureArchive"] = None,
+        replay: Optional["CaptureArchive"] = None,
+        browser_service: bool = False,
+        recycle_after: Optional[int] = DEFAULT_RECYCLE_AFTER,
+        max_attempts: int = DEFAULT_MAX_ATTEMPTS,
+        max_projects: Optional[int] = DEFAULT_MAX_PROJECTS,
+        rate_limiter: Optional["RateLimiter"] = None,
+        work_queue: Optional["WorkQueue"] = None,
+        queue_run: Optional[str] = None,
+        delta: bool = False,
+        budget: Optional[CrawlBudget] = None
+    ):
         """
         Initialize the scraper.
         
@@ -30,57 +83,94 @@ class DevpostScraper:
             headless: Whether to run browser in headless mode
             delay: Delay between requests in seconds
             enable_llm: Whether to enable LLM analysis for project descriptions
+            store: SQLite store that saved results are also upserted into (optional)
+            base_url: Devpost base URL (defaults to DEVPOST_BASE_URL, then devpost.com)
+            capture: Archive that the rendered HTML of every visited page is saved to (optional)
+            replay: Archive to serve pages from instead of launching a browser (optional)
+            browser_service: Connect to the running browser service instead of launching a browser
+            recycle_after: Relaunch the browser after this many pages to cap its memory (None or 0 never recycles)
+            max_attempts: Attempts per project page when the browser crashes while loading it
+            max_projects: Projects to scrape per hackathon page (None or 0 for all on the page)
+            rate_limiter: Limiter awaited before every page load, replacing ``delay`` (optional)
+            work_queue: Shared queue that project pages are scraped through, with other workers (optional)
+            queue_run: Id of an interrupted work queue crawl run to resume (default: a new run per hackathon)
+            delta: Only fetch projects that are new or changed since they were stored (needs ``store``)
+            budget: Caps on project pages, LLM analyses and crawl time (default: unlimited)
         """
         self.headless = headless
         self.delay = delay
-        self.browser: Optional[Browser] = None
+        self.browser: Optional["Browser"] = None
         self.enable_llm = enable_llm
         self.llm_analyzer = LLMAnalyzer() if enable_llm else None
+        self.store = store
+        self.base_url = get_base_url(base_url)
+        self.capture = capture
+        self.replay = replay
+        self.browser_service = browser_service
+        self.recycle_after = recycle_after
+        self.max_attempts = max(1, max_attempts)
+        self.max_projects = max_projects
+        self.rate_limiter = rate_limiter
+        self.work_queue = work_queue
+        self.queue_run = queue_run
+        self.delta = delta and store is not None
+        self.budget = budget or CrawlBudget()
+        self.playwright = None
+        self.browser_restarts = 0
+        self._pages_since_launch = 0
+        self._browser_lost = False
         
+    @profiled("scraper.browser_start")
     async def __aenter__(self):
         """Async context manager entry."""
+        if self.replay is not None:
+            # Pages come from the archive; no browser needed
+            return self
+        
+        from playwright.async_api import async_playwright
+        
         self.playwright = await async_playwright().start()
+        await self._start_browser()
+        return self
+    
+    async def _start_browser(self) -> None:
+        """Connect to the browser service or launch a browser, and watch it for crashes."""
+        from scraper.browser_service import connect_to_service, launch_browser
         
-        # Try different browser launch options for macOS compatibility
-        launch_options = {
-            'headless': self.headless,
-            'timeout': 60000,  # Increase timeout
-        }
-        
-        if self.headless:
-            # More conservative options for headless mode
-            launch_options['args'] = [
-                '--no-sandbox',
-                '--disable-setuid-sandbox',
-                '--disable-dev-shm-usage',
-                '--disable-accelerated-2d-canvas',
-                '--no-first-run',
-                '--no-zygote',
-                '--single-process',
-                '--disable-gpu'
-            ]
+        self.browser = None
+        if self.browser_service:
+            self.browser = await connect_to_service(self.playwright, headless=self.headless)
+            if self.browser is None:
+                logger.warning("Browser service not running; launching a browser for this run")
         
-        try:
-            self.browser = await self.playwright.chromium.launch(**launch_options)
-        except Exception as e:
-            logger.warning(f"Failed to launch Chromium: {e}")
-            # Fallback to Firefox
-            logger.info("Trying Firefox instead...")
-            try:
-                self.browser = await self.playwright.firefox.launch(
-                    headless=self.headless,
-                    timeout=60000
-                )
-            except Exception as e2:
-                logger.error(f"Failed to launch Firefox: {e2}")
-                # Last resort: try WebKit
-                logger.info("Trying WebKit instead...")
-                self.browser = await self.playwright.webkit.launch(
-                    headless=self.headless,
-                    timeout=60000
-                )
+        if self.browser is None:
+            # Tries the engine that last worked on this host first, then the Chromium/Firefox/WebKit fallbacks
+            self.browser, engine = await launch_browser(self.playwright, self.headless)
+            logger.info(f"Launched {engine}")
         
-        return self
+        self._pages_since_launch = 0
+        self._browser_lost = False
+        self.browser.on("disconnected", self._on_browser_disconnected)
+    
+    def _on_browser_disconnected(self, browser: "Browser") -> None:
+        if browser is self.browser:
+            logger.warning("Browser disconnected")
+            self._browser_lost = True
+    
+    async def _restart_browser(self, reason: str) -> None:
+        """Close (or abandon, if it crashed) the current browser and start a new one."""
+        old_browser = self.browser
+        self.browser = None
+        if old_browser is not None and old_browser.is_connected():
+            try:
+                await old_browser.close()
+            except Exception as e:
+                logger.warning(f"Error closing browser: {e}")
+        self.browser_restarts += 1
+        metrics.inc("browser_restarts_total", reason=reason)
+        logger.info(f"Restarting browser ({reason}, restart {self.browser_restarts})")
+        with span("scraper.browser_restart", reason=reason):
+            await self._start_browser()
         
     async def __aexit__(self, exc_type, exc_val, exc_tb):
         """Async context manager exit."""
@@ -89,18 +179,46 @@ class DevpostScraper:
                 await self.browser.close()
         except Exception as e:
             logger.warning(f"Error closing browser: {e}")
+        if self.playwright is None:
+            return
         try:
             await self.playwright.stop()
         except Exception as e:
             logger.warning(f"Error stopping playwright: {e}")
         
-    async def _get_page(self) -> Page:
+    async def _get_page(self) -> "Page":
         """Get a new page instance."""
+        if self.replay is not None:
+            from scraper.capture import ReplayPage
+            return ReplayPage(self.replay)
         if not self.browser:
             raise RuntimeError("Browser not initialized. Use async context manager.")
-        return await self.browser.new_page()
+        if self._browser_lost or not self.browser.is_connected():
+            await self._restart_browser("crash")
+        elif self.recycle_after and self._pages_since_launch >= self.recycle_after:
+            await self._restart_browser("recycle")
+        try:
+            page = await self.browser.new_page()
+        except Exception:
+            if self.browser.is_connected():
+                raise
+            # Crashed between the check and new_page
+            await self._restart_browser("crash")
+            page = await self.browser.new_page()
+        self._pages_since_launch += 1
+        return page
+    
+    async def _capture_page(self, page: "Page", url: str, kind: str) -> None:
+        """Save the rendered HTML of a page to the capture archive, if one is set."""
+        if self.capture is None:
+            return
+        try:
+            with span("scraper.capture"):
+                self.capture.save(url, await page.content(), final_url=page.url, title=await page.title(), kind=kind)
+        except Exception as e:
+            logger.warning(f"Failed to capture {url}: {e}")
         
-    async def _safe_get_text(self, page: Page, selector: str) -> str:
+    async def _safe_get_text(self, page: "Page", selector: str) -> str:
         """Safely get text content from a selector."""
         try:
             element = await page.query_selector(selector)
@@ -111,7 +229,7 @@ class DevpostScraper:
             logger.warning(f"Failed to get text from selector {selector}: {e}")
             return ""
             
-    async def _safe_get_attribute(self, page: Page, selector: str, attribute: str) -> str:
+    async def _safe_get_attribute(self, page: "Page", selector: str, attribute: str) -> str:
         """Safely get attribute value from a selector."""
         try:
             element = await page.query_selector(selector)
@@ -122,6 +240,7 @@ class DevpostScraper:
             logger.warning(f"Failed to get attribute {attribute} from selector {selector}: {e}")
             return ""
             
+    @profiled("scraper.project")
     async def scrape_project(self, project_url: str) -> ScrapingResult:
         """
         Scrape a single project page.
@@ -143,8 +262,15 @@ class DevpostScraper:
             })
             
             # Navigate with timeout and proper wait
-            await page.goto(project_url, wait_until="domcontentloaded", timeout=30000)
-            await page.wait_for_timeout(2000)  # Wait for dynamic content
+            if self.rate_limiter is not None:
+                with span("scraper.rate_limit"):
+                    await self.rate_limiter.acquire()
+            with span("scraper.goto", url=project_url), metrics.timed("page_load_seconds", kind="project"):
+                await page.goto(project_url, wait_until="domcontentloaded", timeout=30000)
+            metrics.inc("pages_total", kind="project")
+            with span("scraper.wait"):
+                await page.wait_for_timeout(2000)  # Wait for dynamic content
+            await self._capture_page(page, project_url, "project")
             
             # Extract project information using updated selectors for Devpost
             project_name = await self._safe_get_text(page, "h1, #app-title, .software-header h1")
@@ -153,9 +279,13 @@ class DevpostScraper:
             page_html = ""
             if self.enable_llm and self.llm_analyzer and self.llm_analyzer.enabled:
                 try:
-                    page_html = await page.content()
+                    with span("scraper.page_content"):
+                        page_html = await page.content()
                 except Exception as e:
                     logger.warning(f"Failed to get page HTML for LLM analysis: {e}")
+            if metrics.enabled():
+                html = page_html or await page.content()
+                metrics.inc("page_bytes_total", len(html.encode('utf-8')), kind="project")
             
             # Try multiple selectors for description
             description_selectors = [
@@ -174,25 +304,26 @@ class DevpostScraper:
                 "#gallery-item-description"
             ]
             description = ""
-            for selector in description_selectors:
-                elements = await page.query_selector_all(f"{selector} p")
-                if elements:
-                    texts = []
-                    for element in elements[:5]:  # Get first 5 paragraphs
-                        text = await element.text_content()
-                        if text and text.strip():
-                            texts.append(text.strip())
-                    if texts:
-                        description = " ".join(texts)
-                        logger.info(f"Found description using selector: {selector}")
-                        break
+            with span("scraper.selectors.description"):
+                for selector in description_selectors:
+                    elements = await page.query_selector_all(f"{selector} p")
+                    if elements:
+                        texts = []
+                        for element in elements[:5]:  # Get first 5 paragraphs
+                            text = await element.text_content()
+                            if text and text.strip():
+                                texts.append(text.strip())
+                        if texts:
+                            description = " ".join(texts)
+                            logger.info(f"Found description using selector: {selector}")
+                            break
                 
-                # Try direct selector if paragraph approach fails
-                if not description:
-                    description = await self._safe_get_text(page, selector)
-                    if description.strip():
-                        logger.info(f"Found description using direct selector: {selector}")
-                        break
+                    # Try direct selector if paragraph approach fails
+                    if not description:
+                        description = await self._safe_get_text(page, selector)
+                        if description.strip():
+                            logger.info(f"Found description using direct selector: {selector}")
+                            break
             
             # Extract tags using updated selectors
             tags = []
@@ -203,14 +334,15 @@ class DevpostScraper:
                 "#app-built-with a",
                 "[data-field='built_with'] a"
             ]
-            for selector in tag_selectors:
-                tag_elements = await page.query_selector_all(selector)
-                for tag_element in tag_elements:
-                    tag_text = await tag_element.text_content()
-                    if tag_text and tag_text.strip():
-                        tags.append(tag_text.strip())
-                if tags:  # If we found tags, don't try other selectors
-                    break
+            with span("scraper.selectors.tags"):
+                for selector in tag_selectors:
+                    tag_elements = await page.query_selector_all(selector)
+                    for tag_element in tag_elements:
+                        tag_text = await tag_element.text_content()
+                        if tag_text and tag_text.strip():
+                            tags.append(tag_text.strip())
+                    if tags:  # If we found tags, don't try other selectors
+                        break
             
             # Extract team members using updated selectors
             members = []
@@ -220,20 +352,21 @@ class DevpostScraper:
                 ".team-members .member",
                 "#software-team-members .user-profile"
             ]
-            for selector in member_selectors:
-                member_elements = await page.query_selector_all(selector)
-                for member_element in member_elements:
-                    member_name = await self._safe_get_text(member_element, "h4, .user-profile-name, .member-name")
-                    profile_url = await self._safe_get_attribute(member_element, "a", "href")
+            with span("scraper.selectors.members"):
+                for selector in member_selectors:
+                    member_elements = await page.query_selector_all(selector)
+                    for member_element in member_elements:
+                        member_name = await self._safe_get_text(member_element, "h4, .user-profile-name, .member-name")
+                        profile_url = await self._safe_get_attribute(member_element, "a", "href")
                     
-                    if member_name and member_name.strip():
-                        member = ProjectMember(
-                            name=member_name.strip(),
-                            profile_url=profile_url if profile_url else None
-                        )
-                        members.append(member)
-                if members:  # If we found members, don't try other selectors
-                    break
+                        if member_name and member_name.strip():
+                            member = ProjectMember(
+                                name=member_name.strip(),
+                                profile_url=profile_url if profile_url else None
+                            )
+                            members.append(member)
+                    if members:  # If we found members, don't try other selectors
+                        break
             
             # Extract awards using updated selectors
             awards = []
@@ -244,15 +377,16 @@ class DevpostScraper:
                 ".prize-badge",
                 "#app-awards .award"
             ]
-            for selector in award_selectors:
-                award_elements = await page.query_selector_all(selector)
-                for award_element in award_elements:
-                    award_name = await award_element.text_content()
-                    if award_name and award_name.strip():
-                        award = Award(name=award_name.strip())
-                        awards.append(award)
-                if awards:  # If we found awards, don't try other selectors
-                    break
+            with span("scraper.selectors.awards"):
+                for selector in award_selectors:
+                    award_elements = await page.query_selector_all(selector)
+                    for award_element in award_elements:
+                        award_name = await award_element.text_content()
+                        if award_name and award_name.strip():
+                            award = Award(name=award_name.strip())
+                            awards.append(award)
+                    if awards:  # If we found awards, don't try other selectors
+                        break
             
             # Extract project URL using updated selectors
             project_link_selectors = [
@@ -263,10 +397,11 @@ class DevpostScraper:
                 ".software-links a"
             ]
             project_link = ""
-            for selector in project_link_selectors:
-                project_link = await self._safe_get_attribute(page, selector, "href")
-                if project_link and not project_link.startswith("/"):
-                    break
+            with span("scraper.selectors.links"):
+                for selector in project_link_selectors:
+                    project_link = await self._safe_get_attribute(page, selector, "href")
+                    if project_link and not project_link.startswith("/"):
+                        break
             
             # Log description status
             if description:
@@ -278,23 +413,42 @@ class DevpostScraper:
                     fallback_selectors = [
                         "main", "article", ".container", "#content", "body"
                     ]
-                    for selector in fallback_selectors:
-                        fallback_text = await self._safe_get_text(page, selector)
-                        if fallback_text and len(fallback_text) > 100:
-                            # Extract first 500 characters of meaningful content
-                            lines = fallback_text.split('\n')
-                            meaningful_lines = [line.strip() for line in lines if len(line.strip()) > 20]
-                            if meaningful_lines:
-                                description = ' '.join(meaningful_lines[:5])[:500] + "..."
-                                logger.info(f"Used fallback description from {selector}")
-                                break
+                    with span("scraper.selectors.fallback"):
+                        for selector in fallback_selectors:
+                            fallback_text = await self._safe_get_text(page, selector)
+                            if fallback_text and len(fallback_text) > 100:
+                                # Extract first 500 characters of meaningful content
+                                lines = fallback_text.split('\n')
+                                meaningful_lines = [line.strip() for line in lines if len(line.strip()) > 20]
+                                if meaningful_lines:
+                                    description = ' '.join(meaningful_lines[:5])[:500] + "..."
+                                    logger.info(f"Used fallback description from {selector}")
+                                    break
                 except Exception as e:
                     logger.error(f"Failed to get fallback description: {e}")
             
+            # In delta mode a page whose content is unchanged keeps its stored analysis
+            llm_enabled = bool(self.enable_llm and self.llm_analyzer and self.llm_analyzer.enabled)
+            page_hash = None
+            stored = None
+            if self.delta:
+                from scraper.delta import content_hash, reusable_project
+                page_hash = content_hash(project_name, description, tags, members, awards, project_link)
+                stored = reusable_project(self.store, project_url, page_hash, need_analysis=llm_enabled)
+            
             # Perform LLM analysis if enabled
             enhanced_description = description
-            if (self.enable_llm and self.llm_analyzer and self.llm_analyzer.enabled 
-                and page_html and project_name):
+            llm_analysis = None
+            if stored is not None:
+                logger.info(f"Content unchanged for {project_name}; reusing the stored description and analysis")
+                enhanced_description = stored.description
+                llm_analysis = stored.analysis
+                if llm_enabled:
+                    metrics.inc("cache_requests_total", cache="delta_analysis", result="hit")
+            elif llm_enabled and page_html and project_name and not self.budget.take_llm_call():
+                logger.warning(f"LLM budget used up; {project_name} is not analyzed")
+                metrics.inc("llm_budget_skips_total")
+            elif llm_enabled and page_html and project_name:
                 try:
                     logger.info(f"Performing LLM analysis for project: {project_name}")
                     llm_analysis = await self.llm_analyzer.analyze_project_content(
@@ -305,7 +459,7 @@ class DevpostScraper:
                         if enhanced_description:
                             # Combine original description with LLM analysis
                             if description:
-                                enhanced_description = f"{description}\n\n---\n\n{enhanced_description}"
+                                enhanced_description = f"{description}{LLM_DESCRIPTION_SEPARATOR}{enhanced_description}"
                         else:
                             enhanced_description = description
                         logger.info(f"LLM analysis completed for: {project_name}")
@@ -313,6 +467,7 @@ class DevpostScraper:
                         logger.warning(f"No LLM analysis results for: {project_name}")
                 except Exception as e:
                     logger.error(f"LLM analysis failed for {project_name}: {e}")
+                    llm_analysis = None
                     enhanced_description = description
             
             # Ensure we have at least some description
@@ -327,8 +482,11 @@ class DevpostScraper:
                 project_url=project_link if project_link else None,
                 tags=tags,
                 awards=awards,
-                members=members
+                members=members,
+                analysis=llm_analysis or None
             )
+            if page_hash is not None:
+                self.store.record_content_hash(project_url, page_hash)
             
             # Create a basic hackathon object (this is a simplified version)
             hackathon = Hackathon(
@@ -337,8 +495,12 @@ class DevpostScraper:
                 projects=[project]
             )
             
+            metrics.inc("projects_total")
+            
             await page.close()
-            await asyncio.sleep(self.delay)
+            if self.replay is None and self.rate_limiter is None:
+                with span("scraper.delay"):
+                    await asyncio.sleep(self.delay)
             
             return ScrapingResult(
                 success=True,
@@ -348,99 +510,238 @@ class DevpostScraper:
             
         except Exception as e:
             logger.error(f"Failed to scrape project {project_url}: {e}")
+            metrics.inc("failures_total", stage="scrape_project")
             return ScrapingResult(
                 success=False,
                 url=project_url,
                 error_message=str(e)
             )
     
-    async def scrape_hackathon(self, hackathon_url: str) -> ScrapingResult:
+    async def _load_gallery_page(self, url: str) -> "Page":
+        """Open a new page on a hackathon or gallery URL and wait for it to render."""
+        page = await self._get_page()
+        
+        # Set user agent to avoid being blocked
+        await page.set_extra_http_headers({
+            'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
+        })
+        
+        # Navigate with timeout and proper wait
+        if self.rate_limiter is not None:
+            with span("scraper.rate_limit"):
+                await self.rate_limiter.acquire()
+        with span("scraper.goto", url=url), metrics.timed("page_load_seconds", kind="gallery"):
+            await page.goto(url, wait_until="domcontentloaded", timeout=30000)
+        metrics.inc("pages_total", kind="gallery")
+        with span("scraper.wait"):
+            await page.wait_for_timeout(3000)  # Wait for dynamic content
+        await self._capture_page(page, url, "gallery")
+        return page
+    
+    async def _hackathon_header(self, page: "Page") -> Tuple[str, str]:
+        """Extract the hackathon name and description from a hackathon or gallery page."""
+        hackathon_name = await self._safe_get_text(page, "h1, .header-title, .challenge-header h1, .hackathon-title")
+        if not hackathon_name.strip():
+            # Try extracting from page title
+            hackathon_name = await page.title()
+            if "Devpost" in hackathon_name:
+                hackathon_name = hackathon_name.replace(" | Devpost", "")
+        
+        description = await self._safe_get_text(page, ".hackathon-description, .challenge-description, .description, .header-description")
+        return hackathon_name, description
+    
+    @profiled("scraper.gallery_summaries")
+    async def scrape_gallery_summaries(self, hackathon_url: str) -> ScrapingResult:
         """
-        Scrape a hackathon page and its projects.
+        Scrape project summaries from every page of a hackathon's gallery, without loading project pages.
+        
+        See scraper.gallery. Stops after max_projects projects (None or 0
+        for the whole gallery). Every gallery page load counts against the
+        crawl budget's page and time limits.
         
         Args:
-            hackathon_url: URL of the hackathon page
+            hackathon_url: URL of the hackathon or its project gallery
             
         Returns:
-            ScrapingResult containing the scraped data
+            ScrapingResult with one summary Project per gallery card, in gallery order
         """
+        from scraper.gallery import merge_stored, parse_gallery_page
+        from scraper.urls import gallery_url
+        
         try:
-            page = await self._get_page()
-            
-            logger.info(f"Scraping hackathon: {hackathon_url}")
-            
-            # Set user agent to avoid being blocked
-            await page.set_extra_http_headers({
-                'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
-            })
-            
-            # Navigate with timeout and proper wait
-            await page.goto(hackathon_url, wait_until="domcontentloaded", timeout=30000)
-            await page.wait_for_timeout(3000)  # Wait for dynamic content
+            projects: List[Project] = []
+            seen_projects = set()
+            seen_pages = set()
+            hackathon_name = description = ""
+            url: Optional[str] = gallery_url(hackathon_url)
+            while url and url not in seen_pages:
+                if not self.budget.take_page():
+                    logger.warning(f"Crawl budget used up ({self.budget.stopped_by}); remaining gallery pages not read")
+                    break
+                seen_pages.add(url)
+                logger.info(f"Reading gallery page {len(seen_pages)}: {url}")
+                page = await self._load_gallery_page(url)
+                try:
+                    if len(seen_pages) == 1:
+                        hackathon_name, description = await self._hackathon_header(page)
+                    html = await page.content()
+                    metrics.inc("page_bytes_total", len(html.encode('utf-8')), kind="gallery")
+                finally:
+                    await page.close()
+                
+                with span("scraper.gallery_cards"):
+                    cards = parse_gallery_page(html, url)
+                for project in cards.projects:
+                    if str(project.devpost_url) not in seen_projects:
+                        seen_projects.add(str(project.devpost_url))
+                        projects.append(project)
+                
+                if self.max_projects and len(projects) >= self.max_projects:
+                    break
+                url = cards.next_url
+                if url and self.replay is None and self.rate_limiter is None:
+                    with span("scraper.delay"):
+                        await asyncio.sleep(self.delay)
+            
+            listed = len(projects)
+            if self.max_projects:
+                projects = projects[:self.max_projects]
+            logger.info(f"Collected {len(projects)} project summaries from {len(seen_pages)} gallery pages")
+            metrics.inc("projects_total", len(projects))
+            if self.store is not None:
+                projects = merge_stored(projects, self.store)
             
-            # Debug: Check if we're on the right page
-            page_title = await page.title()
-            logger.info(f"Page title: {page_title}")
-            logger.info(f"Current URL: {page.url}")
-            
-            # Extract hackathon information using updated selectors
-            hackathon_name = await self._safe_get_text(page, "h1, .header-title, .challenge-header h1, .hackathon-title")
-            if not hackathon_name.strip():
-                # Try extracting from page title
-                hackathon_name = await page.title()
-                if "Devpost" in hackathon_name:
-                    hackathon_name = hackathon_name.replace(" | Devpost", "")
-            
-            description = await self._safe_get_text(page, ".hackathon-description, .challenge-description, .description, .header-description")
-            
-            # Extract project URLs using multiple selectors
-            project_selectors = [
-                "a[href*='/software/']",
-                ".submission-item a",
-                ".project-card a",
-                ".challenge-submission a",
-                ".software-entry a"
-            ]
+            hackathon = Hackathon(
+                name=hackathon_name or "Unknown Hackathon",
+                description=description,
+                devpost_url=hackathon_url,
+                projects=projects,
+                # Summaries come from the gallery pages, which are the pages loaded
+                coverage=build_coverage(listed, len(projects), 0, len(projects), projects, self.budget)
+            )
+            return ScrapingResult(success=True, url=hackathon_url, hackathon=hackathon)
+        
+        except Exception as e:
+            logger.error(f"Failed to scrape gallery of {hackathon_url}: {e}")
+            metrics.inc("failures_total", stage="scrape_gallery")
+            return ScrapingResult(success=False, url=hackathon_url, error_message=str(e))
+    
+    async def scrape_gallery(self, hackathon_url: str) -> GalleryPage:
+        """
+        Load a hackathon page and collect its project URLs (without scraping them).
+        
+        Args:
+            hackathon_url: URL of the hackathon page
             
-            project_links = []
+        Returns:
+            GalleryPage with the project URLs in page order (and, in delta
+            mode, the fingerprints of their gallery cards)
+        """
+        logger.info(f"Scraping hackathon: {hackathon_url}")
+        page = await self._load_gallery_page(hackathon_url)
+        
+        html = await page.content()
+        if metrics.enabled():
+            metrics.inc("page_bytes_total", len(html.encode('utf-8')), kind="gallery")
+        
+        # Debug: Check if we're on the right page
+        page_title = await page.title()
+        logger.info(f"Page title: {page_title}")
+        logger.info(f"Current URL: {page.url}")
+        
+        hackathon_name, description = await self._hackathon_header(page)
+        
+        # Extract project URLs using multiple selectors
+        project_selectors = [
+            "a[href*='/software/']",
+            ".submission-item a",
+            ".project-card a",
+            ".challenge-submission a",
+            ".software-entry a"
+        ]
+        
+        project_links = []
+        with span("scraper.selectors.project_links"):
             for selector in project_selectors:
                 links = await page.query_selector_all(selector)
                 if links:
                     logger.info(f"Found {len(links)} project links using selector: {selector}")
                     project_links.extend(links)
                     break
+        
+        if not project_links:
+            logger.warning("No project links found. Trying fallback approach...")
+            # Fallback: look for any software links on the page
+            project_links = await page.query_selector_all("a[href*='devpost.com/software']")
+        
+        project_urls = []
+        for link in project_links:
+            href = await link.get_attribute("href")
+            if href:
+                full_url = urljoin(hackathon_url, href)
+                if full_url not in project_urls and '/software/' in full_url:
+                    project_urls.append(full_url)
+        
+        logger.info(f"Total project URLs found: {len(project_urls)}")
+        
+        # Winner badges and like counts on the cards rank the projects (see scraper.frontier)
+        from scraper.gallery import parse_gallery_page
+        with span("scraper.gallery_cards"):
+            cards = card_index(parse_gallery_page(html, hackathon_url).projects)
+        listed = len(project_urls)
+        if self.max_projects and listed > self.max_projects:
+            keep = set(prioritize(project_urls, cards)[:self.max_projects])
+            project_urls = [url for url in project_urls if url in keep]
+            logger.info(f"Kept the {len(project_urls)} highest-priority projects")
+        for url in project_urls:
+            logger.info(f"Added project URL: {url}")
+        
+        hashes: Dict[str, str] = {}
+        if self.delta:
+            from scraper.delta import listing_hashes
+            with span("scraper.listing_hashes"):
+                hashes = listing_hashes(project_urls, cards)
+        
+        await page.close()
+        return GalleryPage(hackathon_name, description, project_urls, hashes, cards, listed)
+    
+    @profiled("scraper.hackathon")
+    async def scrape_hackathon(self, hackathon_url: str) -> ScrapingResult:
+        """
+        Scrape a hackathon page and its projects.
+        
+        Args:
+            hackathon_url: URL of the hackathon page
             
-            if not project_links:
-                logger.warning("No project links found. Trying fallback approach...")
-                # Fallback: look for any software links on the page
-                project_links = await page.query_selector_all("a[href*='devpost.com/software']")
-            
-            project_urls = []
-            for link in project_links[:5]:  # Limit to first 5 projects for MVP
-                href = await link.get_attribute("href")
-                if href:
-                    full_url = urljoin(hackathon_url, href)
-                    if full_url not in project_urls and '/software/' in full_url:
-                        project_urls.append(full_url)
-                        logger.info(f"Added project URL: {full_url}")
-            
-            logger.info(f"Total project URLs found: {len(project_urls)}")
-            
-            await page.close()
+        Returns:
+            ScrapingResult containing the scraped data
+        """
+        try:
+            gallery = await self.scrape_gallery(hackathon_url)
+            plan = self.plan_delta(gallery)
+            # Most valuable projects first, so a budget that runs out cuts the least valuable ones
+            project_urls = prioritize(plan.fetch if plan else gallery.project_urls, gallery.cards)
             
             # Scrape individual projects
-            projects = []
-            for project_url in project_urls:
-                project_result = await self.scrape_project(project_url)
-                if project_result.success and project_result.hackathon:
-                    projects.extend(project_result.hackathon.projects)
+            if self.work_queue is not None:
+                from scraper.queue_worker import scrape_projects_via_queue
+                fetched = await scrape_projects_via_queue(
+                    self, self.work_queue, hackathon_url, project_urls, run=self.queue_run
+                )
+            else:
+                fetched = await self.scrape_projects(project_urls)
+            projects = self.merge_delta(gallery, plan, fetched) if plan else gallery_order(gallery.project_urls, fetched)
             
             # Create hackathon object
             hackathon = Hackathon(
-                name=hackathon_name or "Unknown Hackathon",
-                description=description,
+                name=gallery.name or "Unknown Hackathon",
+                description=gallery.description,
                 devpost_url=hackathon_url,
-                projects=projects
+                projects=projects,
+                coverage=build_coverage(
+                    gallery.listed, len(gallery.project_urls), len(plan.reuse) if plan else 0,
+                    len(fetched), projects, self.budget
+                )
             )
             
             return ScrapingResult(
@@ -451,30 +752,111 @@ class DevpostScraper:
             
         except Exception as e:
             logger.error(f"Failed to scrape hackathon {hackathon_url}: {e}")
+            metrics.inc("failures_total", stage="scrape_hackathon")
             return ScrapingResult(
                 success=False,
                 url=hackathon_url,
                 error_message=str(e)
             )
     
-    def save_result(self, result: ScrapingResult, output_path: Path) -> None:
+    def plan_delta(self, gallery: GalleryPage) -> Optional["DeltaPlan"]:
+        """Decide which of a gallery's project pages to fetch (None outside delta mode)."""
+        if not self.delta:
+            return None
+        from scraper.delta import plan_delta
+        return plan_delta(self.store, gallery.project_urls, gallery.listing_hashes)
+    
+    def merge_delta(self, gallery: GalleryPage, plan: "DeltaPlan", fetched: List[Project]) -> List[Project]:
         """
-        Save scraping result to JSON file.
+        Combine fetched and reused projects in gallery order and record the listings seen.
+        
+        Card fingerprints are recorded for reused projects and fetched ones
+        only, so a page that failed is fetched again on the next run.
+        """
+        by_url: Dict[str, List[Project]] = {url_key(url): [project] for url, project in plan.reuse.items()}
+        for project in fetched:
+            by_url.setdefault(url_key(project.devpost_url), []).append(project)
+        listed = [url for url in gallery.project_urls if url_key(url) in by_url]
+        self.store.record_listing({url: gallery.listing_hashes.get(url) for url in listed})
+        return [project for url in listed for project in by_url[url_key(url)]]
+    
+    async def scrape_project_pages(self, project_urls: List[str]) -> ProjectPages:
+        """
+        Scrape project pages, requeueing pages whose load was cut short by a browser crash.
+        
+        A page that fails because the browser died is retried (after the
+        rest of the queue, on the relaunched browser) up to max_attempts
+        times; other failures are not retried. Pages are loaded in the
+        given order until the crawl budget runs out.
+        
+        Args:
+            project_urls: Project page URLs
+            
+        Returns:
+            ProjectPages with the scraped projects keyed by position in
+            project_urls and the URLs given up on; pages the budget left
+            unvisited are in neither
+        """
+        queue = deque((index, url, 1) for index, url in enumerate(project_urls))
+        pages = ProjectPages()
+        while queue:
+            if not self.budget.take_page():
+                logger.warning(f"Crawl budget used up ({self.budget.stopped_by}); {len(queue)} project pages not scraped")
+                break
+            index, project_url, attempt = queue.popleft()
+            project_result = await self.scrape_project(project_url)
+            if project_result.success and project_result.hackathon:
+                pages.scraped[index] = project_result.hackathon.projects
+            elif self.replay is None and (self._browser_lost or not (self.browser and self.browser.is_connected())) \
+                    and attempt < self.max_attempts:
+                logger.warning(f"Browser crashed while scraping {project_url}; requeued (attempt {attempt + 1}/{self.max_attempts})")
+                metrics.inc("retries_total", stage="scrape_project")
+                queue.append((index, project_url, attempt + 1))
+            else:
+                if attempt > 1:
+                    logger.error(f"Giving up on {project_url} after {attempt} attempts")
+                pages.failed.append(project_url)
+        return pages
+    
+    async def scrape_projects(self, project_urls: List[str]) -> List[Project]:
+        """Scrape project pages (see scrape_project_pages) and return the projects in the order of project_urls."""
+        scraped = (await self.scrape_project_pages(project_urls)).scraped
+        return [project for index in sorted(scraped) for project in scraped[index]]
+    
+    @profiled("scraper.save")
+    def save_result(self, result: ScrapingResult, output_path: Optional[Path], pretty: bool = False) -> None:
+        """
+        Save scraping result to a JSON file and, if configured, the SQLite store.
+        
+        The result is encoded with pydantic's native JSON serializer and
+        written atomically. A ``.gz`` or ``.zst`` suffix on output_path
+        compresses the file.
         
         Args:
             result: ScrapingResult to save
-            output_path: Path to save the JSON file
+            output_path: Path to save the JSON file (None skips the JSON file)
+            pretty: Indent the JSON instead of writing it compactly
         """
-        try:
-            output_path.parent.mkdir(parents=True, exist_ok=True)
-            
-            with open(output_path, 'w', encoding='utf-8') as f:
-                json.dump(result.dict(), f, indent=2, ensure_ascii=False, default=str)
+        if output_path is not None:
+            try:
+                output_path.parent.mkdir(parents=True, exist_ok=True)
                 
-            logger.info(f"Saved scraping result to {output_path}")
-            
-        except Exception as e:
-            logger.error(f"Failed to save result to {output_path}: {e}")
+                save_result(result, output_path, pretty=pretty)
+                    
+                logger.info(f"Saved scraping result to {output_path}")
+                metrics.inc("results_saved_total", destination="json")
+                
+            except Exception as e:
+                logger.error(f"Failed to save result to {output_path}: {e}")
+                metrics.inc("failures_total", stage="save_json")
+        
+        if self.store is not None:
+            try:
+                self.store.save_result(result)
+                metrics.inc("results_saved_total", destination="store")
+            except Exception as e:
+                logger.error(f"Failed to store result in {self.store.path}: {e}")
+                metrics.inc("failures_total", stage="save_store")
 
 
 async def main():
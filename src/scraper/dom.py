@@ -0,0 +1,262 @@
+"""
+Minimal HTML tree and CSS selector engine for replaying captured pages.
+
+Captured snapshots come from ``page.content()``, so they are already
+browser-serialized HTML. A small tree built with ``html.parser`` is enough
+to answer the selectors the scraper uses. Supported selector syntax:
+
+- selector lists (``a, b``)
+- descendant (``a b``) and child (``a > b``) combinators
+- type, ``*``, ``#id`` and ``.class`` selectors
+- attribute selectors ``[attr]``, ``=``, ``*=``, ``^=``, ``$=`` and ``~=``
+- Playwright's ``:has-text("...")`` (case-insensitive substring)
+
+Unsupported syntax raises ValueError rather than silently matching nothing.
+"""
+import re
+from functools import lru_cache
+from html.parser import HTMLParser
+from typing import Iterator, List, Optional, Tuple, Union
+
+VOID_ELEMENTS = frozenset({
+    "area", "base", "br", "col", "embed", "hr", "img", "input", "link", "meta",
+    "param", "source", "track", "wbr",
+})
+
+# Opening one of these closes an open <p>, as browsers do
+CLOSES_P = frozenset({
+    "address", "article", "aside", "blockquote", "div", "dl", "fieldset", "figure", "footer",
+    "form", "h1", "h2", "h3", "h4", "h5", "h6", "header", "hr", "main", "nav", "ol", "p",
+    "pre", "section", "table", "ul",
+})
+
+
+class Element:
+    """An element node; children are Elements or text strings."""
+
+    __slots__ = ("tag", "attrs", "children", "parent")
+
+    def __init__(self, tag: str, attrs: dict, parent: Optional["Element"] = None):
+        self.tag = tag
+        self.attrs = attrs
+        self.children: List[Union["Element", str]] = []
+        self.parent = parent
+
+    @property
+    def classes(self) -> List[str]:
+        return self.attrs.get("class", "").split()
+
+    def text_content(self) -> str:
+        """Concatenated text of all descendants (like DOM ``textContent``)."""
+        parts: List[str] = []
+        stack: List[Union[Element, str]] = [self]
+        while stack:
+            node = stack.pop()
+            if isinstance(node, str):
+                parts.append(node)
+            else:
+                stack.extend(reversed(node.children))
+        return "".join(parts)
+
+    def iter_descendants(self) -> Iterator["Element"]:
+        """Yield descendant elements in document order."""
+        stack = [child for child in reversed(self.children) if isinstance(child, Element)]
+        while stack:
+            element = stack.pop()
+            yield element
+            stack.extend(child for child in reversed(element.children) if isinstance(child, Element))
+
+    def query_selector_all(self, selector: str) -> List["Element"]:
+        """Descendants matching a selector, in document order."""
+        compiled = compile_selector(selector)
+        return [element for element in self.iter_descendants() if _matches_any(element, compiled)]
+
+    def query_selector(self, selector: str) -> Optional["Element"]:
+        """First descendant matching a selector, or None."""
+        compiled = compile_selector(selector)
+        for element in self.iter_descendants():
+            if _matches_any(element, compiled):
+                return element
+        return None
+
+
+class _TreeBuilder(HTMLParser):
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.root = Element("#document", {})
+        self.stack = [self.root]
+
+    def handle_starttag(self, tag, attrs):
+        top = self.stack[-1]
+        if top.tag == "p" and tag in CLOSES_P or top.tag == "li" and tag == "li":
+            self.stack.pop()
+            top = self.stack[-1]
+        element = Element(tag, {name: value or "" for name, value in attrs}, top)
+        top.children.append(element)
+        if tag not in VOID_ELEMENTS:
+            self.stack.append(element)
+
+    def handle_startendtag(self, tag, attrs):
+        top = self.stack[-1]
+        top.children.append(Element(tag, {name: value or "" for name, value in attrs}, top))
+
+    def handle_endtag(self, tag):
+        for index in range(len(self.stack) - 1, 0, -1):
+            if self.stack[index].tag == tag:
+                del self.stack[index:]
+                return
+        # Stray end tag: ignored, as browsers do
+
+    def handle_data(self, data):
+        self.stack[-1].children.append(data)
+
+
+def parse_html(html: str) -> Element:
+    """Parse an HTML document into an Element tree rooted at ``#document``."""
+    builder = _TreeBuilder()
+    builder.feed(html)
+    builder.close()
+    return builder.root
+
+
+# --- selectors -------------------------------------------------------------
+
+# A compound selector: (tag or None, ids, classes, attribute tests, has-text values)
+Compound = Tuple[Optional[str], Tuple[str, ...], Tuple[str, ...], Tuple[Tuple[str, str, str], ...], Tuple[str, ...]]
+# A complex selector, rightmost compound first: ((compound, combinator linking it to its left neighbour), ...)
+Complex = Tuple[Tuple[Compound, str], ...]
+
+_TOKEN = re.compile(r"""
+    (?P<ws>\s+)
+  | (?P<comma>,)
+  | (?P<child>>)
+  | (?P<star>\*)
+  | (?P<tag>[a-zA-Z][\w-]*)
+  | \#(?P<id>[\w-]+)
+  | \.(?P<cls>[\w-]+)
+  | \[\s*(?P<attr>[\w:-]+)\s*(?:(?P<op>[*^$~]?=)\s*(?:"(?P<dq>[^"]*)"|'(?P<sq>[^']*)'|(?P<bare>[^\]\s]+))\s*)?\]
+  | :has-text\(\s*(?:"(?P<hdq>[^"]*)"|'(?P<hsq>[^']*)')\s*\)
+""", re.VERBOSE)
+
+
+@lru_cache(maxsize=512)
+def compile_selector(selector: str) -> Tuple[Complex, ...]:
+    """
+    Parse a selector list.
+
+    Raises:
+        ValueError: If the selector uses unsupported syntax
+    """
+    complexes: List[Complex] = []
+    compounds: List[Tuple[Compound, str]] = []
+    current: Optional[dict] = None
+    combinator = " "
+    pos = 0
+
+    def finish_compound():
+        nonlocal current
+        if current is not None:
+            compounds.append(((
+                current["tag"], tuple(current["ids"]), tuple(current["classes"]),
+                tuple(current["attrs"]), tuple(current["texts"])
+            ), combinator))
+            current = None
+
+    def new_compound() -> dict:
+        return {"tag": None, "ids": [], "classes": [], "attrs": [], "texts": []}
+
+    while pos < len(selector):
+        match = _TOKEN.match(selector, pos)
+        if not match:
+            raise ValueError(f"Unsupported selector syntax at {selector[pos:]!r} in {selector!r}")
+        pos = match.end()
+        kind = match.lastgroup
+        if kind in ("ws", "child", "comma"):
+            if current is not None:
+                finish_compound()
+                combinator = " "
+            if kind == "child":
+                combinator = ">"
+            elif kind == "comma":
+                if not compounds:
+                    raise ValueError(f"Empty selector in {selector!r}")
+                complexes.append(tuple(reversed(compounds)))
+                compounds = []
+                combinator = " "
+            continue
+
+        if current is None:
+            current = new_compound()
+        if kind in ("tag", "star"):
+            if current["tag"] is not None or current["ids"] or current["classes"] or current["attrs"]:
+                raise ValueError(f"Misplaced type selector in {selector!r}")
+            current["tag"] = match.group("tag").lower() if kind == "tag" else None
+        elif kind == "id":
+            current["ids"].append(match.group("id"))
+        elif kind == "cls":
+            current["classes"].append(match.group("cls"))
+        elif match.group("attr"):
+            value = next((v for v in match.group("dq", "sq", "bare") if v is not None), "")
+            current["attrs"].append((match.group("attr").lower(), match.group("op") or "", value))
+        else:
+            text = match.group("hdq") if match.group("hdq") is not None else match.group("hsq")
+            current["texts"].append(text.lower())
+
+    finish_compound()
+    if not compounds:
+        raise ValueError(f"Empty selector in {selector!r}")
+    complexes.append(tuple(reversed(compounds)))
+    return tuple(complexes)
+
+
+def _matches_compound(element: Element, compound: Compound) -> bool:
+    tag, ids, classes, attrs, texts = compound
+    if tag is not None and element.tag != tag:
+        return False
+    if ids and any(element.attrs.get("id") != id_ for id_ in ids):
+        return False
+    if classes:
+        element_classes = element.classes
+        if any(cls not in element_classes for cls in classes):
+            return False
+    for name, op, value in attrs:
+        actual = element.attrs.get(name)
+        if actual is None:
+            return False
+        if op == "=" and actual != value:
+            return False
+        if op == "*=" and value not in actual:
+            return False
+        if op == "^=" and not actual.startswith(value):
+            return False
+        if op == "$=" and not actual.endswith(value):
+            return False
+        if op == "~=" and value not in actual.split():
+            return False
+    if texts:
+        content = " ".join(element.text_content().split()).lower()
+        if any(text not in content for text in texts):
+            return False
+    return True
+
+
+def _matches_complex(element: Element, complex_: Complex) -> bool:
+    """Match right to left: complex_[0] is the rightmost compound."""
+    compound, combinator = complex_[0]
+    if not _matches_compound(element, compound):
+        return False
+    if len(complex_) == 1:
+        return True
+    rest = complex_[1:]
+    ancestor = element.parent
+    if combinator == ">":
+        return ancestor is not None and ancestor.tag != "#document" and _matches_complex(ancestor, rest)
+    while ancestor is not None and ancestor.tag != "#document":
+        if _matches_complex(ancestor, rest):
+            return True
+        ancestor = ancestor.parent
+    return False
+
+
+def _matches_any(element: Element, complexes: Tuple[Complex, ...]) -> bool:
+    return any(_matches_complex(element, complex_) for complex_ in complexes)
@@ -0,0 +1,179 @@
+"""
+Crawl priorities and budgets.
+
+Spec.md asks for a run to finish within 30 minutes. Instead of visiting
+project pages in DOM order until done, the crawl works through a priority
+frontier and stops when a budget runs out:
+
+- Priority: winners first, then projects with more likes, then the rest
+  in gallery order. Winner badges and like counts come from the gallery
+  cards (scraper.gallery), so ranking costs no extra page loads.
+  ``max_projects`` keeps the highest-ranked projects too.
+- CrawlBudget caps project page loads and LLM analyses and sets a
+  wall-clock deadline. Pages past the page budget or the deadline are not
+  loaded. Pages past the LLM budget are still scraped, without analysis.
+- The CrawlCoverage of the run is attached to the Hackathon and shown in
+  the report, so a partial result says how partial it is.
+
+The deadline is a wall-clock (epoch) time, so shard workers in other
+processes share it; the page and LLM budgets are split between them.
+"""
+import logging
+import time
+from dataclasses import dataclass
+from typing import Dict, List, Optional
+
+from models.hackathon import CrawlCoverage, Project
+from scraper.urls import url_key
+from utils import metrics
+
+logger = logging.getLogger(__name__)
+
+PAGES = "pages"
+DEADLINE = "deadline"
+
+
+def priority_key(position: int, card: Optional[Project]):
+    """Sort key of a project: winners, then more likes, then gallery position."""
+    if card is None:
+        return (1, 0, position)
+    return (0 if card.awards else 1, -(card.vote_count or 0), position)
+
+
+def card_index(cards: List[Project]) -> Dict[str, Project]:
+    """Key gallery card summaries for prioritize()."""
+    return {url_key(card.devpost_url): card for card in cards}
+
+
+def prioritize(project_urls: List[str], cards: Dict[str, Project]) -> List[str]:
+    """
+    Order project URLs winners first, then by like count, then in gallery order.
+
+    Args:
+        project_urls: Project URLs in gallery order
+        cards: Gallery card summaries from card_index() (projects without a card rank last)
+    """
+    order = sorted(
+        range(len(project_urls)),
+        key=lambda position: priority_key(position, cards.get(url_key(project_urls[position])))
+    )
+    return [project_urls[position] for position in order]
+
+
+def gallery_order(project_urls: List[str], projects: List[Project]) -> List[Project]:
+    """Put projects scraped in priority order back in gallery order."""
+    position = {url_key(url): index for index, url in enumerate(project_urls)}
+    return sorted(projects, key=lambda project: position.get(url_key(project.devpost_url), len(position)))
+
+
+@dataclass
+class CrawlBudget:
+    """Caps on the project pages, LLM analyses and wall-clock time of a crawl."""
+    max_pages: Optional[int] = None
+    max_llm_calls: Optional[int] = None
+    deadline: Optional[float] = None
+    time_budget: Optional[float] = None
+    pages: int = 0
+    llm_calls: int = 0
+    stopped_by: Optional[str] = None
+
+    @classmethod
+    def create(
+        cls,
+        max_pages: Optional[int] = None,
+        max_llm_calls: Optional[int] = None,
+        time_budget: Optional[float] = None
+    ) -> "CrawlBudget":
+        """
+        Start a budget now.
+
+        Args:
+            max_pages: Project page loads (None for no limit)
+            max_llm_calls: LLM project analyses (None for no limit)
+            time_budget: Seconds from now until the crawl stops loading pages (None for no limit)
+        """
+        deadline = time.time() + time_budget if time_budget else None
+        return cls(max_pages=max_pages, max_llm_calls=max_llm_calls, deadline=deadline, time_budget=time_budget)
+
+    def exhausted(self) -> bool:
+        """Whether no more project pages may be loaded (records why)."""
+        if self.stopped_by is None:
+            if self.deadline is not None and time.time() >= self.deadline:
+                self.stopped_by = DEADLINE
+            elif self.max_pages is not None and self.pages >= self.max_pages:
+                self.stopped_by = PAGES
+        return self.stopped_by is not None
+
+    def take_page(self) -> bool:
+        """Claim one project page load; False once the page budget or the deadline is used up."""
+        if self.exhausted():
+            return False
+        self.pages += 1
+        return True
+
+    def take_llm_call(self) -> bool:
+        """Claim one LLM analysis; False once the LLM budget or the deadline is used up."""
+        if self.deadline is not None and time.time() >= self.deadline:
+            return False
+        if self.max_llm_calls is not None and self.llm_calls >= self.max_llm_calls:
+            return False
+        self.llm_calls += 1
+        return True
+
+    def share(self, parts: int, index: int) -> "CrawlBudget":
+        """The ``index``-th of ``parts`` equal shares of what is left (for shard workers)."""
+        def split(limit: Optional[int], used: int) -> Optional[int]:
+            if limit is None:
+                return None
+            left = max(0, limit - used)
+            return left // parts + (1 if index < left % parts else 0)
+
+        return CrawlBudget(
+            max_pages=split(self.max_pages, self.pages),
+            max_llm_calls=split(self.max_llm_calls, self.llm_calls),
+            deadline=self.deadline,
+            time_budget=self.time_budget,
+        )
+
+    def absorb(self, share: "CrawlBudget") -> None:
+        """Add what a share was used for to this budget."""
+        self.pages += share.pages
+        self.llm_calls += share.llm_calls
+        self.stopped_by = self.stopped_by or share.stopped_by
+
+
+def build_coverage(
+    listed: int,
+    selected: int,
+    reused: int,
+    scraped: int,
+    projects: List[Project],
+    budget: CrawlBudget
+) -> CrawlCoverage:
+    """
+    Summarize what a crawl covered.
+
+    Args:
+        listed: Projects listed in the gallery
+        selected: Projects kept after ``max_projects``
+        reused: Projects reused from the store by a delta crawl
+        scraped: Project pages scraped in this run
+        projects: Projects in the result
+        budget: Budget of the run
+    """
+    if budget.stopped_by:
+        metrics.inc("budget_stops_total", reason=budget.stopped_by)
+        logger.warning(f"Crawl stopped by its {budget.stopped_by} budget: {len(projects)} of {selected} projects covered")
+    return CrawlCoverage(
+        projects_listed=listed,
+        projects_selected=selected,
+        projects_reused=reused,
+        projects_scraped=scraped,
+        projects_analyzed=sum(1 for project in projects if project.analysis),
+        pages_loaded=budget.pages,
+        llm_calls=budget.llm_calls,
+        max_pages=budget.max_pages,
+        max_llm_calls=budget.max_llm_calls,
+        time_budget_seconds=budget.time_budget,
+        stopped_by=budget.stopped_by,
+    )
@@ -0,0 +1,137 @@
+"""
+Gallery-only scraping: project summaries straight from the gallery cards.
+
+Devpost gallery cards already show what trend statistics need: the project
+name and tagline, the thumbnail, the winner badge and the like and comment
+counts. DevpostScraper.scrape_gallery_summaries() walks every page of a
+hackathon's gallery and builds one Project per card without loading any
+project page, so a full gallery takes one page load per 24 projects.
+
+Each gallery page is read with one ``page.content()`` call and parsed with
+scraper.dom, instead of one browser round trip per card field.
+
+Summaries have the tagline as description and no tags, members or links
+(cards do not show them). Projects already in the store keep their stored
+details; only their counts, thumbnail and winner status are refreshed.
+"""
+import re
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Dict, List, Optional
+from urllib.parse import urljoin
+
+from pydantic import ValidationError
+
+from models.hackathon import Award, Project
+from scraper.dom import Element, parse_html
+
+if TYPE_CHECKING:
+    from storage.sqlite_store import ProjectStore
+
+GALLERY_CARD_SELECTOR = ".gallery-item, .software-entry, .project-card, .submission-item, .challenge-submission"
+CARD_LINK_SELECTOR = "a[href*='/software/']"
+# Tried in order: the name wrapper also holds the tagline
+CARD_NAME_SELECTORS = ("h5", ".project-name", ".software-entry-name")
+CARD_TAGLINE_SELECTOR = ".tagline"
+CARD_IMAGE_SELECTOR = "img.software_thumbnail_image, img"
+CARD_WINNER_SELECTOR = ".entry-badge .winner, .winner"
+CARD_LIKES_SELECTOR = ".like-count"
+CARD_COMMENTS_SELECTOR = ".comment-count"
+NEXT_PAGE_SELECTOR = "a[rel='next'], .pagination a.next_page"
+
+WINNER_AWARD = "Winner"
+
+_COUNT = re.compile(r"(\d[\d,]*(?:\.\d+)?)\s*([kKmM]?)")
+
+
+def parse_count(text: Optional[str]) -> Optional[int]:
+    """Parse a card counter such as ``"42"``, ``"1,204"`` or ``"1.2k"`` (None if absent)."""
+    match = _COUNT.search(text or "")
+    if not match:
+        return None
+    value = float(match.group(1).replace(",", ""))
+    scale = {"k": 1_000, "m": 1_000_000}.get(match.group(2).lower(), 1)
+    return int(value * scale)
+
+
+def _text(element: Element, selector: str) -> str:
+    found = element.query_selector(selector)
+    return " ".join(found.text_content().split()) if found is not None else ""
+
+
+def parse_card(card: Element, page_url: str) -> Optional[Project]:
+    """
+    Build a project summary from one gallery card.
+
+    Args:
+        card: Parsed card element
+        page_url: URL of the gallery page (card links are relative to it)
+
+    Returns:
+        Project summary, or None if the card has no project link
+    """
+    link = card.query_selector(CARD_LINK_SELECTOR)
+    href = link.attrs.get("href") if link is not None else None
+    if not href:
+        return None
+    image = card.query_selector(CARD_IMAGE_SELECTOR)
+    image_src = image.attrs.get("src") if image is not None else None
+    winner = card.query_selector(CARD_WINNER_SELECTOR)
+    fields = {
+        "name": next(filter(None, (_text(card, selector) for selector in CARD_NAME_SELECTORS)), "Unknown Project"),
+        "description": _text(card, CARD_TAGLINE_SELECTOR),
+        "devpost_url": urljoin(page_url, href),
+        "image_url": urljoin(page_url, image_src) if image_src else None,
+        "awards": [Award(name=winner.attrs.get("alt") or WINNER_AWARD)] if winner is not None else [],
+        "vote_count": parse_count(_text(card, CARD_LIKES_SELECTOR)),
+        "comment_count": parse_count(_text(card, CARD_COMMENTS_SELECTOR)),
+    }
+    try:
+        return Project(**fields)
+    except ValidationError:
+        # Thumbnails on data: URLs and the like are not worth losing the project over
+        fields["image_url"] = None
+        return Project(**fields)
+
+
+@dataclass
+class GalleryCards:
+    """Project summaries of one gallery page and the URL of the next page."""
+    projects: List[Project]
+    next_url: Optional[str]
+
+
+def parse_gallery_page(html: str, page_url: str) -> GalleryCards:
+    """Parse the project cards and the next-page link of one gallery page."""
+    document = parse_html(html)
+    projects = [
+        project for project in (parse_card(card, page_url) for card in document.query_selector_all(GALLERY_CARD_SELECTOR))
+        if project is not None
+    ]
+    next_link = document.query_selector(NEXT_PAGE_SELECTOR)
+    next_href = next_link.attrs.get("href") if next_link is not None else None
+    return GalleryCards(projects, urljoin(page_url, next_href) if next_href else None)
+
+
+def merge_stored(summaries: List[Project], store: "ProjectStore") -> List[Project]:
+    """
+    Keep the stored details of projects that were scraped in full before.
+
+    Stored projects get the card's counts and thumbnail, and the winner
+    award if they had no awards; summaries of unknown projects are kept.
+    """
+    stored: Dict[str, Project] = store.get_projects([str(project.devpost_url) for project in summaries])
+    merged = []
+    for summary in summaries:
+        previous = stored.get(str(summary.devpost_url))
+        if previous is None:
+            merged.append(summary)
+            continue
+        update = {
+            "vote_count": summary.vote_count,
+            "comment_count": summary.comment_count,
+            "image_url": summary.image_url or previous.image_url,
+        }
+        if not previous.awards:
+            update["awards"] = summary.awards
+        merged.append(previous.model_copy(update=update))
+    return merged
@@ -6,15 +6,20 @@ import logging
 import os
 import json
 from datetime import datetime, timedelta
-from typing import List, Optional, Dict, Any, Tuple
+from typing import TYPE_CHECKING, List, Optional, Dict, Any, Tuple
 from urllib.parse import urljoin
 from dataclasses import dataclass
 
-from playwright.async_api import Page, Browser
 from pydantic import BaseModel, HttpUrl
-import google.generativeai as genai
 from dotenv import load_dotenv
 
+from scraper.urls import get_base_url
+from utils import lazy, metrics
+from utils.profiling import profiled, span
+
+if TYPE_CHECKING:
+    from playwright.async_api import Browser, Page
+
 # Load environment variables
 load_dotenv()
 
@@ -36,28 +41,31 @@ class HackathonSearchResult:
 class HackathonSearcher:
     """Searches for hackathons on Devpost based on criteria."""
     
-    DEFAULT_SEARCH_URL = (
-        "https://devpost.com/hackathons"
+    SEARCH_PATH = (
+        "/hackathons"
         "?length[]=days"
         "&order_by=deadline"
         "&status[]=ended"
         "&themes[]=Machine%20Learning%2FAI"
     )
     
-    def __init__(self, browser: Browser):
+    def __init__(self, browser: "Browser", base_url: Optional[str] = None):
         """
         Initialize the hackathon searcher.
         
         Args:
             browser: Playwright browser instance
+            base_url: Devpost base URL (defaults to DEVPOST_BASE_URL, then devpost.com)
         """
         self.browser = browser
+        self.base_url = get_base_url(base_url)
+        self.default_search_url = f"{self.base_url}{self.SEARCH_PATH}"
         
-    async def _get_page(self) -> Page:
+    async def _get_page(self) -> "Page":
         """Get a new page instance."""
         return await self.browser.new_page()
         
-    async def _safe_get_text(self, page: Page, selector: str) -> str:
+    async def _safe_get_text(self, page: "Page", selector: str) -> str:
         """Safely get text content from a selector."""
         try:
             element = await page.query_selector(selector)
@@ -68,7 +76,7 @@ class HackathonSearcher:
             logger.warning(f"Failed to get text from selector {selector}: {e}")
             return ""
             
-    async def _safe_get_attribute(self, page: Page, selector: str, attribute: str) -> str:
+    async def _safe_get_attribute(self, page: "Page", selector: str, attribute: str) -> str:
         """Safely get attribute value from a selector."""
         try:
             element = await page.query_selector(selector)
@@ -79,6 +87,7 @@ class HackathonSearcher:
             logger.warning(f"Failed to get attribute {attribute} from selector {selector}: {e}")
             return ""
     
+    @profiled("search.hackathons")
     async def search_hackathons(
         self, 
         search_url: Optional[str] = None,
@@ -95,7 +104,7 @@ class HackathonSearcher:
             List of hackathon search results
         """
         if search_url is None:
-            search_url = self.DEFAULT_SEARCH_URL
+            search_url = self.default_search_url
             
         logger.info(f"Searching hackathons: {search_url}")
         
@@ -108,8 +117,11 @@ class HackathonSearcher:
             })
             
             # Navigate to search page
-            await page.goto(search_url, wait_until="domcontentloaded", timeout=30000)
-            await page.wait_for_timeout(3000)  # Wait for dynamic content
+            with span("search.goto", url=search_url), metrics.timed("page_load_seconds", kind="search"):
+                await page.goto(search_url, wait_until="domcontentloaded", timeout=30000)
+            metrics.inc("pages_total", kind="search")
+            with span("search.wait"):
+                await page.wait_for_timeout(3000)  # Wait for dynamic content
             
             # Extract hackathon listings
             hackathons = []
@@ -147,7 +159,7 @@ class HackathonSearcher:
                     
                     # Make URL absolute
                     if url.startswith("/"):
-                        url = urljoin("https://devpost.com", url)
+                        url = urljoin(self.base_url, url)
                     
                     # Skip if it's not a hackathon URL
                     if not url or "/software/" in url:
@@ -190,6 +202,7 @@ class HackathonSearcher:
             
         except Exception as e:
             logger.error(f"Error searching hackathons: {e}")
+            metrics.inc("failures_total", stage="search")
             await page.close()
             return []
     
@@ -205,6 +218,7 @@ class HackathonSearcher:
         """
         return await self.search_hackathons(max_results=limit)
     
+    @profiled("search.gallery_url")
     async def get_hackathon_project_gallery_url(self, hackathon_url: str) -> Optional[str]:
         """
         Get the project gallery URL for a hackathon.
@@ -224,8 +238,11 @@ class HackathonSearcher:
                 'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
             })
             
-            await page.goto(hackathon_url, wait_until="domcontentloaded", timeout=30000)
-            await page.wait_for_timeout(2000)
+            with span("search.goto", url=hackathon_url), metrics.timed("page_load_seconds", kind="landing"):
+                await page.goto(hackathon_url, wait_until="domcontentloaded", timeout=30000)
+            metrics.inc("pages_total", kind="landing")
+            with span("search.wait"):
+                await page.wait_for_timeout(2000)
             
             # Look for project gallery link
             gallery_selectors = [
@@ -256,6 +273,7 @@ class HackathonSearcher:
             
         except Exception as e:
             logger.error(f"Error finding project gallery: {e}")
+            metrics.inc("failures_total", stage="gallery_lookup")
             await page.close()
             return None
 
@@ -278,6 +296,7 @@ class LLMHackathonSelector:
             return
             
         try:
+            genai = lazy.gemini()
             genai.configure(api_key=self.api_key)
             self.model = genai.GenerativeModel('gemini-2.5-flash')
             self.enabled = True
@@ -286,6 +305,7 @@ class LLMHackathonSelector:
             logger.error(f"Failed to initialize LLM selector: {e}")
             self.enabled = False
     
+    @profiled("search.llm_select")
     async def select_best_hackathon(
         self, 
         hackathons: List[HackathonSearchResult],
@@ -349,7 +369,8 @@ Only return valid JSON, no additional text.
 """
             
             # Generate selection
-            response = self.model.generate_content(prompt)
+            with span("search.llm_generate"), metrics.llm_call("search") as call:
+                response = call.response = self.model.generate_content(prompt)
             
             if response and response.text:
                 # Parse response
@@ -390,6 +411,7 @@ Only return valid JSON, no additional text.
                 
         except Exception as e:
             logger.error(f"Error in LLM hackathon selection: {e}")
+            metrics.inc("failures_total", stage="llm_select")
             return (hackathons[0] if hackathons else None, f"Fallback: Selected first hackathon due to error: {str(e)}")
 
 
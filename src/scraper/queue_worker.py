@@ -0,0 +1,217 @@
+"""
+Crawl workers that drain project pages from a shared WorkQueue.
+
+With a work queue set, DevpostScraper.scrape_hackathon enqueues the project
+URLs it discovers in the gallery (queue name: the hackathon URL), drains the
+queue itself alongside any other workers, waits until every job is done or
+failed, and assembles the completed projects in gallery order. Workers on
+other processes or machines sharing the queue file run this module:
+
+    python -m scraper.queue_worker ../data/queue.db --headless --no-llm
+
+Each leased job is heartbeated while its page is scraped. A worker that dies
+loses its lease after --lease seconds and the page is scraped by someone
+else. Every crawl is a new run that scrapes each page again; jobs left from
+earlier runs are started over, never reused. Completed projects are stored
+as the job results under the run id logged when the crawl starts, so an
+interrupted crawl resumes from where it stopped when it is started again
+with ``main.py --resume-run RUN``.
+"""
+import argparse
+import asyncio
+import logging
+import os
+import time
+import uuid
+from pathlib import Path
+from typing import TYPE_CHECKING, List, Optional
+
+from storage.work_queue import DEFAULT_LEASE_SECONDS, Job, WorkQueue, default_worker_id
+from utils import metrics
+
+if TYPE_CHECKING:
+    from models.hackathon import Project
+    from scraper.devpost_scraper import DevpostScraper
+
+logger = logging.getLogger(__name__)
+
+POLL_SECONDS = 2.0
+
+
+async def _heartbeat(work_queue: WorkQueue, job: Job, worker_id: str, lease_seconds: float) -> None:
+    while True:
+        await asyncio.sleep(lease_seconds / 3)
+        if not work_queue.heartbeat(job, worker_id, lease_seconds):
+            logger.warning(f"Lost the lease on {job.key}; another worker may scrape it too")
+            return
+
+
+async def process_job(
+    scraper: "DevpostScraper",
+    work_queue: WorkQueue,
+    job: Job,
+    worker_id: str,
+    lease_seconds: float = DEFAULT_LEASE_SECONDS
+) -> bool:
+    """
+    Scrape the project page of a leased job and record the outcome.
+
+    Returns:
+        True if the project was scraped
+    """
+    heartbeat = asyncio.create_task(_heartbeat(work_queue, job, worker_id, lease_seconds))
+    try:
+        result = await scraper.scrape_project(job.payload["url"])
+    finally:
+        heartbeat.cancel()
+
+    if result.success and result.hackathon:
+        projects = [project.model_dump(mode="json", warnings=False) for project in result.hackathon.projects]
+        if not work_queue.complete(job, worker_id, projects):
+            logger.info(f"{job.key} was already completed by another worker")
+        return True
+    work_queue.fail(job, worker_id, result.error_message or "scrape failed")
+    metrics.inc("retries_total", stage="queue_job")
+    return False
+
+
+async def drain(
+    scraper: "DevpostScraper",
+    work_queue: WorkQueue,
+    worker_id: str,
+    queue: Optional[str] = None,
+    lease_seconds: float = DEFAULT_LEASE_SECONDS,
+    until_finished: bool = False,
+    idle_exit: Optional[float] = None,
+    run: Optional[str] = None
+) -> int:
+    """
+    Lease and scrape jobs until there is nothing left to do.
+
+    Args:
+        scraper: Open scraper
+        work_queue: Queue to drain
+        worker_id: Identity used for leases
+        queue: Queue name to drain (None for any queue)
+        lease_seconds: Lease length (heartbeats renew it every third of it)
+        until_finished: Keep polling until every job of ``queue`` is done or
+            failed, including jobs leased by other workers
+        idle_exit: Return after this many seconds without work (None polls forever)
+        run: Only lease jobs of this crawl run (None for any run)
+
+    Returns early, leaving the remaining jobs to other workers, once the
+    scraper's crawl budget is used up.
+
+    Returns:
+        Number of jobs this worker processed
+    """
+    processed = 0
+    idle_since = time.monotonic()
+    while True:
+        if scraper.budget.exhausted():
+            logger.warning(f"Crawl budget used up ({scraper.budget.stopped_by}); leaving the remaining jobs")
+            return processed
+        jobs = work_queue.lease(worker_id, queue, lease_seconds, run=run)
+        if jobs:
+            for job in jobs:
+                if not scraper.budget.take_page():
+                    work_queue.fail(job, worker_id, "crawl budget used up")
+                    return processed
+                logger.info(f"Scraping {job.key} (attempt {job.attempts})")
+                await process_job(scraper, work_queue, job, worker_id, lease_seconds)
+                processed += 1
+            idle_since = time.monotonic()
+            continue
+        if until_finished and queue is not None and not work_queue.outstanding(queue, run):
+            return processed
+        if not until_finished and idle_exit is not None and time.monotonic() - idle_since >= idle_exit:
+            return processed
+        # Others hold the remaining leases; expired ones become leasable again
+        await asyncio.sleep(POLL_SECONDS)
+
+
+async def scrape_projects_via_queue(
+    scraper: "DevpostScraper",
+    work_queue: WorkQueue,
+    queue: str,
+    project_urls: List[str],
+    run: Optional[str] = None
+) -> List["Project"]:
+    """
+    Enqueue project pages, drain them with any other workers and collect the projects.
+
+    Args:
+        scraper: Open scraper (drains the queue alongside other workers)
+        work_queue: Shared queue
+        queue: Queue name (normally the hackathon URL)
+        project_urls: Project page URLs, in the order to scrape them
+        run: Id of an interrupted crawl run to resume (None starts a new run)
+
+    Returns:
+        Completed projects in the order of project_urls
+    """
+    from models.validation import construct_project
+
+    run = run or uuid.uuid4().hex
+    logger.info(f"Crawl run {run} of queue {queue}")
+    items = ((url, {"url": url, "position": i}) for i, url in enumerate(project_urls))
+    added = work_queue.enqueue(queue, items, run=run)
+    if added < len(project_urls):
+        logger.info(f"Resuming run {run}: {len(project_urls) - added} jobs already in queue {queue}")
+
+    worker_id = default_worker_id()
+    processed = await drain(scraper, work_queue, worker_id, queue=queue, until_finished=True, run=run)
+    outstanding = work_queue.outstanding(queue, run)
+    logger.info(
+        f"Scraped {processed} of {len(project_urls)} project pages here; "
+        + (f"{outstanding} jobs of run {run} left unfinished (--resume-run {run})" if outstanding else f"run {run} finished")
+    )
+    for key, error in work_queue.failures(queue, run):
+        logger.warning(f"Project page failed in every attempt: {key}: {error}")
+
+    wanted = set(project_urls)
+    completed = sorted(
+        (payload["position"], result) for key, payload, result in work_queue.results(queue, run) if key in wanted
+    )
+    # Job results are projects our own workers dumped; no need to validate them again
+    return [construct_project(project) for _, result in completed for project in result]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Drain project pages from a shared crawl work queue")
+    parser.add_argument("db", type=Path, help="Queue database (main.py --work-queue)")
+    parser.add_argument("--queue", default=None, help="Only drain this queue (default: any)")
+    parser.add_argument("--lease", type=float, default=DEFAULT_LEASE_SECONDS, help="Lease length in seconds")
+    parser.add_argument("--idle-exit", type=float, default=60.0, help="Exit after this many idle seconds (0: never)")
+    parser.add_argument("--headless", action="store_true", help="Run browser in headless mode")
+    parser.add_argument("--delay", type=float, default=float(os.getenv("SCRAPING_DELAY", "2.0")), help="Delay between requests in seconds")
+    parser.add_argument("--no-llm", action="store_true", help="Disable LLM analysis")
+    parser.add_argument("--base-url", default=None, help="Devpost base URL (default: DEVPOST_BASE_URL or https://devpost.com)")
+    parser.add_argument("--browser-service", action="store_true", help="Connect to the local browser service")
+    parser.add_argument("--replay", type=Path, default=None, help="Serve pages from this capture archive instead of a browser")
+    parser.add_argument("--log-level", default=os.getenv("LOG_LEVEL", "INFO"), help="Logging level")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=args.log_level, format="%(asctime)s %(levelname)s %(name)s: %(message)s")
+
+    async def run() -> int:
+        from scraper.capture import CaptureArchive
+        from scraper.devpost_scraper import DevpostScraper
+
+        replay = CaptureArchive(args.replay) if args.replay else None
+        with WorkQueue(args.db) as work_queue:
+            async with DevpostScraper(
+                headless=args.headless, delay=args.delay, enable_llm=not args.no_llm,
+                base_url=args.base_url, browser_service=args.browser_service, replay=replay
+            ) as scraper:
+                return await drain(
+                    scraper, work_queue, default_worker_id(), queue=args.queue,
+                    lease_seconds=args.lease, idle_exit=args.idle_exit or None
+                )
+
+    processed = asyncio.run(run())
+    print(f"Processed {processed} jobs")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,256 @@
+"""
+Sharded crawling: the project pages of a gallery split across worker processes.
+
+One DevpostScraper drives one browser from one event loop, and all DOM
+extraction runs in one Python process. scrape_hackathon_sharded() loads
+the gallery with the caller's scraper, deals its project URLs round-robin
+to N worker processes (each with its own browser and event loop) and
+merges their projects back, in gallery order, into one ScrapingResult.
+
+The workers share one RateLimiter, so ``rate`` bounds page loads per second
+across all of them; it replaces each scraper's ``delay`` sleep. Worker
+metrics are merged into the parent's registry; profiling covers the
+parent process only.
+
+In delta mode the parent plans the crawl from the gallery and only deals
+out the pages to fetch; workers open the same store (WAL allows it) to reuse
+stored analyses of pages whose content did not change.
+
+Jobs are dealt in priority order (see scraper.frontier), so every worker
+starts with the most valuable pages. Each worker gets an equal share of
+the page and LLM budgets and the shared deadline.
+"""
+import asyncio
+import logging
+import multiprocessing
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import TYPE_CHECKING, List, Optional, Tuple
+
+from models.hackathon import Hackathon, Project, ScrapingResult
+from scraper.frontier import CrawlBudget, build_coverage, gallery_order, prioritize
+from utils import metrics
+from utils.profiling import profiled
+
+if TYPE_CHECKING:
+    from scraper.devpost_scraper import DevpostScraper
+    from utils.metrics import MetricsRegistry
+
+logger = logging.getLogger(__name__)
+
+
+class RateLimiter:
+    """Spaces page loads at least ``1 / rate`` seconds apart, across processes."""
+
+    def __init__(self, rate: float, context=None):
+        """
+        Args:
+            rate: Page loads per second across all users of the limiter (0 for unlimited)
+            context: multiprocessing context the workers are started with
+        """
+        context = context or multiprocessing.get_context()
+        self.interval = 1.0 / rate if rate > 0 else 0.0
+        self._next_slot = context.Value('d', 0.0, lock=False)
+        self._lock = context.Lock()
+
+    def reserve(self) -> float:
+        """Claim the next free slot and return the seconds until it starts."""
+        if not self.interval:
+            return 0.0
+        with self._lock:
+            now = time.time()
+            slot = max(now, self._next_slot.value)
+            self._next_slot.value = slot + self.interval
+        return slot - now
+
+    async def acquire(self) -> None:
+        """Wait for the next free slot."""
+        wait = self.reserve()
+        if wait > 0:
+            await asyncio.sleep(wait)
+
+
+@dataclass
+class ShardOptions:
+    """Scraper settings handed to every worker process."""
+    headless: bool = True
+    enable_llm: bool = True
+    base_url: Optional[str] = None
+    browser_service: bool = False
+    recycle_after: Optional[int] = None
+    max_attempts: int = 3
+    capture_path: Optional[Path] = None
+    replay_path: Optional[Path] = None
+    store_path: Optional[Path] = None
+    delta: bool = False
+    collect_metrics: bool = False
+    log_level: int = logging.INFO
+
+    @classmethod
+    def from_scraper(cls, scraper: "DevpostScraper") -> "ShardOptions":
+        return cls(
+            headless=scraper.headless,
+            enable_llm=scraper.enable_llm,
+            base_url=scraper.base_url,
+            browser_service=scraper.browser_service,
+            recycle_after=scraper.recycle_after,
+            max_attempts=scraper.max_attempts,
+            capture_path=scraper.capture.path if scraper.capture is not None else None,
+            replay_path=scraper.replay.path if scraper.replay is not None else None,
+            store_path=scraper.store.path if scraper.store is not None else None,
+            delta=scraper.delta,
+            collect_metrics=metrics.enabled(),
+            log_level=logging.getLogger().getEffectiveLevel(),
+        )
+
+
+@dataclass
+class ShardResult:
+    """Projects and statistics of one worker."""
+    shard: int
+    projects: List[Tuple[int, List[Project]]] = field(default_factory=list)
+    jobs: int = 0
+    pages: int = 0
+    failed: int = 0
+    browser_restarts: int = 0
+    seconds: float = 0.0
+    budget: Optional[CrawlBudget] = None
+    metrics: Optional["MetricsRegistry"] = None
+
+
+_worker_limiter: Optional[RateLimiter] = None
+
+
+def _init_worker(limiter: RateLimiter, log_level: int) -> None:
+    global _worker_limiter
+    _worker_limiter = limiter
+    logging.basicConfig(level=log_level, format=f"%(asctime)s [shard pid %(process)d] %(levelname)s %(name)s: %(message)s")
+
+
+async def _crawl(shard: int, jobs: List[Tuple[int, str]], options: ShardOptions, budget: CrawlBudget) -> ShardResult:
+    from scraper.capture import CaptureArchive
+    from scraper.devpost_scraper import DevpostScraper
+    from storage.sqlite_store import ProjectStore
+
+    capture = CaptureArchive(options.capture_path) if options.capture_path else None
+    replay = CaptureArchive(options.replay_path) if options.replay_path else None
+    # Results are saved by the parent; workers only read the store and record page hashes
+    store = ProjectStore(options.store_path) if options.delta and options.store_path else None
+    try:
+        async with DevpostScraper(
+            headless=options.headless, delay=0, enable_llm=options.enable_llm, base_url=options.base_url,
+            capture=capture, replay=replay, browser_service=options.browser_service,
+            recycle_after=options.recycle_after, max_attempts=options.max_attempts,
+            rate_limiter=_worker_limiter, store=store, delta=options.delta, budget=budget
+        ) as scraper:
+            pages = await scraper.scrape_project_pages([url for _, url in jobs])
+            # Pages the budget left unvisited are neither scraped nor failed; retried pages count once
+            return ShardResult(
+                shard=shard,
+                projects=[(jobs[index][0], projects) for index, projects in pages.scraped.items()],
+                jobs=len(jobs),
+                pages=scraper.budget.pages,
+                failed=len(pages.failed),
+                browser_restarts=scraper.browser_restarts,
+                budget=scraper.budget,
+            )
+    finally:
+        for resource in (capture, replay, store):
+            if resource is not None:
+                resource.close()
+
+
+def _crawl_shard(shard: int, jobs: List[Tuple[int, str]], options: ShardOptions, budget: CrawlBudget) -> ShardResult:
+    """Worker entry point: scrape one shard of (crawl position, project URL) jobs within a budget share."""
+    if options.collect_metrics:
+        metrics.enable()
+    start = time.perf_counter()
+    result = asyncio.run(_crawl(shard, jobs, options, budget))
+    result.seconds = time.perf_counter() - start
+    result.metrics = metrics.disable()
+    return result
+
+
+@profiled("scraper.hackathon_sharded")
+async def scrape_hackathon_sharded(
+    scraper: "DevpostScraper",
+    hackathon_url: str,
+    shards: int,
+    rate: Optional[float] = None
+) -> ScrapingResult:
+    """
+    Scrape a hackathon with its project pages split across worker processes.
+
+    Args:
+        scraper: Open scraper used for the gallery page; workers copy its settings
+        hackathon_url: URL of the hackathon page
+        shards: Number of worker processes
+        rate: Page loads per second across all workers (default: one page per
+            ``scraper.delay`` per worker; 0 for unlimited)
+
+    Returns:
+        ScrapingResult with the projects in gallery order
+    """
+    try:
+        gallery = await scraper.scrape_gallery(hackathon_url)
+        plan = scraper.plan_delta(gallery)
+        project_urls = prioritize(plan.fetch if plan else gallery.project_urls, gallery.cards)
+
+        jobs = list(enumerate(project_urls))
+        shard_jobs = [jobs[shard::shards] for shard in range(shards) if jobs[shard::shards]]
+        if rate is None:
+            rate = len(shard_jobs) / scraper.delay if scraper.delay > 0 else 0.0
+        if scraper.replay is not None:
+            rate = 0.0
+
+        projects: List[Project] = []
+        if shard_jobs:
+            logger.info(f"Scraping {len(jobs)} projects in {len(shard_jobs)} shards ({rate or 'unlimited'} pages/s)")
+            # spawn: forking a process that may be running an event loop and Playwright is unsafe
+            context = multiprocessing.get_context("spawn")
+            options = ShardOptions.from_scraper(scraper)
+            limiter = RateLimiter(rate, context)
+            loop = asyncio.get_running_loop()
+            with ProcessPoolExecutor(
+                max_workers=len(shard_jobs), mp_context=context,
+                initializer=_init_worker, initargs=(limiter, options.log_level)
+            ) as pool:
+                results = await asyncio.gather(*(
+                    loop.run_in_executor(
+                        pool, _crawl_shard, shard, shard_jobs[shard], options,
+                        scraper.budget.share(len(shard_jobs), shard)
+                    )
+                    for shard in range(len(shard_jobs))
+                ))
+
+            scraped = {}
+            for result in results:
+                logger.info(
+                    f"Shard {result.shard}: {len(result.projects)}/{result.jobs} projects, {result.failed} failed, from "
+                    f"{result.pages} page loads in {result.seconds:.1f}s ({result.browser_restarts} browser restarts)"
+                )
+                scraped.update(result.projects)
+                scraper.budget.absorb(result.budget)
+                metrics.merge(result.metrics)
+            projects = [project for index in sorted(scraped) for project in scraped[index]]
+        fetched = len(projects)
+        projects = scraper.merge_delta(gallery, plan, projects) if plan else gallery_order(gallery.project_urls, projects)
+
+        hackathon = Hackathon(
+            name=gallery.name or "Unknown Hackathon",
+            description=gallery.description,
+            devpost_url=hackathon_url,
+            projects=projects,
+            coverage=build_coverage(
+                gallery.listed, len(gallery.project_urls), len(plan.reuse) if plan else 0,
+                fetched, projects, scraper.budget
+            )
+        )
+        return ScrapingResult(success=True, url=hackathon_url, hackathon=hackathon)
+
+    except Exception as e:
+        logger.error(f"Failed to scrape hackathon {hackathon_url}: {e}")
+        metrics.inc("failures_total", stage="scrape_hackathon")
+        return ScrapingResult(success=False, url=hackathon_url, error_message=str(e))
@@ -0,0 +1,47 @@
+"""
+Devpost base URL handling.
+
+The scraper and hackathon searcher normally talk to https://devpost.com.
+Setting DEVPOST_BASE_URL (or passing ``base_url``) points them at another
+host instead, such as the local fixture server in
+benchmarks/devpost_fixture_server.py.
+"""
+import os
+from typing import Any, Optional
+
+DEFAULT_BASE_URL = "https://devpost.com"
+
+
+def get_base_url(base_url: Optional[str] = None) -> str:
+    """
+    Resolve the Devpost base URL.
+
+    Args:
+        base_url: Explicit base URL (defaults to DEVPOST_BASE_URL, then devpost.com)
+
+    Returns:
+        Base URL without a trailing slash
+    """
+    return (base_url or os.getenv("DEVPOST_BASE_URL") or DEFAULT_BASE_URL).rstrip("/")
+
+
+def is_devpost_url(url: str, base_url: Optional[str] = None) -> bool:
+    """Whether a URL belongs to devpost.com or to the configured base URL."""
+    return "devpost.com" in url or url.startswith(get_base_url(base_url) + "/")
+
+
+def gallery_url(hackathon_url: str) -> str:
+    """The project gallery of a hackathon, given its landing page or gallery URL."""
+    if "project-gallery" in hackathon_url:
+        return hackathon_url
+    return hackathon_url.split("?", 1)[0].split("#", 1)[0].rstrip("/") + "/project-gallery"
+
+
+def url_key(url: Any) -> str:
+    """
+    Key for matching project URLs from different sources.
+
+    URLs that went through a pydantic HttpUrl field come back normalized
+    (e.g. with a trailing slash added), so they are compared without one.
+    """
+    return str(url).rstrip("/")
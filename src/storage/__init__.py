@@ -0,0 +1,3 @@
+"""
+Storage and export modules for scraped hackathon data.
+"""
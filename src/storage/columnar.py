@@ -0,0 +1,215 @@
+"""
+Columnar (Parquet) export of scraped hackathon data.
+
+Scraping results are normalized into five tables and appended as one
+partition per run:
+
+    <output_dir>/projects/run=<run_id>/part-0.parquet
+    <output_dir>/project_tags/run=<run_id>/part-0.parquet
+    <output_dir>/awards/run=<run_id>/part-0.parquet
+    <output_dir>/members/run=<run_id>/part-0.parquet
+    <output_dir>/analyses/run=<run_id>/part-0.parquet
+
+Each table directory can be read as a single hive-partitioned dataset, e.g.
+``pd.read_parquet(output_dir / "project_tags", filters=[("tag", "==", "gemini")])``.
+
+Usage (from src/):
+    python -m storage.columnar ../data/raw/*.json --output-dir ../data/parquet
+"""
+import argparse
+import json
+import logging
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional
+
+import pandas as pd
+
+from models.hackathon import ScrapingResult
+from storage.serialization import load_result
+
+logger = logging.getLogger(__name__)
+
+TABLES = ["projects", "project_tags", "awards", "members", "analyses"]
+
+# Low-cardinality string columns stored dictionary-encoded
+CATEGORICAL_COLUMNS = {
+    "projects": ["hackathon_url"],
+    "project_tags": ["hackathon_url", "tag"],
+    "awards": ["hackathon_url", "award"],
+    "members": ["hackathon_url"],
+    "analyses": ["hackathon_url", "innovation_level", "commercial_potential", "technical_complexity", "social_impact"],
+}
+
+
+def _level(value: Any) -> Optional[str]:
+    """Normalize a high/medium/low rating from an LLM analysis."""
+    return value.strip().lower() if isinstance(value, str) and value.strip() else None
+
+
+def build_rows(result: ScrapingResult) -> Dict[str, List[Dict[str, Any]]]:
+    """
+    Normalize one scraping result into rows for each table.
+
+    Args:
+        result: Successful scraping result
+
+    Returns:
+        Mapping of table name to list of row dicts
+    """
+    rows: Dict[str, List[Dict[str, Any]]] = {table: [] for table in TABLES}
+    hackathon = result.hackathon
+    if not result.success or not hackathon:
+        return rows
+
+    hackathon_url = str(hackathon.devpost_url)
+
+    for project in hackathon.projects:
+        project_url = str(project.devpost_url)
+        rows["projects"].append({
+            "hackathon_url": hackathon_url,
+            "hackathon_name": hackathon.name,
+            "project_url": project_url,
+            "name": project.name,
+            "description": project.description,
+            "external_url": str(project.project_url) if project.project_url else None,
+            "image_url": str(project.image_url) if project.image_url else None,
+            "submission_date": project.submission_date,
+            "vote_count": project.vote_count,
+            "comment_count": project.comment_count,
+            "tag_count": len(project.tags),
+            "award_count": len(project.awards),
+            "member_count": len(project.members),
+            "is_winner": bool(project.awards),
+            "scraped_at": hackathon.scraped_at,
+        })
+
+        for position, tag in enumerate(project.tags):
+            rows["project_tags"].append({
+                "hackathon_url": hackathon_url,
+                "project_url": project_url,
+                "tag": tag,
+                "position": position,
+            })
+
+        for award in project.awards:
+            rows["awards"].append({
+                "hackathon_url": hackathon_url,
+                "project_url": project_url,
+                "award": award.name,
+                "category": award.category,
+                "sponsor": award.sponsor,
+                "prize_value": award.prize_value,
+            })
+
+        for member in project.members:
+            rows["members"].append({
+                "hackathon_url": hackathon_url,
+                "project_url": project_url,
+                "name": member.name,
+                "profile_url": str(member.profile_url) if member.profile_url else None,
+                "role": member.role,
+            })
+
+        analysis = project.analysis
+        if analysis:
+            rows["analyses"].append({
+                "hackathon_url": hackathon_url,
+                "project_url": project_url,
+                "summary": analysis.get("summary"),
+                "detailed_description": analysis.get("detailed_description"),
+                "innovation_level": _level((analysis.get("innovation_analysis") or {}).get("level")),
+                "commercial_potential": _level((analysis.get("market_analysis") or {}).get("commercial_potential")),
+                "technical_complexity": _level((analysis.get("implementation_quality") or {}).get("technical_complexity")),
+                "social_impact": _level((analysis.get("social_impact") or {}).get("level")),
+                "categories": list(analysis.get("categories") or []),
+                "key_technologies": list(analysis.get("key_technologies") or []),
+                "analysis_json": json.dumps(analysis, ensure_ascii=False),
+            })
+
+    return rows
+
+
+def build_tables(results: Iterable[ScrapingResult]) -> Dict[str, pd.DataFrame]:
+    """
+    Build normalized DataFrames from scraping results.
+
+    Args:
+        results: Scraping results to export
+
+    Returns:
+        Mapping of table name to DataFrame
+    """
+    rows: Dict[str, List[Dict[str, Any]]] = {table: [] for table in TABLES}
+    for result in results:
+        for table, table_rows in build_rows(result).items():
+            rows[table].extend(table_rows)
+
+    tables = {}
+    for table, table_rows in rows.items():
+        df = pd.DataFrame(table_rows)
+        for column in CATEGORICAL_COLUMNS[table]:
+            if column in df.columns:
+                df[column] = df[column].astype("category")
+        tables[table] = df
+    return tables
+
+
+def export_parquet(
+    results: Iterable[ScrapingResult],
+    output_dir: Path,
+    run_id: Optional[str] = None
+) -> Dict[str, Path]:
+    """
+    Append scraping results to the columnar dataset as a new run partition.
+
+    Args:
+        results: Scraping results to export
+        output_dir: Root directory of the Parquet dataset
+        run_id: Partition value for this run (defaults to a timestamp)
+
+    Returns:
+        Mapping of table name to the written Parquet file
+    """
+    run_id = run_id or datetime.now().strftime("%Y%m%d_%H%M%S")
+    written = {}
+
+    for table, df in build_tables(results).items():
+        if df.empty:
+            continue
+        partition_dir = output_dir / table / f"run={run_id}"
+        partition_dir.mkdir(parents=True, exist_ok=True)
+        output_path = partition_dir / "part-0.parquet"
+        df.to_parquet(output_path, index=False, compression="zstd")
+        written[table] = output_path
+        logger.info(f"Exported {len(df)} rows to {output_path}")
+
+    return written
+
+
+def main():
+    """Export stored raw results to Parquet."""
+    parser = argparse.ArgumentParser(description="Export raw scraping results to Parquet tables")
+    parser.add_argument("data_files", nargs="+", type=Path, help="Raw result JSON files")
+    parser.add_argument(
+        "--output-dir",
+        type=Path,
+        default=Path("data/parquet"),
+        help="Root directory of the Parquet dataset (default: data/parquet)"
+    )
+    parser.add_argument("--run-id", help="Partition value for this export (default: timestamp)")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO)
+
+    def load_results():
+        for data_file in args.data_files:
+            yield load_result(data_file)
+
+    written = export_parquet(load_results(), args.output_dir, run_id=args.run_id)
+    for table, path in written.items():
+        print(f"{table}: {path}")
+
+
+if __name__ == "__main__":
+    main()
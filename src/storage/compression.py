@@ -0,0 +1,72 @@
+"""
+Compression of stored result files, chosen by file suffix.
+
+gzip uses the standard library; zstd needs the optional ``zstandard``
+package. This module has no model dependencies, so the CLI can use it
+without importing pydantic.
+"""
+import gzip
+from pathlib import Path
+from typing import Optional
+
+try:
+    import zstandard
+except ImportError:  # optional dependency
+    zstandard = None
+
+COMPRESSION_SUFFIXES = {
+    "gzip": ".gz",
+    "zstd": ".zst",
+}
+
+
+def compression_for_path(path: Path) -> Optional[str]:
+    """Return the compression implied by a file suffix, if any."""
+    for compression, suffix in COMPRESSION_SUFFIXES.items():
+        if path.suffix == suffix:
+            return compression
+    return None
+
+
+def with_compression_suffix(path: Path, compression: Optional[str]) -> Path:
+    """
+    Add the suffix of a compression format to a path.
+
+    Args:
+        path: Uncompressed file path (e.g. ``hackathon_...json``)
+        compression: "gzip", "zstd" or None
+
+    Returns:
+        Path with the matching suffix appended
+    """
+    if not compression:
+        return path
+    if compression not in COMPRESSION_SUFFIXES:
+        raise ValueError(f"Unsupported compression: {compression}")
+    suffix = COMPRESSION_SUFFIXES[compression]
+    return path if path.suffix == suffix else path.with_name(path.name + suffix)
+
+
+def _require_zstandard() -> None:
+    if zstandard is None:
+        raise RuntimeError("zstd compression requires the 'zstandard' package")
+
+
+def compress(data: bytes, compression: Optional[str]) -> bytes:
+    """Compress bytes with the given format (None returns them unchanged)."""
+    if compression == "gzip":
+        return gzip.compress(data, compresslevel=6)
+    if compression == "zstd":
+        _require_zstandard()
+        return zstandard.ZstdCompressor(level=3).compress(data)
+    return data
+
+
+def decompress(data: bytes, compression: Optional[str]) -> bytes:
+    """Decompress bytes written by compress()."""
+    if compression == "gzip":
+        return gzip.decompress(data)
+    if compression == "zstd":
+        _require_zstandard()
+        return zstandard.ZstdDecompressor().decompressobj().decompress(data)
+    return data
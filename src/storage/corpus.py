@@ -0,0 +1,316 @@
+"""
+Lazy access to the archive of raw scraping results.
+
+A small manifest (``.manifest.json`` in the raw data directory) records the
+hackathon, success flag, project count, crawl budget stop, content hash and
+mtime of every result file. A file is only read again when its size or mtime
+changes, so listing the corpus does not decode the archive. The manifest is
+only written back when the directory is writable; a read-only archive is
+indexed in memory.
+
+The corpus skips failed and empty results as well as results superseded
+by a better scrape of the same hackathon, and streams the remaining
+projects one file at a time. A complete scrape supersedes a partial one
+(cut short by a crawl budget) even if the partial one is newer.
+
+Usage (from src/):
+    python -m storage.corpus ../data/raw
+"""
+import argparse
+import hashlib
+import logging
+import os
+from dataclasses import asdict, dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Union
+from urllib.parse import urlparse
+
+from models.hackathon import Project, ScrapingResult
+from models.validation import ValidationMode, parse_scraping_result, validate_projects
+from storage.compression import COMPRESSION_SUFFIXES, compression_for_path, decompress
+from storage.serialization import read_result_data
+from utils import fastjson
+from utils.fileio import atomic_write
+
+logger = logging.getLogger(__name__)
+
+MANIFEST_NAME = ".manifest.json"
+MANIFEST_VERSION = 2
+
+RESULT_PATTERNS = ["*.json"] + [f"*.json{suffix}" for suffix in COMPRESSION_SUFFIXES.values()]
+
+
+def hackathon_key(url: Optional[str]) -> Optional[str]:
+    """
+    Identify the hackathon a result URL belongs to.
+
+    Devpost hackathons live on their own subdomain (``<name>.devpost.com``),
+    so gallery pages, landing pages and tracking query strings all map to
+    the same key. Elsewhere (devpost.com itself, a DEVPOST_BASE_URL mirror or
+    the fixture server) several hackathons share a host, so the key is the
+    host and path, without a trailing ``/project-gallery``.
+
+    Args:
+        url: Hackathon URL of a result
+
+    Returns:
+        Normalized key, or None if there is no URL
+    """
+    if not url:
+        return None
+    parsed = urlparse(url)
+    host = parsed.netloc.lower()
+    if host.endswith(".devpost.com") and host != "www.devpost.com":
+        return host
+    path = parsed.path.rstrip('/')
+    if path.endswith("/project-gallery"):
+        path = path[:-len("/project-gallery")]
+    return f"{host}{path}"
+
+
+@dataclass
+class ManifestEntry:
+    """Summary of one raw result file."""
+    file: str
+    hackathon_url: Optional[str]
+    success: bool
+    project_count: int
+    content_hash: str
+    mtime: float
+    size: int
+    scraped_at: Optional[str] = None
+    stopped_by: Optional[str] = None
+
+    @property
+    def usable(self) -> bool:
+        """Whether the file holds a successful result with projects."""
+        return self.success and self.project_count > 0
+
+    @property
+    def complete(self) -> bool:
+        """Whether the scrape ran to the end rather than being stopped by a crawl budget."""
+        return self.stopped_by is None
+
+
+def _scan_file(path: Path) -> ManifestEntry:
+    """Read a result file and build its manifest entry."""
+    stat = path.stat()
+    raw = path.read_bytes()
+    data = fastjson.loads(decompress(raw, compression_for_path(path)))
+    hackathon = data.get('hackathon') or {}
+    return ManifestEntry(
+        file=path.name,
+        hackathon_url=hackathon.get('devpost_url') or data.get('url'),
+        success=bool(data.get('success')) and bool(hackathon),
+        project_count=len(hackathon.get('projects') or []),
+        content_hash=hashlib.sha256(raw).hexdigest(),
+        mtime=stat.st_mtime,
+        size=stat.st_size,
+        scraped_at=hackathon.get('scraped_at') or data.get('scraped_at'),
+        stopped_by=(hackathon.get('coverage') or {}).get('stopped_by'),
+    )
+
+
+def _timestamp(value: Optional[str]) -> float:
+    """
+    Seconds since the epoch of a stored ``scraped_at`` (-inf if missing or unparseable).
+
+    Stored values mix ``Z`` and ``+00:00`` suffixes and naive local times,
+    so they are compared as instants rather than as strings.
+    """
+    if not value:
+        return float("-inf")
+    try:
+        if value.endswith("Z"):
+            value = value[:-1] + "+00:00"
+        # Naive values are local times (datetime.now() at scrape time)
+        return datetime.fromisoformat(value).astimezone().timestamp()
+    except ValueError:
+        return float("-inf")
+
+
+def _scrape_order(entry: ManifestEntry) -> tuple:
+    """Sort key putting older scrapes first."""
+    return (_timestamp(entry.scraped_at), entry.mtime, entry.file)
+
+
+def _preference(entry: ManifestEntry) -> tuple:
+    """Rank scrapes of one hackathon: complete ones first, then partial ones with more projects."""
+    return (entry.complete, 0 if entry.complete else entry.project_count)
+
+
+class Corpus:
+    """The raw result files of a data directory, indexed by a manifest."""
+
+    def __init__(self, raw_dir: Path = Path("data/raw"), manifest_path: Optional[Path] = None):
+        """
+        Open a corpus and bring its manifest up to date.
+
+        Args:
+            raw_dir: Directory holding raw result files
+            manifest_path: Manifest file (defaults to ``<raw_dir>/.manifest.json``)
+        """
+        self.raw_dir = raw_dir
+        self.manifest_path = manifest_path or raw_dir / MANIFEST_NAME
+        self.entries: Dict[str, ManifestEntry] = self._load_manifest()
+        self.refresh()
+
+    def _load_manifest(self) -> Dict[str, ManifestEntry]:
+        """Read the manifest, ignoring it if it is missing or outdated."""
+        if not self.manifest_path.exists():
+            return {}
+        try:
+            data = fastjson.loads(self.manifest_path.read_bytes())
+            if data.get('version') != MANIFEST_VERSION:
+                return {}
+            return {item['file']: ManifestEntry(**item) for item in data.get('files', [])}
+        except (OSError, ValueError, TypeError) as e:
+            logger.warning(f"Ignoring unreadable manifest {self.manifest_path}: {e}")
+            return {}
+
+    def _save_manifest(self) -> None:
+        """Write the manifest atomically (skipped for a read-only directory)."""
+        if not os.access(self.manifest_path.parent, os.W_OK):
+            logger.debug(f"Not saving manifest {self.manifest_path}: directory is not writable")
+            return
+        manifest = {
+            'version': MANIFEST_VERSION,
+            'files': [asdict(entry) for _, entry in sorted(self.entries.items())],
+        }
+        try:
+            with atomic_write(self.manifest_path, 'wb') as f:
+                f.write(fastjson.dumps(manifest, pretty=True))
+        except OSError as e:
+            logger.warning(f"Failed to save manifest {self.manifest_path}: {e}")
+
+    def refresh(self) -> int:
+        """
+        Re-scan the directory, reading only new or modified files.
+
+        Returns:
+            Number of files that were (re)read
+        """
+        paths = {
+            path.name: path
+            for pattern in RESULT_PATTERNS
+            for path in self.raw_dir.glob(pattern)
+            if not path.name.startswith('.')
+        }
+        scanned = 0
+        changed = False
+
+        for name in list(self.entries):
+            if name not in paths:
+                del self.entries[name]
+                changed = True
+
+        for name, path in sorted(paths.items()):
+            stat = path.stat()
+            entry = self.entries.get(name)
+            if entry is not None and entry.mtime == stat.st_mtime and entry.size == stat.st_size:
+                continue
+            try:
+                self.entries[name] = _scan_file(path)
+            except (OSError, ValueError) as e:
+                logger.warning(f"Skipping unreadable result file {path}: {e}")
+                self.entries.pop(name, None)
+                continue
+            scanned += 1
+            changed = True
+
+        if changed:
+            self._save_manifest()
+        return scanned
+
+    def current_entries(self) -> List[ManifestEntry]:
+        """
+        Return the best usable file of each hackathon.
+
+        Failed and empty results are skipped. When a hackathon was scraped
+        several times, the most recent complete scrape is kept; if every
+        scrape was cut short by a crawl budget, the one with the most
+        projects (the most recent of equals). Files with identical content
+        are counted once.
+
+        Returns:
+            Entries ordered by scrape time
+        """
+        latest: Dict[str, ManifestEntry] = {}
+        seen_hashes = set()
+
+        for entry in sorted(self.entries.values(), key=_scrape_order):
+            if not entry.usable or entry.content_hash in seen_hashes:
+                continue
+            seen_hashes.add(entry.content_hash)
+            key = hackathon_key(entry.hackathon_url) or entry.file
+            # Later scrapes win ties
+            if key not in latest or _preference(entry) >= _preference(latest[key]):
+                latest[key] = entry
+
+        return sorted(latest.values(), key=_scrape_order)
+
+    def current_paths(self) -> List[Path]:
+        """Return the paths of the current (non-superseded) result files."""
+        return [self.raw_dir / entry.file for entry in self.current_entries()]
+
+    def iter_data(self) -> Iterator[Dict[str, Any]]:
+        """Yield the raw result dicts of the current files, one file at a time."""
+        for path in self.current_paths():
+            yield read_result_data(path)
+
+    def iter_results(self, mode: Optional[Union[str, ValidationMode]] = None) -> Iterator[ScrapingResult]:
+        """
+        Yield the current results as models, one file at a time.
+
+        Args:
+            mode: Validation mode (defaults to VALIDATION_MODE)
+        """
+        for data in self.iter_data():
+            yield parse_scraping_result(data, mode)
+
+    def iter_project_data(self) -> Iterator[Dict[str, Any]]:
+        """Yield raw project dicts of the current files without building models."""
+        for data in self.iter_data():
+            yield from data['hackathon'].get('projects') or []
+
+    def iter_projects(self, mode: Optional[Union[str, ValidationMode]] = None) -> Iterator[Project]:
+        """
+        Yield the projects of the current files as models.
+
+        Args:
+            mode: Validation mode (defaults to VALIDATION_MODE)
+        """
+        for data in self.iter_data():
+            yield from validate_projects(data['hackathon'].get('projects') or [], mode)
+
+
+def main():
+    """Print the manifest of a raw data directory."""
+    parser = argparse.ArgumentParser(description="Index raw scraping results and list the current ones")
+    parser.add_argument("raw_dir", nargs="?", type=Path, default=Path("data/raw"), help="Raw data directory")
+    parser.add_argument("--all", action="store_true", help="List every file, including skipped ones")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO)
+
+    corpus = Corpus(args.raw_dir)
+    current = {entry.file for entry in corpus.current_entries()}
+    entries = sorted(corpus.entries.values(), key=lambda entry: entry.file)
+
+    for entry in entries:
+        if not args.all and entry.file not in current:
+            continue
+        if entry.file in current:
+            status = "current" if entry.complete else f"current (partial, stopped by {entry.stopped_by})"
+        elif not entry.usable:
+            status = "failed" if not entry.success else "empty"
+        else:
+            status = "superseded" if entry.complete else "superseded (partial)"
+        print(f"{entry.file}\t{status}\t{entry.project_count}\t{entry.hackathon_url}")
+
+    print(f"{len(current)} current of {len(entries)} files")
+
+
+if __name__ == "__main__":
+    main()
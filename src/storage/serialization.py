@@ -0,0 +1,98 @@
+"""
+Serialization of scraping results to and from disk.
+
+Results are encoded with pydantic's native JSON serializer, either compact
+(default) or pretty-printed, and can be compressed with gzip or zstd
+(zstd needs the optional ``zstandard`` package). The compression is chosen
+by file suffix: ``.json``, ``.json.gz`` or ``.json.zst``. Files are written
+atomically.
+"""
+from pathlib import Path
+from typing import Iterable, Optional, Union
+
+from models.hackathon import ScrapingResult
+from models.table import ProjectTable
+from models.validation import ValidationMode, parse_scraping_result
+from storage.compression import compress, compression_for_path, decompress
+from utils import fastjson
+from utils.fileio import atomic_write
+
+
+def dumps_result(result: ScrapingResult, pretty: bool = False) -> bytes:
+    """
+    Encode a scraping result as JSON.
+
+    Args:
+        result: Scraping result to encode
+        pretty: Indent the output instead of writing compact JSON
+
+    Returns:
+        UTF-8 encoded JSON
+    """
+    if pretty:
+        return result.model_dump_json(indent=2, warnings=False).encode('utf-8')
+    return result.model_dump_json(warnings=False).encode('utf-8')
+
+
+def save_result(result: ScrapingResult, path: Path, pretty: bool = False) -> Path:
+    """
+    Atomically write a scraping result to disk.
+
+    Args:
+        result: Scraping result to save
+        path: Destination; a ``.gz``/``.zst`` suffix selects compression
+        pretty: Indent the JSON instead of writing it compactly
+
+    Returns:
+        Path the result was written to
+    """
+    data = compress(dumps_result(result, pretty=pretty), compression_for_path(path))
+    with atomic_write(path, 'wb') as f:
+        f.write(data)
+    return path
+
+
+def read_result_bytes(path: Path) -> bytes:
+    """Read a stored result file and return the decompressed JSON bytes."""
+    return decompress(path.read_bytes(), compression_for_path(path))
+
+
+def read_result_data(path: Path) -> dict:
+    """Read a stored result file as plain (unvalidated) JSON data."""
+    return fastjson.loads(read_result_bytes(path))
+
+
+def load_result(
+    path: Path,
+    mode: Optional[Union[str, ValidationMode]] = None
+) -> ScrapingResult:
+    """
+    Load a stored scraping result.
+
+    Args:
+        path: Result file (``.json``, ``.json.gz`` or ``.json.zst``)
+        mode: Validation mode (defaults to VALIDATION_MODE)
+
+    Returns:
+        ScrapingResult model
+    """
+    return parse_scraping_result(read_result_bytes(path), mode)
+
+
+def load_project_table(paths: Iterable[Path]) -> ProjectTable:
+    """
+    Load stored result files into one compact ProjectTable.
+
+    Files are decoded one at a time and appended without building
+    ``Project`` models; unsuccessful results are skipped.
+
+    Args:
+        paths: Result files (``.json``, ``.json.gz`` or ``.json.zst``)
+
+    Returns:
+        Table holding the projects of every successful result
+    """
+    table = ProjectTable()
+    for path in paths:
+        table.add_result(read_result_data(path))
+    return table
@@ -0,0 +1,753 @@
+"""
+Local SQLite store of scraped hackathon data.
+
+Follows the events / projects / awards / tech_tags layout of Spec.md F-2.
+Projects are upserted by their Devpost URL, so re-scraping a hackathon
+updates the existing rows instead of adding another copy. An event's
+projects are the ones of its newest scrape; projects that dropped out of
+the gallery are detached from it. A stored LLM analysis is kept by a
+re-scrape without analysis only while the page content (name, description,
+tags, members, awards and link) is unchanged. The database runs in WAL mode
+so reports can read it while a scrape is writing.
+
+An FTS5 index (``project_fts``) over project names, descriptions, tags,
+awards and LLM analyses is updated in the same transaction as each upsert.
+
+The models are only imported by the methods that build them, so searching
+the store does not load pydantic.
+
+Usage (from src/):
+    python -m storage.sqlite_store ../data/raw/*.json --db ../data/hackathons.db
+"""
+import argparse
+import logging
+import os
+import sqlite3
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Dict, Iterable, List, Optional, Set, Tuple
+
+from utils import fastjson
+
+if TYPE_CHECKING:
+    from models.hackathon import Hackathon, Project, ScrapingResult
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_STORE_PATH = Path("data/hackathons.db")
+
+SCHEMA_VERSION = 4
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS events (
+    id INTEGER PRIMARY KEY,
+    devpost_url TEXT NOT NULL UNIQUE,
+    name TEXT NOT NULL,
+    description TEXT,
+    start_date TEXT,
+    end_date TEXT,
+    theme TEXT,
+    prizes TEXT,
+    sponsors TEXT,
+    participant_count INTEGER,
+    submission_count INTEGER,
+    first_scraped_at TEXT NOT NULL,
+    last_scraped_at TEXT NOT NULL
+);
+
+CREATE TABLE IF NOT EXISTS projects (
+    id INTEGER PRIMARY KEY,
+    devpost_url TEXT NOT NULL UNIQUE,
+    event_id INTEGER REFERENCES events(id) ON DELETE SET NULL,
+    position INTEGER,
+    name TEXT NOT NULL,
+    description TEXT NOT NULL,
+    project_url TEXT,
+    image_url TEXT,
+    submission_date TEXT,
+    vote_count INTEGER,
+    comment_count INTEGER,
+    members TEXT,
+    analysis TEXT,
+    content_hash TEXT,
+    first_seen_at TEXT NOT NULL,
+    last_seen_at TEXT NOT NULL
+);
+
+CREATE TABLE IF NOT EXISTS awards (
+    project_id INTEGER NOT NULL REFERENCES projects(id) ON DELETE CASCADE,
+    position INTEGER NOT NULL,
+    name TEXT NOT NULL,
+    category TEXT,
+    sponsor TEXT,
+    prize_value TEXT,
+    PRIMARY KEY (project_id, position)
+);
+
+CREATE TABLE IF NOT EXISTS tech_tags (
+    project_id INTEGER NOT NULL REFERENCES projects(id) ON DELETE CASCADE,
+    position INTEGER NOT NULL,
+    tag TEXT NOT NULL,
+    PRIMARY KEY (project_id, position)
+);
+
+CREATE INDEX IF NOT EXISTS idx_projects_event ON projects(event_id, position);
+CREATE INDEX IF NOT EXISTS idx_tech_tags_tag ON tech_tags(tag);
+CREATE INDEX IF NOT EXISTS idx_awards_name ON awards(name);
+
+CREATE TABLE IF NOT EXISTS crawl_state (
+    devpost_url TEXT PRIMARY KEY,
+    listing_hash TEXT,
+    content_hash TEXT,
+    last_listed_at TEXT,
+    last_fetched_at TEXT
+);
+
+CREATE VIRTUAL TABLE IF NOT EXISTS project_fts USING fts5(
+    name, description, tags, awards, analysis,
+    tokenize = 'porter unicode61 remove_diacritics 2'
+);
+"""
+
+# Separates a scraped description from the LLM summary appended to it
+LLM_DESCRIPTION_SEPARATOR = "\n\n---\n\n"
+
+# Column weights for ranking search results (name, description, tags, awards, analysis)
+FTS_WEIGHTS = (10.0, 1.0, 5.0, 3.0, 2.0)
+
+_UPSERT_EVENT = """
+INSERT INTO events (
+    devpost_url, name, description, start_date, end_date, theme, prizes, sponsors,
+    participant_count, submission_count, first_scraped_at, last_scraped_at
+) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+ON CONFLICT(devpost_url) DO UPDATE SET
+    name = excluded.name,
+    description = excluded.description,
+    start_date = excluded.start_date,
+    end_date = excluded.end_date,
+    theme = excluded.theme,
+    prizes = excluded.prizes,
+    sponsors = excluded.sponsors,
+    participant_count = excluded.participant_count,
+    submission_count = excluded.submission_count,
+    last_scraped_at = excluded.last_scraped_at
+"""
+
+_UPSERT_PROJECT = """
+INSERT INTO projects (
+    devpost_url, event_id, position, name, description, project_url, image_url,
+    submission_date, vote_count, comment_count, members, analysis, content_hash, first_seen_at, last_seen_at
+) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+ON CONFLICT(devpost_url) DO UPDATE SET
+    event_id = COALESCE(excluded.event_id, projects.event_id),
+    position = COALESCE(excluded.position, projects.position),
+    name = excluded.name,
+    description = excluded.description,
+    project_url = excluded.project_url,
+    image_url = excluded.image_url,
+    submission_date = excluded.submission_date,
+    vote_count = excluded.vote_count,
+    comment_count = excluded.comment_count,
+    members = excluded.members,
+    -- A stored analysis only outlives a re-scrape without one if the content did not change
+    -- (rows stored before content hashes were kept have none and keep their analysis)
+    analysis = CASE
+        WHEN excluded.analysis IS NOT NULL THEN excluded.analysis
+        WHEN projects.content_hash IS NULL OR projects.content_hash = excluded.content_hash THEN projects.analysis
+    END,
+    content_hash = excluded.content_hash,
+    last_seen_at = excluded.last_seen_at
+"""
+
+_PROJECT_ID = "(SELECT id FROM projects WHERE devpost_url = ?)"
+
+_RECORD_LISTING = """
+INSERT INTO crawl_state (devpost_url, listing_hash, last_listed_at) VALUES (?, ?, ?)
+ON CONFLICT(devpost_url) DO UPDATE SET
+    listing_hash = excluded.listing_hash,
+    last_listed_at = excluded.last_listed_at
+"""
+
+_RECORD_CONTENT = """
+INSERT INTO crawl_state (devpost_url, content_hash, last_fetched_at) VALUES (?, ?, ?)
+ON CONFLICT(devpost_url) DO UPDATE SET
+    content_hash = excluded.content_hash,
+    last_fetched_at = excluded.last_fetched_at
+"""
+
+_SEARCH = f"""
+SELECT
+    p.devpost_url, p.name, e.name AS event_name,
+    (SELECT group_concat(a.name, ', ') FROM awards a WHERE a.project_id = p.id) AS awards,
+    bm25(project_fts, {", ".join(str(weight) for weight in FTS_WEIGHTS)}) AS score,
+    snippet(project_fts, -1, ?, ?, '…', ?) AS snippet
+FROM project_fts
+JOIN projects p ON p.id = project_fts.rowid
+LEFT JOIN events e ON e.id = p.event_id
+WHERE project_fts MATCH ?
+{{filters}}
+ORDER BY score
+LIMIT ?
+"""
+
+
+@dataclass
+class SearchHit:
+    """One ranked full-text search result."""
+    devpost_url: str
+    name: str
+    event_name: Optional[str]
+    awards: Optional[str]
+    score: float
+    snippet: str
+
+
+def is_project_result(result: "ScrapingResult") -> bool:
+    """Whether a result is a single scraped project page rather than a hackathon."""
+    return "/software/" in str(result.hackathon.devpost_url if result.hackathon else result.url)
+
+
+@dataclass
+class CrawlState:
+    """What a delta crawl last saw of a project: its gallery card and its page."""
+    devpost_url: str
+    listing_hash: Optional[str]
+    content_hash: Optional[str]
+    last_listed_at: Optional[str]
+    last_fetched_at: Optional[str]
+
+
+def _text(value: Any) -> Optional[str]:
+    """Convert URLs and datetimes to the text stored in the database."""
+    if value is None or isinstance(value, str):
+        return value
+    if isinstance(value, datetime):
+        return value.isoformat()
+    return str(value)
+
+
+def _json(value: Any) -> Optional[str]:
+    """Encode a JSON column (None stays NULL)."""
+    return fastjson.dumps(value).decode('utf-8') if value is not None else None
+
+
+def _content_hash(project: "Project") -> str:
+    """
+    Hash a project's scraped content, like the delta crawl hashes a page.
+
+    The LLM summary that analysis appends to the description is left out,
+    so the same page hashes the same with and without analysis.
+    """
+    from scraper.delta import content_hash
+
+    description = project.description
+    if project.analysis:
+        description = description.split(LLM_DESCRIPTION_SEPARATOR, 1)[0]
+    return content_hash(project.name, description, project.tags, project.members, project.awards, _text(project.project_url))
+
+
+def _analysis_text(value: Any) -> str:
+    """Flatten the text of an LLM analysis (nested dicts and lists) for indexing."""
+    if value is None:
+        return ""
+    if isinstance(value, dict):
+        return "\n".join(filter(None, (_analysis_text(item) for item in value.values())))
+    if isinstance(value, (list, tuple)):
+        return "\n".join(filter(None, (_analysis_text(item) for item in value)))
+    return str(value)
+
+
+def to_match_query(text: str) -> str:
+    """
+    Turn free text into an FTS5 query matching all of its words.
+
+    Each word is quoted, so punctuation such as ``gpt-4`` or ``c++`` is
+    searched literally instead of being parsed as query syntax.
+
+    Args:
+        text: Words to search for
+
+    Returns:
+        FTS5 MATCH expression
+    """
+    return " ".join('"' + word.replace('"', '""') + '"' for word in text.split())
+
+
+def get_store_path(path: Optional[Path] = None) -> Path:
+    """Resolve the store path, falling back to STORE_PATH (default: data/hackathons.db)."""
+    if path is not None:
+        return path
+    return Path(os.getenv("STORE_PATH", str(DEFAULT_STORE_PATH)))
+
+
+class ProjectStore:
+    """SQLite database of events, projects, awards and technology tags."""
+
+    def __init__(self, path: Optional[Path] = None):
+        """
+        Open (and if needed create) the store.
+
+        Args:
+            path: Database file (defaults to STORE_PATH)
+        """
+        self.path = get_store_path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.conn = sqlite3.connect(str(self.path))
+        self.conn.row_factory = sqlite3.Row
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.execute("PRAGMA foreign_keys=ON")
+        version = self.conn.execute("PRAGMA user_version").fetchone()[0]
+        self.conn.executescript(SCHEMA)
+        if version < 2:
+            # Stores created before the search index existed
+            self.rebuild_search_index()
+        columns = {row['name'] for row in self.conn.execute("PRAGMA table_info(projects)")}
+        if 'content_hash' not in columns:
+            # Stores created before project content hashes were kept
+            self.conn.execute("ALTER TABLE projects ADD COLUMN content_hash TEXT")
+        self.conn.execute(f"PRAGMA user_version={SCHEMA_VERSION}")
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def close(self) -> None:
+        """Close the database connection."""
+        self.conn.close()
+
+    def upsert_event(self, hackathon: "Hackathon") -> int:
+        """
+        Insert or update a hackathon (without its projects).
+
+        Args:
+            hackathon: Hackathon to store
+
+        Returns:
+            Row id of the event
+        """
+        scraped_at = _text(hackathon.scraped_at)
+        devpost_url = str(hackathon.devpost_url)
+        with self.conn:
+            self.conn.execute(_UPSERT_EVENT, (
+                devpost_url,
+                hackathon.name,
+                hackathon.description,
+                _text(hackathon.start_date),
+                _text(hackathon.end_date),
+                hackathon.theme,
+                _json(hackathon.prizes),
+                _json(hackathon.sponsors),
+                hackathon.participant_count,
+                hackathon.submission_count,
+                scraped_at,
+                scraped_at,
+            ))
+        return self.conn.execute("SELECT id FROM events WHERE devpost_url = ?", (devpost_url,)).fetchone()[0]
+
+    def upsert_projects(
+        self,
+        projects: Iterable["Project"],
+        event_id: Optional[int] = None,
+        seen_at: Optional[datetime] = None
+    ) -> int:
+        """
+        Bulk insert or update projects, keyed by their Devpost URL.
+
+        Awards and tags of each project are replaced, so storing the same
+        project twice leaves a single, up-to-date copy. All projects are
+        written in one transaction.
+
+        Args:
+            projects: Projects to store
+            event_id: Event the projects belong to (optional)
+            seen_at: When the projects were scraped (defaults to now)
+
+        Returns:
+            Number of projects written
+        """
+        seen_at_text = _text(seen_at or datetime.now())
+        project_rows = []
+        project_urls = []
+        award_rows = []
+        tag_rows = []
+        fts_rows = []
+
+        for position, project in enumerate(projects):
+            devpost_url = str(project.devpost_url)
+            project_urls.append((devpost_url,))
+            project_rows.append((
+                devpost_url,
+                event_id,
+                position if event_id is not None else None,
+                project.name,
+                project.description,
+                _text(project.project_url),
+                _text(project.image_url),
+                _text(project.submission_date),
+                project.vote_count,
+                project.comment_count,
+                _json([member.model_dump(mode='json', warnings=False) for member in project.members]),
+                _json(project.analysis),
+                _content_hash(project),
+                seen_at_text,
+                seen_at_text,
+            ))
+            for award_position, award in enumerate(project.awards):
+                award_rows.append((
+                    devpost_url, award_position, award.name, award.category, award.sponsor, award.prize_value
+                ))
+            for tag_position, tag in enumerate(project.tags):
+                tag_rows.append((devpost_url, tag_position, tag))
+            fts_rows.append((
+                devpost_url,
+                project.name,
+                project.description,
+                " ".join(project.tags),
+                " ".join(award.name for award in project.awards),
+                _analysis_text(project.analysis),
+            ))
+
+        with self.conn:
+            self.conn.executemany(_UPSERT_PROJECT, project_rows)
+            self.conn.executemany(f"DELETE FROM awards WHERE project_id = {_PROJECT_ID}", project_urls)
+            self.conn.executemany(f"DELETE FROM tech_tags WHERE project_id = {_PROJECT_ID}", project_urls)
+            self.conn.executemany(
+                f"INSERT INTO awards (project_id, position, name, category, sponsor, prize_value) "
+                f"VALUES ({_PROJECT_ID}, ?, ?, ?, ?, ?)",
+                award_rows
+            )
+            self.conn.executemany(
+                f"INSERT INTO tech_tags (project_id, position, tag) VALUES ({_PROJECT_ID}, ?, ?)",
+                tag_rows
+            )
+            self.conn.executemany(f"DELETE FROM project_fts WHERE rowid = {_PROJECT_ID}", project_urls)
+            self.conn.executemany(
+                f"INSERT INTO project_fts (rowid, name, description, tags, awards, analysis) "
+                f"VALUES ({_PROJECT_ID}, ?, ?, ?, ?, ?)",
+                fts_rows
+            )
+
+        return len(project_rows)
+
+    def save_result(self, result: "ScrapingResult") -> int:
+        """
+        Store a successful scraping result.
+
+        A single project page (``/software/`` URL) is wrapped in a stand-in
+        hackathon by the scraper. Its projects are stored without an event,
+        so a project already stored keeps its event and position. For a
+        hackathon, stored projects missing from the result are detached
+        from its event, so the event lists the projects of this scrape.
+
+        Args:
+            result: Scraping result to store
+
+        Returns:
+            Number of projects written (0 for unsuccessful results)
+        """
+        if not result.success or not result.hackathon:
+            return 0
+        hackathon = result.hackathon
+        event_id = None if is_project_result(result) else self.upsert_event(hackathon)
+        count = self.upsert_projects(hackathon.projects, event_id=event_id, seen_at=hackathon.scraped_at)
+        if event_id is not None:
+            self._detach_missing(event_id, {str(project.devpost_url) for project in hackathon.projects})
+        logger.info(f"Stored {count} projects of {hackathon.name} in {self.path}")
+        return count
+
+    def _detach_missing(self, event_id: int, devpost_urls: Set[str]) -> int:
+        """Detach the projects of an event that are not among ``devpost_urls``; returns how many."""
+        missing = [
+            (row['devpost_url'],)
+            for row in self.conn.execute("SELECT devpost_url FROM projects WHERE event_id = ?", (event_id,))
+            if row['devpost_url'] not in devpost_urls
+        ]
+        if missing:
+            with self.conn:
+                self.conn.executemany(
+                    "UPDATE projects SET event_id = NULL, position = NULL WHERE devpost_url = ?", missing
+                )
+            logger.info(f"Detached {len(missing)} projects no longer listed from event {event_id}")
+        return len(missing)
+
+    def _project_dicts(self, rows: List[sqlite3.Row]) -> List[Dict[str, Any]]:
+        """Rebuild raw project dicts (with awards and tags) from project rows."""
+        ids = [row['id'] for row in rows]
+        tags: Dict[int, List[str]] = {project_id: [] for project_id in ids}
+        awards: Dict[int, List[Dict[str, Any]]] = {project_id: [] for project_id in ids}
+
+        # Query child rows in chunks to stay under SQLite's variable limit
+        for start in range(0, len(ids), 500):
+            chunk = ids[start:start + 500]
+            placeholders = ",".join("?" * len(chunk))
+            for tag_row in self.conn.execute(
+                f"SELECT project_id, tag FROM tech_tags WHERE project_id IN ({placeholders}) "
+                f"ORDER BY project_id, position", chunk
+            ):
+                tags[tag_row['project_id']].append(tag_row['tag'])
+            for award_row in self.conn.execute(
+                f"SELECT project_id, name, category, sponsor, prize_value FROM awards "
+                f"WHERE project_id IN ({placeholders}) ORDER BY project_id, position", chunk
+            ):
+                awards[award_row['project_id']].append({
+                    'name': award_row['name'],
+                    'category': award_row['category'],
+                    'sponsor': award_row['sponsor'],
+                    'prize_value': award_row['prize_value'],
+                })
+
+        return [
+            {
+                'name': row['name'],
+                'description': row['description'],
+                'devpost_url': row['devpost_url'],
+                'project_url': row['project_url'],
+                'tags': tags[row['id']],
+                'awards': awards[row['id']],
+                'members': fastjson.loads(row['members']) if row['members'] else [],
+                'submission_date': row['submission_date'],
+                'image_url': row['image_url'],
+                'vote_count': row['vote_count'],
+                'comment_count': row['comment_count'],
+                'analysis': fastjson.loads(row['analysis']) if row['analysis'] else None,
+            }
+            for row in rows
+        ]
+
+    def get_project(self, devpost_url: str) -> Optional["Project"]:
+        """
+        Look up a project by its Devpost URL.
+
+        Args:
+            devpost_url: Project page URL
+
+        Returns:
+            Project, or None if it is not stored
+        """
+        row = self.conn.execute("SELECT * FROM projects WHERE devpost_url = ?", (devpost_url,)).fetchone()
+        if row is None:
+            return None
+        from models.validation import construct_project
+        return construct_project(self._project_dicts([row])[0])
+
+    def get_projects(self, devpost_urls: List[str]) -> Dict[str, "Project"]:
+        """
+        Look up several projects by their Devpost URLs.
+
+        Returns:
+            Stored projects keyed by URL (URLs that are not stored are missing)
+        """
+        rows: List[sqlite3.Row] = []
+        for start in range(0, len(devpost_urls), 500):
+            chunk = devpost_urls[start:start + 500]
+            rows.extend(self.conn.execute(
+                f"SELECT * FROM projects WHERE devpost_url IN ({','.join('?' * len(chunk))})", chunk
+            ).fetchall())
+        from models.validation import construct_project
+        return {
+            row['devpost_url']: construct_project(data)
+            for row, data in zip(rows, self._project_dicts(rows))
+        }
+
+    def crawl_states(self, devpost_urls: List[str]) -> Dict[str, CrawlState]:
+        """Delta crawl state of projects, keyed by URL (never-seen URLs are missing)."""
+        states: Dict[str, CrawlState] = {}
+        for start in range(0, len(devpost_urls), 500):
+            chunk = devpost_urls[start:start + 500]
+            for row in self.conn.execute(
+                f"SELECT * FROM crawl_state WHERE devpost_url IN ({','.join('?' * len(chunk))})", chunk
+            ):
+                states[row['devpost_url']] = CrawlState(**dict(row))
+        return states
+
+    def record_listing(self, listing_hashes: Dict[str, Optional[str]], listed_at: Optional[datetime] = None) -> None:
+        """Record the gallery card hashes of projects seen in a listing."""
+        listed_at_text = (listed_at or datetime.now()).isoformat()
+        with self.conn:
+            self.conn.executemany(
+                _RECORD_LISTING, [(url, listing_hash, listed_at_text) for url, listing_hash in listing_hashes.items()]
+            )
+
+    def record_content_hash(self, devpost_url: str, content_hash: str, fetched_at: Optional[datetime] = None) -> None:
+        """Record the content hash of a fetched project page."""
+        with self.conn:
+            self.conn.execute(_RECORD_CONTENT, (devpost_url, content_hash, (fetched_at or datetime.now()).isoformat()))
+
+    def find_projects_by_tag(self, tag: str) -> List["Project"]:
+        """
+        Find all projects using a technology tag.
+
+        Args:
+            tag: Technology tag (exact match)
+
+        Returns:
+            Matching projects
+        """
+        rows = self.conn.execute(
+            "SELECT DISTINCT p.* FROM tech_tags t JOIN projects p ON p.id = t.project_id "
+            "WHERE t.tag = ? ORDER BY p.id",
+            (tag,)
+        ).fetchall()
+        from models.validation import construct_project
+        return [construct_project(data) for data in self._project_dicts(rows)]
+
+    def tag_counts(self, limit: Optional[int] = None) -> List[Tuple[str, int]]:
+        """
+        Count how many projects use each tag.
+
+        Args:
+            limit: Maximum number of tags to return (optional)
+
+        Returns:
+            (tag, project count) pairs, most common first
+        """
+        query = (
+            "SELECT tag, COUNT(DISTINCT project_id) AS count FROM tech_tags "
+            "GROUP BY tag ORDER BY count DESC, tag"
+        )
+        if limit is not None:
+            query += f" LIMIT {int(limit)}"
+        return [(row['tag'], row['count']) for row in self.conn.execute(query)]
+
+    def list_events(self) -> List[Dict[str, Any]]:
+        """Return the stored events with their project counts, most recently scraped first."""
+        rows = self.conn.execute(
+            "SELECT e.devpost_url, e.name, e.last_scraped_at, COUNT(p.id) AS project_count "
+            "FROM events e LEFT JOIN projects p ON p.event_id = e.id "
+            "GROUP BY e.id ORDER BY e.last_scraped_at DESC"
+        ).fetchall()
+        return [dict(row) for row in rows]
+
+    def load_hackathon(self, devpost_url: str) -> Optional["Hackathon"]:
+        """
+        Load a stored hackathon with its projects.
+
+        Args:
+            devpost_url: Hackathon URL the data was scraped from
+
+        Returns:
+            Hackathon, or None if it is not stored
+        """
+        event = self.conn.execute("SELECT * FROM events WHERE devpost_url = ?", (devpost_url,)).fetchone()
+        if event is None:
+            return None
+        rows = self.conn.execute(
+            "SELECT * FROM projects WHERE event_id = ? ORDER BY position, id", (event['id'],)
+        ).fetchall()
+        from models.validation import construct_hackathon
+        return construct_hackathon({
+            'name': event['name'],
+            'description': event['description'],
+            'devpost_url': event['devpost_url'],
+            'start_date': event['start_date'],
+            'end_date': event['end_date'],
+            'theme': event['theme'],
+            'prizes': fastjson.loads(event['prizes']) if event['prizes'] else [],
+            'sponsors': fastjson.loads(event['sponsors']) if event['sponsors'] else [],
+            'participant_count': event['participant_count'],
+            'submission_count': event['submission_count'],
+            'projects': self._project_dicts(rows),
+            'scraped_at': event['last_scraped_at'],
+        })
+
+    def rebuild_search_index(self) -> int:
+        """
+        Rebuild the full-text index from the stored projects.
+
+        Returns:
+            Number of indexed projects
+        """
+        rows = self.conn.execute(
+            "SELECT p.id, p.name, p.description, p.analysis, "
+            "(SELECT group_concat(tag, ' ') FROM (SELECT tag FROM tech_tags t WHERE t.project_id = p.id ORDER BY position)), "
+            "(SELECT group_concat(name, ' ') FROM (SELECT name FROM awards a WHERE a.project_id = p.id ORDER BY position)) "
+            "FROM projects p"
+        ).fetchall()
+        with self.conn:
+            self.conn.execute("DELETE FROM project_fts")
+            self.conn.executemany(
+                "INSERT INTO project_fts (rowid, name, description, tags, awards, analysis) VALUES (?, ?, ?, ?, ?, ?)",
+                [
+                    (row[0], row[1], row[2], row[4] or "", row[5] or "",
+                     _analysis_text(fastjson.loads(row[3])) if row[3] else "")
+                    for row in rows
+                ]
+            )
+        return len(rows)
+
+    def search(
+        self,
+        query: str,
+        limit: int = 20,
+        winners_only: bool = False,
+        raw_query: bool = False,
+        highlight: Tuple[str, str] = ("[", "]"),
+        snippet_tokens: int = 16
+    ) -> List[SearchHit]:
+        """
+        Full-text search over project names, descriptions, tags, awards and analyses.
+
+        Results are ranked by BM25 with names and tags weighted highest.
+
+        Args:
+            query: Words that must all appear (or an FTS5 expression if raw_query)
+            limit: Maximum number of results
+            winners_only: Only return projects that won an award
+            raw_query: Pass the query to FTS5 unchanged (supports OR, NEAR, prefix*)
+            highlight: Markers placed around matched words in snippets
+            snippet_tokens: Approximate snippet length in tokens
+
+        Returns:
+            Hits, best match first
+        """
+        match = query if raw_query else to_match_query(query)
+        if not match:
+            return []
+        filters = "AND EXISTS (SELECT 1 FROM awards a WHERE a.project_id = p.id)" if winners_only else ""
+        rows = self.conn.execute(
+            _SEARCH.format(filters=filters),
+            (highlight[0], highlight[1], snippet_tokens, match, limit)
+        ).fetchall()
+        return [
+            SearchHit(
+                devpost_url=row['devpost_url'],
+                name=row['name'],
+                event_name=row['event_name'],
+                awards=row['awards'],
+                score=-row['score'],
+                snippet=row['snippet'],
+            )
+            for row in rows
+        ]
+
+    def count_projects(self) -> int:
+        """Return the number of stored projects."""
+        return self.conn.execute("SELECT COUNT(*) FROM projects").fetchone()[0]
+
+
+def main():
+    """Import stored raw result files into the SQLite store."""
+    parser = argparse.ArgumentParser(description="Import raw scraping results into the SQLite store")
+    parser.add_argument("data_files", nargs="+", type=Path, help="Raw result JSON files")
+    parser.add_argument("--db", type=Path, default=None, help="Database file (default: STORE_PATH or data/hackathons.db)")
+    args = parser.parse_args()
+
+    from storage.serialization import load_result
+
+    logging.basicConfig(level=logging.INFO)
+
+    with ProjectStore(args.db) as store:
+        for data_file in sorted(args.data_files):
+            try:
+                store.save_result(load_result(data_file))
+            except (OSError, ValueError) as e:
+                logger.warning(f"Skipping unreadable result file {data_file}: {e}")
+        print(f"{store.count_projects()} projects in {store.path}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,345 @@
+"""
+Lease-based work queue in a SQLite file.
+
+Lets crawl workers on several processes or machines share work through a
+file on a shared filesystem, without another service:
+
+- enqueue() is idempotent within a crawl run: a job is identified by
+  (queue, key), and enqueueing it again in the same run is a no-op.
+  Enqueueing it in a new run starts it over, so a re-crawl scrapes every
+  page again instead of handing back the results of an earlier crawl.
+- lease() hands a job to one worker for a limited time. Workers extend the
+  lease with heartbeat() while they work on it; a job whose lease expires
+  (the worker died or hung) becomes visible to other workers again.
+- complete() records the result once. Later completions of the same job,
+  e.g. by a worker whose lease had expired, are ignored.
+- A job that keeps failing or losing its lease is marked failed after
+  ``max_attempts`` leases.
+
+Leasing runs in a ``BEGIN IMMEDIATE`` transaction, so two workers never
+lease the same job. The database uses the rollback journal rather than WAL
+because WAL's shared memory does not work across machines.
+
+Usage (from src/):
+    python -m storage.work_queue ../data/queue.db stats
+    python -m storage.work_queue ../data/queue.db purge "https://example.devpost.com/project-gallery"
+"""
+import argparse
+import json
+import os
+import socket
+import sqlite3
+import time
+import uuid
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+DEFAULT_LEASE_SECONDS = 120.0
+DEFAULT_MAX_ATTEMPTS = 3
+
+PENDING = "pending"
+LEASED = "leased"
+DONE = "done"
+FAILED = "failed"
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS jobs (
+    id INTEGER PRIMARY KEY,
+    queue TEXT NOT NULL,
+    key TEXT NOT NULL,
+    payload TEXT NOT NULL,
+    priority INTEGER NOT NULL DEFAULT 0,
+    status TEXT NOT NULL DEFAULT 'pending',
+    attempts INTEGER NOT NULL DEFAULT 0,
+    max_attempts INTEGER NOT NULL,
+    lease_owner TEXT,
+    lease_expires_at REAL,
+    enqueued_at REAL NOT NULL,
+    updated_at REAL NOT NULL,
+    completed_by TEXT,
+    result TEXT,
+    error TEXT,
+    run TEXT NOT NULL DEFAULT '',
+    UNIQUE (queue, key)
+);
+
+CREATE INDEX IF NOT EXISTS idx_jobs_ready ON jobs(queue, status, priority DESC, id);
+"""
+
+
+@dataclass
+class Job:
+    """A leased job."""
+    id: int
+    queue: str
+    key: str
+    payload: Dict[str, Any]
+    attempts: int
+    lease_expires_at: float
+
+
+def _filters(queue: Optional[str], run: Optional[str]) -> Tuple[str, Tuple[Any, ...]]:
+    """SQL conditions (each starting with AND) and parameters selecting a queue and a run."""
+    conditions = ""
+    params: Tuple[Any, ...] = ()
+    if queue is not None:
+        conditions += " AND queue = ?"
+        params += (queue,)
+    if run is not None:
+        conditions += " AND run = ?"
+        params += (run,)
+    return conditions, params
+
+
+def default_worker_id() -> str:
+    """Identify a worker by host, pid and a random suffix."""
+    return f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:6]}"
+
+
+class WorkQueue:
+    """Jobs with leases, heartbeats and idempotent completion, in one SQLite file."""
+
+    def __init__(self, path: Path, timeout: float = 30.0):
+        """
+        Open (and if needed create) the queue database.
+
+        Args:
+            path: Database file (on a filesystem all workers can reach)
+            timeout: Seconds to wait for another worker's lock
+        """
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        # Autocommit mode; multi-statement operations open their own transactions
+        self.conn = sqlite3.connect(str(self.path), timeout=timeout, isolation_level=None)
+        self.conn.row_factory = sqlite3.Row
+        self.conn.execute("PRAGMA journal_mode=DELETE")
+        self.conn.executescript(SCHEMA)
+        columns = {row["name"] for row in self.conn.execute("PRAGMA table_info(jobs)")}
+        if "run" not in columns:
+            # Queue files created before crawl runs were tracked
+            self.conn.execute("ALTER TABLE jobs ADD COLUMN run TEXT NOT NULL DEFAULT ''")
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def close(self) -> None:
+        """Close the database connection."""
+        self.conn.close()
+
+    def enqueue(
+        self,
+        queue: str,
+        items: Iterable[Tuple[str, Dict[str, Any]]],
+        priority: int = 0,
+        max_attempts: int = DEFAULT_MAX_ATTEMPTS,
+        run: str = ""
+    ) -> int:
+        """
+        Add jobs to a queue for a crawl run.
+
+        Keys already enqueued in the same run are left untouched, which
+        resumes an interrupted run. Keys left over from another run, done,
+        failed or not, are started over in this one.
+
+        Args:
+            queue: Queue name
+            items: (key, JSON-serializable payload) pairs
+            priority: Higher priorities are leased first
+            max_attempts: Leases before a job is marked failed
+            run: Crawl run the jobs belong to
+
+        Returns:
+            Number of jobs added or started over
+        """
+        now = time.time()
+        rows = [(queue, key, json.dumps(payload), priority, max_attempts, now, now, run) for key, payload in items]
+        self.conn.execute("BEGIN IMMEDIATE")
+        try:
+            before = self.conn.total_changes
+            self.conn.executemany(
+                "INSERT INTO jobs (queue, key, payload, priority, max_attempts, enqueued_at, updated_at, run) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?) "
+                f"ON CONFLICT (queue, key) DO UPDATE SET "
+                f"payload = excluded.payload, priority = excluded.priority, max_attempts = excluded.max_attempts, "
+                f"status = '{PENDING}', attempts = 0, lease_owner = NULL, lease_expires_at = NULL, "
+                f"completed_by = NULL, result = NULL, error = NULL, "
+                f"enqueued_at = excluded.enqueued_at, updated_at = excluded.updated_at, run = excluded.run "
+                f"WHERE jobs.run != excluded.run",
+                rows
+            )
+            added = self.conn.total_changes - before
+            self.conn.execute("COMMIT")
+        except BaseException:
+            self.conn.execute("ROLLBACK")
+            raise
+        return added
+
+    def lease(
+        self,
+        worker_id: str,
+        queue: Optional[str] = None,
+        lease_seconds: float = DEFAULT_LEASE_SECONDS,
+        limit: int = 1,
+        run: Optional[str] = None
+    ) -> List[Job]:
+        """
+        Lease pending jobs, or jobs whose previous lease expired.
+
+        Args:
+            worker_id: Identity of the leasing worker
+            queue: Queue to lease from (None for any queue)
+            lease_seconds: Lease length; extend it with heartbeat()
+            limit: Maximum number of jobs
+            run: Only lease jobs of this crawl run (None for any run)
+
+        Returns:
+            Leased jobs, highest priority first (empty if none are available)
+        """
+        now = time.time()
+        queue_filter, params = _filters(queue, run)
+        self.conn.execute("BEGIN IMMEDIATE")
+        try:
+            # Expired leases that used up their attempts are failed, not re-leased
+            self.conn.execute(
+                f"UPDATE jobs SET status = '{FAILED}', error = COALESCE(error, 'lease expired'), updated_at = ? "
+                f"WHERE status = '{LEASED}' AND lease_expires_at < ? AND attempts >= max_attempts {queue_filter}",
+                (now, now) + params
+            )
+            rows = self.conn.execute(
+                f"SELECT id, queue, key, payload, attempts FROM jobs "
+                f"WHERE (status = '{PENDING}' OR (status = '{LEASED}' AND lease_expires_at < ?)) {queue_filter} "
+                f"ORDER BY priority DESC, id LIMIT ?",
+                (now,) + params + (limit,)
+            ).fetchall()
+            expires = now + lease_seconds
+            self.conn.executemany(
+                f"UPDATE jobs SET status = '{LEASED}', lease_owner = ?, lease_expires_at = ?, "
+                f"attempts = attempts + 1, updated_at = ? WHERE id = ?",
+                [(worker_id, expires, now, row["id"]) for row in rows]
+            )
+            self.conn.execute("COMMIT")
+        except BaseException:
+            self.conn.execute("ROLLBACK")
+            raise
+        return [
+            Job(row["id"], row["queue"], row["key"], json.loads(row["payload"]), row["attempts"] + 1, expires)
+            for row in rows
+        ]
+
+    def heartbeat(self, job: Job, worker_id: str, lease_seconds: float = DEFAULT_LEASE_SECONDS) -> bool:
+        """
+        Extend a lease.
+
+        Returns:
+            False if the lease was lost (it expired and another worker took the job, or the job finished)
+        """
+        now = time.time()
+        cursor = self.conn.execute(
+            f"UPDATE jobs SET lease_expires_at = ?, updated_at = ? "
+            f"WHERE id = ? AND status = '{LEASED}' AND lease_owner = ?",
+            (now + lease_seconds, now, job.id, worker_id)
+        )
+        if cursor.rowcount:
+            job.lease_expires_at = now + lease_seconds
+        return cursor.rowcount == 1
+
+    def complete(self, job: Job, worker_id: str, result: Any = None) -> bool:
+        """
+        Record a job's result.
+
+        Completion is idempotent: the first completion wins, even from a
+        worker whose lease has expired, and later ones are ignored.
+
+        Returns:
+            True if this call completed the job
+        """
+        cursor = self.conn.execute(
+            f"UPDATE jobs SET status = '{DONE}', result = ?, completed_by = ?, error = NULL, "
+            f"lease_owner = NULL, lease_expires_at = NULL, updated_at = ? "
+            f"WHERE id = ? AND status IN ('{PENDING}', '{LEASED}')",
+            (json.dumps(result), worker_id, time.time(), job.id)
+        )
+        return cursor.rowcount == 1
+
+    def fail(self, job: Job, worker_id: str, error: str, retry: bool = True) -> None:
+        """
+        Give a leased job back after an error.
+
+        The job becomes pending again if ``retry`` and it has attempts left,
+        and is marked failed otherwise. Does nothing if the lease was lost.
+        """
+        self.conn.execute(
+            f"UPDATE jobs SET status = CASE WHEN ? AND attempts < max_attempts THEN '{PENDING}' ELSE '{FAILED}' END, "
+            f"error = ?, lease_owner = NULL, lease_expires_at = NULL, updated_at = ? "
+            f"WHERE id = ? AND status = '{LEASED}' AND lease_owner = ?",
+            (1 if retry else 0, error, time.time(), job.id, worker_id)
+        )
+
+    def counts(self, queue: Optional[str] = None, run: Optional[str] = None) -> Dict[str, int]:
+        """Number of jobs by status, for one queue (and run) or all of them."""
+        queue_filter, params = _filters(queue, run)
+        counts = {PENDING: 0, LEASED: 0, DONE: 0, FAILED: 0}
+        counts.update(dict(
+            self.conn.execute(f"SELECT status, COUNT(*) FROM jobs WHERE 1 {queue_filter} GROUP BY status", params).fetchall()
+        ))
+        return counts
+
+    def outstanding(self, queue: str, run: Optional[str] = None) -> int:
+        """Jobs of a queue (and run) that are neither done nor failed."""
+        counts = self.counts(queue, run)
+        return counts[PENDING] + counts[LEASED]
+
+    def results(self, queue: str, run: Optional[str] = None) -> List[Tuple[str, Dict[str, Any], Any]]:
+        """(key, payload, result) of the completed jobs of a queue (and run), in enqueue order."""
+        queue_filter, params = _filters(queue, run)
+        rows = self.conn.execute(
+            f"SELECT key, payload, result FROM jobs WHERE status = '{DONE}' {queue_filter} ORDER BY id", params
+        ).fetchall()
+        return [(row["key"], json.loads(row["payload"]), json.loads(row["result"])) for row in rows]
+
+    def failures(self, queue: str, run: Optional[str] = None) -> List[Tuple[str, Optional[str]]]:
+        """(key, last error) of the failed jobs of a queue (and run)."""
+        queue_filter, params = _filters(queue, run)
+        rows = self.conn.execute(
+            f"SELECT key, error FROM jobs WHERE status = '{FAILED}' {queue_filter} ORDER BY id", params
+        ).fetchall()
+        return [(row["key"], row["error"]) for row in rows]
+
+    def queues(self) -> List[str]:
+        """Names of all queues."""
+        return [row[0] for row in self.conn.execute("SELECT DISTINCT queue FROM jobs ORDER BY queue")]
+
+    def purge(self, queue: str) -> int:
+        """Delete every job of a queue (to crawl it again from scratch). Returns the number deleted."""
+        return self.conn.execute("DELETE FROM jobs WHERE queue = ?", (queue,)).rowcount
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Inspect or clear a crawl work queue")
+    parser.add_argument("db", type=Path, help="Queue database")
+    parser.add_argument("command", choices=["stats", "purge"])
+    parser.add_argument("queue", nargs="?", default=None, help="Queue name (stats: default all; purge: required)")
+    args = parser.parse_args()
+
+    if not args.db.exists():
+        parser.error(f"{args.db} does not exist")
+
+    with WorkQueue(args.db) as work_queue:
+        if args.command == "purge":
+            if args.queue is None:
+                parser.error("purge needs a queue name")
+            print(f"Deleted {work_queue.purge(args.queue)} jobs")
+            return
+        for queue in [args.queue] if args.queue else work_queue.queues():
+            counts = work_queue.counts(queue)
+            print(f"{queue}: " + ", ".join(f"{count} {status}" for status, count in counts.items()))
+            for key, error in work_queue.failures(queue):
+                print(f"    failed {key}: {error}")
+
+
+if __name__ == "__main__":
+    main()
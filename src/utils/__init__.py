@@ -0,0 +1,7 @@
+"""
+Shared utilities for Hackathon Insight Automator.
+"""
+
+from .fileio import atomic_write
+
+__all__ = ["atomic_write"]
@@ -0,0 +1,63 @@
+"""
+File helpers shared by the scraper and report stages.
+"""
+import os
+import tempfile
+from contextlib import contextmanager
+from pathlib import Path
+from typing import IO, Iterator, Optional
+
+
+def _read_umask() -> int:
+    umask = os.umask(0)
+    os.umask(umask)
+    return umask
+
+
+# Read once: os.umask() can only be read by setting it, which races with other threads
+_UMASK = _read_umask()
+
+
+def _file_mode(path: Path) -> int:
+    """Permissions for a rewrite of ``path``: its current ones, or what open() would give a new file."""
+    try:
+        return os.stat(path).st_mode & 0o7777
+    except FileNotFoundError:
+        return 0o666 & ~_UMASK
+
+
+@contextmanager
+def atomic_write(
+    path: Path,
+    mode: str = 'w',
+    encoding: Optional[str] = 'utf-8'
+) -> Iterator[IO]:
+    """
+    Open a temporary file next to ``path`` and rename it into place on success.
+    
+    Readers never observe a half-written file: the target is either the old
+    content or the complete new content. On error the temporary file is removed.
+    The file keeps the permissions of the file it replaces (new files get the
+    usual umask-based ones, not mkstemp's 0600).
+    
+    Args:
+        path: Final destination of the file
+        mode: File mode ('w' for text, 'wb' for binary)
+        encoding: Text encoding (ignored for binary modes)
+        
+    Yields:
+        Writable file object
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp_name = tempfile.mkstemp(prefix=f".{path.name}.", suffix=".tmp", dir=path.parent)
+    try:
+        with os.fdopen(fd, mode, encoding=None if 'b' in mode else encoding) as f:
+            yield f
+        os.chmod(tmp_name, _file_mode(path))
+        os.replace(tmp_name, path)
+    except BaseException:
+        try:
+            os.unlink(tmp_name)
+        except OSError:
+            pass
+        raise
@@ -0,0 +1,21 @@
+"""
+Heavy optional modules, imported on first use.
+
+The CLI imports the analyzer and scraper modules for every command, so
+modules that are slow to import are loaded here only when a feature that
+needs them is actually used (see benchmarks/check_import_time.py).
+"""
+from types import ModuleType
+
+
+def gemini() -> ModuleType:
+    """
+    The Gemini SDK (``google.generativeai``).
+
+    Imported on first call: the SDK takes most of a second to load.
+
+    Raises:
+        ImportError: If google-generativeai is not installed
+    """
+    import google.generativeai as genai
+    return genai
@@ -0,0 +1,452 @@
+"""
+Run metrics for scheduled (cron) runs.
+
+The scraper, analyzers and report generator report counters and latencies
+through ``inc()`` and ``observe()``::
+
+    metrics.inc("pages_total", kind="project")
+    metrics.observe("page_load_seconds", elapsed, kind="project")
+
+Metrics are off by default. Until ``enable()`` is called, both functions
+return after one global lookup. Once enabled, a MetricsRegistry collects
+the values. At the end of the run it writes them as a Prometheus
+textfile-collector file (for node_exporter) and as a JSON run summary with
+derived throughput numbers (pages per second, cache hit rate, ...).
+
+Every metric is declared in METRICS with its type and help text, and is
+exported with the ``hackathon_`` prefix.
+"""
+import math
+import threading
+import time
+from contextlib import nullcontext
+from dataclasses import dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+from utils import fastjson
+from utils.fileio import atomic_write
+
+METRIC_PREFIX = "hackathon_"
+
+# Histogram buckets (seconds); page loads and LLM calls take from ~100 ms to tens of seconds
+LATENCY_BUCKETS = (0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+
+# name -> (type, help)
+METRICS: Dict[str, Tuple[str, str]] = {
+    "pages_total": ("counter", "Devpost pages loaded, by page kind"),
+    "page_bytes_total": ("counter", "Bytes of HTML downloaded, by page kind"),
+    "page_load_seconds": ("histogram", "Time to navigate to a page (page.goto), by page kind"),
+    "projects_total": ("counter", "Projects scraped"),
+    "llm_calls_total": ("counter", "Gemini calls, by component and status"),
+    "llm_tokens_total": ("counter", "Gemini tokens, by component and direction (prompt/output)"),
+    "llm_latency_seconds": ("histogram", "Gemini call latency, by component"),
+    "cache_requests_total": ("counter", "Cache lookups, by cache and result (hit/miss)"),
+    "retries_total": ("counter", "Retried operations, by stage"),
+    "failures_total": ("counter", "Failed operations, by stage"),
+    "browser_restarts_total": ("counter", "Browser relaunches, by reason (crash/recycle)"),
+    "budget_stops_total": ("counter", "Crawls cut short by a budget, by reason (pages/deadline)"),
+    "llm_budget_skips_total": ("counter", "Project analyses skipped because the LLM budget or deadline was used up"),
+    "delta_projects_total": ("counter", "Gallery projects in delta crawls, by status (new/changed/unchanged)"),
+    "reports_total": ("counter", "Reports written, by kind"),
+    "report_render_seconds": ("histogram", "Time to render and write a report, by kind"),
+    "results_saved_total": ("counter", "Scraping results saved, by destination (json/store)"),
+    "run_duration_seconds": ("gauge", "Wall-clock duration of the run"),
+    "run_success": ("gauge", "1 if the run succeeded, 0 otherwise"),
+    "run_last_timestamp_seconds": ("gauge", "Unix time the run finished"),
+}
+
+LabelKey = Tuple[Tuple[str, str], ...]
+
+_NULL_TIMER = nullcontext()
+
+
+def _label_key(labels: Dict[str, Any]) -> LabelKey:
+    """Turn keyword labels into a hashable, ordered key."""
+    return tuple(sorted((key, str(value)) for key, value in labels.items()))
+
+
+def _format_labels(key: LabelKey, extra: Optional[Tuple[str, str]] = None) -> str:
+    """Format a label key in the Prometheus exposition syntax."""
+    pairs = list(key) + ([extra] if extra else [])
+    if not pairs:
+        return ""
+    formatted = []
+    for name, value in pairs:
+        value = value.replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+        formatted.append(f'{name}="{value}"')
+    return "{" + ",".join(formatted) + "}"
+
+
+def _format_value(value: float) -> str:
+    """Format a sample value (integers without a fraction)."""
+    if value == math.inf:
+        return "+Inf"
+    return str(int(value)) if float(value).is_integer() else repr(float(value))
+
+
+@dataclass
+class Histogram:
+    """Cumulative-bucket histogram of one label set."""
+    buckets: Tuple[float, ...] = LATENCY_BUCKETS
+    counts: List[int] = field(default_factory=list)
+    total: float = 0.0
+    count: int = 0
+
+    def __post_init__(self):
+        if not self.counts:
+            self.counts = [0] * len(self.buckets)
+
+    def observe(self, value: float) -> None:
+        """Add one observation."""
+        self.total += value
+        self.count += 1
+        for i, bound in enumerate(self.buckets):
+            if value <= bound:
+                self.counts[i] += 1
+                break
+
+    def cumulative(self) -> List[Tuple[float, int]]:
+        """Return (upper bound, cumulative count) pairs including +Inf."""
+        pairs = []
+        running = 0
+        for bound, count in zip(self.buckets, self.counts):
+            running += count
+            pairs.append((bound, running))
+        pairs.append((math.inf, self.count))
+        return pairs
+
+    def quantile(self, fraction: float) -> Optional[float]:
+        """Estimate a quantile as the upper bound of the bucket holding it."""
+        if not self.count:
+            return None
+        rank = fraction * self.count
+        for bound, cumulative in self.cumulative():
+            if cumulative >= rank:
+                return bound
+        return math.inf
+
+
+class MetricsRegistry:
+    """Collects the counters, gauges and histograms of one run."""
+
+    def __init__(self):
+        self.started_at = time.time()
+        self._start = time.perf_counter()
+        self.counters: Dict[str, Dict[LabelKey, float]] = {}
+        self.gauges: Dict[str, Dict[LabelKey, float]] = {}
+        self.histograms: Dict[str, Dict[LabelKey, Histogram]] = {}
+        self._lock = threading.Lock()
+
+    def inc(self, name: str, value: float = 1, labels: Optional[Dict[str, Any]] = None) -> None:
+        """Increase a counter."""
+        key = _label_key(labels or {})
+        with self._lock:
+            series = self.counters.setdefault(name, {})
+            series[key] = series.get(key, 0) + value
+
+    def set_gauge(self, name: str, value: float, labels: Optional[Dict[str, Any]] = None) -> None:
+        """Set a gauge."""
+        with self._lock:
+            self.gauges.setdefault(name, {})[_label_key(labels or {})] = value
+
+    def observe(self, name: str, value: float, labels: Optional[Dict[str, Any]] = None) -> None:
+        """Add an observation to a histogram."""
+        key = _label_key(labels or {})
+        with self._lock:
+            series = self.histograms.setdefault(name, {})
+            histogram = series.get(key)
+            if histogram is None:
+                histogram = series[key] = Histogram()
+            histogram.observe(value)
+
+    def merge(self, other: "MetricsRegistry") -> None:
+        """Add the counters and histograms of another registry (e.g. a worker process's) to this one."""
+        with self._lock:
+            for name, series in other.counters.items():
+                target = self.counters.setdefault(name, {})
+                for key, value in series.items():
+                    target[key] = target.get(key, 0) + value
+            for name, series in other.histograms.items():
+                target = self.histograms.setdefault(name, {})
+                for key, histogram in series.items():
+                    mine = target.get(key)
+                    if mine is None:
+                        mine = target[key] = Histogram(buckets=histogram.buckets)
+                    mine.counts = [a + b for a, b in zip(mine.counts, histogram.counts)]
+                    mine.total += histogram.total
+                    mine.count += histogram.count
+
+    def __getstate__(self) -> Dict[str, Any]:
+        # Registries are returned from worker processes; locks do not pickle
+        state = self.__dict__.copy()
+        del state['_lock']
+        return state
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+
+    def counter_total(self, name: str, **match: Any) -> float:
+        """Sum a counter over the label sets that contain all of ``match``."""
+        wanted = set(_label_key(match))
+        return sum(
+            value for key, value in self.counters.get(name, {}).items()
+            if wanted <= set(key)
+        )
+
+    def finish(self, success: bool) -> None:
+        """Record the run duration, outcome and finish time."""
+        self.set_gauge("run_duration_seconds", time.perf_counter() - self._start)
+        self.set_gauge("run_success", 1 if success else 0)
+        self.set_gauge("run_last_timestamp_seconds", time.time())
+
+    def prometheus_text(self, job: str) -> str:
+        """
+        Render the metrics in the Prometheus text exposition format.
+
+        Args:
+            job: Value of the ``job`` label added to every sample (e.g. scrape, report)
+        """
+        lines = []
+        families = [(self.counters, "counter"), (self.gauges, "gauge"), (self.histograms, "histogram")]
+        for store, kind in families:
+            for name in sorted(store):
+                full_name = METRIC_PREFIX + name
+                help_text = METRICS.get(name, (kind, name))[1]
+                lines.append(f"# HELP {full_name} {help_text}")
+                lines.append(f"# TYPE {full_name} {kind}")
+                for key, value in sorted(store[name].items()):
+                    key = _label_key({**dict(key), "job": job})
+                    if kind != "histogram":
+                        lines.append(f"{full_name}{_format_labels(key)} {_format_value(value)}")
+                        continue
+                    for bound, cumulative in value.cumulative():
+                        le = ("le", _format_value(bound))
+                        lines.append(f"{full_name}_bucket{_format_labels(key, le)} {cumulative}")
+                    lines.append(f"{full_name}_sum{_format_labels(key)} {_format_value(value.total)}")
+                    lines.append(f"{full_name}_count{_format_labels(key)} {value.count}")
+        if not lines:
+            lines.append(f"# no metrics recorded (job={job})")
+        return "\n".join(lines) + "\n"
+
+    def summary(self) -> Dict[str, Any]:
+        """
+        Build the JSON run summary.
+
+        Returns:
+            Dict with the raw series and derived throughput numbers
+        """
+        duration = self.gauges.get("run_duration_seconds", {}).get((), time.perf_counter() - self._start)
+        pages = self.counter_total("pages_total")
+        hits = self.counter_total("cache_requests_total", result="hit")
+        lookups = self.counter_total("cache_requests_total")
+
+        def series(store, convert=lambda value: value):
+            return {
+                name: [{'labels': dict(key), 'value': convert(value)} for key, value in sorted(values.items())]
+                for name, values in sorted(store.items())
+            }
+
+        def histogram_summary(histogram: Histogram) -> Dict[str, Any]:
+            return {
+                'count': histogram.count,
+                'sum': histogram.total,
+                'mean': histogram.total / histogram.count if histogram.count else None,
+                'p50': histogram.quantile(0.50),
+                'p95': histogram.quantile(0.95),
+                'buckets': {_format_value(bound): count for bound, count in histogram.cumulative()},
+            }
+
+        return {
+            'started_at': datetime.fromtimestamp(self.started_at).isoformat(),
+            'duration_seconds': duration,
+            'success': bool(self.gauges.get("run_success", {}).get((), 0)),
+            'throughput': {
+                'pages': pages,
+                'pages_per_second': pages / duration if duration else None,
+                'page_bytes': self.counter_total("page_bytes_total"),
+                'projects': self.counter_total("projects_total"),
+                'llm_calls': self.counter_total("llm_calls_total"),
+                'llm_tokens': self.counter_total("llm_tokens_total"),
+                'cache_hit_rate': hits / lookups if lookups else None,
+                'retries': self.counter_total("retries_total"),
+                'failures': self.counter_total("failures_total"),
+                'browser_restarts': self.counter_total("browser_restarts_total"),
+            },
+            'counters': series(self.counters),
+            'gauges': series(self.gauges),
+            'histograms': series(self.histograms, histogram_summary),
+        }
+
+    def write_prometheus(self, path: Path, job: str) -> Path:
+        """
+        Write a textfile-collector file atomically (node_exporter may read it at any time).
+
+        Args:
+            path: Output ``.prom`` file
+            job: Value of the ``job`` label
+        """
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with atomic_write(path, 'w') as f:
+            f.write(self.prometheus_text(job))
+        return path
+
+    def write_summary(self, path: Path) -> Path:
+        """
+        Write the JSON run summary atomically.
+
+        Args:
+            path: Output ``.json`` file
+        """
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with atomic_write(path, 'wb') as f:
+            f.write(fastjson.dumps(self.summary(), pretty=True))
+        return path
+
+
+_registry: Optional[MetricsRegistry] = None
+
+
+def enable() -> MetricsRegistry:
+    """Start collecting metrics (keeps the current registry if already enabled)."""
+    global _registry
+    if _registry is None:
+        _registry = MetricsRegistry()
+    return _registry
+
+
+def disable() -> Optional[MetricsRegistry]:
+    """Stop collecting metrics and return the registry that collected them."""
+    global _registry
+    registry, _registry = _registry, None
+    return registry
+
+
+def merge(other: Optional[MetricsRegistry]) -> None:
+    """Merge a worker's registry into the current one (no-op when disabled)."""
+    if _registry is not None and other is not None:
+        _registry.merge(other)
+
+
+def enabled() -> bool:
+    """Whether metrics are being collected (lets callers skip costly measurements)."""
+    return _registry is not None
+
+
+def inc(name: str, value: float = 1, **labels: Any) -> None:
+    """Increase a counter (no-op when metrics are off)."""
+    registry = _registry
+    if registry is not None:
+        registry.inc(name, value, labels)
+
+
+def observe(name: str, value: float, **labels: Any) -> None:
+    """Add a histogram observation (no-op when metrics are off)."""
+    registry = _registry
+    if registry is not None:
+        registry.observe(name, value, labels)
+
+
+class _Timer:
+    """Context manager observing the duration of a block into a histogram."""
+
+    __slots__ = ("registry", "name", "labels", "start")
+
+    def __init__(self, registry: MetricsRegistry, name: str, labels: Dict[str, Any]):
+        self.registry = registry
+        self.name = name
+        self.labels = labels
+
+    def __enter__(self) -> "_Timer":
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.registry.observe(self.name, time.perf_counter() - self.start, self.labels)
+
+
+def timed(name: str, **labels: Any):
+    """
+    Observe the duration of a block into a histogram.
+
+    Returns:
+        Context manager (a shared no-op when metrics are off)
+    """
+    registry = _registry
+    if registry is None:
+        return _NULL_TIMER
+    return _Timer(registry, name, labels)
+
+
+class _LLMCall:
+    """Context manager recording one Gemini call; set ``response`` inside the block."""
+
+    __slots__ = ("component", "start", "response")
+
+    def __init__(self, component: str):
+        self.component = component
+        self.response = None
+
+    def __enter__(self) -> "_LLMCall":
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        record_llm_response(self.component, self.response, time.perf_counter() - self.start)
+
+
+class _NullLLMCall:
+    """Shared stand-in for _LLMCall when metrics are off."""
+
+    def __enter__(self) -> "_NullLLMCall":
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        return None
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        pass
+
+
+_NULL_LLM_CALL = _NullLLMCall()
+
+
+def llm_call(component: str):
+    """
+    Record a Gemini call made inside the block::
+
+        with metrics.llm_call("analyzer") as call:
+            call.response = model.generate_content(prompt)
+
+    A call that raises, or leaves ``response`` unset, counts as an error.
+
+    Args:
+        component: Calling component (analyzer, ideas, search)
+    """
+    if _registry is None:
+        return _NULL_LLM_CALL
+    return _LLMCall(component)
+
+
+def record_llm_response(component: str, response: Any, elapsed: float) -> None:
+    """
+    Record a Gemini call: count, latency and token usage when the SDK reports it.
+
+    Args:
+        component: Calling component (analyzer, ideas, search)
+        response: generate_content response (None if the call failed)
+        elapsed: Call latency in seconds
+    """
+    registry = _registry
+    if registry is None:
+        return
+    status = "ok" if response is not None else "error"
+    registry.inc("llm_calls_total", 1, {'component': component, 'status': status})
+    registry.observe("llm_latency_seconds", elapsed, {'component': component})
+    usage = getattr(response, "usage_metadata", None)
+    for direction, attribute in (("prompt", "prompt_token_count"), ("output", "candidates_token_count")):
+        tokens = getattr(usage, attribute, None)
+        if tokens:
+            registry.inc("llm_tokens_total", tokens, {'component': component, 'direction': direction})
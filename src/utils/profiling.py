@@ -0,0 +1,246 @@
+"""
+Lightweight span-based profiling.
+
+Code marks the stages worth timing with ``span()`` blocks or the
+``profiled()`` decorator::
+
+    with span("scraper.goto", url=url):
+        await page.goto(url)
+
+    @profiled("llm.analyze_project")
+    async def analyze_project_content(...): ...
+
+Profiling is off by default. Until ``enable()`` is called, ``span()`` returns
+a shared no-op context manager, so instrumented code pays for one global
+lookup per block. Once enabled, every span is recorded with its start time,
+duration and the thread or asyncio task it ran in, which gives a per-stage
+breakdown (count, total, p50, p95, max) and a Chrome trace file for
+chrome://tracing or https://ui.perfetto.dev.
+"""
+import functools
+import inspect
+import math
+import os
+import sys
+import threading
+import time
+from contextlib import nullcontext
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+from utils import fastjson
+from utils.fileio import atomic_write
+
+_NULL_SPAN = nullcontext()
+
+
+@dataclass
+class SpanRecord:
+    """One finished span."""
+    name: str
+    start_ns: int
+    duration_ns: int
+    track: int
+    args: Dict[str, Any] = field(default_factory=dict)
+
+
+def _percentile(sorted_values: List[float], fraction: float) -> float:
+    """Nearest-rank percentile of an already sorted list."""
+    index = max(0, math.ceil(fraction * len(sorted_values)) - 1)
+    return sorted_values[index]
+
+
+class _Span:
+    """Context manager timing one span into a Profiler."""
+
+    __slots__ = ("profiler", "name", "args", "start_ns")
+
+    def __init__(self, profiler: "Profiler", name: str, args: Dict[str, Any]):
+        self.profiler = profiler
+        self.name = name
+        self.args = args
+
+    def __enter__(self) -> "_Span":
+        self.start_ns = time.perf_counter_ns()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        end_ns = time.perf_counter_ns()
+        if exc_type is not None:
+            self.args["error"] = exc_type.__name__
+        self.profiler.record(self.name, self.start_ns, end_ns - self.start_ns, self.args)
+
+
+class Profiler:
+    """Collects spans and reports them as a stage breakdown or a Chrome trace."""
+
+    def __init__(self):
+        self.spans: List[SpanRecord] = []
+        self.origin_ns = time.perf_counter_ns()
+        self._lock = threading.Lock()
+        # Concurrent asyncio tasks share a thread; give each its own trace track
+        self._tracks: Dict[int, int] = {}
+        self._track_names: Dict[int, str] = {}
+
+    def _current_track(self) -> int:
+        """Return a small, stable id for the running asyncio task or thread."""
+        # Only ask asyncio when it is already loaded (report rendering never needs it)
+        asyncio = sys.modules.get("asyncio")
+        try:
+            task = asyncio.current_task() if asyncio is not None else None
+        except RuntimeError:
+            task = None
+        key = id(task) if task is not None else threading.get_ident()
+        track = self._tracks.get(key)
+        if track is None:
+            track = len(self._tracks) + 1
+            self._tracks[key] = track
+            self._track_names[track] = task.get_name() if task is not None else threading.current_thread().name
+        return track
+
+    def span(self, name: str, args: Dict[str, Any]) -> _Span:
+        """Create a span context manager."""
+        return _Span(self, name, args)
+
+    def record(self, name: str, start_ns: int, duration_ns: int, args: Dict[str, Any]) -> None:
+        """Record a finished span."""
+        with self._lock:
+            self.spans.append(SpanRecord(name, start_ns, duration_ns, self._current_track(), args))
+
+    def stage_stats(self) -> Dict[str, Dict[str, float]]:
+        """
+        Summarize the spans per stage name.
+
+        Returns:
+            Mapping of stage name to count, total, p50, p95 and max (seconds),
+            ordered by total time
+        """
+        durations: Dict[str, List[float]] = {}
+        for record in self.spans:
+            durations.setdefault(record.name, []).append(record.duration_ns / 1e9)
+
+        stats = {}
+        for name, values in durations.items():
+            values.sort()
+            stats[name] = {
+                'count': len(values),
+                'total': sum(values),
+                'p50': _percentile(values, 0.50),
+                'p95': _percentile(values, 0.95),
+                'max': values[-1],
+            }
+        return dict(sorted(stats.items(), key=lambda item: item[1]['total'], reverse=True))
+
+    def format_stage_stats(self) -> str:
+        """Format the stage breakdown as a plain-text table."""
+        stats = self.stage_stats()
+        if not stats:
+            return "No spans recorded"
+        width = max(len("stage"), *(len(name) for name in stats))
+        lines = [f"{'stage':<{width}} {'count':>6} {'total s':>9} {'p50 ms':>9} {'p95 ms':>9} {'max ms':>9}"]
+        for name, s in stats.items():
+            lines.append(
+                f"{name:<{width}} {s['count']:>6} {s['total']:>9.3f} "
+                f"{s['p50'] * 1000:>9.1f} {s['p95'] * 1000:>9.1f} {s['max'] * 1000:>9.1f}"
+            )
+        return "\n".join(lines)
+
+    def chrome_trace(self) -> Dict[str, Any]:
+        """Build a Chrome trace (Trace Event Format) document from the spans."""
+        pid = os.getpid()
+        events: List[Dict[str, Any]] = [
+            {'name': 'thread_name', 'ph': 'M', 'pid': pid, 'tid': track, 'args': {'name': name}}
+            for track, name in sorted(self._track_names.items())
+        ]
+        for record in self.spans:
+            events.append({
+                'name': record.name,
+                'cat': record.name.split('.', 1)[0],
+                'ph': 'X',
+                'ts': (record.start_ns - self.origin_ns) / 1000,
+                'dur': record.duration_ns / 1000,
+                'pid': pid,
+                'tid': record.track,
+                'args': {key: str(value) for key, value in record.args.items()},
+            })
+        return {'traceEvents': events, 'displayTimeUnit': 'ms'}
+
+    def write_chrome_trace(self, path: Path) -> Path:
+        """
+        Write the spans as a Chrome trace JSON file.
+
+        Args:
+            path: Output file
+
+        Returns:
+            Path of the written file
+        """
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with atomic_write(path, 'wb') as f:
+            f.write(fastjson.dumps(self.chrome_trace()))
+        return path
+
+
+_profiler: Optional[Profiler] = None
+
+
+def enable() -> Profiler:
+    """Start recording spans (keeps the current profiler if already enabled)."""
+    global _profiler
+    if _profiler is None:
+        _profiler = Profiler()
+    return _profiler
+
+
+def disable() -> Optional[Profiler]:
+    """Stop recording spans and return the profiler that recorded them."""
+    global _profiler
+    profiler, _profiler = _profiler, None
+    return profiler
+
+
+def get_profiler() -> Optional[Profiler]:
+    """Return the active profiler, or None when profiling is off."""
+    return _profiler
+
+
+def span(name: str, **args: Any):
+    """
+    Time a block of code as a named stage.
+
+    Args:
+        name: Stage name, ``<component>.<stage>`` (the component becomes the trace category)
+        **args: Extra values shown with the span in the trace viewer
+
+    Returns:
+        Context manager (a shared no-op when profiling is off)
+    """
+    profiler = _profiler
+    if profiler is None:
+        return _NULL_SPAN
+    return profiler.span(name, args)
+
+
+def profiled(name: str) -> Callable:
+    """
+    Decorator timing every call of a function or coroutine function as a span.
+
+    Args:
+        name: Stage name
+    """
+    def decorator(func: Callable) -> Callable:
+        if inspect.iscoroutinefunction(func):
+            @functools.wraps(func)
+            async def async_wrapper(*args, **kwargs):
+                with span(name):
+                    return await func(*args, **kwargs)
+            return async_wrapper
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            with span(name):
+                return func(*args, **kwargs)
+        return wrapper
+
+    return decorator
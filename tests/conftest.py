@@ -0,0 +1,49 @@
+"""
+Shared pytest setup.
+
+The package modules live in src/ and are imported top-level, like the CLI
+does. The synthetic data and the fixture site of benchmarks/ are reused
+for browserless tests.
+"""
+import sys
+from pathlib import Path
+
+import pytest
+
+ROOT = Path(__file__).resolve().parent.parent
+for path in (ROOT / "src", ROOT / "benchmarks"):
+    if str(path) not in sys.path:
+        sys.path.insert(0, str(path))
+
+FIXTURE_BASE_URL = "http://devpost.test"
+
+
+@pytest.fixture
+def fixture_site():
+    """A synthetic 30-project hackathon with two gallery pages."""
+    from devpost_fixture_server import FixtureSite
+
+    return FixtureSite.synthetic(30)
+
+
+@pytest.fixture
+def replay_archive(tmp_path, fixture_site):
+    """
+    Capture archive of every gallery and project page of ``fixture_site``,
+    rendered under FIXTURE_BASE_URL, for browserless scraper runs.
+    """
+    from scraper.capture import CaptureArchive
+
+    path = tmp_path / "capture.db"
+    with CaptureArchive(path) as archive:
+        for key in fixture_site.hackathons:
+            pages = -(-len(fixture_site.hackathons[key]["projects"]) // fixture_site.page_size)
+            for page in range(1, pages + 1):
+                suffix = f"?page={page}" if page > 1 else ""
+                archive.save(
+                    f"{FIXTURE_BASE_URL}/h/{key}/project-gallery{suffix}",
+                    fixture_site.gallery_page(key, page), kind="gallery", title=None
+                )
+        for slug in fixture_site.projects:
+            archive.save(f"{FIXTURE_BASE_URL}/software/{slug}", fixture_site.project_page(slug), kind="project", title=None)
+    return path
@@ -0,0 +1,71 @@
+"""Tests for the running report aggregates."""
+from models.table import ProjectTable
+from models.validation import parse_scraping_result
+from report.aggregates import ReportAggregates
+from storage.serialization import save_result
+from synthetic import make_result_dict, make_result_json
+
+
+def _hackathon(size: int, seed: int = 0):
+    return parse_scraping_result(make_result_json(size, seed=seed)).hackathon
+
+
+def _expected(hackathons):
+    projects = [project for hackathon in hackathons for project in hackathon.projects]
+    tags = {}
+    for project in projects:
+        for tag in project.tags:
+            tags[tag] = tags.get(tag, 0) + 1
+    return {
+        'total_projects': len(projects),
+        'total_awards': sum(len(project.awards) for project in projects),
+        'unique_technologies': len(tags),
+        'avg_team_size': round(sum(len(project.members) for project in projects) / len(projects), 1),
+    }
+
+
+def test_models_dicts_and_tables_agree():
+    hackathons = [_hackathon(40, seed=0), _hackathon(25, seed=1)]
+
+    from_models = ReportAggregates(sample_size=5)
+    from_dicts = ReportAggregates(sample_size=5)
+    from_table = ReportAggregates(sample_size=5)
+    for hackathon in hackathons:
+        from_models.add_hackathon(hackathon)
+        from_dicts.add_hackathon(hackathon.model_dump(mode="json", warnings=False))
+    table = ProjectTable()
+    for hackathon in hackathons:
+        table.add_hackathon(hackathon)
+    from_table.add_table(table)
+
+    analysis = from_models.analysis()
+    assert {key: analysis[key] for key in _expected(hackathons)} == _expected(hackathons)
+    assert from_dicts.analysis() == analysis
+    assert from_table.analysis() == analysis
+    assert from_models.hackathon_count == from_table.hackathon_count == 2
+
+    names = [project.name for project in from_models.sample_projects()]
+    assert [project["name"] for project in from_dicts.sample_projects()] == names
+    assert [project.name for project in from_table.sample_projects()] == names
+
+
+def test_sample_ranks_winners_then_votes_then_order():
+    aggregates = ReportAggregates(sample_size=3)
+    for name, awards, votes in [("a", 0, 50), ("b", 1, 1), ("c", 0, 50), ("d", 0, 99), ("e", 2, 0)]:
+        aggregates.add_project({"name": name, "awards": [{"name": "Prize"}] * awards, "vote_count": votes})
+    assert [project["name"] for project in aggregates.sample_projects()] == ["e", "b", "d"]
+    assert aggregates.analysis()["award_distribution"] == [("Prize", 3)]
+
+
+def test_add_result_file(tmp_path):
+    path = tmp_path / "result.json.gz"
+    result = parse_scraping_result(make_result_json(10))
+    save_result(result, path)
+    failed = tmp_path / "failed.json"
+    save_result(result.model_copy(update={"success": False, "hackathon": None}), failed)
+
+    aggregates = ReportAggregates()
+    assert aggregates.add_result_file(path)
+    assert not aggregates.add_result_file(failed)
+    assert aggregates.analysis()['total_projects'] == len(make_result_dict(10)["hackathon"]["projects"])
+    assert aggregates.sample_projects() == []
@@ -0,0 +1,89 @@
+"""Tests for the raw result corpus and its manifest."""
+import os
+
+from models.hackathon import CrawlCoverage, Hackathon, Project, ScrapingResult
+from storage import corpus as corpus_module
+from storage.corpus import MANIFEST_NAME, Corpus, hackathon_key
+from storage.serialization import save_result
+
+URL = "https://demo.devpost.com/project-gallery"
+
+
+def _save(raw_dir, name: str, projects: int, scraped_at: str, stopped_by=None, url: str = URL):
+    hackathon = Hackathon(
+        name="Demo", description="", devpost_url=url, scraped_at=scraped_at,
+        projects=[
+            Project(name=f"P{i}", description="", devpost_url=f"https://devpost.com/software/p{i}")
+            for i in range(projects)
+        ],
+        coverage=CrawlCoverage(projects_selected=10, projects_scraped=projects, stopped_by=stopped_by),
+    )
+    save_result(ScrapingResult(success=True, url=url, hackathon=hackathon), raw_dir / name)
+
+
+def _current(raw_dir):
+    return [entry.file for entry in Corpus(raw_dir).current_entries()]
+
+
+def test_newest_scrape_wins(tmp_path):
+    _save(tmp_path, "old.json", 10, "2025-01-01T00:00:00")
+    _save(tmp_path, "new.json", 8, "2025-02-01T00:00:00")
+    _save(tmp_path, "other.json", 3, "2025-01-15T00:00:00", url="https://other.devpost.com/")
+    assert _current(tmp_path) == ["other.json", "new.json"]
+
+
+def test_hackathon_key():
+    assert hackathon_key("https://Demo.devpost.com/project-gallery?ref=x") == "demo.devpost.com"
+    assert hackathon_key("https://demo.devpost.com/") == "demo.devpost.com"
+    assert hackathon_key("https://devpost.com/hackathons/demo/") == "devpost.com/hackathons/demo"
+    # Hackathons sharing a non-Devpost host are told apart by path
+    assert hackathon_key("http://devpost.test/h/a/project-gallery") == "devpost.test/h/a"
+    assert hackathon_key("http://devpost.test/h/a") == "devpost.test/h/a"
+    assert hackathon_key("http://devpost.test/h/b/project-gallery") == "devpost.test/h/b"
+    assert hackathon_key(None) is None
+
+
+def test_hackathons_on_one_mirror_host_are_kept_apart(tmp_path):
+    _save(tmp_path, "a.json", 3, "2025-01-01T00:00:00", url="http://devpost.test/h/a/project-gallery")
+    _save(tmp_path, "b.json", 3, "2025-01-02T00:00:00", url="http://devpost.test/h/b/project-gallery")
+    assert _current(tmp_path) == ["a.json", "b.json"]
+
+
+def test_scrape_times_are_compared_as_instants(tmp_path):
+    # 11:00 at -02:00 is 13:00 UTC, later than 12:00Z even though it sorts first as a string
+    _save(tmp_path, "utc.json", 5, "2025-01-01T12:00:00Z")
+    _save(tmp_path, "offset.json", 5, "2025-01-01T11:00:00-02:00")
+    assert _current(tmp_path) == ["offset.json"]
+
+
+def test_complete_scrape_beats_newer_partial_one(tmp_path):
+    _save(tmp_path, "complete.json", 10, "2025-01-01T00:00:00")
+    _save(tmp_path, "partial.json", 4, "2025-02-01T00:00:00", stopped_by="pages")
+    assert _current(tmp_path) == ["complete.json"]
+
+
+def test_partial_scrapes_prefer_more_projects(tmp_path):
+    _save(tmp_path, "big.json", 7, "2025-01-01T00:00:00", stopped_by="deadline")
+    _save(tmp_path, "small.json", 3, "2025-02-01T00:00:00", stopped_by="pages")
+    assert _current(tmp_path) == ["big.json"]
+    _save(tmp_path, "bigger.json", 7, "2025-03-01T00:00:00", stopped_by="pages")
+    assert _current(tmp_path) == ["bigger.json"]
+
+
+def test_manifest_is_reused(tmp_path):
+    _save(tmp_path, "a.json", 2, "2025-01-01T00:00:00")
+    corpus = Corpus(tmp_path)
+    assert (tmp_path / MANIFEST_NAME).exists()
+    assert corpus.entries["a.json"].stopped_by is None
+    assert Corpus(tmp_path).refresh() == 0
+
+
+def test_read_only_directory_is_indexed_in_memory(tmp_path, monkeypatch):
+    _save(tmp_path, "a.json", 2, "2025-01-01T00:00:00")
+    real_access = os.access
+    monkeypatch.setattr(
+        corpus_module.os, "access",
+        lambda path, mode: False if mode == os.W_OK and str(path) == str(tmp_path) else real_access(path, mode)
+    )
+    assert [entry.file for entry in Corpus(tmp_path).current_entries()] == ["a.json"]
+    assert not (tmp_path / MANIFEST_NAME).exists()
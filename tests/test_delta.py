@@ -0,0 +1,139 @@
+"""Tests for delta crawling."""
+import asyncio
+
+import pytest
+
+from models.hackathon import Project
+from scraper.delta import content_hash, listing_hashes, plan_delta, reusable_project
+from scraper.devpost_scraper import DevpostScraper, GalleryPage
+from scraper.frontier import card_index
+from scraper.gallery import parse_gallery_page
+from storage.sqlite_store import ProjectStore
+
+from conftest import FIXTURE_BASE_URL
+
+URLS = [f"https://devpost.com/software/project-{i}" for i in range(4)]
+GALLERY_URL = f"{FIXTURE_BASE_URL}/h/synthetic-0/project-gallery"
+
+
+@pytest.fixture
+def store(tmp_path):
+    with ProjectStore(tmp_path / "projects.db") as store:
+        yield store
+
+
+def _project(url: str, **fields) -> Project:
+    return Project(name=url.rstrip("/").rsplit("/", 1)[1], description="", devpost_url=url, **fields)
+
+
+def test_plan_delta(store):
+    # project-0 unchanged, project-1 changed, project-2 listed but never stored, project-3 new
+    store.upsert_projects([_project(URLS[0]), _project(URLS[1])])
+    store.record_listing({URLS[0]: "h0", URLS[1]: "h1", URLS[2]: "h2"})
+    plan = plan_delta(store, URLS, {URLS[0]: "h0", URLS[1]: "h1-edited", URLS[2]: "h2", URLS[3]: "h3"})
+    assert plan.fetch == URLS[1:]
+    assert list(plan.reuse) == [URLS[0]]
+    assert (plan.new, plan.changed, plan.unchanged) == (2, 1, 1)
+
+
+def test_plan_delta_fetches_cards_without_fingerprint(store):
+    store.upsert_projects([_project(URLS[0])])
+    store.record_listing({URLS[0]: None})
+    assert plan_delta(store, URLS[:1], {}).fetch == URLS[:1]
+
+
+def test_merge_delta(store):
+    gallery = GalleryPage(
+        name="Demo", description="", project_urls=URLS,
+        listing_hashes={url: f"h{i}" for i, url in enumerate(URLS)}
+    )
+    store.record_listing({URLS[0]: "h0"})
+    store.upsert_projects([_project(URLS[0])])
+    scraper = DevpostScraper(enable_llm=False, store=store, delta=True)
+    plan = scraper.plan_delta(gallery)
+    # Fetched projects come back normalized (with a trailing slash) and out of order; project-2 failed
+    fetched = [_project(URLS[3] + "/"), _project(URLS[1] + "/")]
+    merged = scraper.merge_delta(gallery, plan, fetched)
+    assert [project.name for project in merged] == ["project-0", "project-1", "project-3"]
+    # The failed page's card is not recorded, so the next run fetches it again
+    states = store.crawl_states(URLS)
+    assert {url: state.listing_hash for url, state in states.items()} == {
+        URLS[0]: "h0", URLS[1]: "h1", URLS[3]: "h3"
+    }
+
+
+def _card_hash(badge: str = "", likes: int = 3) -> str:
+    card = (
+        '<div class="gallery-item"><a href="/software/project-0"><h5>Name</h5><p class="tagline">Tagline</p></a>'
+        f'<img class="software_thumbnail_image" src="/thumb.png">{badge}<span class="like-count">{likes}</span></div>'
+    )
+    cards = card_index(parse_gallery_page(card, "https://devpost.com/").projects)
+    return listing_hashes(URLS[:1], cards)[URLS[0]]
+
+
+def test_listing_hashes_follow_the_gallery_card_parser():
+    plain = _card_hash()
+    assert _card_hash(likes=40) == plain
+    # Only a winner badge counts, as in gallery-only summaries; other entry badges do not
+    assert _card_hash('<aside class="entry-badge"><span class="featured">Featured</span></aside>') == plain
+    assert _card_hash('<aside class="entry-badge"><img class="winner" alt="Winner"></aside>') != plain
+    assert listing_hashes(URLS[1:2], {}) == {}
+
+
+def test_content_hash_and_reusable_project(store):
+    page_hash = content_hash("Name", "About", ["python"], [], [], None)
+    assert page_hash == content_hash("Name", "About", ["python"], [], [], "")
+    assert page_hash != content_hash("Name", "About it", ["python"], [], [], None)
+
+    store.upsert_projects([_project(URLS[0])])
+    store.record_content_hash(URLS[0], page_hash)
+    assert reusable_project(store, URLS[0], page_hash, need_analysis=False).name == "project-0"
+    assert reusable_project(store, URLS[0], page_hash, need_analysis=True) is None
+    assert reusable_project(store, URLS[0], "other", need_analysis=False) is None
+
+
+def _crawl(store, replay_archive):
+    from scraper.capture import CaptureArchive
+
+    async def run():
+        with CaptureArchive(replay_archive) as archive:
+            async with DevpostScraper(
+                enable_llm=False, base_url=FIXTURE_BASE_URL, replay=archive, max_projects=None,
+                store=store, delta=True
+            ) as scraper:
+                return await scraper.scrape_hackathon(GALLERY_URL)
+
+    result = asyncio.run(run())
+    assert result.success
+    store.save_result(result)
+    return result.hackathon
+
+
+def _edit_gallery(replay_archive, old: str, new: str):
+    from scraper.capture import CaptureArchive
+
+    with CaptureArchive(replay_archive) as archive:
+        html = archive.get(GALLERY_URL).html
+        assert old in html
+        archive.save(GALLERY_URL, html.replace(old, new, 1), kind="gallery")
+
+
+def test_delta_crawl_fetches_only_new_or_changed_projects(store, fixture_site, replay_archive):
+    first = _crawl(store, replay_archive)
+    listed = len(first.projects)
+    assert (first.coverage.projects_scraped, first.coverage.projects_reused) == (listed, 0)
+
+    second = _crawl(store, replay_archive)
+    assert (second.coverage.projects_scraped, second.coverage.projects_reused) == (0, listed)
+    assert [project.name for project in second.projects] == [project.name for project in first.projects]
+
+    # Like counts are not part of a card's fingerprint
+    project = next(iter(fixture_site.projects.values()))
+    _edit_gallery(replay_archive, f'like-count">{project["vote_count"]}<', 'like-count">9999<')
+    assert _crawl(store, replay_archive).coverage.projects_scraped == 0
+
+    # A new tagline is
+    tagline = project["description"][:140]
+    _edit_gallery(replay_archive, f'tagline">{tagline}<', 'tagline">A brand new tagline<')
+    third = _crawl(store, replay_archive)
+    assert (third.coverage.projects_scraped, third.coverage.projects_reused) == (1, listed - 1)
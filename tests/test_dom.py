@@ -0,0 +1,78 @@
+"""Tests for the replay HTML tree and selector engine."""
+import pytest
+
+from scraper.dom import compile_selector, parse_html
+
+HTML = """
+<div id="gallery" class="gallery">
+  <div class="gallery-item winner-card"><a href="/software/one" data-kind="project card"><h5>One</h5></a>
+    <p class="small tagline">First project</p></div>
+  <div class="gallery-item"><a href="https://x.test/software/two"><h5>Two</h5></a>
+    <section><span class="like-count">12</span></section></div>
+</div>
+<p>Unclosed paragraph<div class="after">Block</div>
+<img src="/a.png"><span class="label">View Gallery</span>
+"""
+
+
+@pytest.fixture(scope="module")
+def document():
+    return parse_html(HTML)
+
+
+def test_compile_selector_structure():
+    compiled = compile_selector("div.gallery-item > a[href*='/software/'], h5")
+    assert len(compiled) == 2
+    (anchor, child), (div, _) = compiled[0]
+    assert anchor == ("a", (), (), (("href", "*=", "/software/"),), ())
+    assert child == ">"
+    assert div == ("div", (), ("gallery-item",), (), ())
+    assert compiled[1] == ((("h5", (), (), (), ()), " "),)
+
+
+def test_compile_selector_is_cached():
+    assert compile_selector(".tagline") is compile_selector(".tagline")
+
+
+@pytest.mark.parametrize("selector", ["a + b", "a ~ b", "a:first-child", "div.x*", "", "a, ", ", a", "a::before"])
+def test_unsupported_selectors_raise(selector):
+    with pytest.raises(ValueError):
+        compile_selector(selector)
+
+
+def test_selector_lists_match_in_document_order(document):
+    assert [e.text_content() for e in document.query_selector_all("h5, .tagline")] == ["One", "First project", "Two"]
+
+
+def test_child_and_descendant_combinators(document):
+    assert len(document.query_selector_all("#gallery .like-count")) == 1
+    assert document.query_selector_all("#gallery > .like-count") == []
+    assert document.query_selector("div > section > span").text_content() == "12"
+
+
+@pytest.mark.parametrize("selector,count", [
+    ("a[href]", 2),
+    ("a[href='/software/one']", 1),
+    ("a[href^='https://']", 1),
+    ("a[href$='/two']", 1),
+    ("a[data-kind~=card]", 1),
+    ("a[data-kind~=car]", 0),
+    ("[href*=software]", 2),
+    ("div.gallery-item.winner-card", 1),
+    ("*.tagline", 1),
+])
+def test_attribute_and_class_selectors(document, selector, count):
+    assert len(document.query_selector_all(selector)) == count
+
+
+def test_has_text_is_case_insensitive(document):
+    assert document.query_selector("span:has-text('view gallery')").attrs["class"] == "label"
+    assert document.query_selector("span:has-text(\"missing\")") is None
+
+
+def test_tree_building(document):
+    # A block element closes an open <p>, and void elements take no children
+    after = document.query_selector(".after")
+    assert after.parent.tag != "p"
+    assert document.query_selector("img").children == []
+    assert document.query_selector("img").parent is document.query_selector("span.label").parent
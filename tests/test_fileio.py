@@ -0,0 +1,36 @@
+"""Tests for the atomic file writer."""
+import os
+
+import pytest
+
+from utils import fileio
+from utils.fileio import atomic_write
+
+
+def test_new_file_gets_umask_permissions(tmp_path):
+    path = tmp_path / "out.json"
+    with atomic_write(path) as f:
+        f.write("{}")
+    assert path.read_text() == "{}"
+    assert os.stat(path).st_mode & 0o777 == 0o666 & ~fileio._UMASK
+
+
+def test_rewrite_keeps_existing_permissions(tmp_path):
+    path = tmp_path / "out.json"
+    path.write_text("old")
+    os.chmod(path, 0o640)
+    with atomic_write(path, 'wb') as f:
+        f.write(b"new")
+    assert path.read_bytes() == b"new"
+    assert os.stat(path).st_mode & 0o777 == 0o640
+
+
+def test_failed_write_keeps_old_content(tmp_path):
+    path = tmp_path / "out.json"
+    path.write_text("old")
+    with pytest.raises(RuntimeError):
+        with atomic_write(path) as f:
+            f.write("partial")
+            raise RuntimeError("boom")
+    assert path.read_text() == "old"
+    assert [p.name for p in tmp_path.iterdir()] == ["out.json"]
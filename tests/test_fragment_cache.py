@@ -0,0 +1,62 @@
+"""Tests for the report fragment cache and incremental rendering."""
+import json
+import re
+
+from models.validation import parse_scraping_result
+from report.fragment_cache import CACHE_VERSION, FragmentCache, hash_inputs
+from report.markdown_generator import MarkdownReportGenerator
+from synthetic import make_result_json
+
+
+def test_hash_inputs_is_canonical():
+    assert hash_inputs({"a": 1, "b": [1, 2]}) == hash_inputs({"b": [1, 2], "a": 1})
+    assert hash_inputs({"a": 1}) != hash_inputs({"a": 2})
+    assert hash_inputs("a", "b") != hash_inputs("ab")
+
+
+def test_get_put_and_save(tmp_path):
+    path = tmp_path / "cache.json"
+    cache = FragmentCache(path)
+    assert cache.get("overview", "h1") is None
+    cache.put("overview", "h1", "# Overview")
+    cache.put("stats", "h2", "stats")
+    cache.save()
+
+    cache = FragmentCache(path)
+    assert cache.get("overview", "h1") == "# Overview"
+    assert cache.get("overview", "changed") is None
+    assert (cache.hits, cache.misses) == (1, 1)
+    cache.save()
+
+    # Only fragments used by the last render are kept
+    assert json.loads(path.read_text())["entries"] == {"overview": {"hash": "h1", "fragment": "# Overview"}}
+
+
+def test_unreadable_or_old_cache_is_ignored(tmp_path):
+    path = tmp_path / "cache.json"
+    path.write_text("{not json")
+    assert FragmentCache(path).get("overview", "h1") is None
+    path.write_text(json.dumps({"version": CACHE_VERSION + 1, "entries": {"overview": {"hash": "h1", "fragment": "x"}}}))
+    assert FragmentCache(path).get("overview", "h1") is None
+
+
+def _render(generator, hackathon, path, incremental):
+    assert generator.generate_report(hackathon, path, incremental=incremental)
+    # The generation date differs between renders
+    return re.sub(r"\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2}", "<date>", path.read_text())
+
+
+def test_incremental_report_matches_full_render(tmp_path):
+    generator = MarkdownReportGenerator(fragment_cache_dir=tmp_path / "fragments")
+    hackathon = parse_scraping_result(make_result_json(12)).hackathon
+    full = _render(generator, hackathon, tmp_path / "full.md", incremental=False)
+    assert _render(generator, hackathon, tmp_path / "first.md", incremental=True) == full
+    assert _render(generator, hackathon, tmp_path / "cached.md", incremental=True) == full
+
+    # A changed project re-renders its own section and the statistics that depend on it
+    projects = list(hackathon.projects)
+    projects[3] = projects[3].model_copy(update={"name": "Renamed Project", "tags": ["zig"]})
+    changed = hackathon.model_copy(update={"projects": projects})
+    full = _render(generator, changed, tmp_path / "full2.md", incremental=False)
+    assert "Renamed Project" in full
+    assert _render(generator, changed, tmp_path / "cached2.md", incremental=True) == full
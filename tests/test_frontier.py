@@ -0,0 +1,126 @@
+"""Tests for crawl priorities and budgets."""
+import asyncio
+import time
+
+import pytest
+
+from models.hackathon import Award, Project
+from scraper.frontier import (
+    DEADLINE, PAGES, CrawlBudget, build_coverage, card_index, gallery_order, prioritize
+)
+
+from conftest import FIXTURE_BASE_URL
+
+
+def _card(slug: str, votes=None, winner: bool = False) -> Project:
+    return Project(
+        name=slug, description="", devpost_url=f"https://devpost.com/software/{slug}",
+        vote_count=votes, awards=[Award(name="Winner")] if winner else []
+    )
+
+
+def test_prioritize_winners_then_likes_then_gallery_order():
+    urls = [f"https://devpost.com/software/{slug}" for slug in ("a", "b", "c", "d", "e", "f")]
+    cards = card_index([
+        _card("a", votes=5), _card("b", votes=50), _card("c", votes=1, winner=True),
+        _card("d", votes=50), _card("e"),
+    ])
+    # "f" has no card and ranks last; "e" has no likes; "b" and "d" tie on likes
+    assert [url.rsplit("/", 1)[1] for url in prioritize(urls, cards)] == ["c", "b", "d", "a", "e", "f"]
+
+
+def test_prioritize_matches_urls_with_trailing_slash():
+    cards = card_index([_card("a", votes=1), _card("b", winner=True)])
+    urls = ["https://devpost.com/software/a/", "https://devpost.com/software/b/"]
+    assert prioritize(urls, cards) == urls[::-1]
+
+
+def test_gallery_order():
+    urls = ["https://devpost.com/software/a/", "https://devpost.com/software/b", "https://devpost.com/software/c"]
+    projects = [_card("c"), _card("x"), _card("a")]
+    assert [project.name for project in gallery_order(urls, projects)] == ["a", "c", "x"]
+
+
+def test_page_budget():
+    budget = CrawlBudget.create(max_pages=2)
+    assert budget.take_page() and budget.take_page()
+    assert not budget.take_page()
+    assert (budget.pages, budget.stopped_by) == (2, PAGES)
+
+
+def test_deadline_stops_pages_and_llm_calls():
+    budget = CrawlBudget(deadline=time.time() - 1)
+    assert not budget.take_llm_call()
+    assert not budget.take_page()
+    assert budget.stopped_by == DEADLINE
+
+
+def test_llm_budget_does_not_stop_pages():
+    budget = CrawlBudget.create(max_llm_calls=1)
+    assert budget.take_llm_call()
+    assert not budget.take_llm_call()
+    assert budget.take_page()
+    assert budget.stopped_by is None
+
+
+@pytest.mark.parametrize("max_pages,used,parts,expected", [
+    (10, 0, 3, [4, 3, 3]),
+    (10, 8, 3, [1, 1, 0]),
+    (2, 5, 2, [0, 0]),
+    (None, 3, 2, [None, None]),
+])
+def test_share_splits_what_is_left(max_pages, used, parts, expected):
+    budget = CrawlBudget.create(max_pages=max_pages, max_llm_calls=5, time_budget=60)
+    budget.pages = used
+    shares = [budget.share(parts, index) for index in range(parts)]
+    assert [share.max_pages for share in shares] == expected
+    assert sum(share.max_llm_calls for share in shares) == 5
+    assert {share.deadline for share in shares} == {budget.deadline}
+
+
+def test_absorb_adds_usage_and_stop_reason():
+    budget = CrawlBudget.create(max_pages=4)
+    shares = [budget.share(2, index) for index in range(2)]
+    while shares[0].take_page():
+        pass
+    shares[1].take_page()
+    shares[1].llm_calls = 1
+    for share in shares:
+        budget.absorb(share)
+    assert (budget.pages, budget.llm_calls, budget.stopped_by) == (3, 1, PAGES)
+
+
+def test_build_coverage():
+    budget = CrawlBudget.create(max_pages=1)
+    budget.take_page()
+    budget.take_page()
+    projects = [_card("a"), _card("b").model_copy(update={"analysis": {"summary": "x"}})]
+    coverage = build_coverage(listed=30, selected=10, reused=1, scraped=1, projects=projects, budget=budget)
+    assert coverage.model_dump() == {
+        "projects_listed": 30, "projects_selected": 10, "projects_reused": 1, "projects_scraped": 1,
+        "projects_analyzed": 1, "pages_loaded": 1, "llm_calls": 0, "max_pages": 1, "max_llm_calls": None,
+        "time_budget_seconds": None, "stopped_by": PAGES,
+    }
+
+
+def test_budgeted_crawl_takes_winners_first(fixture_site, replay_archive):
+    from scraper.capture import CaptureArchive
+    from scraper.devpost_scraper import DevpostScraper
+
+    async def run():
+        with CaptureArchive(replay_archive) as archive:
+            async with DevpostScraper(
+                enable_llm=False, base_url=FIXTURE_BASE_URL, replay=archive, max_projects=None,
+                budget=CrawlBudget.create(max_pages=3)
+            ) as scraper:
+                return await scraper.scrape_hackathon(f"{FIXTURE_BASE_URL}/h/synthetic-0/project-gallery")
+
+    result = asyncio.run(run())
+    # A full crawl reads the first gallery page
+    listed = list(fixture_site.projects.values())[:fixture_site.page_size]
+    ranked = sorted(range(len(listed)), key=lambda i: (not listed[i]["awards"], -listed[i]["vote_count"], i))
+    # The three best-ranked projects, back in gallery order
+    assert [project.name for project in result.hackathon.projects] == [listed[i]["name"] for i in sorted(ranked[:3])]
+    coverage = result.hackathon.coverage
+    assert (coverage.projects_listed, coverage.projects_scraped, coverage.pages_loaded) == (len(listed), 3, 3)
+    assert coverage.stopped_by == PAGES
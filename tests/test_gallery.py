@@ -0,0 +1,132 @@
+"""Tests for gallery card parsing (gallery-only mode)."""
+import asyncio
+
+import pytest
+
+from models.hackathon import Project
+from scraper.dom import parse_html
+from scraper.gallery import WINNER_AWARD, merge_stored, parse_card, parse_count, parse_gallery_page
+from storage.sqlite_store import ProjectStore
+
+from conftest import FIXTURE_BASE_URL
+
+PAGE_URL = "https://demo.devpost.com/project-gallery"
+
+CARD = """
+<div class="gallery-item">
+  <a class="link-to-software" href="/software/smart-notes">
+    <div class="software-entry-name entry-body"><h5> Smart  Notes </h5>
+      <p class="small tagline">Notes that   organize themselves</p></div>
+    <img class="software_thumbnail_image" src="/thumbs/smart-notes.png">
+    <aside class="entry-badge"><img class="winner label" alt="Winner"></aside>
+    <div class="entry-footer"><span class="like-count">1.2k</span><span class="comment-count">7</span></div>
+  </a>
+</div>
+"""
+
+
+def _card(html: str):
+    return parse_html(html).query_selector(".gallery-item")
+
+
+@pytest.mark.parametrize("text,count", [
+    ("42", 42),
+    ("1,204", 1204),
+    ("1.2k", 1200),
+    ("3M likes", 3_000_000),
+    (" 7 ", 7),
+    ("", None),
+    (None, None),
+    ("no count", None),
+])
+def test_parse_count(text, count):
+    assert parse_count(text) == count
+
+
+def test_parse_card():
+    project = parse_card(_card(CARD), PAGE_URL)
+    assert project.name == "Smart Notes"
+    assert project.description == "Notes that organize themselves"
+    assert str(project.devpost_url) == "https://demo.devpost.com/software/smart-notes"
+    assert str(project.image_url) == "https://demo.devpost.com/thumbs/smart-notes.png"
+    assert [award.name for award in project.awards] == [WINNER_AWARD]
+    assert (project.vote_count, project.comment_count) == (1200, 7)
+
+
+def test_parse_card_without_optional_parts():
+    project = parse_card(_card(
+        '<div class="gallery-item"><a href="/software/bare"><div class="project-name">Bare</div></a>'
+        '<img src="data:image/png;base64,AAAA"></div>'
+    ), PAGE_URL)
+    assert project.name == "Bare"
+    assert project.awards == [] and project.vote_count is None
+    # An image URL that does not validate is dropped rather than the card
+    assert project.image_url is None
+
+
+def test_parse_card_without_link():
+    assert parse_card(_card('<div class="gallery-item"><h5>Placeholder</h5></div>'), PAGE_URL) is None
+
+
+def test_parse_gallery_page(fixture_site):
+    html = fixture_site.gallery_page("synthetic-0", 1)
+    page_url = f"{FIXTURE_BASE_URL}/h/synthetic-0/project-gallery"
+    cards = parse_gallery_page(html, page_url)
+    expected = list(fixture_site.projects.values())[:fixture_site.page_size]
+    assert [project.name for project in cards.projects] == [project["name"] for project in expected]
+    assert [project.vote_count for project in cards.projects] == [project["vote_count"] for project in expected]
+    assert [bool(project.awards) for project in cards.projects] == [bool(project["awards"]) for project in expected]
+    assert cards.next_url == f"{page_url}?page=2"
+
+    last = parse_gallery_page(fixture_site.gallery_page("synthetic-0", 2), f"{page_url}?page=2")
+    assert len(last.projects) == 30 - fixture_site.page_size
+    assert last.next_url is None
+
+
+def test_merge_stored_keeps_stored_details(tmp_path):
+    url = "https://demo.devpost.com/software/smart-notes"
+    summary = parse_card(_card(CARD), PAGE_URL)
+    unknown = Project(name="New", description="", devpost_url="https://demo.devpost.com/software/new")
+    with ProjectStore(tmp_path / "projects.db") as store:
+        store.upsert_projects([Project(
+            name="Smart Notes", description="The full write-up", devpost_url=url, tags=["python"], vote_count=3
+        )])
+        merged = merge_stored([summary, unknown], store)
+
+    assert merged[1] is unknown
+    stored = merged[0]
+    assert (stored.description, stored.tags) == ("The full write-up", ["python"])
+    assert (stored.vote_count, stored.comment_count) == (1200, 7)
+    assert [award.name for award in stored.awards] == [WINNER_AWARD]
+
+
+def _summaries(replay_archive, **options):
+    from scraper.capture import CaptureArchive
+    from scraper.devpost_scraper import DevpostScraper
+
+    async def run():
+        with CaptureArchive(replay_archive) as archive:
+            async with DevpostScraper(enable_llm=False, base_url=FIXTURE_BASE_URL, replay=archive, **options) as scraper:
+                return await scraper.scrape_gallery_summaries(f"{FIXTURE_BASE_URL}/h/synthetic-0/")
+
+    result = asyncio.run(run())
+    assert result.success
+    return result.hackathon
+
+
+def test_scrape_gallery_summaries_walks_every_page(fixture_site, replay_archive):
+    hackathon = _summaries(replay_archive, max_projects=None)
+    assert [project.name for project in hackathon.projects] == [
+        project["name"] for project in fixture_site.projects.values()
+    ]
+    coverage = hackathon.coverage
+    assert (coverage.projects_listed, coverage.projects_selected, coverage.pages_loaded) == (30, 30, 2)
+    assert coverage.stopped_by is None
+
+
+def test_scrape_gallery_summaries_respects_the_page_budget(replay_archive):
+    from scraper.frontier import PAGES, CrawlBudget
+
+    hackathon = _summaries(replay_archive, max_projects=None, budget=CrawlBudget.create(max_pages=1))
+    assert len(hackathon.projects) == 24
+    assert (hackathon.coverage.pages_loaded, hackathon.coverage.stopped_by) == (1, PAGES)
@@ -0,0 +1,45 @@
+"""Tests for the report-only CLI command."""
+import gc
+import weakref
+
+import pytest
+
+import main
+from models.validation import parse_scraping_result
+from storage.serialization import save_result
+from synthetic import make_result_json
+
+
+@pytest.fixture
+def raw_dir(tmp_path):
+    directory = tmp_path / "raw"
+    directory.mkdir()
+    for seed in range(3):
+        result = parse_scraping_result(make_result_json(8, seed=seed))
+        hackathon = result.hackathon.model_copy(update={"devpost_url": f"https://h{seed}.devpost.com/"})
+        save_result(result.model_copy(update={"hackathon": hackathon}), directory / f"hackathon_2025010{seed + 1}_120000.json")
+    return directory
+
+
+def test_summary_streams_stored_hackathons(tmp_path, raw_dir, monkeypatch):
+    loaded = []
+    stored_hackathons = main._stored_hackathons
+
+    def tracking(*args):
+        for hackathon, path in stored_hackathons(*args):
+            gc.collect()
+            # Hackathons before the previous one were folded into the summary and released
+            assert all(ref() is None for ref in loaded[:-1])
+            loaded.append(weakref.ref(hackathon))
+            yield hackathon, path
+
+    monkeypatch.setattr(main, "_stored_hackathons", tracking)
+    main.report_command([str(raw_dir), "--summary", "--reports-dir", str(tmp_path / "reports")])
+    report, = (tmp_path / "reports").glob("summary_*.md")
+    assert "Combined Analysis (3 events)" in report.read_text()
+    assert len(loaded) == 3
+
+
+def test_summary_rejects_incremental(raw_dir):
+    with pytest.raises(SystemExit):
+        main.report_command([str(raw_dir), "--summary", "--incremental"])
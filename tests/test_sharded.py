@@ -0,0 +1,57 @@
+"""Tests for the sharded crawl workers."""
+import asyncio
+
+from scraper.frontier import PAGES, CrawlBudget
+from scraper.sharded import ShardOptions, _crawl
+
+from conftest import FIXTURE_BASE_URL
+
+
+def _jobs(fixture_site, count: int, missing: int = 0):
+    urls = [f"{FIXTURE_BASE_URL}/software/{slug}" for slug in list(fixture_site.projects)[:count]]
+    urls[1:1] = [f"{FIXTURE_BASE_URL}/software/missing-{i}" for i in range(missing)]
+    return list(enumerate(urls, start=100))
+
+
+def _run(jobs, replay_archive, budget):
+    options = ShardOptions(enable_llm=False, base_url=FIXTURE_BASE_URL, replay_path=replay_archive)
+    return asyncio.run(_crawl(0, jobs, options, budget))
+
+
+def test_shard_counts_pages_and_failures(fixture_site, replay_archive):
+    jobs = _jobs(fixture_site, 4, missing=1)
+    result = _run(jobs, replay_archive, CrawlBudget())
+    assert (result.jobs, result.pages, result.failed) == (5, 5, 1)
+    assert [position for position, _ in sorted(result.projects)] == [100, 102, 103, 104]
+
+
+def test_budget_skipped_pages_are_not_failures(fixture_site, replay_archive):
+    jobs = _jobs(fixture_site, 6)
+    result = _run(jobs, replay_archive, CrawlBudget.create(max_pages=2))
+    assert (result.jobs, result.pages, result.failed) == (6, 2, 0)
+    assert len(result.projects) == 2
+    assert result.budget.stopped_by == PAGES
+
+
+def test_retried_pages_that_succeed_are_not_failures(monkeypatch):
+    from models.hackathon import Hackathon, Project, ScrapingResult
+    from scraper.devpost_scraper import DevpostScraper
+
+    urls = ["https://devpost.com/software/flaky", "https://devpost.com/software/broken"]
+    attempts = []
+
+    async def scrape_project(url):
+        attempts.append(url)
+        if url == urls[0] and attempts.count(url) == 2:
+            project = Project(name="flaky", description="", devpost_url=url)
+            hackathon = Hackathon(name="Demo", devpost_url="https://demo.devpost.com/", projects=[project])
+            return ScrapingResult(success=True, url=url, hackathon=hackathon)
+        return ScrapingResult(success=False, url=url, error_message="browser crashed")
+
+    # Without a browser every failure looks like a crash and is retried
+    scraper = DevpostScraper(enable_llm=False, max_attempts=3)
+    monkeypatch.setattr(scraper, "scrape_project", scrape_project)
+    pages = asyncio.run(scraper.scrape_project_pages(urls))
+    assert list(pages.scraped) == [0]
+    assert pages.failed == [urls[1]]
+    assert scraper.budget.pages == len(attempts) == 5
@@ -0,0 +1,149 @@
+"""Tests for the SQLite project store."""
+import pytest
+
+from models.hackathon import Hackathon, Project, ScrapingResult
+from storage.sqlite_store import ProjectStore
+
+EVENT_URL = "https://demo.devpost.com/"
+PROJECT_URL = "https://devpost.com/software/project-1"
+
+
+def _project(name: str, url: str, **fields) -> Project:
+    return Project(name=name, description=f"{name} description", devpost_url=url, **fields)
+
+
+def _result(hackathon: Hackathon) -> ScrapingResult:
+    return ScrapingResult(success=True, url=hackathon.devpost_url, hackathon=hackathon)
+
+
+@pytest.fixture
+def store(tmp_path):
+    with ProjectStore(tmp_path / "projects.db") as store:
+        yield store
+
+
+def _event_row(store: ProjectStore, url: str):
+    return store.conn.execute(
+        "SELECT event_id, position FROM projects WHERE devpost_url = ?", (url,)
+    ).fetchone()
+
+
+def test_save_result_stores_event_and_projects(store):
+    hackathon = Hackathon(
+        name="Demo Hackathon",
+        description="A demo",
+        devpost_url=EVENT_URL,
+        projects=[_project("Project 0", "https://devpost.com/software/project-0"), _project("Project 1", PROJECT_URL)],
+    )
+    assert store.save_result(_result(hackathon)) == 2
+    assert store.count_projects() == 2
+    loaded = store.load_hackathon(EVENT_URL)
+    assert [project.name for project in loaded.projects] == ["Project 0", "Project 1"]
+
+
+def test_save_result_upsert_updates_project(store):
+    hackathon = Hackathon(name="Demo Hackathon", description="", devpost_url=EVENT_URL,
+                          projects=[_project("Project 1", PROJECT_URL, vote_count=3)])
+    store.save_result(_result(hackathon))
+    updated = hackathon.model_copy(update={"projects": [_project("Project 1", PROJECT_URL, vote_count=9)]})
+    store.save_result(_result(updated))
+    assert store.count_projects() == 1
+    assert store.get_project(PROJECT_URL).vote_count == 9
+
+
+def test_project_only_result_keeps_event_and_position(store):
+    hackathon = Hackathon(
+        name="Demo Hackathon",
+        description="A demo",
+        devpost_url=EVENT_URL,
+        projects=[_project("Project 0", "https://devpost.com/software/project-0"), _project("Project 1", PROJECT_URL)],
+    )
+    store.save_result(_result(hackathon))
+    before = _event_row(store, PROJECT_URL)
+
+    # What DevpostScraper.scrape_project() returns for a single project page
+    single = Hackathon(
+        name="Scraped Hackathon",
+        description="",
+        devpost_url=PROJECT_URL,
+        projects=[_project("Project 1 renamed", PROJECT_URL)],
+    )
+    assert store.save_result(_result(single)) == 1
+
+    after = _event_row(store, PROJECT_URL)
+    assert (after['event_id'], after['position']) == (before['event_id'], before['position'])
+    events = store.list_events()
+    assert [event['devpost_url'] for event in events] == [EVENT_URL]
+    assert events[0]['project_count'] == 2
+    assert store.get_project(PROJECT_URL).name == "Project 1 renamed"
+
+
+def test_project_only_result_for_unknown_project(store):
+    single = Hackathon(name="Scraped Hackathon", description="", devpost_url=PROJECT_URL,
+                       projects=[_project("Project 1", PROJECT_URL)])
+    assert store.save_result(_result(single)) == 1
+    assert store.list_events() == []
+    assert store.get_project(PROJECT_URL).name == "Project 1"
+
+
+def test_upsert_keeps_stored_analysis(store):
+    analysis = {"summary": "A helper", "technologies": ["python"]}
+    store.upsert_projects([_project("Project 1", PROJECT_URL, analysis=analysis)])
+    store.upsert_projects([_project("Project 1", PROJECT_URL, vote_count=4)])
+    project = store.get_project(PROJECT_URL)
+    assert project.analysis == analysis
+    assert project.vote_count == 4
+
+
+def test_changed_content_drops_stored_analysis(store):
+    analysis = {"summary": "A helper"}
+    analyzed = _project("Project 1", PROJECT_URL, analysis=analysis, tags=["python"])
+    # An analyzed description carries the LLM summary after the separator
+    analyzed.description += "\n\n---\n\n**Summary**: A helper"
+    store.upsert_projects([analyzed])
+
+    # Same page scraped without analysis: the analysis still fits it
+    store.upsert_projects([_project("Project 1", PROJECT_URL, tags=["python"])])
+    assert store.get_project(PROJECT_URL).analysis == analysis
+
+    # Edited page scraped without analysis: the old analysis no longer fits
+    store.upsert_projects([_project("Project 1", PROJECT_URL, tags=["python", "rust"])])
+    assert store.get_project(PROJECT_URL).analysis is None
+
+
+def test_rescrape_detaches_projects_dropped_from_the_gallery(store):
+    other = "https://devpost.com/software/project-2"
+    hackathon = Hackathon(name="Demo Hackathon", description="", devpost_url=EVENT_URL,
+                          projects=[_project("Project 1", PROJECT_URL), _project("Project 2", other)])
+    store.save_result(_result(hackathon))
+    store.save_result(_result(hackathon.model_copy(update={"projects": [_project("Project 2", other)]})))
+
+    assert [project.name for project in store.load_hackathon(EVENT_URL).projects] == ["Project 2"]
+    assert store.list_events()[0]['project_count'] == 1
+    # The dropped project stays in the store
+    assert store.get_project(PROJECT_URL).name == "Project 1"
+
+
+def test_upsert_replaces_tags_and_awards(store):
+    store.upsert_projects([_project("Project 1", PROJECT_URL, tags=["python", "react"], awards=[{"name": "1st Place"}])])
+    store.upsert_projects([_project("Project 1", PROJECT_URL, tags=["rust"])])
+    project = store.get_project(PROJECT_URL)
+    assert project.tags == ["rust"]
+    assert project.awards == []
+    assert store.tag_counts() == [("rust", 1)]
+
+
+def test_get_projects(store):
+    other = "https://devpost.com/software/project-2"
+    store.upsert_projects([_project("Project 1", PROJECT_URL), _project("Project 2", other)])
+    found = store.get_projects([PROJECT_URL, other, "https://devpost.com/software/missing"])
+    assert {url: project.name for url, project in found.items()} == {PROJECT_URL: "Project 1", other: "Project 2"}
+
+
+def test_crawl_state_listing_and_content_hashes(store):
+    store.record_listing({PROJECT_URL: "card-1"})
+    store.record_content_hash(PROJECT_URL, "page-1")
+    store.record_listing({PROJECT_URL: "card-2"})
+    state = store.crawl_states([PROJECT_URL, "https://devpost.com/software/unseen"])
+    assert list(state) == [PROJECT_URL]
+    assert (state[PROJECT_URL].listing_hash, state[PROJECT_URL].content_hash) == ("card-2", "page-1")
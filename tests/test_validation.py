@@ -0,0 +1,42 @@
+"""Tests for the validation modes used to load stored results."""
+import warnings
+
+import pytest
+
+from models.validation import ValidationMode, get_validation_mode, parse_scraping_result
+from storage.serialization import dumps_result
+from synthetic import make_result_json
+
+
+@pytest.fixture(scope="module")
+def raw():
+    return make_result_json(50)
+
+
+@pytest.mark.parametrize("mode", [ValidationMode.BATCH, ValidationMode.TRUSTED])
+def test_modes_load_the_same_result(raw, mode):
+    strict = parse_scraping_result(raw, ValidationMode.STRICT)
+    loaded = parse_scraping_result(raw, mode)
+    assert loaded.model_dump(mode="json", warnings=False) == strict.model_dump(mode="json")
+
+
+def test_trusted_keeps_url_strings_and_parses_datetimes(raw):
+    result = parse_scraping_result(raw, ValidationMode.TRUSTED)
+    project = result.hackathon.projects[0]
+    assert isinstance(project.devpost_url, str)
+    assert result.hackathon.scraped_at.year == 2025
+
+
+def test_trusted_result_dumps_without_warnings(raw):
+    result = parse_scraping_result(raw, ValidationMode.TRUSTED)
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        assert parse_scraping_result(dumps_result(result), ValidationMode.STRICT).hackathon.projects
+
+
+def test_default_mode(monkeypatch):
+    monkeypatch.delenv("VALIDATION_MODE", raising=False)
+    assert get_validation_mode() == ValidationMode.BATCH
+    monkeypatch.setenv("VALIDATION_MODE", "strict")
+    assert get_validation_mode() == ValidationMode.STRICT
+    assert get_validation_mode("batch") == ValidationMode.BATCH
@@ -0,0 +1,183 @@
+"""Tests for the lease-based SQLite work queue and the queue workers."""
+import asyncio
+import os
+import subprocess
+import sys
+import time
+
+import pytest
+
+from storage.work_queue import DONE, FAILED, LEASED, PENDING, WorkQueue
+
+from conftest import FIXTURE_BASE_URL, ROOT
+
+QUEUE = "https://demo.devpost.com/project-gallery"
+
+
+@pytest.fixture
+def work_queue(tmp_path):
+    with WorkQueue(tmp_path / "queue.db") as work_queue:
+        yield work_queue
+
+
+def _items(*keys):
+    return [(key, {"url": key}) for key in keys]
+
+
+def test_enqueue_is_idempotent(work_queue):
+    assert work_queue.enqueue(QUEUE, _items("a", "b")) == 2
+    assert work_queue.enqueue(QUEUE, _items("a", "b", "c")) == 1
+    assert work_queue.counts(QUEUE) == {PENDING: 3, LEASED: 0, DONE: 0, FAILED: 0}
+
+    # Re-enqueueing a finished job in the same run does not reopen it
+    job, = work_queue.lease("w1", QUEUE)
+    assert work_queue.complete(job, "w1", ["result"])
+    assert work_queue.enqueue(QUEUE, _items(job.key)) == 0
+    assert work_queue.counts(QUEUE)[DONE] == 1
+
+
+def test_new_run_starts_jobs_over(work_queue):
+    work_queue.enqueue(QUEUE, _items("a", "b", "stale"), run="r1")
+    for worker_id in ("w1", "w2"):
+        job, = work_queue.lease(worker_id, QUEUE, run="r1")
+        work_queue.complete(job, worker_id, [job.key])
+
+    # Done jobs of an earlier run are neither reused nor reported for the new one
+    assert work_queue.enqueue(QUEUE, _items("a", "b"), run="r2") == 2
+    assert work_queue.results(QUEUE, "r2") == []
+    assert work_queue.counts(QUEUE, "r2") == {PENDING: 2, LEASED: 0, DONE: 0, FAILED: 0}
+
+    # A run only leases its own keys, not the leftovers of another run
+    leased = work_queue.lease("w3", QUEUE, limit=10, run="r2")
+    assert sorted(job.key for job in leased) == ["a", "b"]
+    assert [job.attempts for job in leased] == [1, 1]
+    assert work_queue.outstanding(QUEUE, "r1") == 1
+
+
+def test_lease_is_exclusive_in_priority_order(work_queue):
+    work_queue.enqueue(QUEUE, _items("low"))
+    work_queue.enqueue(QUEUE, _items("high"), priority=5)
+    first, = work_queue.lease("w1", QUEUE)
+    second, = work_queue.lease("w2", QUEUE)
+    assert (first.key, second.key) == ("high", "low")
+    assert work_queue.lease("w3", QUEUE) == []
+
+
+def test_expired_lease_is_leased_by_another_worker(work_queue):
+    work_queue.enqueue(QUEUE, _items("a"))
+    job, = work_queue.lease("w1", QUEUE, lease_seconds=0.05)
+    assert work_queue.lease("w2", QUEUE) == []
+    time.sleep(0.1)
+
+    retry, = work_queue.lease("w2", QUEUE)
+    assert (retry.key, retry.attempts) == ("a", 2)
+    # The first worker lost its lease
+    assert not work_queue.heartbeat(job, "w1")
+    assert work_queue.heartbeat(retry, "w2")
+
+
+def test_first_completion_wins(work_queue):
+    work_queue.enqueue(QUEUE, _items("a"))
+    stale, = work_queue.lease("w1", QUEUE, lease_seconds=0.05)
+    time.sleep(0.1)
+    current, = work_queue.lease("w2", QUEUE)
+
+    # The worker whose lease expired finishes first; its result stands
+    assert work_queue.complete(stale, "w1", ["from w1"])
+    assert not work_queue.complete(current, "w2", ["from w2"])
+    assert work_queue.results(QUEUE) == [("a", {"url": "a"}, ["from w1"])]
+    assert work_queue.outstanding(QUEUE) == 0
+
+
+def test_max_attempts_fails_the_job(work_queue):
+    work_queue.enqueue(QUEUE, _items("flaky"), max_attempts=2)
+    for attempt in (1, 2):
+        job, = work_queue.lease("w1", QUEUE)
+        assert job.attempts == attempt
+        work_queue.fail(job, "w1", f"error {attempt}")
+    assert work_queue.lease("w1", QUEUE) == []
+    assert work_queue.failures(QUEUE) == [("flaky", "error 2")]
+
+    # A job whose every lease expires is failed too instead of being leased again
+    work_queue.enqueue(QUEUE, _items("hung"), max_attempts=2)
+    hung, = work_queue.lease("w2", QUEUE, lease_seconds=0.05)
+    time.sleep(0.1)
+    hung, = work_queue.lease("w2", QUEUE, lease_seconds=0.05)
+    assert hung.attempts == 2
+    time.sleep(0.1)
+    assert work_queue.lease("w3", QUEUE) == []
+    assert work_queue.counts(QUEUE) == {PENDING: 0, LEASED: 0, DONE: 0, FAILED: 2}
+    assert work_queue.failures(QUEUE)[1] == ("hung", "lease expired")
+
+
+def test_multi_process_drain(tmp_path, fixture_site, replay_archive):
+    from scraper.capture import CaptureArchive
+    from scraper.devpost_scraper import DevpostScraper
+    from scraper.queue_worker import scrape_projects_via_queue
+
+    db = tmp_path / "queue.db"
+    project_urls = [f"{FIXTURE_BASE_URL}/software/{slug}" for slug in fixture_site.projects]
+    WorkQueue(db).close()
+
+    env = {**os.environ, "PYTHONPATH": str(ROOT / "src")}
+    workers = [
+        subprocess.Popen(
+            [sys.executable, "-m", "scraper.queue_worker", str(db), "--queue", QUEUE, "--no-llm",
+             "--replay", str(replay_archive), "--base-url", FIXTURE_BASE_URL, "--idle-exit", "1",
+             "--log-level", "WARNING"],
+            cwd=ROOT / "src", env=env, stdout=subprocess.PIPE, text=True
+        )
+        for _ in range(2)
+    ]
+
+    async def run():
+        with WorkQueue(db) as work_queue, CaptureArchive(replay_archive) as archive:
+            async with DevpostScraper(enable_llm=False, base_url=FIXTURE_BASE_URL, replay=archive) as scraper:
+                return await scrape_projects_via_queue(scraper, work_queue, QUEUE, project_urls)
+
+    projects = asyncio.run(run())
+    outputs = [worker.communicate(timeout=60)[0] for worker in workers]
+    assert [worker.returncode for worker in workers] == [0, 0]
+
+    assert [str(project.devpost_url) for project in projects] == project_urls
+    assert [project.name for project in projects] == [project["name"] for project in fixture_site.projects.values()]
+
+    with WorkQueue(db) as work_queue:
+        assert work_queue.counts(QUEUE) == {PENDING: 0, LEASED: 0, DONE: 30, FAILED: 0}
+        completed_by = [row[0] for row in work_queue.conn.execute("SELECT completed_by FROM jobs")]
+    # Every page was scraped exactly once, by the test process or one of the workers
+    worker_jobs = sum(int(output.split("Processed ")[1].split()[0]) for output in outputs)
+    own_jobs = sum(1 for worker_id in completed_by if f":{os.getpid()}:" in worker_id)
+    assert worker_jobs + own_jobs == len(project_urls)
+
+
+def test_recrawl_through_queue_sees_edited_page(tmp_path, fixture_site, replay_archive):
+    from scraper.capture import CaptureArchive
+    from scraper.devpost_scraper import DevpostScraper
+
+    gallery_url = f"{FIXTURE_BASE_URL}/h/synthetic-0/project-gallery"
+    edited_url = f"{FIXTURE_BASE_URL}/software/h0-project-0"
+
+    def crawl():
+        async def run():
+            with WorkQueue(tmp_path / "queue.db") as work_queue, CaptureArchive(replay_archive) as archive:
+                async with DevpostScraper(
+                    enable_llm=False, base_url=FIXTURE_BASE_URL, replay=archive, max_projects=None,
+                    work_queue=work_queue
+                ) as scraper:
+                    return await scraper.scrape_hackathon(gallery_url)
+
+        result = asyncio.run(run())
+        assert result.success
+        return {str(project.devpost_url): project for project in result.hackathon.projects}
+
+    first = crawl()
+    old_name = first[edited_url].name
+    with CaptureArchive(replay_archive) as archive:
+        html = archive.get(edited_url).html
+        assert old_name in html
+        archive.save(edited_url, html.replace(old_name, "Edited Project"), kind="project")
+
+    second = crawl()
+    assert second[edited_url].name == "Edited Project"
+    assert len(second) == len(first)